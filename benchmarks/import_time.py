@@ -0,0 +1,74 @@
+"""Benchmark for the cold-start cost of importing the client library.
+Each module is imported in fresh interpreter processes, and the time
+of an interpreter that imports nothing is subtracted.
+
+Usage: python benchmarks/import_time.py [--runs N] [--modules M [M ...]]
+           [--max-seconds S]
+
+"""
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+
+_DEFAULT_MODULES = [
+    'pantos.client', 'pantos.client.library.api',
+    'pantos.client.library.blockchains',
+    'pantos.client.library.blockchains.ethereum'
+]
+
+_HEAVY_MODULES = ['web3', 'eth_account', 'aiohttp']
+"""Modules that are reported if they are loaded by an import."""
+
+
+def _measure_import_time(statement: str, number_runs: int) -> float:
+    import_times = []
+    for _ in range(number_runs):
+        start_time = time.perf_counter()
+        subprocess.run([sys.executable, '-c', statement], check=True,
+                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        import_times.append(time.perf_counter() - start_time)
+    return statistics.median(import_times)
+
+
+def _find_loaded_heavy_modules(module: str) -> list[str]:
+    result = subprocess.run([
+        sys.executable, '-c', f'import sys, {module}; '
+        f'print(*[module for module in {_HEAVY_MODULES!r} '
+        'if module in sys.modules])'
+    ], check=True, capture_output=True, text=True)
+    return result.stdout.split()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--runs', type=int, default=5,
+                        help='number of interpreter processes per module')
+    parser.add_argument('--modules', nargs='+', default=_DEFAULT_MODULES,
+                        help='modules to import')
+    parser.add_argument('--max-seconds', type=float,
+                        help='fail if importing the first module takes longer')
+    arguments = parser.parse_args()
+    baseline_time = _measure_import_time('pass', arguments.runs)
+    print(f'{arguments.runs} runs, interpreter start-up '
+          f'{baseline_time * 1000:.0f} ms')
+    print(f'{"module":<45} {"import ms":>10}  heavy modules loaded')
+    import_times = []
+    for module in arguments.modules:
+        import_time = max(
+            _measure_import_time(f'import {module}', arguments.runs) -
+            baseline_time, 0.0)
+        import_times.append(import_time)
+        heavy_modules = _find_loaded_heavy_modules(module)
+        print(f'{module:<45} {import_time * 1000:>10.0f}  '
+              f'{", ".join(heavy_modules) or "-"}')
+    if (arguments.max_seconds is not None
+            and import_times[0] > arguments.max_seconds):
+        sys.exit(f'importing {arguments.modules[0]} took '
+                 f'{import_times[0]:.3f} s (maximum: '
+                 f'{arguments.max_seconds:.3f} s)')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,107 @@
+"""Benchmark for the throughput of the transfer signing engine with an
+increasing number of worker processes.
+
+Usage: python benchmarks/transfer_signing.py [--transfers N]
+           [--processes P [P ...]]
+
+"""
+import argparse
+import os
+import time
+
+from pantos.client.library.blockchains.ethereum import \
+    _TRANSFER_MESSAGE_ENCODER
+from pantos.client.library.blockchains.signing import Eip712StructEncoder
+from pantos.client.library.blockchains.signing import TransferSigningEngine
+from pantos.client.library.blockchains.signing import TransferSigningJob
+
+_DOMAIN_ENCODER = Eip712StructEncoder(
+    'EIP712Domain', {
+        'EIP712Domain': [{
+            'name': 'name',
+            'type': 'string'
+        }, {
+            'name': 'version',
+            'type': 'string'
+        }, {
+            'name': 'chainId',
+            'type': 'uint256'
+        }, {
+            'name': 'verifyingContract',
+            'type': 'address'
+        }]
+    })
+
+_SENDER_PRIVATE_KEYS = ['0x' + 64 * digit for digit in '123456789']
+
+
+def _create_signing_jobs(number_transfers: int) -> list[TransferSigningJob]:
+    domain_separator = _DOMAIN_ENCODER.hash_struct({
+        'name': 'Pantos',
+        'version': '1',
+        'chainId': 1,
+        'verifyingContract': '0x' + 40 * '2'
+    })
+    return [
+        TransferSigningJob(
+            _SENDER_PRIVATE_KEYS[index % len(_SENDER_PRIVATE_KEYS)],
+            domain_separator, _TRANSFER_MESSAGE_ENCODER, {
+                'request': {
+                    'sender': '0x' + 40 * '3',
+                    'recipient': '0x' + 40 * '4',
+                    'token': '0x' + 40 * '5',
+                    'amount': 10**18 + index,
+                    'serviceNode': '0x' + 40 * '6',
+                    'fee': 10**8,
+                    'nonce': index,
+                    'validUntil': 1700000000
+                },
+                'blockchainId': 0,
+                'pantosHub': '0x' + 40 * '7',
+                'pantosForwarder': '0x' + 40 * '2',
+                'pantosToken': '0x' + 40 * '8'
+            }) for index in range(number_transfers)
+    ]
+
+
+def _measure_throughput(number_processes: int,
+                        signing_jobs: list[TransferSigningJob]) -> float:
+    transfer_signing_engine = TransferSigningEngine(number_processes)
+    try:
+        # Warm up the worker processes before measuring
+        transfer_signing_engine.sign(signing_jobs[:2 * number_processes])
+        start_time = time.perf_counter()
+        transfer_signing_engine.sign(signing_jobs)
+        return len(signing_jobs) / (time.perf_counter() - start_time)
+    finally:
+        transfer_signing_engine.close()
+
+
+def main() -> None:
+    number_cpus = os.cpu_count() or 1
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--transfers', type=int, default=2000,
+                        help='number of transfers to sign per run')
+    default_numbers_processes = [0] + [
+        number_processes for number_processes in (1, 2, 4, 8, 16, 32)
+        if number_processes < number_cpus
+    ] + [number_cpus]
+    parser.add_argument(
+        '--processes', type=int, nargs='+', default=default_numbers_processes,
+        help='numbers of worker processes to benchmark (0 '
+        'signs in the calling process)')
+    arguments = parser.parse_args()
+    signing_jobs = _create_signing_jobs(arguments.transfers)
+    print(f'{arguments.transfers} transfers, {number_cpus} CPUs')
+    print(f'{"processes":>10} {"signatures/s":>14} {"speedup":>9}')
+    baseline_throughput = None
+    for number_processes in arguments.processes:
+        throughput = _measure_throughput(number_processes, signing_jobs)
+        if baseline_throughput is None:
+            baseline_throughput = throughput
+        print(f'{number_processes:>10} {throughput:>14.1f} '
+              f'{throughput / baseline_throughput:>8.2f}x')
+
+
+if __name__ == '__main__':
+    main()
@@ -1,8 +1,7 @@
 """Top-level package of the Pantos client library.
 
 """
-import ctypes as _ctypes
-import multiprocessing as _multiprocessing
+import threading as _threading
 
 import semantic_version as _semantic_version  # type: ignore
 from pantos.common.configuration import ConfigError as _ConfigError
@@ -14,12 +13,25 @@ from pantos.client.library.exceptions import \
 from pantos.client.library.protocol import \
     is_supported_protocol_version as _is_supported_protocol_version
 
-_initialized = _multiprocessing.Value(_ctypes.c_bool, False)
+_initialized_networks: frozenset[bool] = frozenset()
+"""Networks the library has been initialized for in this process (True
+for mainnet, False for testnet). The set is replaced as a whole on each
+change, so that it can be checked without locking."""
+
+_config_loaded = False
+"""True if the configuration has been loaded in this process."""
+
+_initialization_lock = _threading.Lock()
+"""Lock for initializing the library."""
 
 
 def initialize_library(mainnet: bool) -> None:
-    """Initialize the Pantos client library. The function is thread-safe
-    and performs the initialization only once at the first invocation.
+    """Initialize the Pantos client library for mainnet or testnet
+    operation. The function is thread-safe and performs the
+    initialization only once per process and network. Once the library
+    has been initialized for a network, the function returns without
+    locking. The library can be initialized for both networks and then
+    used for both of them concurrently.
 
     Parameters
     ----------
@@ -33,17 +45,41 @@ def initialize_library(mainnet: bool) -> None:
         If the library cannot be initialized.
 
     """
-    with _initialized.get_lock():
-        if not _initialized.value:
+    global _config_loaded, _initialized_networks
+    if mainnet in _initialized_networks:
+        return
+    with _initialization_lock:
+        if mainnet in _initialized_networks:
+            return
+        if not _config_loaded:
             try:
                 _load_config()
             except _ConfigError:
                 raise _ClientLibraryError('error loading config')
-            environment = 'mainnet' if mainnet else 'testnet'
-            protocol_version = _semantic_version.Version(
-                _config['protocol'][environment])
-            if not _is_supported_protocol_version(protocol_version):
-                raise _ClientLibraryError(
-                    'unsupported Pantos protocol version',
-                    protocol_version=protocol_version)
-            _initialized.value = True
+            _config_loaded = True
+        check_protocol_version(mainnet)
+        _initialized_networks = _initialized_networks | {mainnet}
+
+
+def check_protocol_version(mainnet: bool) -> None:
+    """Check if the configured Pantos protocol version of a network is
+    supported by the client library.
+
+    Parameters
+    ----------
+    mainnet : bool
+        If True, the mainnet protocol version is checked. Otherwise,
+        the testnet protocol version is checked.
+
+    Raises
+    ------
+    ClientLibraryError
+        If the protocol version is not supported.
+
+    """
+    environment = 'mainnet' if mainnet else 'testnet'
+    protocol_version = _semantic_version.Version(
+        _config['protocol'][environment])
+    if not _is_supported_protocol_version(protocol_version):
+        raise _ClientLibraryError('unsupported Pantos protocol version',
+                                  protocol_version=protocol_version)
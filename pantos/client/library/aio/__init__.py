@@ -0,0 +1,4 @@
+"""Package for the Pantos client library's asynchronous (asyncio) API.
+
+"""
+from pantos.client.library.aio.api import *  # noqa: F401, F403
@@ -0,0 +1,555 @@
+"""Module for asynchronous blockchain clients. They are the asyncio
+counterparts of the blockchain clients in the
+pantos.client.library.blockchains package and communicate with the
+blockchain nodes via non-blocking JSON-RPC requests.
+
+"""
+import abc
+import asyncio
+import collections
+import threading
+import time
+import typing
+import urllib.parse
+
+import aiohttp
+import web3
+import web3.contract
+import web3.contract.async_contract
+import web3.middleware
+import web3.types
+from pantos.common.blockchains.base import Blockchain
+from pantos.common.blockchains.base import VersionedContractAbi
+from pantos.common.blockchains.enums import ContractAbi
+from pantos.common.types import AccountId
+from pantos.common.types import BlockchainAddress
+from pantos.common.types import PrivateKey
+
+from pantos.client.library.blockchains import BlockchainClient
+from pantos.client.library.blockchains import get_blockchain_client
+from pantos.client.library.blockchains.ethereum import EthereumClient
+from pantos.client.library.context import get_client_context
+from pantos.client.library.exceptions import ClientLibraryError
+from pantos.client.library.metrics import get_metrics_registry
+from pantos.client.library.metrics import record_cache_access
+
+_TOKEN_CONTRACTS_CACHE_SIZE = 256
+"""Maximum number of token contract instances cached per asynchronous
+client."""
+
+
+class AsyncBlockchainClient(abc.ABC):
+    """Base class for all asynchronous blockchain clients. An
+    asynchronous blockchain client wraps a synchronous blockchain client
+    and shares its configuration, protocol version, and errors.
+
+    """
+    def __init__(self, blockchain_client: BlockchainClient):
+        """Construct an asynchronous blockchain client instance.
+
+        Parameters
+        ----------
+        blockchain_client : BlockchainClient
+            The synchronous blockchain client to wrap.
+
+        """
+        self._blockchain_client = blockchain_client
+
+    def get_blockchain(self) -> Blockchain:
+        """Get the blockchain the client is implemented for.
+
+        Returns
+        -------
+        Blockchain
+            The supported blockchain.
+
+        """
+        return self._blockchain_client.get_blockchain()
+
+    def is_valid_recipient_address(self, recipient_address: str) -> bool:
+        """Determine if an address string is a valid recipient address
+        on the blockchain.
+
+        See Also
+        --------
+        BlockchainClient.is_valid_recipient_address
+
+        """
+        return self._blockchain_client.is_valid_recipient_address(
+            recipient_address)
+
+    async def decrypt_private_key(self, keystore: str,
+                                  password: str) -> PrivateKey:
+        """Decrypt the private key from a password-encrypted keystore.
+        Since the key derivation is CPU-bound, it is executed in a
+        separate thread.
+
+        See Also
+        --------
+        BlockchainClient.decrypt_private_key
+
+        """
+        return await asyncio.to_thread(
+            self._blockchain_client.decrypt_private_key, keystore, password)
+
+    @abc.abstractmethod
+    async def compute_transfer_signature(
+            self, request: BlockchainClient.ComputeTransferSignatureRequest) \
+            -> BlockchainClient.ComputeTransferSignatureResponse:
+        """Compute the sender's signature for a single-chain token
+        transfer.
+
+        See Also
+        --------
+        BlockchainClient.compute_transfer_signature
+
+        """
+        pass  # pragma: no cover
+
+    @abc.abstractmethod
+    async def compute_transfer_from_signature(
+            self,
+            request: BlockchainClient.ComputeTransferFromSignatureRequest) \
+            -> BlockchainClient.ComputeTransferFromSignatureResponse:
+        """Compute the sender's signature for a cross-chain token
+        transfer.
+
+        See Also
+        --------
+        BlockchainClient.compute_transfer_from_signature
+
+        """
+        pass  # pragma: no cover
+
+    @abc.abstractmethod
+    async def read_external_token_address(
+            self, token_address: BlockchainAddress,
+            destination_blockchain: Blockchain) -> BlockchainAddress:
+        """Read an external token address that is registered at the
+        Pantos Hub on the blockchain.
+
+        See Also
+        --------
+        BlockchainClient.read_external_token_address
+
+        """
+        pass  # pragma: no cover
+
+    @abc.abstractmethod
+    async def read_service_node_addresses(self) -> list[BlockchainAddress]:
+        """Read the blockchain addresses of the active service nodes
+        registered at the Pantos Hub on the blockchain.
+
+        See Also
+        --------
+        BlockchainClient.read_service_node_addresses
+
+        """
+        pass  # pragma: no cover
+
+    @abc.abstractmethod
+    async def read_service_node_url(
+            self, service_node_address: BlockchainAddress) -> str:
+        """Read a service node's URL that is registered at the Pantos
+        Hub on the blockchain.
+
+        See Also
+        --------
+        BlockchainClient.read_service_node_url
+
+        """
+        pass  # pragma: no cover
+
+    @abc.abstractmethod
+    async def read_destination_transfer(
+            self, request: BlockchainClient.DestinationTransferRequest) \
+            -> BlockchainClient.DestinationTransferResponse:
+        """Read a token transfer on the destination blockchain.
+
+        See Also
+        --------
+        BlockchainClient.read_destination_transfer
+
+        """
+        pass  # pragma: no cover
+
+    @abc.abstractmethod
+    async def read_token_balance(self, token_address: BlockchainAddress,
+                                 account_id: AccountId) -> int:
+        """Read a blockchain account's balance of a Pantos-compatible
+        token.
+
+        See Also
+        --------
+        BlockchainClient.read_token_balance
+
+        """
+        pass  # pragma: no cover
+
+    @abc.abstractmethod
+    async def read_token_decimals(self,
+                                  token_address: BlockchainAddress) -> int:
+        """Read the number of decimals of a Pantos-compatible token.
+
+        See Also
+        --------
+        BlockchainClient.read_token_decimals
+
+        """
+        pass  # pragma: no cover
+
+
+class AsyncEthereumClient(AsyncBlockchainClient):
+    """Asynchronous client for Ethereum-compatible blockchains.
+
+    """
+    def __init__(self, blockchain_client: EthereumClient):
+        # Docstring inherited
+        super().__init__(blockchain_client)
+        self.__ethereum_client = blockchain_client
+        self.__node_connections: dict[str, web3.AsyncWeb3] = {}
+        self.__hub_contracts: dict[web3.AsyncWeb3,
+                                   web3.contract.AsyncContract] = {}
+        self.__token_contracts: collections.OrderedDict[
+            tuple[web3.AsyncWeb3, BlockchainAddress],
+            web3.contract.AsyncContract] = collections.OrderedDict()
+        self.__contracts_lock = threading.Lock()
+
+    async def compute_transfer_signature(
+            self, request: BlockchainClient.ComputeTransferSignatureRequest) \
+            -> BlockchainClient.ComputeTransferSignatureResponse:
+        # Docstring inherited
+        try:
+            sender_address = self.__ethereum_client.\
+                _account_id_to_account_address(request.sender_private_key)
+            sender_nonce = await self.__generate_sender_nonce(sender_address)
+            signature = self.__ethereum_client._sign_transfer(
+                request, sender_address, sender_nonce)
+            return BlockchainClient.ComputeTransferSignatureResponse(
+                sender_address, sender_nonce, signature)
+        except Exception:
+            raise self.__create_error(
+                'unable to compute a single-chain transfer signature',
+                request=request)
+
+    async def compute_transfer_from_signature(
+            self,
+            request: BlockchainClient.ComputeTransferFromSignatureRequest) \
+            -> BlockchainClient.ComputeTransferFromSignatureResponse:
+        # Docstring inherited
+        try:
+            sender_address = self.__ethereum_client.\
+                _account_id_to_account_address(request.sender_private_key)
+            sender_nonce = await self.__generate_sender_nonce(sender_address)
+            signature = self.__ethereum_client._sign_transfer_from(
+                request, sender_address, sender_nonce)
+            return BlockchainClient.ComputeTransferFromSignatureResponse(
+                sender_address, sender_nonce, signature)
+        except Exception:
+            raise self.__create_error(
+                'unable to compute a cross-chain transfer signature',
+                request=request)
+
+    async def read_external_token_address(
+            self, token_address: BlockchainAddress,
+            destination_blockchain: Blockchain) -> BlockchainAddress:
+        # Docstring inherited
+        try:
+            external_token_record = await self.__call_hub(
+                'getExternalTokenRecord', token_address,
+                destination_blockchain.value)
+            assert len(external_token_record) == 2
+            if not external_token_record[0]:
+                raise self.__create_error(
+                    'external token is not active',
+                    token_address=token_address,
+                    destination_blockchain=destination_blockchain)
+            external_token_address = external_token_record[1]
+            assert isinstance(external_token_address, str)
+            return BlockchainAddress(external_token_address)
+        except ClientLibraryError:
+            raise
+        except Exception:
+            raise self.__create_error(
+                'unable to read an external token address',
+                token_address=token_address,
+                destination_blockchain=destination_blockchain)
+
+    async def read_service_node_addresses(self) -> list[BlockchainAddress]:
+        # Docstring inherited
+        try:
+            service_node_addresses = await self.__call_hub('getServiceNodes')
+            return [
+                BlockchainAddress(service_node_address)
+                for service_node_address in sorted(service_node_addresses)
+            ]
+        except Exception:
+            raise self.__create_error(
+                'unable to read the active service node addresses')
+
+    async def read_service_node_url(
+            self, service_node_address: BlockchainAddress) -> str:
+        # Docstring inherited
+        try:
+            service_node_record = await self.__call_hub(
+                'getServiceNodeRecord', service_node_address)
+            assert len(service_node_record) == 5
+            if not service_node_record[0]:
+                raise self.__create_error(
+                    'service node is not active',
+                    service_node_address=service_node_address)
+            service_node_url = service_node_record[1]
+            assert isinstance(service_node_url, str)
+            return service_node_url
+        except ClientLibraryError:
+            raise
+        except Exception:
+            raise self.__create_error(
+                'unable to read a service node URL',
+                service_node_address=service_node_address)
+
+    async def read_destination_transfer(
+            self, request: BlockchainClient.DestinationTransferRequest) \
+            -> BlockchainClient.DestinationTransferResponse:
+        # Docstring inherited
+        try:
+            # The sweep over the event logs is delegated to the
+            # synchronous client, so that it shares the destination
+            # transfer index and the source transaction timestamp
+            # bound
+            return await asyncio.to_thread(
+                self.__ethereum_client.read_destination_transfer, request)
+        except ClientLibraryError:
+            raise
+        except Exception:
+            raise self.__create_error('unable to read a destination transfer',
+                                      request=request)
+
+    async def read_token_balance(self, token_address: BlockchainAddress,
+                                 account_id: AccountId) -> int:
+        # Docstring inherited
+        try:
+            account_address = self.__ethereum_client.\
+                _account_id_to_account_address(account_id)
+            return await self.__call_token(token_address, 'balanceOf',
+                                           account_address)
+        except Exception:
+            raise self.__create_error(
+                'unable to read the token balance of a blockchain account',
+                token_address=token_address, account_id=account_id)
+
+    async def read_token_decimals(self,
+                                  token_address: BlockchainAddress) -> int:
+        # Docstring inherited
+        try:
+            return await self.__call_token(token_address, 'decimals')
+        except Exception:
+            raise self.__create_error(
+                'unable to read the number of decimals of a token',
+                token_address=token_address)
+
+    async def __generate_sender_nonce(
+            self, sender_address: BlockchainAddress) -> int:
+        # The nonces are taken from the synchronous client's pool, so
+        # that they are issued only once within the process. Only if
+        # the pool is empty, new nonces are validated in a separate
+        # thread.
+        sender_nonce = self.__ethereum_client._take_sender_nonce(
+            sender_address)
+        if sender_nonce is None:
+            sender_nonce = await asyncio.to_thread(
+                self.__ethereum_client._generate_sender_nonce, sender_address)
+        return sender_nonce
+
+    async def __call_hub(self, function_name: str, *args:
+                         typing.Any) -> typing.Any:
+        return await self.__call_with_fallback(
+            lambda w3: self.__get_contract_function(
+                self.__get_hub_contract(w3), function_name)(*args).call())
+
+    async def __call_token(self, token_address: BlockchainAddress,
+                           function_name: str, *args:
+                           typing.Any) -> typing.Any:
+        return await self.__call_with_fallback(
+            lambda w3: self.__get_contract_function(
+                self.__get_token_contract(w3, token_address), function_name)
+            (*args).call())
+
+    async def __call_with_fallback(
+            self, function: typing.Callable[[web3.AsyncWeb3],
+                                            typing.Awaitable[typing.Any]]) \
+            -> typing.Any:
+        blockchain_node_urls = (
+            [self.__get_config()['provider']] +
+            self.__get_config().get('fallback_providers', []))
+        for blockchain_node_url in blockchain_node_urls[:-1]:
+            try:
+                return await function(
+                    self.__get_node_connection(blockchain_node_url))
+            except (aiohttp.ClientError, TimeoutError):
+                # Only connection errors are retried with the next node
+                continue
+        return await function(
+            self.__get_node_connection(blockchain_node_urls[-1]))
+
+    def __get_hub_contract(self,
+                           w3: web3.AsyncWeb3) -> web3.contract.AsyncContract:
+        # The contract instances are cached per node connection, so
+        # that the contract ABI is loaded only once
+        with self.__contracts_lock:
+            hub_contract = self.__hub_contracts.get(w3)
+            if hub_contract is None:
+                hub_contract = w3.eth.contract(
+                    address=self.__get_config()['hub'],
+                    abi=self.__load_contract_abi(ContractAbi.PANTOS_HUB))
+                self.__hub_contracts[w3] = hub_contract
+            return hub_contract
+
+    def __get_token_contract(
+            self, w3: web3.AsyncWeb3,
+            token_address: BlockchainAddress) -> web3.contract.AsyncContract:
+        key = (w3, token_address)
+        with self.__contracts_lock:
+            token_contract = self.__token_contracts.get(key)
+            record_cache_access('token_contracts', token_contract is not None)
+            if token_contract is None:
+                token_contract = w3.eth.contract(
+                    address=typing.cast(web3.types.ChecksumAddress,
+                                        token_address),
+                    abi=self.__load_contract_abi(ContractAbi.PANTOS_TOKEN))
+                self.__token_contracts[key] = token_contract
+                if len(self.__token_contracts) > _TOKEN_CONTRACTS_CACHE_SIZE:
+                    self.__token_contracts.popitem(last=False)
+            else:
+                self.__token_contracts.move_to_end(key)
+            return token_contract
+
+    def __create_error(self, message: str,
+                       **kwargs: typing.Any) -> ClientLibraryError:
+        return self.__ethereum_client._create_error(message, **kwargs)
+
+    def __get_config(self) -> dict[str, typing.Any]:
+        return self.__ethereum_client._get_config()
+
+    def __get_contract_function(
+            self, contract: web3.contract.AsyncContract, function_name: str) \
+            -> web3.contract.async_contract.AsyncContractFunction:
+        return typing.cast(web3.contract.async_contract.AsyncContractFunction,
+                           contract.functions[function_name])
+
+    def __get_node_connection(self,
+                              blockchain_node_url: str) -> web3.AsyncWeb3:
+        w3 = self.__node_connections.get(blockchain_node_url)
+        if w3 is None:
+            w3 = web3.AsyncWeb3(web3.AsyncHTTPProvider(blockchain_node_url))
+            w3.middleware_onion.inject(
+                web3.middleware.async_geth_poa_middleware, layer=0)
+            w3.middleware_onion.add(
+                self.__create_rpc_metrics_middleware(blockchain_node_url))
+            self.__node_connections[blockchain_node_url] = w3
+        return w3
+
+    def __create_rpc_metrics_middleware(
+            self, blockchain_node_url: str) -> typing.Callable:
+        # Asynchronous web3 middleware that records each JSON-RPC
+        # request to the node in the metrics registry (if metrics are
+        # enabled)
+        blockchain = self.get_blockchain().name.lower()
+        # The host (and port) only, without any user credentials
+        provider = urllib.parse.urlsplit(
+            blockchain_node_url).netloc.rpartition('@')[2]
+
+        async def middleware(make_request: typing.Callable,
+                             _: web3.AsyncWeb3) -> typing.Callable:
+            async def record_rpc_request(method: str,
+                                         params: typing.Any) -> typing.Any:
+                metrics_registry = get_metrics_registry()
+                if metrics_registry is None:
+                    return await make_request(method, params)
+                start_time = time.perf_counter()
+                succeeded = False
+                try:
+                    response = await make_request(method, params)
+                    succeeded = 'error' not in response
+                    return response
+                finally:
+                    metrics_registry.observe_rpc_request(
+                        blockchain, provider, method,
+                        time.perf_counter() - start_time, succeeded)
+
+            return record_rpc_request
+
+        return middleware
+
+    def __load_contract_abi(self,
+                            contract_abi: ContractAbi) -> list[typing.Any]:
+        return self.__ethereum_client._get_utilities().load_contract_abi(
+            VersionedContractAbi(contract_abi,
+                                 self.__ethereum_client.protocol_version))
+
+
+class _AsyncBlockchainClientRegistry:
+    """Thread-safe registry of asynchronous blockchain-specific client
+    objects. Each asynchronous client wraps exactly one synchronous
+    client, so a registry must not outlive the synchronous clients of
+    its client context.
+
+    """
+    def __init__(self):
+        self.__async_blockchain_clients: dict[BlockchainClient,
+                                              AsyncBlockchainClient] = {}
+        self.__lock = threading.Lock()
+
+    def get(self, blockchain: Blockchain) -> AsyncBlockchainClient:
+        blockchain_client = get_blockchain_client(blockchain)
+        async_blockchain_client = self.__async_blockchain_clients.get(
+            blockchain_client)
+        if async_blockchain_client is not None:
+            return async_blockchain_client
+        if not isinstance(blockchain_client, EthereumClient):
+            raise ClientLibraryError('no asynchronous client available',
+                                     blockchain=blockchain)
+        with self.__lock:
+            async_blockchain_client = self.__async_blockchain_clients.get(
+                blockchain_client)
+            if async_blockchain_client is None:
+                async_blockchain_client = AsyncEthereumClient(
+                    blockchain_client)
+                self.__async_blockchain_clients[blockchain_client] = \
+                    async_blockchain_client
+            return async_blockchain_client
+
+
+_blockchain_clients = _AsyncBlockchainClientRegistry()
+"""Process-wide asynchronous blockchain-specific client objects (wrapping
+the process-wide synchronous client objects)."""
+
+
+def get_async_blockchain_client(blockchain: Blockchain) \
+        -> AsyncBlockchainClient:
+    """Factory for asynchronous blockchain-specific client objects.
+
+    Parameters
+    ----------
+    blockchain : Blockchain
+        The blockchain to get the asynchronous client instance for.
+
+    Returns
+    -------
+    AsyncBlockchainClient
+        An asynchronous blockchain client instance for the specified
+        blockchain (owned by the active client context, if any).
+
+    Raises
+    ------
+    ClientLibraryError
+        If there is no asynchronous client for the specified
+        blockchain.
+
+    """
+    client_context = get_client_context()
+    async_blockchain_clients = (_blockchain_clients if client_context is None
+                                else client_context.get_resource(
+                                    'async_blockchain_clients',
+                                    _AsyncBlockchainClientRegistry))
+    return async_blockchain_clients.get(blockchain)
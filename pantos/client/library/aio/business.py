@@ -0,0 +1,746 @@
+"""Asynchronous business logic. The interactors of this module are the
+asyncio counterparts of the interactors in the
+pantos.client.library.business package. They accept the same request
+data and raise the same errors.
+
+"""
+import asyncio
+import decimal
+import functools
+import math
+import time
+import typing
+import uuid
+
+import aiohttp
+from pantos.common.blockchains.base import Blockchain
+from pantos.common.entities import ServiceNodeBid
+from pantos.common.entities import ServiceNodeTransferStatus
+from pantos.common.entities import \
+    TokenDeploymentRequest as TokenDeploymentSubmissionRequest
+from pantos.common.servicenodes import ServiceNodeClient
+from pantos.common.types import Amount
+from pantos.common.types import BlockchainAddress
+from pantos.common.types import TokenId
+from pantos.common.types import TokenSymbol
+
+from pantos.client.library.aio.blockchains import AsyncBlockchainClient
+from pantos.client.library.aio.blockchains import get_async_blockchain_client
+from pantos.client.library.aio.servicenodes import AsyncServiceNodeClient
+from pantos.client.library.aio.sessions import get_async_http_session
+from pantos.client.library.blockchains import BlockchainClient
+from pantos.client.library.blockchains import BlockchainClientError
+from pantos.client.library.blockchains import get_blockchain_client
+from pantos.client.library.blockchains.base import UnknownTransferError
+from pantos.client.library.business.base import Interactor
+from pantos.client.library.business.bids import BidInteractor
+from pantos.client.library.business.bids import BidInteractorError
+from pantos.client.library.business.deployments import \
+    TokenDeploymentInteractor
+from pantos.client.library.business.deployments import \
+    TokenDeploymentInteractorError
+from pantos.client.library.business.ranking import LowestFeePolicy
+from pantos.client.library.business.ranking import rank_service_node_bids
+from pantos.client.library.business.tokens import TokenInteractor
+from pantos.client.library.business.tokens import TokenInteractorError
+from pantos.client.library.business.tokens import get_token_decimals_cache
+from pantos.client.library.business.transfers import TransferInteractor
+from pantos.client.library.business.transfers import TransferInteractorError
+from pantos.client.library.configuration import config
+from pantos.client.library.configuration import get_blockchain_config
+from pantos.client.library.constants import TOKEN_SYMBOL_PAN
+from pantos.client.library.entitites import DestinationTransferStatus
+from pantos.client.library.entitites import ServiceNodeTaskInfo
+from pantos.client.library.entitites import TokenTransferStatus
+from pantos.client.library.metrics import measure_http_request
+
+_DEPLOYMENT_RESOURCE = 'deployment'
+
+_PAYMENT_RESOURCE = 'payment'
+
+_CHEAPEST_BID_RESOURCE = 'bids/cheapest'
+
+
+class AsyncTokenInteractor(Interactor):
+    """Asynchronous interactor for handling Pantos-compatible tokens.
+
+    See Also
+    --------
+    TokenInteractor
+
+    """
+    async def convert_amount_to_main_unit(
+            self, blockchain: Blockchain, token_id: TokenId,
+            amount_subunit: int) -> decimal.Decimal:
+        """Convert an amount from a token's smallest subunit to its main
+        unit.
+
+        See Also
+        --------
+        TokenInteractor.convert_amount_to_main_unit
+
+        """
+        try:
+            if amount_subunit < 0:
+                raise TokenInteractorError('amount must be non-negative',
+                                           amount_subunit=amount_subunit)
+            if amount_subunit == 0:
+                return decimal.Decimal(0)
+            token_decimals = await self.__read_token_decimals(
+                blockchain, token_id)
+            return decimal.Decimal(amount_subunit) / (10**token_decimals)
+        except TokenInteractorError:
+            raise
+        except Exception:
+            raise TokenInteractorError(
+                'unable to convert an amount to a token\'s main unit',
+                blockchain=blockchain, token_id=token_id,
+                amount_subunit=amount_subunit)
+
+    async def convert_amount_to_subunit(
+            self, blockchain: Blockchain, token_id: TokenId,
+            amount_main_unit: decimal.Decimal) -> int:
+        """Convert an amount from a token's main unit to its smallest
+        subunit.
+
+        See Also
+        --------
+        TokenInteractor.convert_amount_to_subunit
+
+        """
+        try:
+            if amount_main_unit < 0:
+                raise TokenInteractorError('amount must be non-negative',
+                                           amount_main_unit=amount_main_unit)
+            if amount_main_unit == 0:
+                return 0
+            token_decimals = await self.__read_token_decimals(
+                blockchain, token_id)
+            amount_subunit = amount_main_unit * (10**token_decimals)
+            amount_subunit_integer = int(amount_subunit)
+            if (amount_subunit - amount_subunit_integer) != 0:
+                raise TokenInteractorError(
+                    'amount must not have more decimals than token',
+                    amount_main_unit=amount_main_unit,
+                    token_decimals=token_decimals)
+            return amount_subunit_integer
+        except TokenInteractorError:
+            raise
+        except Exception:
+            raise TokenInteractorError(
+                'unable to convert an amount to a token\'s smallest subunit',
+                blockchain=blockchain, token_id=token_id,
+                amount_main_unit=amount_main_unit)
+
+    async def find_token_addresses(
+            self, source_blockchain: Blockchain,
+            destination_blockchain: Blockchain, source_token_id: TokenId) \
+            -> TokenInteractor.FindTokenAddressesResponse:
+        """Find the blockchain addresses of a token on a source and
+        destination blockchain.
+
+        See Also
+        --------
+        TokenInteractor.find_token_addresses
+
+        """
+        try:
+            source_token_address = self.__token_id_to_token_address(
+                source_blockchain, source_token_id)
+            if source_blockchain is destination_blockchain:
+                destination_token_address = source_token_address
+            elif isinstance(source_token_id, TokenSymbol):
+                destination_token_address = \
+                    TokenInteractor().find_token_address(
+                        destination_blockchain, source_token_id)
+            else:
+                source_blockchain_client = get_async_blockchain_client(
+                    source_blockchain)
+                destination_token_address = \
+                    await source_blockchain_client.read_external_token_address(
+                        source_token_address, destination_blockchain)
+            return TokenInteractor.FindTokenAddressesResponse(
+                source_token_address, destination_token_address)
+        except TokenInteractorError:
+            raise
+        except Exception:
+            raise TokenInteractorError(
+                'unable to search for token addresses',
+                source_blockchain=source_blockchain,
+                destination_blockchain=destination_blockchain,
+                source_token_id=source_token_id)
+
+    async def retrieve_token_balance(
+            self,
+            request: TokenInteractor.RetrieveTokenBalanceRequest) -> Amount:
+        """Retrieve the token balance of a blockchain account.
+
+        See Also
+        --------
+        TokenInteractor.retrieve_token_balance
+
+        """
+        try:
+            token_address = self.__token_id_to_token_address(
+                request.blockchain, request.token_id)
+            blockchain_client = get_async_blockchain_client(request.blockchain)
+            token_balance = await blockchain_client.read_token_balance(
+                token_address, request.account_id)
+            assert token_balance >= 0
+            return (token_balance if not request.return_in_main_unit else
+                    await self.convert_amount_to_main_unit(
+                        request.blockchain, token_address, token_balance))
+        except TokenInteractorError:
+            raise
+        except Exception:
+            raise TokenInteractorError(
+                'unable to retrieve the token balance of a blockchain account',
+                request=request)
+
+    async def __read_token_decimals(self, blockchain: Blockchain,
+                                    token_id: TokenId) -> int:
+        token_address = self.__token_id_to_token_address(blockchain, token_id)
+        token_decimals = get_token_decimals_cache().get(
+            blockchain, token_address)
+        if token_decimals is None:
+            blockchain_client = get_async_blockchain_client(blockchain)
+            token_decimals = await blockchain_client.read_token_decimals(
+                token_address)
+            assert token_decimals >= 0
+            get_token_decimals_cache().set(blockchain, token_address,
+                                           token_decimals)
+        return token_decimals
+
+    def __token_id_to_token_address(self, blockchain: Blockchain,
+                                    token_id: TokenId) -> BlockchainAddress:
+        if isinstance(token_id, BlockchainAddress):
+            return token_id
+        return TokenInteractor().find_token_address(blockchain, token_id)
+
+
+class AsyncBidInteractor(Interactor):
+    """Asynchronous interactor for handling service node bids.
+
+    See Also
+    --------
+    BidInteractor
+
+    """
+    async def find_cheapest_service_node_bid(
+            self, source_blockchain: Blockchain,
+            destination_blockchain: Blockchain) \
+            -> BidInteractor.CheapestServiceNodeBid:
+        """Find the cheapest service node bid.
+
+        See Also
+        --------
+        BidInteractor.find_cheapest_service_node_bid
+
+        """
+        try:
+            all_service_node_bids = await self.retrieve_service_node_bids(
+                source_blockchain, destination_blockchain, False)
+            bid_pairs = rank_service_node_bids(all_service_node_bids,
+                                               LowestFeePolicy())
+            if len(bid_pairs) == 0:
+                raise BidInteractorError('no active service node bids found')
+            service_node_address, service_node_bid = bid_pairs[0]
+            return BidInteractor.CheapestServiceNodeBid(
+                service_node_address, service_node_bid)
+        except BidInteractorError:
+            raise
+        except Exception:
+            raise BidInteractorError(
+                'unable to search for the cheapest service node bid',
+                source_blockchain=source_blockchain,
+                destination_blockchain=destination_blockchain)
+
+    async def find_acceptable_service_node_bid(
+            self, source_blockchain: Blockchain,
+            destination_blockchain: Blockchain, max_fee: Amount,
+            timeout: typing.Optional[float] = None) \
+            -> BidInteractor.AcceptableServiceNodeBid:
+        """Find the first service node bid with a fee not exceeding a
+        maximum fee.
+
+        See Also
+        --------
+        BidInteractor.find_acceptable_service_node_bid
+
+        """
+        try:
+            if not isinstance(max_fee, int):
+                max_fee = await AsyncTokenInteractor(
+                ).convert_amount_to_subunit(source_blockchain,
+                                            TOKEN_SYMBOL_PAN, max_fee)
+            stream = self.stream_service_node_bids(source_blockchain,
+                                                   destination_blockchain,
+                                                   False, timeout)
+            try:
+                async for service_node_address, service_node_bids in stream:
+                    acceptable_bids = [
+                        service_node_bid
+                        for service_node_bid in service_node_bids
+                        if service_node_bid.fee <= max_fee
+                    ]
+                    if len(acceptable_bids) > 0:
+                        service_node_bid = min(
+                            acceptable_bids, key=lambda bid:
+                            (bid.fee, bid.execution_time))
+                        return BidInteractor.AcceptableServiceNodeBid(
+                            service_node_address, service_node_bid)
+            finally:
+                await stream.aclose()
+            raise BidInteractorError(
+                'no acceptable service node bid found',
+                source_blockchain=source_blockchain,
+                destination_blockchain=destination_blockchain, max_fee=max_fee,
+                timeout=timeout)
+        except BidInteractorError:
+            raise
+        except Exception:
+            raise BidInteractorError(
+                'unable to search for an acceptable service node bid',
+                source_blockchain=source_blockchain,
+                destination_blockchain=destination_blockchain, max_fee=max_fee,
+                timeout=timeout)
+
+    async def stream_service_node_bids(
+            self, source_blockchain: Blockchain,
+            destination_blockchain: Blockchain, return_fee_in_main_unit: bool,
+            timeout: typing.Optional[float] = None) \
+            -> typing.AsyncGenerator[typing.Tuple[
+                BlockchainAddress, typing.List[ServiceNodeBid]], None]:
+        """Stream the service node bids for token transfers from a
+        specified source blockchain to a specified destination
+        blockchain. The bids of a service node are yielded as soon as
+        the service node has answered.
+
+        See Also
+        --------
+        BidInteractor.stream_service_node_bids
+
+        """
+        try:
+            source_blockchain_client = get_async_blockchain_client(
+                source_blockchain)
+            service_node_addresses = \
+                await source_blockchain_client.read_service_node_addresses()
+        except Exception:
+            raise BidInteractorError(
+                'unable to retrieve the service node bids',
+                source_blockchain=source_blockchain,
+                destination_blockchain=destination_blockchain)
+        tasks = [
+            asyncio.ensure_future(
+                self.__retrieve_bid_pair_from_service_node(
+                    source_blockchain_client, destination_blockchain,
+                    service_node_address, return_fee_in_main_unit))
+            for service_node_address in service_node_addresses
+        ]
+        try:
+            for task in asyncio.as_completed(tasks, timeout=timeout):
+                service_node_address, service_node_bids = await task
+                if service_node_bids is not None:
+                    yield service_node_address, service_node_bids
+        except TimeoutError:
+            return
+        except Exception:
+            raise BidInteractorError(
+                'unable to retrieve the service node bids',
+                source_blockchain=source_blockchain,
+                destination_blockchain=destination_blockchain)
+        finally:
+            # Do not wait for the service nodes that have not answered
+            for task in tasks:
+                task.cancel()
+
+    async def retrieve_service_node_bids(
+            self, source_blockchain: Blockchain,
+            destination_blockchain: Blockchain,
+            return_fee_in_main_unit: bool) \
+            -> typing.Dict[BlockchainAddress, typing.List[ServiceNodeBid]]:
+        """Retrieve the service node bids for token transfers from a
+        specified source blockchain to a specified destination
+        blockchain. All registered service nodes are queried
+        concurrently.
+
+        See Also
+        --------
+        BidInteractor.retrieve_service_node_bids
+
+        """
+        try:
+            source_blockchain_client = get_async_blockchain_client(
+                source_blockchain)
+            service_node_addresses = \
+                await source_blockchain_client.read_service_node_addresses()
+            all_service_node_bids = await asyncio.gather(
+                *(self.__retrieve_bid_from_service_node(
+                    source_blockchain_client, destination_blockchain,
+                    service_node_address, return_fee_in_main_unit)
+                  for service_node_address in service_node_addresses))
+            return {
+                service_node_address: service_node_bids
+                for service_node_address, service_node_bids in zip(
+                    service_node_addresses, all_service_node_bids)
+                if service_node_bids is not None
+            }
+        except Exception:
+            raise BidInteractorError(
+                'unable to retrieve the service node bids',
+                source_blockchain=source_blockchain,
+                destination_blockchain=destination_blockchain)
+
+    async def __retrieve_bid_pair_from_service_node(
+            self, source_blockchain_client: AsyncBlockchainClient,
+            destination_blockchain: Blockchain,
+            service_node_address: BlockchainAddress,
+            return_fee_in_main_unit: bool) \
+            -> typing.Tuple[BlockchainAddress,
+                            typing.Optional[list[ServiceNodeBid]]]:
+        service_node_bids = await self.__retrieve_bid_from_service_node(
+            source_blockchain_client, destination_blockchain,
+            service_node_address, return_fee_in_main_unit)
+        return service_node_address, service_node_bids
+
+    async def __retrieve_bid_from_service_node(
+            self, source_blockchain_client: AsyncBlockchainClient,
+            destination_blockchain: Blockchain,
+            service_node_address: BlockchainAddress,
+            return_fee_in_main_unit: bool) \
+            -> typing.Optional[list[ServiceNodeBid]]:
+        service_node_url = await source_blockchain_client.\
+            read_service_node_url(service_node_address)
+        source_blockchain = source_blockchain_client.get_blockchain()
+        timeout = config['service_nodes']['timeout']
+        try:
+            service_node_bids = await AsyncServiceNodeClient().bids(
+                service_node_url, source_blockchain, destination_blockchain,
+                timeout)
+        except Exception:
+            return None
+        if not return_fee_in_main_unit:
+            return service_node_bids
+        token_interactor = AsyncTokenInteractor()
+        for service_node_bid in service_node_bids:
+            fee = service_node_bid.fee
+            assert isinstance(fee, int)
+            service_node_bid.fee = \
+                await token_interactor.convert_amount_to_main_unit(
+                    source_blockchain, TOKEN_SYMBOL_PAN, fee)
+        return service_node_bids
+
+
+class AsyncTransferInteractor(Interactor):
+    """Asynchronous interactor for handling Pantos token transfers.
+
+    See Also
+    --------
+    TransferInteractor
+
+    """
+    async def transfer_tokens(
+            self, request: TransferInteractor.TransferTokensRequest) \
+            -> ServiceNodeTaskInfo:
+        """Transfer tokens from a sender's account on a source
+        blockchain to a recipient's account on a (possibly different)
+        destination blockchain.
+
+        See Also
+        --------
+        TransferInteractor.transfer_tokens
+
+        """
+        try:
+            token_interactor = AsyncTokenInteractor()
+            find_token_addresses_response = \
+                await token_interactor.find_token_addresses(
+                    request.source_blockchain, request.destination_blockchain,
+                    request.source_token_id)
+            source_token_address = \
+                find_token_addresses_response.source_token_address
+            destination_token_address = \
+                find_token_addresses_response.destination_token_address
+            token_amount = (request.token_amount if isinstance(
+                request.token_amount,
+                int) else await token_interactor.convert_amount_to_subunit(
+                    request.source_blockchain, source_token_address,
+                    request.token_amount))
+            if request.service_node_bid is None:
+                cheapest_service_node_bid = \
+                    await AsyncBidInteractor().find_cheapest_service_node_bid(
+                        request.source_blockchain,
+                        request.destination_blockchain)
+                service_node_address = \
+                    cheapest_service_node_bid.service_node_address
+                service_node_bid = cheapest_service_node_bid.service_node_bid
+            else:
+                service_node_address, service_node_bid = \
+                    request.service_node_bid
+            valid_until = self.__compute_valid_until(request, service_node_bid)
+            source_blockchain_client = get_async_blockchain_client(
+                request.source_blockchain)
+            if not source_blockchain_client.is_valid_recipient_address(
+                    request.recipient_address):
+                raise TransferInteractorError(
+                    'invalid recipient address',
+                    recipient_address=request.recipient_address)
+            signature_response: typing.Union[
+                BlockchainClient.ComputeTransferSignatureResponse,
+                BlockchainClient.ComputeTransferFromSignatureResponse]
+            if request.source_blockchain is request.destination_blockchain:
+                # Single-chain token transfer
+                signature_response = \
+                    await source_blockchain_client.compute_transfer_signature(
+                        BlockchainClient.ComputeTransferSignatureRequest(
+                            request.sender_private_key,
+                            request.recipient_address, source_token_address,
+                            token_amount, service_node_address,
+                            service_node_bid, valid_until))
+            else:
+                # Cross-chain token transfer
+                signature_response = await source_blockchain_client.\
+                    compute_transfer_from_signature(
+                        BlockchainClient.ComputeTransferFromSignatureRequest(
+                            request.destination_blockchain,
+                            request.sender_private_key,
+                            request.recipient_address, source_token_address,
+                            destination_token_address, token_amount,
+                            service_node_address, service_node_bid,
+                            valid_until))
+            service_node_url = \
+                await source_blockchain_client.read_service_node_url(
+                    service_node_address)
+            submit_transfer_request = ServiceNodeClient.SubmitTransferRequest(
+                service_node_url, request.source_blockchain,
+                request.destination_blockchain,
+                signature_response.sender_address, request.recipient_address,
+                source_token_address, destination_token_address, token_amount,
+                service_node_bid, signature_response.sender_nonce, valid_until,
+                signature_response.signature)
+            service_node_task_id = \
+                await AsyncServiceNodeClient().submit_transfer(
+                    submit_transfer_request)
+            return ServiceNodeTaskInfo(service_node_task_id,
+                                       service_node_address)
+        except TransferInteractorError:
+            raise
+        except Exception:
+            raise TransferInteractorError('unable to execute a token transfer',
+                                          request=request)
+
+    async def get_token_transfer_status(
+            self, request: TransferInteractor.TokenTransferStatusRequest) \
+            -> TokenTransferStatus:
+        """Get the status of a token transfer.
+
+        See Also
+        --------
+        TransferInteractor.get_token_transfer_status
+
+        """
+        try:
+            service_node_url = await get_async_blockchain_client(
+                request.source_blockchain
+            ).read_service_node_url(request.service_node_address)
+            source_status = await AsyncServiceNodeClient().status(
+                service_node_url, request.service_node_task_id)
+            token_transfer_status = TokenTransferStatus(
+                destination_blockchain=source_status.destination_blockchain,
+                source_transfer_status=source_status.status,
+                destination_transfer_status=DestinationTransferStatus.UNKNOWN,
+                sender_address=source_status.sender_address,
+                recipient_address=source_status.recipient_address,
+                source_token_address=source_status.source_token_address,
+                destination_token_address=source_status.
+                destination_token_address, amount=source_status.token_amount)
+            if source_status.status is not ServiceNodeTransferStatus.CONFIRMED:
+                return token_transfer_status
+            token_transfer_status.source_transaction_id = \
+                source_status.transaction_id
+            token_transfer_status.source_transfer_id = \
+                source_status.transfer_id
+            destination_transfer_request = \
+                BlockchainClient.DestinationTransferRequest(
+                    request.source_blockchain, source_status.transaction_id,
+                    request.blocks_to_search,
+                    functools.partial(self.__read_source_transaction_timestamp,
+                                      request.source_blockchain,
+                                      source_status.transaction_id))
+            try:
+                destination_response = await get_async_blockchain_client(
+                    source_status.destination_blockchain
+                ).read_destination_transfer(destination_transfer_request)
+            except UnknownTransferError:
+                return token_transfer_status
+            confirmations = get_blockchain_config(
+                source_status.destination_blockchain)['confirmations']
+            token_transfer_status.destination_transfer_status = (
+                DestinationTransferStatus.SUBMITTED
+                if destination_response.latest_block_number -
+                destination_response.transaction_block_number < confirmations
+                else DestinationTransferStatus.CONFIRMED)
+            token_transfer_status.destination_transaction_id = \
+                destination_response.destination_transaction_id
+            token_transfer_status.destination_transfer_id = \
+                destination_response.destination_transfer_id
+            token_transfer_status.validator_nonce = \
+                destination_response.validator_nonce
+            token_transfer_status.signer_addresses = \
+                destination_response.signer_addresses
+            token_transfer_status.signatures = destination_response.signatures
+            return token_transfer_status
+        except Exception:
+            raise TransferInteractorError(
+                'unable to get token transfer status', request=request)
+
+    def __compute_valid_until(
+            self, request: TransferInteractor.TransferTokensRequest,
+            service_node_bid: ServiceNodeBid) -> int:
+        if request.valid_until_buffer < 0:
+            raise TransferInteractorError(
+                '"valid until" buffer must be non-negative',
+                valid_until_buffer=request.valid_until_buffer)
+        return (math.ceil(time.time()) + service_node_bid.execution_time +
+                request.valid_until_buffer)
+
+    def __read_source_transaction_timestamp(
+            self, source_blockchain: Blockchain,
+            source_transaction_id: str) -> typing.Optional[int]:
+        # Called by the destination blockchain client's worker thread
+        # only if the token transfer must be searched
+        try:
+            return get_blockchain_client(
+                source_blockchain).read_transaction_timestamp(
+                    source_transaction_id)
+        except BlockchainClientError:
+            # The destination transfer is then searched without a
+            # lower bound
+            return None
+
+
+class AsyncTokenDeploymentInteractor(Interactor):
+    """Asynchronous interactor for handling Pantos compatible token
+    deployments.
+
+    See Also
+    --------
+    TokenDeploymentInteractor
+
+    """
+    async def deploy_token(
+            self, request: TokenDeploymentInteractor.TokenDeploymentRequest) \
+            -> uuid.UUID:
+        """Deploy a Pantos compatible token.
+
+        See Also
+        --------
+        TokenDeploymentInteractor.deploy_token
+
+        """
+        if request.valid_until_buffer < 0:
+            raise TokenDeploymentInteractorError(
+                '"valid until" buffer must be non-negative',
+                valid_until_buffer=request.valid_until_buffer)
+        payment_blockchain = request.payment_blockchain
+        deployment_blockchain_ids = [
+            blockchain.value for blockchain in request.deployment_blockchains
+        ]
+        token_creator_url = config['token_creator']['url']
+        if not token_creator_url.endswith('/'):
+            token_creator_url += '/'
+        session = get_async_http_session()
+        cheapest_bid = await self.__request_token_creator(
+            session, 'GET', _CHEAPEST_BID_RESOURCE,
+            f'{token_creator_url}{_CHEAPEST_BID_RESOURCE}'
+            f'?payment_blockchain_id={payment_blockchain.value}')
+        service_node_bid = ServiceNodeBid(
+            source_blockchain=payment_blockchain,
+            destination_blockchain=payment_blockchain, fee=cheapest_bid['fee'],
+            execution_time=cheapest_bid['execution_time'],
+            valid_until=cheapest_bid['valid_until'],
+            signature=cheapest_bid['signature'])
+        valid_until = (math.ceil(time.time()) +
+                       service_node_bid.execution_time +
+                       request.valid_until_buffer)
+        payment = await self.__request_token_creator(
+            session, 'POST', _PAYMENT_RESOURCE,
+            f'{token_creator_url}{_PAYMENT_RESOURCE}', {
+                'payment_blockchain_id': payment_blockchain.value,
+                'deployment_blockchain_ids': deployment_blockchain_ids
+            })
+        deployment_fee = int(payment['fee']['amount'])
+        pan_token_address = get_blockchain_config(
+            payment_blockchain)['tokens'][TOKEN_SYMBOL_PAN]
+        blockchain_client = get_async_blockchain_client(payment_blockchain)
+        signature_response = \
+            await blockchain_client.compute_transfer_signature(
+                BlockchainClient.ComputeTransferSignatureRequest(
+                    request.payer_private_key,
+                    BlockchainAddress(payment['receiver_address']),
+                    pan_token_address, deployment_fee,
+                    cheapest_bid['service_node_address'],
+                    service_node_bid, valid_until))
+        deployment_request = TokenDeploymentSubmissionRequest(
+            deployment_blockchain_ids, request.token_name,
+            request.token_symbol, request.token_decimals,
+            request.token_pausable, request.token_burnable,
+            request.token_supply, payment_blockchain.value,
+            signature_response.sender_address, deployment_fee,
+            payment['signature'], payment['valid_until'], service_node_bid.fee,
+            service_node_bid.execution_time, service_node_bid.valid_until,
+            service_node_bid.signature, signature_response.sender_nonce,
+            valid_until, signature_response.signature)
+        deployment = await self.__request_token_creator(
+            session, 'POST', _DEPLOYMENT_RESOURCE,
+            f'{token_creator_url}{_DEPLOYMENT_RESOURCE}',
+            self.__create_deployment_payload(deployment_request))
+        try:
+            return uuid.UUID(deployment['task_id'])
+        except (KeyError, ValueError):
+            raise TokenDeploymentInteractorError(
+                'unable to submit a new deployment request',
+                extra=deployment_request)
+
+    async def __request_token_creator(
+            self, session: aiohttp.ClientSession, method: str, resource: str,
+            url: str, payload: typing.Optional[dict[str, typing.Any]] = None) \
+            -> dict[str, typing.Any]:
+        try:
+            with measure_http_request(url, resource):
+                async with session.request(method, url,
+                                           json=payload) as response:
+                    response.raise_for_status()
+                    return await response.json()
+        except (aiohttp.ClientError, ValueError):
+            raise TokenDeploymentInteractorError(
+                'unable to send a token creator request', url=url,
+                payload=payload)
+
+    def __create_deployment_payload(
+            self, request: TokenDeploymentSubmissionRequest) \
+            -> dict[str, typing.Any]:
+        return {
+            'deployment_blockchain_ids': request.deployment_blockchain_ids,
+            'token_name': request.token_name,
+            'token_symbol': request.token_symbol,
+            'token_decimals': request.token_decimals,
+            'token_pausable': request.token_pausable,
+            'token_burnable': request.token_burnable,
+            'token_supply': request.token_supply,
+            'payment_blockchain_id': request.payment_blockchain_id,
+            'payer_address': request.payer_address,
+            'deployment_fee': request.deployment_fee,
+            'deployment_fee_valid_until': request.deployment_fee_valid_until,
+            'deployment_fee_signature': request.deployment_fee_signature,
+            'bid': {
+                'fee': request.bid_fee,
+                'execution_time': request.bid_execution_time,
+                'valid_until': request.bid_valid_until,
+                'signature': request.bid_signature
+            },
+            'payment_nonce': request.payment_nonce,
+            'payment_valid_until': request.payment_valid_until,
+            'payment_signature': request.payment_signature
+        }
@@ -0,0 +1,206 @@
+"""Module for communicating with Pantos service nodes without blocking
+the asyncio event loop.
+
+"""
+import typing
+import uuid
+
+import aiohttp
+from pantos.common.blockchains.base import Blockchain
+from pantos.common.entities import ServiceNodeBid
+from pantos.common.servicenodes import ServiceNodeClient
+from pantos.common.servicenodes import ServiceNodeClientError
+
+from pantos.client.library.aio.sessions import get_async_http_session
+from pantos.client.library.metrics import measure_http_request
+from pantos.client.library.servicenodes import build_bids_url
+from pantos.client.library.servicenodes import build_status_url
+from pantos.client.library.servicenodes import build_transfer_url
+from pantos.client.library.servicenodes import create_service_node_bids
+from pantos.client.library.servicenodes import create_submit_transfer_payload
+from pantos.client.library.servicenodes import create_transfer_status_response
+
+_TRANSFER_RESOURCE = 'transfer'
+
+_STATUS_RESOURCE = 'status'
+
+_BID_RESOURCE = 'bids'
+
+
+class AsyncServiceNodeClient:
+    """Asynchronous client for communicating with Pantos service nodes.
+    It offers the same operations as
+    pantos.common.servicenodes.ServiceNodeClient and raises the same
+    errors.
+
+    """
+    def __init__(self,
+                 http_session: typing.Optional[aiohttp.ClientSession] = None):
+        """Construct an asynchronous service node client instance.
+
+        Parameters
+        ----------
+        http_session : aiohttp.ClientSession, optional
+            The HTTP session to send the requests over (default: the
+            shared HTTP session of the running event loop).
+
+        """
+        self.__http_session = http_session
+
+    async def submit_transfer(
+            self, request: ServiceNodeClient.SubmitTransferRequest,
+            timeout: typing.Optional[float] = None) -> uuid.UUID:
+        """Submit a new token transfer request to a Pantos service node.
+
+        Parameters
+        ----------
+        request : ServiceNodeClient.SubmitTransferRequest
+            The request data for a new token transfer.
+        timeout : float, optional
+            The total timeout of the HTTP request in seconds.
+
+        Returns
+        -------
+        uuid.UUID
+            The service node's task ID.
+
+        Raises
+        ------
+        ServiceNodeClientError
+            If the token transfer request cannot be submitted
+            successfully.
+
+        """
+        transfer_url = build_transfer_url(request.service_node_url)
+        response_message = None
+        try:
+            with measure_http_request(transfer_url, _TRANSFER_RESOURCE):
+                async with self.__get_http_session().post(
+                        transfer_url,
+                        json=create_submit_transfer_payload(request),
+                        timeout=self.__create_timeout(timeout)) as response:
+                    response_message = await self.__read_response_message(
+                        response)
+                    response.raise_for_status()
+                    task_id = (await response.json())['task_id']
+            return uuid.UUID(task_id)
+        except (aiohttp.ClientError, TimeoutError, KeyError, ValueError):
+            raise ServiceNodeClientError(
+                'unable to submit a new token transfer request',
+                request=request, transfer_url=transfer_url,
+                response_message=response_message)
+
+    async def bids(
+            self, service_node_url: str, source_blockchain: Blockchain,
+            destination_blockchain: Blockchain,
+            timeout: typing.Optional[float] = None) \
+            -> typing.List[ServiceNodeBid]:
+        """Retrieve the bids of the service node found at the given
+        service node URL.
+
+        Parameters
+        ----------
+        service_node_url : str
+            The URL of the service node.
+        source_blockchain : Blockchain
+            The source blockchain of the bids.
+        destination_blockchain : Blockchain
+            The destination blockchain of the bids.
+        timeout : float, optional
+            The total timeout of the HTTP request in seconds.
+
+        Returns
+        -------
+        list of ServiceNodeBid
+            The bids offered by the service node.
+
+        Raises
+        ------
+        ServiceNodeClientError
+            If the bids cannot be retrieved.
+
+        """
+        bids_url = build_bids_url(service_node_url, source_blockchain,
+                                  destination_blockchain)
+        response_message = None
+        try:
+            with measure_http_request(bids_url, _BID_RESOURCE):
+                async with self.__get_http_session().get(
+                        bids_url,
+                        timeout=self.__create_timeout(timeout)) as response:
+                    response_message = await self.__read_response_message(
+                        response)
+                    response.raise_for_status()
+                    json_response = await response.json()
+            return create_service_node_bids(source_blockchain,
+                                            destination_blockchain,
+                                            json_response)
+        except (aiohttp.ClientError, TimeoutError, KeyError, ValueError):
+            raise ServiceNodeClientError(
+                'unable to get the bids of the service node',
+                service_node_url=service_node_url,
+                source_blockchain=source_blockchain,
+                destination_blockchain=destination_blockchain,
+                response_message=response_message)
+
+    async def status(self, service_node_url: str, task_id: uuid.UUID,
+                     timeout: typing.Optional[float] = None) \
+            -> ServiceNodeClient.TransferStatusResponse:
+        """Retrieve the status of a token transfer.
+
+        Parameters
+        ----------
+        service_node_url : str
+            The URL of the service node.
+        task_id : uuid.UUID
+            The service node task ID of the token transfer.
+        timeout : float, optional
+            The total timeout of the HTTP request in seconds.
+
+        Returns
+        -------
+        ServiceNodeClient.TransferStatusResponse
+            The transfer status response.
+
+        Raises
+        ------
+        ServiceNodeClientError
+            If the status of the token transfer cannot be retrieved.
+
+        """
+        status_url = build_status_url(service_node_url, task_id)
+        response_message = None
+        try:
+            with measure_http_request(status_url, _STATUS_RESOURCE):
+                async with self.__get_http_session().get(
+                        status_url,
+                        timeout=self.__create_timeout(timeout)) as response:
+                    response_message = await self.__read_response_message(
+                        response)
+                    response.raise_for_status()
+                    json_response = await response.json()
+            return create_transfer_status_response(json_response)
+        except (aiohttp.ClientError, TimeoutError, KeyError, ValueError):
+            raise ServiceNodeClientError(
+                'unable to get the status of the transfer',
+                service_node_url=service_node_url, task_id=task_id,
+                response_message=response_message)
+
+    def __get_http_session(self) -> aiohttp.ClientSession:
+        if self.__http_session is not None:
+            return self.__http_session
+        return get_async_http_session()
+
+    def __create_timeout(
+            self, timeout: typing.Optional[float]) -> aiohttp.ClientTimeout:
+        return aiohttp.ClientTimeout(total=timeout)
+
+    async def __read_response_message(
+            self, response: aiohttp.ClientResponse) -> typing.Optional[str]:
+        if response.status < 400 or response.content_type != \
+                'application/json':
+            return None
+        try:
+            return (await response.json()).get('message')
+        except Exception:
+            return None
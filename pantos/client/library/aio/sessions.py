@@ -0,0 +1,64 @@
+"""Module for the HTTP sessions shared by all asynchronous requests to
+Pantos service nodes and the Pantos token creator.
+
+"""
+import asyncio
+import weakref
+
+import aiohttp
+
+from pantos.client.library.configuration import config
+
+_http_sessions: weakref.WeakKeyDictionary[
+    asyncio.AbstractEventLoop,
+    aiohttp.ClientSession] = weakref.WeakKeyDictionary()
+"""HTTP sessions by asyncio event loop (an aiohttp session must only be
+used on the event loop it was created on)."""
+
+
+def get_async_http_session() -> aiohttp.ClientSession:
+    """Get the HTTP session of the running asyncio event loop. Its
+    connections are kept alive and pooled per host, so that subsequent
+    requests to the same host do not need to establish a new TCP
+    connection (and TLS session). The connection limits are determined
+    by the configuration: at most pool_maxsize connections per host and
+    pool_connections times pool_maxsize connections in total (further
+    requests wait for a free connection). The session should be closed
+    with close_async_http_session before the event loop is closed.
+
+    Returns
+    -------
+    aiohttp.ClientSession
+        The HTTP session.
+
+    Raises
+    ------
+    RuntimeError
+        If there is no running event loop.
+
+    """
+    event_loop = asyncio.get_running_loop()
+    http_session = _http_sessions.get(event_loop)
+    if http_session is None or http_session.closed:
+        http_session = _create_async_http_session()
+        _http_sessions[event_loop] = http_session
+    return http_session
+
+
+async def close_async_http_session() -> None:
+    """Close the HTTP session of the running asyncio event loop and all
+    its pooled connections. A new HTTP session is created on the next
+    request.
+
+    """
+    http_session = _http_sessions.pop(asyncio.get_running_loop(), None)
+    if http_session is not None:
+        await http_session.close()
+
+
+def _create_async_http_session() -> aiohttp.ClientSession:
+    http_config = config['http']
+    connector = aiohttp.TCPConnector(
+        limit=http_config['pool_connections'] * http_config['pool_maxsize'],
+        limit_per_host=http_config['pool_maxsize'])
+    return aiohttp.ClientSession(connector=connector)
@@ -3,16 +3,30 @@ exposed to the users of the library.
 
 """
 __all__ = [
-    'Blockchain', 'BlockchainAddress', 'PantosClientError', 'PrivateKey',
-    'ServiceNodeBid', 'TokenSymbol', 'ServiceNodeTaskInfo',
-    'DestinationTransferStatus', 'TokenTransferStatus', 'decrypt_private_key',
-    'retrieve_service_node_bids', 'retrieve_token_balance', 'transfer_tokens',
-    'get_token_transfer_status', 'deploy_pantos_compatible_token'
+    'Blockchain', 'BlockchainAddress', 'PantosClient', 'PantosClientError',
+    'PrivateKey', 'ServiceNodeBid', 'TokenSymbol', 'ServiceNodeTaskInfo',
+    'DestinationTransferStatus', 'TokenTransfer', 'TokenTransferStatus',
+    'TokenTransferStatusChange', 'TransferWatcher', 'decrypt_private_key',
+    'BidRankingPolicy', 'LowestFeePolicy', 'FastestExecutionPolicy',
+    'LowestFeeWithinDeadlinePolicy', 'StageRecord', 'add_stage_hook',
+    'remove_stage_hook', 'MetricsRegistry', 'enable_metrics',
+    'disable_metrics', 'get_metrics_registry', 'start_metrics_server',
+    'push_metrics', 'prewarm_blockchain_clients', 'prewarm_token_decimals',
+    'find_acceptable_service_node_bid', 'find_best_service_node_bids',
+    'retrieve_service_node_bids', 'stream_service_node_bids',
+    'retrieve_token_balance', 'retrieve_token_balances', 'transfer_tokens',
+    'transfer_tokens_many', 'get_token_transfer_status',
+    'get_token_transfer_statuses', 'create_transfer_watcher',
+    'deploy_pantos_compatible_token'
 ]
 
+import contextlib as _contextlib
+import threading as _threading
+import typing as _typing
 import uuid as _uuid
 
 from pantos.common.blockchains.base import Blockchain
+from pantos.common.configuration import ConfigError as _ConfigError
 from pantos.common.entities import \
     BlockchainAddressBidPair as _BlockchainAddressBidPair
 from pantos.common.entities import ServiceNodeBid
@@ -23,27 +37,689 @@ from pantos.common.types import PrivateKey
 from pantos.common.types import TokenId as _TokenId
 from pantos.common.types import TokenSymbol
 
+from pantos.client.library import \
+    check_protocol_version as _check_protocol_version
 from pantos.client.library import initialize_library as _initialize_library
 from pantos.client.library.blockchains import \
     get_blockchain_client as _get_blockchain_client
+from pantos.client.library.blockchains import \
+    prewarm_blockchain_clients as _prewarm_blockchain_clients
 from pantos.client.library.business.bids import BidInteractor as _BidInteractor
 from pantos.client.library.business.deployments import \
     TokenDeploymentInteractor as _TokenDeploymentInteractor
+from pantos.client.library.business.ranking import BidRankingPolicy
+from pantos.client.library.business.ranking import FastestExecutionPolicy
+from pantos.client.library.business.ranking import LowestFeePolicy
+from pantos.client.library.business.ranking import \
+    LowestFeeWithinDeadlinePolicy
 from pantos.client.library.business.tokens import \
     TokenInteractor as _TokenInteractor
 from pantos.client.library.business.transfers import \
     TransferInteractor as _TransferInteractor
+from pantos.client.library.business.watchers import TransferWatcher
+from pantos.client.library.configuration import create_config as _create_config
 from pantos.client.library.constants import \
     TOKEN_SYMBOL_PAN as _TOKEN_SYMBOL_PAN
+from pantos.client.library.context import ClientContext as _ClientContext
+from pantos.client.library.context import \
+    bind_client_context_iterator as _bind_client_context_iterator
 from pantos.client.library.entitites import DestinationTransferStatus
 from pantos.client.library.entitites import ServiceNodeTaskInfo
+from pantos.client.library.entitites import TokenTransfer
 from pantos.client.library.entitites import TokenTransferStatus
+from pantos.client.library.entitites import TokenTransferStatusChange
 from pantos.client.library.exceptions import ClientError as _ClientError
+from pantos.client.library.exceptions import \
+    ClientLibraryError as _ClientLibraryError
+from pantos.client.library.instrumentation import StageRecord
+from pantos.client.library.instrumentation import add_stage_hook
+from pantos.client.library.instrumentation import remove_stage_hook
+from pantos.client.library.metrics import MetricsRegistry
+from pantos.client.library.metrics import disable_metrics
+from pantos.client.library.metrics import enable_metrics
+from pantos.client.library.metrics import get_metrics_registry
+from pantos.client.library.metrics import push_metrics
+from pantos.client.library.metrics import start_metrics_server
 
 # Exception to be used by external client library users
 PantosClientError = _ClientError
 
 
+class PantosClient:
+    """Pantos client instance that owns its configuration, blockchain
+    node connections, HTTP session, shared executor and caches. Multiple
+    instances (e.g. for mainnet and testnet, or for different
+    configuration files) can be used side by side in the same process.
+    The instance's resources are created on first use and released by
+    PantosClient.close (or when leaving a with statement).
+
+    """
+    def __init__(self, config_file_path: str | None = None, *,
+                 mainnet: bool = False):
+        """Construct a client instance. The configuration is loaded
+        when the client is first used.
+
+        Parameters
+        ----------
+        config_file_path : str or None, optional
+            The path to the configuration file (typical configuration
+            file locations are searched if none is specified).
+        mainnet : bool, optional
+            If True, the client operates on mainnet. Otherwise, it
+            operates on testnet (default: testnet).
+
+        """
+        self.__config_file_path = config_file_path
+        self.__mainnet = mainnet
+        self.__client_context: _ClientContext | None = None
+        self.__lock = _threading.Lock()
+
+    @property
+    def mainnet(self) -> bool:
+        """True if the client operates on mainnet, False if it operates
+        on testnet.
+
+        """
+        return self.__mainnet
+
+    def close(self) -> None:
+        """Release all resources of the client instance (e.g. node
+        connections, HTTP session and worker threads). The client can
+        be used again afterwards, in which case its configuration is
+        loaded again.
+
+        """
+        with self.__lock:
+            client_context = self.__client_context
+            self.__client_context = None
+        if client_context is not None:
+            client_context.close()
+
+    def __enter__(self) -> 'PantosClient':
+        return self
+
+    def __exit__(self, exception_type: _typing.Any,
+                 exception: BaseException | None,
+                 traceback: _typing.Any) -> None:
+        self.close()
+
+    def decrypt_private_key(self, blockchain: Blockchain, keystore: str,
+                            password: str) -> PrivateKey:
+        """Decrypt the private key from a password-encrypted keystore.
+
+        Parameters
+        ----------
+        blockchain : Blockchain
+            The blockchain to load the private key for.
+        keystore: str
+            The keystore contents.
+        password : str
+            The password to decrypt the private key.
+
+        Returns
+        -------
+        PrivateKey
+            The decrypted private key.
+
+        Raises
+        ------
+        PantosClientError
+            If the private key cannot be loaded from the keystore file.
+
+        """
+        with self._activate():
+            return _get_blockchain_client(blockchain).decrypt_private_key(
+                keystore, password)
+
+    def prewarm_blockchain_clients(self,
+                                   blockchains: list[Blockchain]) -> None:
+        """Construct the blockchain clients for the given blockchains in
+        parallel (e.g. during the start-up phase of a service), so that
+        subsequent operations do not need to wait for them.
+
+        Parameters
+        ----------
+        blockchains : list of Blockchain
+            The blockchains to construct the blockchain clients for.
+
+        Raises
+        ------
+        PantosClientError
+            If a blockchain client cannot be constructed.
+
+        """
+        with self._activate():
+            _prewarm_blockchain_clients(blockchains)
+
+    def prewarm_token_decimals(self, blockchains: list[Blockchain]) -> None:
+        """Cache the numbers of decimals of all tokens configured for the
+        given blockchains, so that subsequent token amount conversions do
+        not need to read them from the blockchains.
+
+        Parameters
+        ----------
+        blockchains : list of Blockchain
+            The blockchains to cache the token decimals for.
+
+        Raises
+        ------
+        PantosClientError
+            If the token decimals cannot be read.
+
+        """
+        with self._activate():
+            token_interactor = _TokenInteractor()
+            for blockchain in blockchains:
+                token_interactor.prewarm_token_decimals(blockchain)
+
+    def find_acceptable_service_node_bid(
+            self, source_blockchain: Blockchain,
+            destination_blockchain: Blockchain, max_fee: _Amount,
+            timeout: float | None = None) -> _BlockchainAddressBidPair:
+        """Find the first service node bid for a token transfer from a
+        specified source blockchain to a specified destination blockchain
+        whose fee does not exceed a maximum fee. The search stops as soon
+        as a service node offers an acceptable bid.
+
+        Parameters
+        ----------
+        source_blockchain : Blockchain
+            The source blockchain of the service node bid.
+        destination_blockchain : Blockchain
+            The destination blockchain of the service node bid.
+        max_fee : int or decimal.Decimal
+            The maximum acceptable fee (an integer value in case of the
+            Pantos Token's smallest subunit, a decimal value in case of the
+            Pantos Token's main unit).
+        timeout : float or None, optional
+            The number of seconds to wait for an acceptable service node
+            bid (default: no timeout).
+
+        Returns
+        -------
+        tuple of BlockchainAddress and ServiceNodeBid
+            A pair of the address of the service node and its acceptable
+            bid (with the fee in the Pantos Token's smallest subunit). It
+            can be used as the service node bid of a token transfer.
+
+        Raises
+        ------
+        PantosClientError
+            If no acceptable service node bid is found in time.
+
+        """
+        with self._activate():
+            response = _BidInteractor().find_acceptable_service_node_bid(
+                source_blockchain, destination_blockchain, max_fee, timeout)
+            return response.service_node_address, response.service_node_bid
+
+    def find_best_service_node_bids(
+            self, source_blockchain: Blockchain,
+            destination_blockchain: Blockchain,
+            policy: BidRankingPolicy | None = None,
+            number_bids: int = 1) -> list[_BlockchainAddressBidPair]:
+        """Find the best service node bids for a token transfer from a
+        specified source blockchain to a specified destination blockchain
+        according to a ranking policy. If a token transfer with the best
+        bid fails, the next best bid can be used without retrieving the
+        service node bids again.
+
+        Parameters
+        ----------
+        source_blockchain : Blockchain
+            The source blockchain of the service node bids.
+        destination_blockchain : Blockchain
+            The destination blockchain of the service node bids.
+        policy : BidRankingPolicy or None, optional
+            The policy to rank the service node bids by, e.g.
+            LowestFeePolicy, FastestExecutionPolicy, or
+            LowestFeeWithinDeadlinePolicy (default: lowest fee first).
+        number_bids : int, optional
+            The maximum number of service node bids to return (default: 1).
+
+        Returns
+        -------
+        list of tuple of BlockchainAddress and ServiceNodeBid
+            Pairs of the address of a service node and its bid (with the
+            fee in the Pantos Token's smallest subunit), best first. Each
+            of them can be used as the service node bid of a token
+            transfer.
+
+        Raises
+        ------
+        PantosClientError
+            If no eligible service node bid is found.
+
+        """
+        with self._activate():
+            responses = _BidInteractor().find_best_service_node_bids(
+                source_blockchain, destination_blockchain, policy, number_bids)
+            return [(response.service_node_address, response.service_node_bid)
+                    for response in responses]
+
+    def retrieve_service_node_bids(
+            self, source_blockchain: Blockchain,
+            destination_blockchain: Blockchain,
+            return_fee_in_main_unit: bool = True) \
+            -> dict[BlockchainAddress, list[ServiceNodeBid]]:
+        """Retrieve the service node bids for token transfers from a
+        specified source blockchain to a specified destination blockchain.
+
+        Parameters
+        ----------
+        source_blockchain : Blockchain
+            The source blockchain of the service node bids.
+        destination_blockchain : Blockchain
+            The destination blockchain of the service node bids.
+        return_fee_in_main_unit : bool, optional
+            True if the service node bids' fee is to be returned in the
+            Pantos Token's main unit, False if it is to be returned in the
+            Pantos Token's smallest subunit (default: True).
+
+        Returns
+        -------
+        dict of BlockchainAddress and list of ServiceNodeBid
+            The matching service node bids of each registered service
+            node.
+
+        Raises
+        ------
+        PantosClientError
+            If the service node bids cannot be retrieved.
+
+        """
+        with self._activate():
+            return _BidInteractor().retrieve_service_node_bids(
+                source_blockchain, destination_blockchain,
+                return_fee_in_main_unit)
+
+    def stream_service_node_bids(
+            self, source_blockchain: Blockchain,
+            destination_blockchain: Blockchain,
+            return_fee_in_main_unit: bool = True,
+            timeout: float | None = None) \
+            -> _typing.Iterator[tuple[BlockchainAddress,
+                                      list[ServiceNodeBid]]]:
+        """Stream the service node bids for token transfers from a
+        specified source blockchain to a specified destination blockchain.
+        The bids of a service node are yielded as soon as the service node
+        has answered.
+
+        Parameters
+        ----------
+        source_blockchain : Blockchain
+            The source blockchain of the service node bids.
+        destination_blockchain : Blockchain
+            The destination blockchain of the service node bids.
+        return_fee_in_main_unit : bool, optional
+            True if the service node bids' fee is to be returned in the
+            Pantos Token's main unit, False if it is to be returned in the
+            Pantos Token's smallest subunit (default: True).
+        timeout : float or None, optional
+            The number of seconds after which the stream ends even if not
+            all service nodes have answered yet (default: no timeout).
+
+        Returns
+        -------
+        iterator of tuple of BlockchainAddress and list of ServiceNodeBid
+            The address of each registered service node and its matching
+            bids, in the order in which the service nodes answer.
+
+        Raises
+        ------
+        PantosClientError
+            If the service node bids cannot be retrieved.
+
+        """
+        with self._activate():
+            bid_pairs = _BidInteractor().stream_service_node_bids(
+                source_blockchain, destination_blockchain,
+                return_fee_in_main_unit, timeout)
+            return _bind_client_context_iterator(bid_pairs)
+
+    def retrieve_token_balance(self, blockchain: Blockchain,
+                               account_id: _AccountId,
+                               token_id: _TokenId = _TOKEN_SYMBOL_PAN,
+                               return_in_main_unit: bool = True) -> _Amount:
+        """Retrieve the token balance of a blockchain account.
+
+        Parameters
+        ----------
+        blockchain : Blockchain
+            The blockchain to retrieve the token balance on.
+        account_id : BlockchainAddress or PrivateKey
+            The address or unencrypted private key of the blockchain
+            account.
+        token_id : BlockchainAddress or TokenSymbol
+            The address or symbol of the token (default: PAN).
+        return_in_main_unit : bool, optional
+            True if the token balance is to be returned in the token's main
+            unit, False if it is to be returned in the token's smallest
+            subunit (default: True).
+
+        Returns
+        -------
+        int or decimal.Decimal
+            The token balance of the blockchain account (an integer value in
+            case of the token's smallest subunit, a decimal value in case of
+            the token's main unit).
+
+        Raises
+        ------
+        PantosClientError
+            If the token balance cannot be retrieved.
+
+        """
+        with self._activate():
+            request = _TokenInteractor.RetrieveTokenBalanceRequest(
+                blockchain, token_id, account_id, return_in_main_unit)
+            return _TokenInteractor().retrieve_token_balance(request)
+
+    def retrieve_token_balances(
+            self, blockchain: Blockchain,
+            account_token_ids: list[tuple[_AccountId, _TokenId]],
+            return_in_main_unit: bool = True) -> list[_Amount]:
+        """Retrieve the token balances of multiple blockchain accounts. The
+        balances are read in batches of aggregated calls instead of one
+        node request per blockchain account.
+
+        Parameters
+        ----------
+        blockchain : Blockchain
+            The blockchain to retrieve the token balances on.
+        account_token_ids : list of tuple of AccountId and TokenId
+            Pairs of the address or private key of a blockchain account and
+            the address or symbol of a token.
+        return_in_main_unit : bool, optional
+            True if the token balances are to be returned in the tokens'
+            main units, False if they are to be returned in the tokens'
+            smallest subunits (default: True).
+
+        Returns
+        -------
+        list of int or decimal.Decimal
+            The token balances of the blockchain accounts (in the same
+            order as the given pairs of account and token identifiers).
+
+        Raises
+        ------
+        PantosClientError
+            If the token balances cannot be retrieved.
+
+        """
+        with self._activate():
+            request = _TokenInteractor.RetrieveTokenBalancesRequest(
+                blockchain, account_token_ids, return_in_main_unit)
+            return _TokenInteractor().retrieve_token_balances(request)
+
+    def transfer_tokens(
+        self, source_blockchain: Blockchain,
+        destination_blockchain: Blockchain, sender_private_key: PrivateKey,
+        recipient_address: BlockchainAddress, source_token_id: _TokenId,
+        token_amount: _Amount,
+        service_node_bid: _BlockchainAddressBidPair | None = None
+    ) -> ServiceNodeTaskInfo:
+        """Transfer tokens from a sender's account on a source blockchain to
+        a recipient's account on a (possibly different) destination blockchain.
+
+        Parameters
+        ----------
+        source_blockchain : Blockchain
+            The token transfer's source blockchain.
+        destination_blockchain : Blockchain
+            The token transfer's destination blockchain.
+        sender_private_key : PrivateKey
+            The unencrypted private key of the sender's account on the
+            source blockchain.
+        recipient_address : BlockchainAddress
+            The address of the recipient's account on the destination
+            blockchain.
+        source_token_id : BlockchainAddress or TokenSymbol
+            The address or symbol of the token to be transferred (on the
+            source blockchain).
+        token_amount : int or decimal.Decimal
+            The amount of tokens to be transferred (an integer value in case
+            of the token's smallest subunit, a decimal value in case of the
+            token's main unit).
+        service_node_bid : tuple of ServiceNodeBid and int or None
+            A pair of the address of the chosen service node and the
+            service node's chosen bid. If none is specified,
+            the registered service node bid with the lowest
+            fee for the token transfer is automatically chosen.
+
+        Returns
+        -------
+        ServiceNodeTaskInfo
+            Service node-related information of a token transfer.
+
+        Raises
+        ------
+        PantosClientError
+            If the token transfer cannot be executed.
+
+        """
+        with self._activate():
+            request = _TransferInteractor.TransferTokensRequest(
+                source_blockchain, destination_blockchain, sender_private_key,
+                recipient_address, source_token_id, token_amount,
+                service_node_bid)
+            return _TransferInteractor().transfer_tokens(request)
+
+    def transfer_tokens_many(
+            self, token_transfers: list[TokenTransfer]) \
+            -> list[ServiceNodeTaskInfo | PantosClientError]:
+        """Execute a batch of token transfers. Token addresses, token
+        decimals, the cheapest service node bid and service node URLs are
+        determined only once for all token transfers with the same source
+        blockchain, destination blockchain and source token. The token
+        transfers are signed and submitted in parallel, and a failing
+        token transfer does not abort the remaining ones.
+
+        Parameters
+        ----------
+        token_transfers : list of TokenTransfer
+            The token transfers to execute.
+
+        Returns
+        -------
+        list of ServiceNodeTaskInfo or PantosClientError
+            For each token transfer (in the same order), either the
+            service node-related information of the token transfer or the
+            error that prevented it from being executed.
+
+        """
+        with self._activate():
+            requests = [
+                _TransferInteractor.TransferTokensRequest(
+                    token_transfer.source_blockchain,
+                    token_transfer.destination_blockchain,
+                    token_transfer.sender_private_key,
+                    token_transfer.recipient_address,
+                    token_transfer.source_token_id,
+                    token_transfer.token_amount,
+                    token_transfer.service_node_bid)
+                for token_transfer in token_transfers
+            ]
+            return list(_TransferInteractor().transfer_tokens_many(requests))
+
+    def get_token_transfer_status(
+            self, source_blockchain: Blockchain,
+            service_node_address: BlockchainAddress,
+            service_node_task_id: _uuid.UUID,
+            blocks_to_search: int | None = None) -> TokenTransferStatus:
+        """Get the status of a token transfer process.
+
+        Parameters
+        ----------
+        source_blockchain : Blockchain
+            The source blockchain of the token transfer.
+        service_node_address : BlockchainAddress
+            The address of the service node that is handling the token
+            transfer.
+        service_node_task_id : uuid.UUID
+            The service node task ID of the token transfer.
+        blocks_to_search : int or None
+            The number of blocks to search for the destination transfer.
+            If None, the search is performed until the genesis block.
+
+        Returns
+        -------
+        TokenTransferStatus
+            The status of the token transfer transfer.
+
+        Raises
+        ------
+        PantosClientError
+            If the destination transfer cannot be found.
+
+        """
+        with self._activate():
+            request = _TransferInteractor.TokenTransferStatusRequest(
+                source_blockchain, service_node_address, service_node_task_id,
+                blocks_to_search)
+            return _TransferInteractor().get_token_transfer_status(request)
+
+    def get_token_transfer_statuses(
+            self,
+            token_transfers: list[tuple[Blockchain, ServiceNodeTaskInfo]],
+            blocks_to_search: int | None = None) \
+            -> list[TokenTransferStatus | PantosClientError]:
+        """Get the statuses of a batch of token transfer processes. The
+        service node statuses are retrieved in parallel, and each
+        destination blockchain is searched only once for all of its token
+        transfers. A failing status retrieval does not abort the remaining
+        ones.
+
+        Parameters
+        ----------
+        token_transfers : list of tuple of Blockchain and ServiceNodeTaskInfo
+            The source blockchain and the service node-related information
+            of each token transfer.
+        blocks_to_search : int or None
+            The number of blocks to search for the destination transfers.
+            If None, the search is performed until the genesis block.
+
+        Returns
+        -------
+        list of TokenTransferStatus or PantosClientError
+            For each token transfer (in the same order), either the status
+            of the token transfer or the error that prevented it from being
+            retrieved.
+
+        """
+        with self._activate():
+            requests = [
+                _TransferInteractor.TokenTransferStatusRequest(
+                    source_blockchain,
+                    service_node_task_info.service_node_address,
+                    service_node_task_info.task_id, blocks_to_search) for
+                source_blockchain, service_node_task_info in token_transfers
+            ]
+            return list(
+                _TransferInteractor().get_token_transfer_statuses(requests))
+
+    def create_transfer_watcher(
+            self, blocks_to_search: int | None = None) -> TransferWatcher:
+        """Create a watcher for the statuses of token transfer processes.
+        Token transfers to be watched are added with TransferWatcher.watch.
+        Status changes are reported to the callbacks added with
+        TransferWatcher.add_callback and by the TransferWatcher.changes
+        asynchronous iterator. The token transfers are polled by
+        TransferWatcher.run, TransferWatcher.changes, or explicit calls of
+        TransferWatcher.poll.
+
+        Parameters
+        ----------
+        blocks_to_search : int or None
+            The number of blocks to search for the destination transfers.
+            If None, the search is performed until the genesis block.
+
+        Returns
+        -------
+        TransferWatcher
+            The new watcher without any watched token transfers.
+
+        """
+        with self._activate():
+            return TransferWatcher(blocks_to_search)
+
+    def deploy_pantos_compatible_token(
+            self, token_name: str, token_symbol: str, token_decimals: int,
+            token_pausable: bool, token_burnable: bool, token_supply: int,
+            deployment_blockchains: list[Blockchain],
+            payment_blockchain: Blockchain,
+            payer_private_key: PrivateKey) -> _uuid.UUID:
+        """Deploy a Pantos-compatible token on the given blockchains.
+
+        Parameters
+        ----------
+        token_name : str
+            The name of the token.
+        token_symbol : str
+            The symbol of the token.
+        token_decimals : int
+            The token's number of decimals.
+        token_pausable : bool
+            If the token is pausable.
+        token_burnable : bool
+            If the token is burnable.
+        token_supply : int
+            The supply of the token.
+        deployment_blockchains : list of Blockchain
+            The blockchains where the deployment will be requested.
+        payment_blockchain : Blockchain
+            The blockchain on which the payment for the fee will be made.
+        payer_private_key : PrivateKey
+            The unencrypted private key of the payer's account on the
+            payment_blockchain.
+
+        Returns
+        -------
+        uuid.UUID
+            The task ID of the token creator for the deployment process.
+
+        Raises
+        ------
+        PantosClientError
+            If the deployment process cannot be executed.
+
+        """
+        with self._activate():
+            request = _TokenDeploymentInteractor.TokenDeploymentRequest(
+                token_name, token_symbol, token_decimals, token_pausable,
+                token_burnable, token_supply, deployment_blockchains,
+                payment_blockchain, payer_private_key)
+            return _TokenDeploymentInteractor().deploy_token(request)
+
+    def _activate(self) -> _typing.ContextManager[None]:
+        """Activate the client instance's context for executing an
+        operation. The configuration is loaded on first activation.
+
+        Returns
+        -------
+        contextlib.AbstractContextManager
+            The context manager that activates the client context.
+
+        Raises
+        ------
+        ClientLibraryError
+            If the configuration cannot be loaded or its Pantos protocol
+            version is not supported.
+
+        """
+        with self.__lock:
+            if self.__client_context is None:
+                try:
+                    client_config = _create_config(self.__config_file_path)
+                except _ConfigError:
+                    raise _ClientLibraryError('error loading config')
+                client_context = _ClientContext(client_config)
+                with client_context.activate():
+                    _check_protocol_version(self.__mainnet)
+                self.__client_context = client_context
+            return self.__client_context.activate()
+
+
 def decrypt_private_key(blockchain: Blockchain, keystore: str,
                         password: str) -> PrivateKey:
     """Decrypt the private key from a password-encrypted keystore.
@@ -68,9 +744,141 @@ def decrypt_private_key(blockchain: Blockchain, keystore: str,
         If the private key cannot be loaded from the keystore file.
 
     """
-    _initialize_library(False)
-    return _get_blockchain_client(blockchain).decrypt_private_key(
-        keystore, password)
+    return _default_clients[False].decrypt_private_key(blockchain, keystore,
+                                                       password)
+
+
+def prewarm_blockchain_clients(blockchains: list[Blockchain], *,
+                               mainnet: bool = False) -> None:
+    """Construct the blockchain clients for the given blockchains in
+    parallel (e.g. during the start-up phase of a service), so that
+    subsequent operations do not need to wait for them.
+
+    Parameters
+    ----------
+    blockchains : list of Blockchain
+        The blockchains to construct the blockchain clients for.
+    mainnet : bool, optional
+        If True, the function is executed on mainnet. Otherwise, it is
+        executed on testnet (default: testnet).
+
+    Raises
+    ------
+    PantosClientError
+        If a blockchain client cannot be constructed.
+
+    """
+    return _default_clients[mainnet].prewarm_blockchain_clients(blockchains)
+
+
+def prewarm_token_decimals(blockchains: list[Blockchain], *,
+                           mainnet: bool = False) -> None:
+    """Cache the numbers of decimals of all tokens configured for the
+    given blockchains, so that subsequent token amount conversions do
+    not need to read them from the blockchains.
+
+    Parameters
+    ----------
+    blockchains : list of Blockchain
+        The blockchains to cache the token decimals for.
+    mainnet : bool, optional
+        If True, the function is executed on mainnet. Otherwise, it is
+        executed on testnet (default: testnet).
+
+    Raises
+    ------
+    PantosClientError
+        If the token decimals cannot be read.
+
+    """
+    return _default_clients[mainnet].prewarm_token_decimals(blockchains)
+
+
+def find_acceptable_service_node_bid(
+        source_blockchain: Blockchain, destination_blockchain: Blockchain,
+        max_fee: _Amount, timeout: float | None = None, *,
+        mainnet: bool = False) -> _BlockchainAddressBidPair:
+    """Find the first service node bid for a token transfer from a
+    specified source blockchain to a specified destination blockchain
+    whose fee does not exceed a maximum fee. The search stops as soon
+    as a service node offers an acceptable bid.
+
+    Parameters
+    ----------
+    source_blockchain : Blockchain
+        The source blockchain of the service node bid.
+    destination_blockchain : Blockchain
+        The destination blockchain of the service node bid.
+    max_fee : int or decimal.Decimal
+        The maximum acceptable fee (an integer value in case of the
+        Pantos Token's smallest subunit, a decimal value in case of the
+        Pantos Token's main unit).
+    timeout : float or None, optional
+        The number of seconds to wait for an acceptable service node
+        bid (default: no timeout).
+    mainnet : bool, optional
+        If True, the function is executed on mainnet. Otherwise, it is
+        executed on testnet (default: testnet).
+
+    Returns
+    -------
+    tuple of BlockchainAddress and ServiceNodeBid
+        A pair of the address of the service node and its acceptable
+        bid (with the fee in the Pantos Token's smallest subunit). It
+        can be used as the service node bid of a token transfer.
+
+    Raises
+    ------
+    PantosClientError
+        If no acceptable service node bid is found in time.
+
+    """
+    return _default_clients[mainnet].find_acceptable_service_node_bid(
+        source_blockchain, destination_blockchain, max_fee, timeout)
+
+
+def find_best_service_node_bids(
+        source_blockchain: Blockchain, destination_blockchain: Blockchain,
+        policy: BidRankingPolicy | None = None, number_bids: int = 1, *,
+        mainnet: bool = False) -> list[_BlockchainAddressBidPair]:
+    """Find the best service node bids for a token transfer from a
+    specified source blockchain to a specified destination blockchain
+    according to a ranking policy. If a token transfer with the best
+    bid fails, the next best bid can be used without retrieving the
+    service node bids again.
+
+    Parameters
+    ----------
+    source_blockchain : Blockchain
+        The source blockchain of the service node bids.
+    destination_blockchain : Blockchain
+        The destination blockchain of the service node bids.
+    policy : BidRankingPolicy or None, optional
+        The policy to rank the service node bids by, e.g.
+        LowestFeePolicy, FastestExecutionPolicy, or
+        LowestFeeWithinDeadlinePolicy (default: lowest fee first).
+    number_bids : int, optional
+        The maximum number of service node bids to return (default: 1).
+    mainnet : bool, optional
+        If True, the function is executed on mainnet. Otherwise, it is
+        executed on testnet (default: testnet).
+
+    Returns
+    -------
+    list of tuple of BlockchainAddress and ServiceNodeBid
+        Pairs of the address of a service node and its bid (with the
+        fee in the Pantos Token's smallest subunit), best first. Each
+        of them can be used as the service node bid of a token
+        transfer.
+
+    Raises
+    ------
+    PantosClientError
+        If no eligible service node bid is found.
+
+    """
+    return _default_clients[mainnet].find_best_service_node_bids(
+        source_blockchain, destination_blockchain, policy, number_bids)
 
 
 def retrieve_service_node_bids(
@@ -106,11 +914,54 @@ def retrieve_service_node_bids(
         If the service node bids cannot be retrieved.
 
     """
-    _initialize_library(mainnet)
-    return _BidInteractor().retrieve_service_node_bids(
+    return _default_clients[mainnet].retrieve_service_node_bids(
         source_blockchain, destination_blockchain, return_fee_in_main_unit)
 
 
+def stream_service_node_bids(
+        source_blockchain: Blockchain, destination_blockchain: Blockchain,
+        return_fee_in_main_unit: bool = True, timeout: float | None = None,
+        *, mainnet: bool = False) \
+        -> _typing.Iterator[tuple[BlockchainAddress, list[ServiceNodeBid]]]:
+    """Stream the service node bids for token transfers from a
+    specified source blockchain to a specified destination blockchain.
+    The bids of a service node are yielded as soon as the service node
+    has answered.
+
+    Parameters
+    ----------
+    source_blockchain : Blockchain
+        The source blockchain of the service node bids.
+    destination_blockchain : Blockchain
+        The destination blockchain of the service node bids.
+    return_fee_in_main_unit : bool, optional
+        True if the service node bids' fee is to be returned in the
+        Pantos Token's main unit, False if it is to be returned in the
+        Pantos Token's smallest subunit (default: True).
+    timeout : float or None, optional
+        The number of seconds after which the stream ends even if not
+        all service nodes have answered yet (default: no timeout).
+    mainnet : bool, optional
+        If True, the function is executed on mainnet. Otherwise, it is
+        executed on testnet (default: testnet).
+
+    Returns
+    -------
+    iterator of tuple of BlockchainAddress and list of ServiceNodeBid
+        The address of each registered service node and its matching
+        bids, in the order in which the service nodes answer.
+
+    Raises
+    ------
+    PantosClientError
+        If the service node bids cannot be retrieved.
+
+    """
+    return _default_clients[mainnet].stream_service_node_bids(
+        source_blockchain, destination_blockchain, return_fee_in_main_unit,
+        timeout)
+
+
 def retrieve_token_balance(blockchain: Blockchain, account_id: _AccountId,
                            token_id: _TokenId = _TOKEN_SYMBOL_PAN,
                            return_in_main_unit: bool = True, *,
@@ -147,10 +998,48 @@ def retrieve_token_balance(blockchain: Blockchain, account_id: _AccountId,
         If the token balance cannot be retrieved.
 
     """
-    _initialize_library(mainnet)
-    request = _TokenInteractor.RetrieveTokenBalanceRequest(
-        blockchain, token_id, account_id, return_in_main_unit)
-    return _TokenInteractor().retrieve_token_balance(request)
+    return _default_clients[mainnet].retrieve_token_balance(
+        blockchain, account_id, token_id, return_in_main_unit)
+
+
+def retrieve_token_balances(blockchain: Blockchain,
+                            account_token_ids: list[tuple[_AccountId,
+                                                          _TokenId]],
+                            return_in_main_unit: bool = True, *,
+                            mainnet: bool = False) -> list[_Amount]:
+    """Retrieve the token balances of multiple blockchain accounts. The
+    balances are read in batches of aggregated calls instead of one
+    node request per blockchain account.
+
+    Parameters
+    ----------
+    blockchain : Blockchain
+        The blockchain to retrieve the token balances on.
+    account_token_ids : list of tuple of AccountId and TokenId
+        Pairs of the address or private key of a blockchain account and
+        the address or symbol of a token.
+    return_in_main_unit : bool, optional
+        True if the token balances are to be returned in the tokens'
+        main units, False if they are to be returned in the tokens'
+        smallest subunits (default: True).
+    mainnet : bool, optional
+        If True, the function is executed on mainnet. Otherwise, it is
+        executed on testnet (default: testnet).
+
+    Returns
+    -------
+    list of int or decimal.Decimal
+        The token balances of the blockchain accounts (in the same
+        order as the given pairs of account and token identifiers).
+
+    Raises
+    ------
+    PantosClientError
+        If the token balances cannot be retrieved.
+
+    """
+    return _default_clients[mainnet].retrieve_token_balances(
+        blockchain, account_token_ids, return_in_main_unit)
 
 
 def transfer_tokens(source_blockchain: Blockchain,
@@ -202,11 +1091,38 @@ def transfer_tokens(source_blockchain: Blockchain,
         If the token transfer cannot be executed.
 
     """
-    _initialize_library(mainnet)
-    request = _TransferInteractor.TransferTokensRequest(
+    return _default_clients[mainnet].transfer_tokens(
         source_blockchain, destination_blockchain, sender_private_key,
         recipient_address, source_token_id, token_amount, service_node_bid)
-    return _TransferInteractor().transfer_tokens(request)
+
+
+def transfer_tokens_many(
+        token_transfers: list[TokenTransfer], *, mainnet: bool = False) \
+        -> list[ServiceNodeTaskInfo | PantosClientError]:
+    """Execute a batch of token transfers. Token addresses, token
+    decimals, the cheapest service node bid and service node URLs are
+    determined only once for all token transfers with the same source
+    blockchain, destination blockchain and source token. The token
+    transfers are signed and submitted in parallel, and a failing
+    token transfer does not abort the remaining ones.
+
+    Parameters
+    ----------
+    token_transfers : list of TokenTransfer
+        The token transfers to execute.
+    mainnet : bool, optional
+        If True, the function is executed on mainnet. Otherwise, it is
+        executed on testnet (default: testnet).
+
+    Returns
+    -------
+    list of ServiceNodeTaskInfo or PantosClientError
+        For each token transfer (in the same order), either the
+        service node-related information of the token transfer or the
+        error that prevented it from being executed.
+
+    """
+    return _default_clients[mainnet].transfer_tokens_many(token_transfers)
 
 
 def get_token_transfer_status(source_blockchain: Blockchain,
@@ -243,11 +1159,71 @@ def get_token_transfer_status(source_blockchain: Blockchain,
         If the destination transfer cannot be found.
 
     """
-    _initialize_library(mainnet)
-    request = _TransferInteractor.TokenTransferStatusRequest(
+    return _default_clients[mainnet].get_token_transfer_status(
         source_blockchain, service_node_address, service_node_task_id,
         blocks_to_search)
-    return _TransferInteractor().get_token_transfer_status(request)
+
+
+def get_token_transfer_statuses(
+        token_transfers: list[tuple[Blockchain, ServiceNodeTaskInfo]],
+        blocks_to_search: int | None = None, *, mainnet: bool = False) \
+        -> list[TokenTransferStatus | PantosClientError]:
+    """Get the statuses of a batch of token transfer processes. The
+    service node statuses are retrieved in parallel, and each
+    destination blockchain is searched only once for all of its token
+    transfers. A failing status retrieval does not abort the remaining
+    ones.
+
+    Parameters
+    ----------
+    token_transfers : list of tuple of Blockchain and ServiceNodeTaskInfo
+        The source blockchain and the service node-related information
+        of each token transfer.
+    blocks_to_search : int or None
+        The number of blocks to search for the destination transfers.
+        If None, the search is performed until the genesis block.
+    mainnet : bool, optional
+        If True, the function is executed on mainnet. Otherwise, it is
+        executed on testnet (default: testnet).
+
+    Returns
+    -------
+    list of TokenTransferStatus or PantosClientError
+        For each token transfer (in the same order), either the status
+        of the token transfer or the error that prevented it from being
+        retrieved.
+
+    """
+    return _default_clients[mainnet].get_token_transfer_statuses(
+        token_transfers, blocks_to_search)
+
+
+def create_transfer_watcher(blocks_to_search: int | None = None, *,
+                            mainnet: bool = False) -> TransferWatcher:
+    """Create a watcher for the statuses of token transfer processes.
+    Token transfers to be watched are added with TransferWatcher.watch.
+    Status changes are reported to the callbacks added with
+    TransferWatcher.add_callback and by the TransferWatcher.changes
+    asynchronous iterator. The token transfers are polled by
+    TransferWatcher.run, TransferWatcher.changes, or explicit calls of
+    TransferWatcher.poll.
+
+    Parameters
+    ----------
+    blocks_to_search : int or None
+        The number of blocks to search for the destination transfers.
+        If None, the search is performed until the genesis block.
+    mainnet : bool, optional
+        If True, the function is executed on mainnet. Otherwise, it is
+        executed on testnet (default: testnet).
+
+    Returns
+    -------
+    TransferWatcher
+        The new watcher without any watched token transfers.
+
+    """
+    return _default_clients[mainnet].create_transfer_watcher(blocks_to_search)
 
 
 def deploy_pantos_compatible_token(token_name: str, token_symbol: str,
@@ -295,9 +1271,30 @@ def deploy_pantos_compatible_token(token_name: str, token_symbol: str,
         If the deployment process cannot be executed.
 
     """
-    _initialize_library(mainnet)
-    request = _TokenDeploymentInteractor.TokenDeploymentRequest(
+    return _default_clients[mainnet].deploy_pantos_compatible_token(
         token_name, token_symbol, token_decimals, token_pausable,
         token_burnable, token_supply, deployment_blockchains,
         payment_blockchain, payer_private_key)
-    return _TokenDeploymentInteractor().deploy_token(request)
+
+
+class _DefaultPantosClient(PantosClient):
+    """Client instance that uses the process-wide state of the client
+    library. It backs the module-level API functions.
+
+    """
+    def close(self) -> None:
+        # Docstring inherited
+        # The process-wide state is never released
+        pass
+
+    def _activate(self) -> _typing.ContextManager[None]:
+        # Docstring inherited
+        _initialize_library(self.mainnet)
+        return _contextlib.nullcontext()
+
+
+_default_clients = {
+    False: _DefaultPantosClient(mainnet=False),
+    True: _DefaultPantosClient(mainnet=True)
+}
+"""Default client instances for testnet (False) and mainnet (True)."""
@@ -2,9 +2,12 @@
 
 """
 __all__ = [
-    'BlockchainClient', 'BlockchainClientError', 'get_blockchain_client'
+    'BlockchainClient', 'BlockchainClientError', 'get_blockchain_client',
+    'prewarm_blockchain_clients'
 ]
 
 from pantos.client.library.blockchains.base import BlockchainClient
 from pantos.client.library.blockchains.base import BlockchainClientError
 from pantos.client.library.blockchains.factory import get_blockchain_client
+from pantos.client.library.blockchains.factory import \
+    prewarm_blockchain_clients
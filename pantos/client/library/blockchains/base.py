@@ -3,6 +3,9 @@
 """
 import abc
 import dataclasses
+import importlib
+import threading
+import types
 import typing
 
 import semantic_version  # type: ignore
@@ -10,8 +13,6 @@ from pantos.common.blockchains.base import Blockchain
 from pantos.common.blockchains.base import BlockchainHandler
 from pantos.common.blockchains.base import BlockchainUtilities
 from pantos.common.blockchains.base import BlockchainUtilitiesError
-from pantos.common.blockchains.factory import get_blockchain_utilities
-from pantos.common.blockchains.factory import initialize_blockchain_utilities
 from pantos.common.entities import ServiceNodeBid
 from pantos.common.exceptions import ErrorCreator
 from pantos.common.types import AccountId
@@ -22,6 +23,15 @@ from pantos.client.library.configuration import get_blockchain_config
 from pantos.client.library.exceptions import ClientLibraryError
 from pantos.client.library.protocol import is_supported_protocol_version
 
+_BLOCKCHAIN_UTILITIES_FACTORY_MODULE = 'pantos.common.blockchains.factory'
+"""Module of the Pantos blockchain utilities factory."""
+
+_blockchain_utilities_factory: typing.Optional[types.ModuleType] = None
+"""Pantos blockchain utilities factory (imported on first use)."""
+
+_blockchain_utilities_lock = threading.Lock()
+"""Lock for initializing the blockchain utilities of a client."""
+
 
 class BlockchainClientError(ClientLibraryError):
     """Base exception class for all blockchain client errors.
@@ -79,10 +89,20 @@ class BlockchainClient(BlockchainHandler, ErrorCreator[BlockchainClientError]):
             self._get_config()['confirmations']
         transaction_network_id = self._get_config().get('chain_id')
         try:
-            initialize_blockchain_utilities(
-                self.get_blockchain(), [blockchain_node_url],
-                fallback_blockchain_nodes_urls, average_block_time,
-                required_transaction_confirmations, transaction_network_id)
+            with _blockchain_utilities_lock:
+                blockchain_utilities_factory = \
+                    _import_blockchain_utilities_factory()
+                blockchain_utilities_factory.initialize_blockchain_utilities(
+                    self.get_blockchain(), [blockchain_node_url],
+                    fallback_blockchain_nodes_urls, average_block_time,
+                    required_transaction_confirmations, transaction_network_id)
+                # The process-wide utilities are replaced on each
+                # initialization, so that each client keeps its own
+                # instance (e.g. with the blockchain nodes of its own
+                # client context)
+                self.__utilities = \
+                    blockchain_utilities_factory.get_blockchain_utilities(
+                        self.get_blockchain())
         except BlockchainUtilitiesError:
             raise self._create_error(
                 'unable to initialize the {} utilities'.format(
@@ -155,11 +175,20 @@ class BlockchainClient(BlockchainHandler, ErrorCreator[BlockchainClientError]):
         blocks_to_search : int | None
             The blocks to search for the token transfer on the
             destination blockchain.
+        source_transaction_timestamp_reader : Callable | None
+            Reads the timestamp (in seconds since the epoch) of the
+            token transfer's transaction on the source blockchain, or
+            returns None if it is unknown. It is only called if the
+            token transfer must be searched on the destination
+            blockchain. If the timestamp is known, blocks older than
+            the source transaction are not searched.
 
         """
         source_blockchain: Blockchain
         source_transaction_id: str
         blocks_to_search: int | None = None
+        source_transaction_timestamp_reader: typing.Callable[
+            [], int | None] | None = None
 
     @dataclasses.dataclass
     class DestinationTransferResponse:
@@ -329,6 +358,50 @@ class BlockchainClient(BlockchainHandler, ErrorCreator[BlockchainClientError]):
         """
         pass  # pragma: no cover
 
+    def compute_transfer_signatures(
+        self, requests: typing.Sequence[
+            typing.Union[ComputeTransferSignatureRequest,
+                         ComputeTransferFromSignatureRequest]]
+    ) -> list[typing.Union[ComputeTransferSignatureResponse,
+                           ComputeTransferFromSignatureResponse,
+                           BlockchainClientError]]:
+        """Compute the sender's signatures for multiple single-chain
+        and cross-chain token transfers. Blockchain clients may compute
+        the signatures in parallel.
+
+        Parameters
+        ----------
+        requests : sequence of ComputeTransferSignatureRequest or
+                ComputeTransferFromSignatureRequest
+            The request data for computing the transfer signatures.
+
+        Returns
+        -------
+        list of ComputeTransferSignatureResponse or
+                ComputeTransferFromSignatureResponse or
+                BlockchainClientError
+            For each request (in the same order), either the response
+            data with the computed transfer signature or the error that
+            prevented the signature from being computed.
+
+        """
+        results: list[
+            typing.Union[BlockchainClient.ComputeTransferSignatureResponse,
+                         BlockchainClient.ComputeTransferFromSignatureResponse,
+                         BlockchainClientError]] = []
+        for request in requests:
+            try:
+                if isinstance(
+                        request,
+                        BlockchainClient.ComputeTransferSignatureRequest):
+                    results.append(self.compute_transfer_signature(request))
+                else:
+                    results.append(
+                        self.compute_transfer_from_signature(request))
+            except BlockchainClientError as error:
+                results.append(error)
+        return results
+
     @abc.abstractmethod
     def is_valid_recipient_address(self, recipient_address: str) -> bool:
         """Determine if an address string is a valid recipient address
@@ -475,6 +548,61 @@ class BlockchainClient(BlockchainHandler, ErrorCreator[BlockchainClientError]):
         """
         pass  # pragma: no cover
 
+    def read_destination_transfers(
+            self, requests: typing.Sequence[DestinationTransferRequest]) \
+            -> list[typing.Optional[DestinationTransferResponse]]:
+        """Read multiple token transfers on the destination blockchain.
+
+        Parameters
+        ----------
+        requests : sequence of DestinationTransferRequest
+            The request data for reading the token transfers.
+
+        Returns
+        -------
+        list of DestinationTransferResponse or None
+            For each request (in the same order), either the response
+            data with the token transfer information or None if the
+            token transfer is unknown.
+
+        Raises
+        ------
+        BlockchainClientError
+            If the token transfers cannot be read.
+
+        """
+        responses: list[typing.Optional[
+            BlockchainClient.DestinationTransferResponse]] = []
+        for request in requests:
+            try:
+                responses.append(self.read_destination_transfer(request))
+            except UnknownTransferError:
+                responses.append(None)
+        return responses
+
+    @abc.abstractmethod
+    def read_transaction_timestamp(self, transaction_id: str) -> int:
+        """Read the timestamp of a transaction's block.
+
+        Parameters
+        ----------
+        transaction_id : str
+            The ID of the transaction.
+
+        Returns
+        -------
+        int
+            The timestamp (in seconds since the epoch) of the block
+            that includes the transaction.
+
+        Raises
+        ------
+        BlockchainClientError
+            If the transaction timestamp cannot be read.
+
+        """
+        pass  # pragma: no cover
+
     def read_token_balance(self, token_address: BlockchainAddress,
                            account_id: AccountId) -> int:
         """Read a blockchain account's balance of a Pantos-compatible
@@ -508,6 +636,39 @@ class BlockchainClient(BlockchainHandler, ErrorCreator[BlockchainClientError]):
                 'unable to read the token balance of a blockchain account',
                 token_address=token_address, account_id=account_id)
 
+    def read_multiple_token_balances(
+            self,
+            token_account_ids: typing.Sequence[tuple[BlockchainAddress,
+                                                     AccountId]]) \
+            -> list[int]:
+        """Read the balances of multiple blockchain accounts and
+        Pantos-compatible tokens. Blockchain clients may aggregate the
+        reads into a smaller number of node requests.
+
+        Parameters
+        ----------
+        token_account_ids : sequence of tuple of BlockchainAddress and
+                AccountId
+            Pairs of a token's blockchain address and the identifier of
+            a blockchain account.
+
+        Returns
+        -------
+        list of int
+            The blockchain accounts' token balances in the tokens'
+            smallest subunits (in the same order as the given pairs).
+
+        Raises
+        ------
+        BlockchainClientError
+            If any of the token balances cannot be read.
+
+        """
+        return [
+            self.read_token_balance(token_address, account_id)
+            for token_address, account_id in token_account_ids
+        ]
+
     @abc.abstractmethod
     def read_token_decimals(self, token_address: BlockchainAddress) -> int:
         """Read the number of decimals of a Pantos-compatible token.
@@ -530,6 +691,43 @@ class BlockchainClient(BlockchainHandler, ErrorCreator[BlockchainClientError]):
         """
         pass  # pragma: no cover
 
+    def read_multiple_token_decimals(
+            self,
+            token_addresses: typing.Sequence[BlockchainAddress]) -> list[int]:
+        """Read the numbers of decimals of multiple Pantos-compatible
+        tokens. Blockchain clients may aggregate the reads into a
+        smaller number of node requests.
+
+        Parameters
+        ----------
+        token_addresses : sequence of BlockchainAddress
+            The blockchain addresses of the tokens.
+
+        Returns
+        -------
+        list of int
+            The numbers of decimals of the tokens (in the same order as
+            the given token addresses).
+
+        Raises
+        ------
+        BlockchainClientError
+            If any of the tokens' numbers of decimals cannot be read.
+
+        """
+        return [
+            self.read_token_decimals(token_address)
+            for token_address in token_addresses
+        ]
+
+    def close(self) -> None:
+        """Release the resources held by the blockchain client (e.g.
+        open database connections and cached node connections). The
+        client must not be used afterwards.
+
+        """
+        pass
+
     def _create_unknown_transfer_error(
             self, **kwargs: typing.Any) -> BlockchainClientError:
         return self._create_error(specialized_error_class=UnknownTransferError,
@@ -545,4 +743,14 @@ class BlockchainClient(BlockchainHandler, ErrorCreator[BlockchainClientError]):
         return get_blockchain_config(self.get_blockchain())
 
     def _get_utilities(self) -> BlockchainUtilities:
-        return get_blockchain_utilities(self.get_blockchain())
+        return self.__utilities
+
+
+def _import_blockchain_utilities_factory() -> types.ModuleType:
+    # Importing the factory imports the utilities of all blockchains
+    # (and with them web3), so it is deferred until it is first needed
+    global _blockchain_utilities_factory
+    if _blockchain_utilities_factory is None:
+        _blockchain_utilities_factory = importlib.import_module(
+            _BLOCKCHAIN_UTILITIES_FACTORY_MODULE)
+    return _blockchain_utilities_factory
@@ -1,9 +1,19 @@
 """Module for Ethereum-specific clients and errors.
 
 """
+import collections
+import concurrent.futures
+import contextlib
+import itertools
+import math
 import secrets
+import threading
+import time
 import typing
+import urllib.parse
 
+import eth_abi
+import semantic_version  # type: ignore
 import web3
 import web3.contract
 import web3.types
@@ -12,12 +22,24 @@ from pantos.common.blockchains.base import NodeConnections
 from pantos.common.blockchains.base import VersionedContractAbi
 from pantos.common.blockchains.enums import ContractAbi
 from pantos.common.blockchains.ethereum import EthereumUtilities
+from pantos.common.types import AccountId
 from pantos.common.types import BlockchainAddress
 
 from pantos.client.library.blockchains.base import BlockchainClient
 from pantos.client.library.blockchains.base import BlockchainClientError
 from pantos.client.library.blockchains.base import UnknownTransferError
+from pantos.client.library.blockchains.index import BlockRange
+from pantos.client.library.blockchains.index import DestinationTransferIndex
+from pantos.client.library.blockchains.signing import Eip712StructEncoder
+from pantos.client.library.blockchains.signing import TransferSigningJob
+from pantos.client.library.blockchains.signing import \
+    get_transfer_signing_engine
+from pantos.client.library.blockchains.signing import sign_transfer_message
 from pantos.client.library.constants import TOKEN_SYMBOL_PAN
+from pantos.client.library.executors import get_executor
+from pantos.client.library.instrumentation import instrument_stage
+from pantos.client.library.metrics import get_metrics_registry
+from pantos.client.library.metrics import record_cache_access
 
 _EIP712_DOMAIN_NAME = 'Pantos'
 
@@ -115,9 +137,247 @@ _TRANSFER_FROM_MESSAGE_TYPES = {
     }]
 }
 
+_EIP712_DOMAIN_TYPES = {
+    'EIP712Domain': [{
+        'name': 'name',
+        'type': 'string'
+    }, {
+        'name': 'version',
+        'type': 'string'
+    }, {
+        'name': 'chainId',
+        'type': 'uint256'
+    }, {
+        'name': 'verifyingContract',
+        'type': 'address'
+    }]
+}
+
+_MULTICALL3_ABI = [{
+    'name': 'aggregate3',
+    'type': 'function',
+    'stateMutability': 'payable',
+    'inputs': [{
+        'name': 'calls',
+        'type': 'tuple[]',
+        'components': [{
+            'name': 'target',
+            'type': 'address'
+        }, {
+            'name': 'allowFailure',
+            'type': 'bool'
+        }, {
+            'name': 'callData',
+            'type': 'bytes'
+        }]
+    }],
+    'outputs': [{
+        'name': 'returnData',
+        'type': 'tuple[]',
+        'components': [{
+            'name': 'success',
+            'type': 'bool'
+        }, {
+            'name': 'returnData',
+            'type': 'bytes'
+        }]
+    }]
+}]
+"""Application binary interface of the Multicall3 aggregate3 function."""
+
+_BALANCE_OF_SELECTOR = bytes.fromhex('70a08231')
+"""Function selector of ERC-20 balanceOf(address)."""
+
+_DECIMALS_SELECTOR = bytes.fromhex('313ce567')
+"""Function selector of ERC-20 decimals()."""
+
+_IS_VALID_SENDER_NONCE_SELECTOR = bytes.fromhex('15089e1a')
+"""Function selector of the Pantos Hub's isValidSenderNonce(address,
+uint256)."""
+
+_BLOCK_TIMESTAMP_TOLERANCE = 300
+"""Number of seconds that block timestamps of different blockchains are
+allowed to deviate from each other."""
+
+_TOKEN_CONTRACTS_CACHE_SIZE = 256
+"""Maximum number of token contract instances cached per client."""
+
+_MULTICALL_MAX_FAILURES = 3
+"""Number of consecutive failed Multicall3 calls after which read-only
+calls are no longer aggregated for a while."""
+
+_MULTICALL_RETRY_INTERVAL = 600
+"""Number of seconds during which read-only calls are not aggregated
+after repeated Multicall3 failures."""
+
 Web3Contract: typing.TypeAlias = NodeConnections.Wrapper[
     web3.contract.Contract]
 
+_TransferSignatureRequest: typing.TypeAlias = typing.Union[
+    BlockchainClient.ComputeTransferSignatureRequest,
+    BlockchainClient.ComputeTransferFromSignatureRequest]
+"""Request data for computing a single-chain or cross-chain transfer
+signature."""
+
+_TransferSignatureResult: typing.TypeAlias = typing.Union[
+    BlockchainClient.ComputeTransferSignatureResponse,
+    BlockchainClient.ComputeTransferFromSignatureResponse,
+    BlockchainClientError]
+"""Response data for computing a single-chain or cross-chain transfer
+signature, or the error that prevented the signature from being
+computed."""
+
+
+class _ServiceNodeRegistry:
+    """Thread-safe cache for the service node addresses and records
+    registered at a Pantos Hub contract. The cached entries are
+    discarded once they are older than a time to live or, optionally,
+    as soon as a new block is seen.
+
+    """
+    def __init__(self):
+        self.__lock = threading.Lock()
+        self.__service_node_addresses: typing.Optional[
+            list[BlockchainAddress]] = None
+        self.__service_node_records: dict[BlockchainAddress,
+                                          typing.Sequence[typing.Any]] = {}
+        self.__expiry_time: typing.Optional[float] = None
+        self.__block_number: typing.Optional[int] = None
+
+    def get_service_node_addresses(
+            self) -> typing.Optional[list[BlockchainAddress]]:
+        with self.__lock:
+            self.__discard_if_expired()
+            service_node_addresses = self.__service_node_addresses
+        record_cache_access('service_node_addresses', service_node_addresses
+                            is not None)
+        return service_node_addresses
+
+    def set_service_node_addresses(
+            self, service_node_addresses: list[BlockchainAddress],
+            time_to_live: float) -> None:
+        with self.__lock:
+            self.__discard_if_expired()
+            self.__service_node_addresses = service_node_addresses
+            self.__start_expiry(time_to_live)
+
+    def get_service_node_record(
+            self, service_node_address: BlockchainAddress) \
+            -> typing.Optional[typing.Sequence[typing.Any]]:
+        with self.__lock:
+            self.__discard_if_expired()
+            service_node_record = self.__service_node_records.get(
+                service_node_address)
+        record_cache_access('service_node_records', service_node_record
+                            is not None)
+        return service_node_record
+
+    def set_service_node_record(self, service_node_address: BlockchainAddress,
+                                service_node_record: typing.Sequence[
+                                    typing.Any], time_to_live: float) -> None:
+        with self.__lock:
+            self.__discard_if_expired()
+            self.__service_node_records[service_node_address] = \
+                service_node_record
+            self.__start_expiry(time_to_live)
+
+    def observe_block_number(self, block_number: int) -> None:
+        with self.__lock:
+            if (self.__block_number is not None
+                    and block_number > self.__block_number):
+                self.__discard()
+            if self.__block_number is None or \
+                    block_number > self.__block_number:
+                self.__block_number = block_number
+
+    def clear(self) -> None:
+        with self.__lock:
+            self.__discard()
+            self.__block_number = None
+
+    def __start_expiry(self, time_to_live: float) -> None:
+        if self.__expiry_time is None:
+            self.__expiry_time = time.monotonic() + time_to_live
+
+    def __discard_if_expired(self) -> None:
+        if (self.__expiry_time is not None
+                and time.monotonic() >= self.__expiry_time):
+            self.__discard()
+
+    def __discard(self) -> None:
+        self.__service_node_addresses = None
+        self.__service_node_records.clear()
+        self.__expiry_time = None
+
+
+class _SenderNoncePool:
+    """Thread-safe pool of sender nonces that have already been
+    validated at a Pantos Hub contract. A pooled nonce is issued only
+    once. Nonces that have already been issued are not remembered,
+    since a collision of two random 256-bit nonces within a process is
+    negligible.
+
+    """
+    def __init__(self):
+        self.__lock = threading.Lock()
+        self.__sender_nonces: dict[BlockchainAddress,
+                                   collections.deque[int]] = {}
+        self.__refilling_sender_addresses: set[BlockchainAddress] = set()
+
+    def generate_candidates(self, sender_address: BlockchainAddress,
+                            number_candidates: int) -> list[int]:
+        with self.__lock:
+            pooled_sender_nonces = set(
+                self.__sender_nonces.get(sender_address, ()))
+        return list({secrets.randbits(256)
+                     for _ in range(number_candidates)} - pooled_sender_nonces)
+
+    def add(self, sender_address: BlockchainAddress,
+            sender_nonces: typing.Iterable[int]) -> None:
+        with self.__lock:
+            pooled_sender_nonces = self.__sender_nonces.setdefault(
+                sender_address, collections.deque())
+            known_sender_nonces = set(pooled_sender_nonces)
+            for sender_nonce in sender_nonces:
+                if sender_nonce not in known_sender_nonces:
+                    known_sender_nonces.add(sender_nonce)
+                    pooled_sender_nonces.append(sender_nonce)
+
+    def take(self, sender_address: BlockchainAddress) -> typing.Optional[int]:
+        with self.__lock:
+            pooled_sender_nonces = self.__sender_nonces.get(sender_address)
+            if not pooled_sender_nonces:
+                return None
+            return pooled_sender_nonces.popleft()
+
+    def count(self, sender_address: BlockchainAddress) -> int:
+        with self.__lock:
+            return len(self.__sender_nonces.get(sender_address, ()))
+
+    def start_refill(self, sender_address: BlockchainAddress) -> bool:
+        with self.__lock:
+            if sender_address in self.__refilling_sender_addresses:
+                return False
+            self.__refilling_sender_addresses.add(sender_address)
+            return True
+
+    def finish_refill(self, sender_address: BlockchainAddress) -> None:
+        with self.__lock:
+            self.__refilling_sender_addresses.discard(sender_address)
+
+
+_EIP712_DOMAIN_ENCODER = Eip712StructEncoder('EIP712Domain',
+                                             _EIP712_DOMAIN_TYPES)
+"""Encoder for the EIP-712 domain of the transfer messages."""
+
+_TRANSFER_MESSAGE_ENCODER = Eip712StructEncoder('Transfer',
+                                                _TRANSFER_MESSAGE_TYPES)
+"""Encoder for the EIP-712 Transfer messages."""
+
+_TRANSFER_FROM_MESSAGE_ENCODER = Eip712StructEncoder(
+    'TransferFrom', _TRANSFER_FROM_MESSAGE_TYPES)
+"""Encoder for the EIP-712 TransferFrom messages."""
+
 
 class EthereumClientError(BlockchainClientError):
     """Exception class for all Ethereum client errors.
@@ -130,6 +390,24 @@ class EthereumClient(BlockchainClient):
     """Ethereum-specific blockchain client.
 
     """
+    def __init__(self, protocol_version: semantic_version.Version):
+        # Docstring inherited
+        super().__init__(protocol_version)
+        self.__service_node_registry = _ServiceNodeRegistry()
+        self.__sender_nonce_pool = _SenderNoncePool()
+        # EIP-712 domain separators by chain ID and forwarder address
+        self.__eip712_domain_separators: dict[tuple[int, str], bytes] = {}
+        self.__contracts_lock = threading.Lock()
+        self.__node_connections: typing.Optional[NodeConnections] = None
+        self.__hub_contract: typing.Optional[Web3Contract] = None
+        self.__multicall_contract: typing.Optional[Web3Contract] = None
+        self.__multicall_failures = 0
+        self.__multicall_disabled_until = 0.0
+        self.__token_contracts: collections.OrderedDict[
+            BlockchainAddress, Web3Contract] = collections.OrderedDict()
+        self.__destination_transfer_index: typing.Optional[
+            DestinationTransferIndex] = None
+
     def compute_transfer_signature(
             self, request: BlockchainClient.ComputeTransferSignatureRequest) \
             -> BlockchainClient.ComputeTransferSignatureResponse:
@@ -137,17 +415,13 @@ class EthereumClient(BlockchainClient):
         try:
             sender_address = self._account_id_to_account_address(
                 request.sender_private_key)
-            node_connections = self._get_utilities().create_node_connections()
-            hub_contract = self._create_hub_contract(node_connections)
-            sender_nonce = self.__generate_sender_nonce(
-                hub_contract, sender_address)
-            domain_data = self.__get_eip712_domain_data()
-            message_data = self.__get_transfer_message_data(
-                request, sender_address, sender_nonce)
-            signed_message = web3.Account.sign_typed_data(
-                request.sender_private_key, domain_data,
-                _TRANSFER_MESSAGE_TYPES, message_data)
-            signature = signed_message.signature.to_0x_hex()
+            hub_contract = self._get_hub_contract()
+            with instrument_stage('sender_nonce'):
+                sender_nonce = self.__generate_sender_nonce(
+                    hub_contract, sender_address)
+            with instrument_stage('signature'):
+                signature = self._sign_transfer(request, sender_address,
+                                                sender_nonce)
             return BlockchainClient.ComputeTransferSignatureResponse(
                 sender_address, sender_nonce, signature)
         except Exception:
@@ -163,17 +437,13 @@ class EthereumClient(BlockchainClient):
         try:
             sender_address = self._account_id_to_account_address(
                 request.sender_private_key)
-            node_connections = self._get_utilities().create_node_connections()
-            hub_contract = self._create_hub_contract(node_connections)
-            sender_nonce = self.__generate_sender_nonce(
-                hub_contract, sender_address)
-            domain_data = self.__get_eip712_domain_data()
-            message_data = self.__get_transfer_from_message_data(
-                request, sender_address, sender_nonce)
-            signed_message = web3.Account.sign_typed_data(
-                request.sender_private_key, domain_data,
-                _TRANSFER_FROM_MESSAGE_TYPES, message_data)
-            signature = signed_message.signature.to_0x_hex()
+            hub_contract = self._get_hub_contract()
+            with instrument_stage('sender_nonce'):
+                sender_nonce = self.__generate_sender_nonce(
+                    hub_contract, sender_address)
+            with instrument_stage('signature'):
+                signature = self._sign_transfer_from(request, sender_address,
+                                                     sender_nonce)
             return BlockchainClient.ComputeTransferFromSignatureResponse(
                 sender_address, sender_nonce, signature)
         except Exception:
@@ -181,6 +451,55 @@ class EthereumClient(BlockchainClient):
                 'unable to compute a cross-chain transfer signature',
                 request=request)
 
+    def compute_transfer_signatures(
+            self, requests: typing.Sequence[_TransferSignatureRequest]) \
+            -> list[_TransferSignatureResult]:
+        # Docstring inherited
+        results: list[
+            typing.Optional[_TransferSignatureResult]] = [None] * len(requests)
+        # The sender nonces are generated in this process, while the
+        # messages are hashed and signed by the transfer signing engine
+        signing_jobs = []
+        # Request index, sender address and sender nonce of each job
+        signing_job_transfers: list[tuple[int, BlockchainAddress, int]] = []
+        for index, request in enumerate(requests):
+            try:
+                sender_address = self._account_id_to_account_address(
+                    request.sender_private_key)
+                with instrument_stage('sender_nonce'):
+                    sender_nonce = self.__generate_sender_nonce(
+                        self._get_hub_contract(), sender_address)
+                signing_jobs.append(
+                    self.__create_transfer_signing_job(request, sender_address,
+                                                       sender_nonce))
+                signing_job_transfers.append(
+                    (index, sender_address, sender_nonce))
+            except Exception:
+                results[index] = self._create_error(
+                    'unable to compute a transfer signature', request=request)
+        try:
+            with instrument_stage('signature'):
+                signatures = get_transfer_signing_engine().sign(signing_jobs)
+        except Exception:
+            for index, _, _ in signing_job_transfers:
+                results[index] = self._create_error(
+                    'unable to compute a transfer signature',
+                    request=requests[index])
+            return typing.cast(list, results)
+        for (index, sender_address,
+             sender_nonce), signature in zip(signing_job_transfers,
+                                             signatures):
+            if isinstance(requests[index],
+                          BlockchainClient.ComputeTransferSignatureRequest):
+                results[index] = \
+                    BlockchainClient.ComputeTransferSignatureResponse(
+                        sender_address, sender_nonce, signature)
+            else:
+                results[index] = \
+                    BlockchainClient.ComputeTransferFromSignatureResponse(
+                        sender_address, sender_nonce, signature)
+        return typing.cast(list, results)
+
     def is_valid_recipient_address(self, recipient_address: str) -> bool:
         # Docstring inherited
         is_valid_address = int(recipient_address, 0) != 0 and \
@@ -202,8 +521,7 @@ class EthereumClient(BlockchainClient):
             destination_blockchain: Blockchain) -> BlockchainAddress:
         # Docstring inherited
         try:
-            node_connections = self._get_utilities().create_node_connections()
-            hub_contract = self._create_hub_contract(node_connections)
+            hub_contract = self._get_hub_contract()
             external_token_record = \
                 hub_contract.caller().getExternalTokenRecord(
                     token_address, destination_blockchain.value).get()
@@ -228,14 +546,22 @@ class EthereumClient(BlockchainClient):
     def read_service_node_addresses(self) -> list[BlockchainAddress]:
         # Docstring inherited
         try:
-            node_connections = self._get_utilities().create_node_connections()
-            hub_contract = self._create_hub_contract(node_connections)
+            node_connections = self._get_node_connections()
+            time_to_live = self.__refresh_service_node_registry(
+                node_connections)
             service_node_addresses = \
-                hub_contract.caller().getServiceNodes().get()
-            return [
-                BlockchainAddress(service_node_address)
-                for service_node_address in sorted(service_node_addresses)
-            ]
+                self.__service_node_registry.get_service_node_addresses()
+            if service_node_addresses is None:
+                hub_contract = self._get_hub_contract()
+                service_node_addresses = [
+                    BlockchainAddress(service_node_address)
+                    for service_node_address in sorted(
+                        hub_contract.caller().getServiceNodes().get())
+                ]
+                if time_to_live > 0:
+                    self.__service_node_registry.set_service_node_addresses(
+                        service_node_addresses, time_to_live)
+            return list(service_node_addresses)
         except Exception:
             raise self._create_error(
                 'unable to read the active service node addresses')
@@ -244,11 +570,22 @@ class EthereumClient(BlockchainClient):
                               service_node_address: BlockchainAddress) -> str:
         # Docstring inherited
         try:
-            node_connections = self._get_utilities().create_node_connections()
-            hub_contract = self._create_hub_contract(node_connections)
-            service_node_record = hub_contract.caller().getServiceNodeRecord(
-                service_node_address).get()
-            assert len(service_node_record) == 5
+            node_connections = self._get_node_connections()
+            time_to_live = self.__refresh_service_node_registry(
+                node_connections)
+            service_node_record = \
+                self.__service_node_registry.get_service_node_record(
+                    service_node_address)
+            if service_node_record is None:
+                hub_contract = self._get_hub_contract()
+                service_node_record = \
+                    hub_contract.caller().getServiceNodeRecord(
+                        service_node_address).get()
+                assert len(service_node_record) == 5
+                if time_to_live > 0:
+                    self.__service_node_registry.set_service_node_record(
+                        service_node_address, service_node_record,
+                        time_to_live)
             service_node_active = service_node_record[0]
             if not service_node_active:
                 raise self._create_error(
@@ -263,52 +600,171 @@ class EthereumClient(BlockchainClient):
             raise self._create_error('unable to read a service node URL',
                                      service_node_address=service_node_address)
 
+    def clear_service_node_registry(self) -> None:
+        """Discard the cached service node addresses and records so
+        that they are read again from the Pantos Hub contract.
+
+        """
+        self.__service_node_registry.clear()
+
     def read_destination_transfer(
             self, request: BlockchainClient.DestinationTransferRequest) \
             -> BlockchainClient.DestinationTransferResponse:
         # Docstring inherited
         try:
-            node_connections = self._get_utilities().create_node_connections()
-            to_block_number = \
-                node_connections.eth.get_block_number().get_minimum_result()
-            from_block_number = (to_block_number - request.blocks_to_search +
-                                 1 if request.blocks_to_search else 0)
-            blocks_per_query = self._get_config()['blocks_per_query']
-            hub_contract = self._create_hub_contract(node_connections)
-            transfer_event = typing.cast(
-                NodeConnections.Wrapper[web3.contract.contract.ContractEvent],
-                hub_contract.events.TransferToSucceeded())
-            for to_block_number_ in range(to_block_number + 1,
-                                          from_block_number,
-                                          -blocks_per_query):
-                from_block_number_ = max(to_block_number_ - blocks_per_query,
-                                         from_block_number)
-                transfer_event_logs = self._get_utilities().get_logs(
-                    transfer_event, from_block_number_, to_block_number_ - 1)
-                transfer_response = self.__find_destination_transfer(
-                    transfer_event_logs, request.source_transaction_id,
-                    request.source_blockchain, to_block_number)
-                if transfer_response:
-                    return transfer_response
-            raise self._create_unknown_transfer_error(request=request)
+            transfer_response = self.__read_destination_transfers([request])[0]
+            if transfer_response is None:
+                raise self._create_unknown_transfer_error(request=request)
+            return transfer_response
         except UnknownTransferError:
             raise
         except Exception:
             raise self._create_error('unable to read a destination transfer',
                                      request=request)
 
+    def read_destination_transfers(
+            self, requests: typing.Sequence[
+                BlockchainClient.DestinationTransferRequest]) \
+            -> list[typing.Optional[
+                BlockchainClient.DestinationTransferResponse]]:
+        # Docstring inherited
+        try:
+            return self.__read_destination_transfers(requests)
+        except Exception:
+            raise self._create_error('unable to read destination transfers',
+                                     requests=requests)
+
+    def read_transaction_timestamp(self, transaction_id: str) -> int:
+        # Docstring inherited
+        try:
+            node_connections = self._get_node_connections()
+            block_number = node_connections.eth.get_transaction(
+                transaction_id).get()['blockNumber']
+            assert block_number is not None
+            return self.__read_block_timestamp(node_connections, block_number)
+        except Exception:
+            raise self._create_error(
+                'unable to read the timestamp of a transaction',
+                transaction_id=transaction_id)
+
+    def read_token_balance(self, token_address: BlockchainAddress,
+                           account_id: AccountId) -> int:
+        # Docstring inherited
+        try:
+            account_address = self._account_id_to_account_address(account_id)
+            token_contract = self._get_token_contract(token_address)
+            return token_contract.caller().balanceOf(account_address).get()
+        except Exception:
+            raise self._create_error(
+                'unable to read the token balance of a blockchain account',
+                token_address=token_address, account_id=account_id)
+
     def read_token_decimals(self, token_address: BlockchainAddress) -> int:
         # Docstring inherited
         try:
-            node_connections = self._get_utilities().create_node_connections()
-            token_contract = self._create_token_contract(
-                node_connections, token_address)
+            token_contract = self._get_token_contract(token_address)
             return token_contract.caller().decimals().get()
         except Exception:
             raise self._create_error(
                 'unable to read the number of decimals of a token',
                 token_address=token_address)
 
+    def read_multiple_token_balances(
+            self,
+            token_account_ids: typing.Sequence[tuple[BlockchainAddress,
+                                                     AccountId]]) \
+            -> list[int]:
+        # Docstring inherited
+        try:
+            calls = []
+            for token_address, account_id in token_account_ids:
+                account_address = self._account_id_to_account_address(
+                    account_id)
+                calls.append((token_address, _BALANCE_OF_SELECTOR +
+                              eth_abi.encode(['address'], [account_address])))
+            token_balances = self.__aggregate_calls(calls, 'uint256')
+            return [
+                token_balance if token_balance is not None else
+                self.read_token_balance(*token_account_ids[index])
+                for index, token_balance in enumerate(token_balances)
+            ]
+        except EthereumClientError:
+            raise
+        except Exception:
+            raise self._create_error(
+                'unable to read the token balances of blockchain accounts',
+                number_balances=len(token_account_ids))
+
+    def read_multiple_token_decimals(
+            self,
+            token_addresses: typing.Sequence[BlockchainAddress]) -> list[int]:
+        # Docstring inherited
+        try:
+            calls = [(token_address, _DECIMALS_SELECTOR)
+                     for token_address in token_addresses]
+            tokens_decimals = self.__aggregate_calls(calls, 'uint8')
+            return [
+                token_decimals if token_decimals is not None else
+                self.read_token_decimals(token_addresses[index])
+                for index, token_decimals in enumerate(tokens_decimals)
+            ]
+        except EthereumClientError:
+            raise
+        except Exception:
+            raise self._create_error(
+                'unable to read the numbers of decimals of tokens',
+                token_addresses=token_addresses)
+
+    def close(self) -> None:
+        # Docstring inherited
+        with self.__contracts_lock:
+            destination_transfer_index = self.__destination_transfer_index
+            self.__destination_transfer_index = None
+            self.__node_connections = None
+            self.__hub_contract = None
+            self.__multicall_contract = None
+            self.__multicall_failures = 0
+            self.__multicall_disabled_until = 0.0
+            self.__token_contracts.clear()
+        if destination_transfer_index is not None:
+            destination_transfer_index.close()
+
+    def _get_node_connections(self) -> NodeConnections:
+        with self.__contracts_lock:
+            if self.__node_connections is None:
+                node_connections = \
+                    self._get_utilities().create_node_connections()
+                for node_connection in \
+                        node_connections.get_configured_node_connections():
+                    node_connection.middleware_onion.add(
+                        self.__create_rpc_metrics_middleware(node_connection))
+                self.__node_connections = node_connections
+            return self.__node_connections
+
+    def _get_hub_contract(self) -> Web3Contract:
+        node_connections = self._get_node_connections()
+        with self.__contracts_lock:
+            if self.__hub_contract is None:
+                self.__hub_contract = self._create_hub_contract(
+                    node_connections)
+            return self.__hub_contract
+
+    def _get_token_contract(self,
+                            token_address: BlockchainAddress) -> Web3Contract:
+        node_connections = self._get_node_connections()
+        with self.__contracts_lock:
+            token_contract = self.__token_contracts.get(token_address)
+            record_cache_access('token_contracts', token_contract is not None)
+            if token_contract is None:
+                token_contract = self._create_token_contract(
+                    node_connections, token_address)
+                self.__token_contracts[token_address] = token_contract
+                if len(self.__token_contracts) > _TOKEN_CONTRACTS_CACHE_SIZE:
+                    self.__token_contracts.popitem(last=False)
+            else:
+                self.__token_contracts.move_to_end(token_address)
+            return token_contract
+
     def _create_hub_contract(
             self, node_connections: NodeConnections) \
             -> NodeConnections.Wrapper[web3.contract.Contract]:
@@ -337,13 +793,548 @@ class EthereumClient(BlockchainClient):
         # Docstring inherited
         return typing.cast(EthereumUtilities, super()._get_utilities())
 
+    def _sign_transfer(
+            self, request: BlockchainClient.ComputeTransferSignatureRequest,
+            sender_address: BlockchainAddress, sender_nonce: int) -> str:
+        return sign_transfer_message(
+            self.__create_transfer_signing_job(request, sender_address,
+                                               sender_nonce))
+
+    def _sign_transfer_from(
+            self,
+            request: BlockchainClient.ComputeTransferFromSignatureRequest,
+            sender_address: BlockchainAddress, sender_nonce: int) -> str:
+        return sign_transfer_message(
+            self.__create_transfer_signing_job(request, sender_address,
+                                               sender_nonce))
+
+    def _take_sender_nonce(
+            self, sender_address: BlockchainAddress) -> typing.Optional[int]:
+        # Takes an already validated sender nonce from the pool without
+        # any blocking RPC (None if the pool is empty)
+        sender_nonce = self.__sender_nonce_pool.take(sender_address)
+        if sender_nonce is not None:
+            self.__start_sender_nonce_pool_refill(sender_address)
+        return sender_nonce
+
+    def _generate_sender_nonce(self, sender_address: BlockchainAddress) -> int:
+        # Blocks to validate new sender nonces if the pool is empty
+        return self.__generate_sender_nonce(self._get_hub_contract(),
+                                            sender_address)
+
+    def __read_destination_transfers(
+            self, requests: typing.Sequence[
+                BlockchainClient.DestinationTransferRequest]) \
+            -> list[typing.Optional[
+                BlockchainClient.DestinationTransferResponse]]:
+        # Searches all requested token transfers in a single sweep over
+        # the TransferToSucceeded event logs, starting with the most
+        # recent block. The sweep ends as soon as each token transfer
+        # has been found or its block range has been searched.
+        node_connections = self._get_node_connections()
+        with instrument_stage('block_number'):
+            to_block_number = \
+                node_connections.eth.get_block_number().get_minimum_result()
+        if self._get_config()['service_node_cache_block_invalidation']:
+            self.__service_node_registry.observe_block_number(to_block_number)
+        transfer_responses: list[typing.Optional[
+            BlockchainClient.DestinationTransferResponse]] = [None
+                                                              ] * len(requests)
+        destination_transfer_index = self.__get_destination_transfer_index()
+        # Indices of the requests by source blockchain ID and source
+        # transaction ID
+        wanted_transfers: dict[tuple[int, str], list[int]] = {}
+        for index, request in enumerate(requests):
+            transfer_key = (int(request.source_blockchain),
+                            request.source_transaction_id)
+            if destination_transfer_index is not None:
+                transfer_responses[index] = \
+                    destination_transfer_index.read_transfer(
+                        *transfer_key, to_block_number)
+                record_cache_access('destination_transfers',
+                                    transfer_responses[index] is not None)
+                if transfer_responses[index] is not None:
+                    continue
+            wanted_transfers.setdefault(transfer_key, []).append(index)
+        if len(wanted_transfers) == 0:
+            return transfer_responses
+        # The source transaction timestamps are only read for the
+        # requests that are not already indexed
+        source_transaction_timestamps = {
+            index: self.__read_source_transaction_timestamp(requests[index])
+            for indices in wanted_transfers.values()
+            for index in indices
+        }
+        first_block_number = self.__find_batch_first_block_number(
+            node_connections, requests, source_transaction_timestamps,
+            to_block_number)
+        # First block numbers to search by source blockchain ID and
+        # source transaction ID
+        from_block_numbers = {
+            transfer_key: min(
+                self.__compute_from_block_number(
+                    requests[index], source_transaction_timestamps[index],
+                    to_block_number, first_block_number) for index in indices)
+            for transfer_key, indices in wanted_transfers.items()
+        }
+        from_block_number = min(from_block_numbers.values())
+        if destination_transfer_index is None:
+            block_ranges = [(from_block_number, to_block_number)]
+        else:
+            block_ranges = \
+                destination_transfer_index.find_unscanned_block_ranges(
+                    from_block_number, to_block_number)
+        blocks_per_query = self._get_config()['blocks_per_query']
+        transfer_event = typing.cast(
+            NodeConnections.Wrapper[web3.contract.contract.ContractEvent],
+            self._get_hub_contract().events.TransferToSucceeded())
+        for block_range in block_ranges:
+            with contextlib.closing(
+                    self.__get_logs_most_recent_first(
+                        transfer_event, *block_range,
+                        blocks_per_query)) as all_transfer_event_logs:
+                for block_window, transfer_event_logs in \
+                        all_transfer_event_logs:
+                    if destination_transfer_index is not None:
+                        self.__index_destination_transfers(
+                            destination_transfer_index, block_window,
+                            transfer_event_logs, to_block_number)
+                    for transfer_event_log in transfer_event_logs:
+                        transfer_event_request = \
+                            transfer_event_log['args']['request']
+                        transfer_key = (
+                            transfer_event_request['sourceBlockchainId'],
+                            transfer_event_request['sourceTransactionId'])
+                        indices = wanted_transfers.pop(transfer_key, None)
+                        if indices is None:
+                            continue
+                        del from_block_numbers[transfer_key]
+                        transfer_response = \
+                            self.__create_destination_transfer_response(
+                                transfer_event_log, to_block_number)
+                        for index in indices:
+                            transfer_responses[index] = transfer_response
+                    for transfer_key, from_block_number in list(
+                            from_block_numbers.items()):
+                        if from_block_number >= block_window[0]:
+                            del wanted_transfers[transfer_key]
+                            del from_block_numbers[transfer_key]
+                    if len(wanted_transfers) == 0:
+                        return transfer_responses
+        return transfer_responses
+
+    def __read_source_transaction_timestamp(
+            self, request: BlockchainClient.DestinationTransferRequest) \
+            -> typing.Optional[int]:
+        if request.source_transaction_timestamp_reader is None:
+            return None
+        return request.source_transaction_timestamp_reader()
+
+    def __find_batch_first_block_number(
+            self, node_connections: NodeConnections, requests: typing.Sequence[
+                BlockchainClient.DestinationTransferRequest],
+            source_transaction_timestamps: dict[int, typing.Optional[int]],
+            to_block_number: int) -> int:
+        # Each search reads about 2*log2(n) block timestamps, so it is
+        # only performed once for the earliest source transaction of
+        # the batch. All requests with a known source transaction
+        # timestamp are searched from that block on. The search is
+        # skipped if the blocks_to_search limits of these requests
+        # already start after the estimated first block.
+        bounded_block_numbers = [
+            self.__compute_from_block_number(requests[index], None,
+                                             to_block_number, 0)
+            for index, source_transaction_timestamp in
+            source_transaction_timestamps.items()
+            if source_transaction_timestamp is not None
+        ]
+        if len(bounded_block_numbers) == 0:
+            return 0
+        return self.__find_first_block_number(
+            node_connections,
+            min(timestamp
+                for timestamp in source_transaction_timestamps.values()
+                if timestamp is not None) - _BLOCK_TIMESTAMP_TOLERANCE,
+            to_block_number, min(bounded_block_numbers))
+
+    def __compute_from_block_number(
+            self, request: BlockchainClient.DestinationTransferRequest,
+            source_transaction_timestamp: typing.Optional[int],
+            to_block_number: int, first_block_number: int) -> int:
+        from_block_number = (to_block_number - request.blocks_to_search +
+                             1 if request.blocks_to_search else 0)
+        if source_transaction_timestamp is not None:
+            from_block_number = max(from_block_number, first_block_number)
+        return from_block_number
+
+    def __get_logs_most_recent_first(
+            self, event: NodeConnections.Wrapper[
+                web3.contract.contract.ContractEvent], from_block_number: int,
+            to_block_number: int, blocks_per_query: int) \
+            -> typing.Generator[tuple[BlockRange, list[web3.types.EventData]],
+                                None, None]:
+        # Yields the block windows and their event logs, starting with
+        # the most recent window. Up to parallel_log_queries windows
+        # are queried concurrently, but the logs are still yielded in
+        # window order.
+        block_windows = self.__generate_block_windows(from_block_number,
+                                                      to_block_number,
+                                                      blocks_per_query)
+        parallel_log_queries = self._get_config()['parallel_log_queries']
+        if parallel_log_queries == 1:
+            for block_window in block_windows:
+                yield block_window, self.__get_logs(event, *block_window)
+            return
+        executor = get_executor()
+        futures: collections.deque[tuple[
+            BlockRange, concurrent.futures.Future]] = collections.deque()
+        try:
+            for block_window in itertools.islice(block_windows,
+                                                 parallel_log_queries):
+                futures.append((block_window,
+                                executor.submit(self.__get_logs, event,
+                                                *block_window)))
+            while len(futures) > 0:
+                block_window, future = futures.popleft()
+                next_block_window = next(block_windows, None)
+                if next_block_window is not None:
+                    futures.append((next_block_window,
+                                    executor.submit(self.__get_logs, event,
+                                                    *next_block_window)))
+                yield block_window, future.result()
+        finally:
+            # Windows older than a match are not needed anymore
+            for _, future in futures:
+                future.cancel()
+
+    def __get_logs(self, event: NodeConnections.Wrapper[
+        web3.contract.contract.ContractEvent], from_block_number: int,
+                   to_block_number: int) -> list[web3.types.EventData]:
+        with instrument_stage('log_window'):
+            return self._get_utilities().get_logs(event, from_block_number,
+                                                  to_block_number)
+
+    def __find_first_block_number(self, node_connections: NodeConnections,
+                                  timestamp: int, latest_block_number: int,
+                                  min_block_number: int = 0) -> int:
+        # Finds the first block with a timestamp not before the given
+        # one (or the latest block if there is no such block). The
+        # search starts at a block number estimated from the average
+        # block time, gallops outwards until the block is enclosed,
+        # and then bisects the enclosing range. If the estimated block
+        # is not after the given minimum block, the minimum block is
+        # returned without searching (as it is a sufficient bound).
+        latest_block_timestamp = self.__read_block_timestamp(
+            node_connections, latest_block_number)
+        if latest_block_timestamp < timestamp:
+            return latest_block_number
+        estimated_blocks = math.ceil((latest_block_timestamp - timestamp) /
+                                     self._get_config()['average_block_time'])
+        block_number = max(latest_block_number - estimated_blocks, 0)
+        if block_number <= min_block_number:
+            return min_block_number
+        if self.__read_block_timestamp(node_connections, 0) >= timestamp:
+            return 0
+        # Invariant: timestamp(lower) < timestamp <= timestamp(upper)
+        step = 1
+        if self.__read_block_timestamp(node_connections,
+                                       block_number) >= timestamp:
+            upper_block_number = block_number
+            lower_block_number = max(upper_block_number - step, 0)
+            while self.__read_block_timestamp(node_connections,
+                                              lower_block_number) >= timestamp:
+                upper_block_number = lower_block_number
+                step *= 2
+                lower_block_number = max(upper_block_number - step, 0)
+        else:
+            lower_block_number = block_number
+            upper_block_number = min(lower_block_number + step,
+                                     latest_block_number)
+            while self.__read_block_timestamp(node_connections,
+                                              upper_block_number) < timestamp:
+                lower_block_number = upper_block_number
+                step *= 2
+                upper_block_number = min(lower_block_number + step,
+                                         latest_block_number)
+        while upper_block_number - lower_block_number > 1:
+            middle_block_number = (lower_block_number +
+                                   upper_block_number) // 2
+            if self.__read_block_timestamp(node_connections,
+                                           middle_block_number) >= timestamp:
+                upper_block_number = middle_block_number
+            else:
+                lower_block_number = middle_block_number
+        return upper_block_number
+
+    def __read_block_timestamp(self, node_connections: NodeConnections,
+                               block_number: int) -> int:
+        return node_connections.eth.get_block(block_number).get()['timestamp']
+
+    def __generate_block_windows(
+            self, from_block_number: int, to_block_number: int,
+            blocks_per_query: int) -> typing.Iterator[BlockRange]:
+        for to_block_number_ in range(to_block_number + 1, from_block_number,
+                                      -blocks_per_query):
+            from_block_number_ = max(to_block_number_ - blocks_per_query,
+                                     from_block_number)
+            yield from_block_number_, to_block_number_ - 1
+
+    def __get_destination_transfer_index(
+            self) -> typing.Optional[DestinationTransferIndex]:
+        database_path = self._get_config().get('destination_transfer_index')
+        if database_path is None:
+            return None
+        with self.__contracts_lock:
+            if self.__destination_transfer_index is None:
+                self.__destination_transfer_index = DestinationTransferIndex(
+                    database_path,
+                    self.get_blockchain().value,
+                    self._get_config()['hub'])
+            return self.__destination_transfer_index
+
+    def __index_destination_transfers(
+            self, destination_transfer_index: DestinationTransferIndex,
+            block_window: BlockRange,
+            transfer_event_logs: list[web3.types.EventData],
+            latest_block_number: int) -> None:
+        # Only blocks with the required number of confirmations are
+        # indexed since more recent blocks may still be reorganized
+        confirmed_block_number = (latest_block_number -
+                                  self._get_config()['confirmations'])
+        from_block_number = block_window[0]
+        to_block_number = min(block_window[1], confirmed_block_number)
+        if from_block_number > to_block_number:
+            return
+        destination_transfer_index.add_scanned_block_range(
+            from_block_number, to_block_number,
+            ((transfer_event_log['args']['request']['sourceBlockchainId'],
+              transfer_event_log['args']['request']['sourceTransactionId'],
+              self.__create_destination_transfer_response(
+                  transfer_event_log, latest_block_number))
+             for transfer_event_log in transfer_event_logs
+             if transfer_event_log['blockNumber'] <= to_block_number))
+
+    def __create_destination_transfer_response(
+            self, transfer_event_log: web3.types.EventData,
+            latest_block_number: int) \
+            -> BlockchainClient.DestinationTransferResponse:
+        transfer_event_args = transfer_event_log['args']
+        transfer_event_request = transfer_event_args['request']
+        return BlockchainClient.DestinationTransferResponse(
+            latest_block_number, transfer_event_log['blockNumber'],
+            transfer_event_log['transactionHash'].to_0x_hex(),
+            transfer_event_request['sourceTransferId'],
+            transfer_event_args['destinationTransferId'],
+            BlockchainAddress(transfer_event_request['sender']),
+            BlockchainAddress(transfer_event_request['recipient']),
+            BlockchainAddress(transfer_event_request['sourceToken']),
+            BlockchainAddress(transfer_event_request['destinationToken']),
+            transfer_event_request['amount'], transfer_event_request['nonce'],
+            [
+                BlockchainAddress(signer_address)
+                for signer_address in transfer_event_args['signerAddresses']
+            ], [
+                f"0x{signature.hex()}"
+                for signature in transfer_event_args['signatures']
+            ])
+
+    def __aggregate_calls(self, calls: list[tuple[BlockchainAddress, bytes]],
+                          result_type: str) -> list[typing.Optional[int]]:
+        # Aggregates read-only calls into Multicall3 aggregate3 calls.
+        # None is returned for each call whose result is not available
+        # (e.g. because it failed or the batch could not be aggregated).
+        # Each aggregation is recorded as a "multicall" cache access
+        # (a miss if the batch falls back to one call per RPC).
+        results: list[typing.Optional[int]] = [None] * len(calls)
+        if len(calls) == 0:
+            return results
+        blockchain_config = self._get_config()
+        calls_per_multicall = blockchain_config['calls_per_multicall']
+        multicall_contract = self.__get_multicall_contract()
+        for start_index in range(0, len(calls), calls_per_multicall):
+            if time.monotonic() < self.__multicall_disabled_until:
+                # Multicall3 failed repeatedly, so the remaining calls
+                # are not aggregated
+                record_cache_access('multicall', False)
+                break
+            batch = calls[start_index:start_index + calls_per_multicall]
+            try:
+                batch_results = multicall_contract.functions.aggregate3([
+                    (web3.Web3.to_checksum_address(target), True, call_data)
+                    for target, call_data in batch
+                ]).call().get()
+            except Exception:
+                self.__record_multicall_outcome(False)
+                continue
+            self.__record_multicall_outcome(True)
+            for index, (success,
+                        return_data) in enumerate(batch_results, start_index):
+                if success and len(return_data) >= 32:
+                    results[index] = eth_abi.decode([result_type],
+                                                    return_data)[0]
+        return results
+
+    def __record_multicall_outcome(self, succeeded: bool) -> None:
+        # Multicall3 is not used for a while after repeated failures
+        # (e.g. if it is not deployed at the configured address)
+        record_cache_access('multicall', succeeded)
+        with self.__contracts_lock:
+            if succeeded:
+                self.__multicall_failures = 0
+                return
+            self.__multicall_failures += 1
+            if self.__multicall_failures >= _MULTICALL_MAX_FAILURES:
+                self.__multicall_failures = 0
+                self.__multicall_disabled_until = (time.monotonic() +
+                                                   _MULTICALL_RETRY_INTERVAL)
+
+    def __get_multicall_contract(self) -> Web3Contract:
+        node_connections = self._get_node_connections()
+        with self.__contracts_lock:
+            if self.__multicall_contract is None:
+                self.__multicall_contract = node_connections.eth.contract(
+                    address=web3.Web3.to_checksum_address(
+                        self._get_config()['multicall']), abi=_MULTICALL3_ABI)
+            return self.__multicall_contract
+
+    def __create_rpc_metrics_middleware(
+            self, node_connection: web3.Web3) -> typing.Callable:
+        # Web3 middleware that records each JSON-RPC request to the
+        # node in the metrics registry (if metrics are enabled)
+        blockchain = self.get_blockchain().name.lower()
+        endpoint_uri = getattr(node_connection.provider, 'endpoint_uri', '')
+        # The host (and port) only, without any user credentials
+        provider = urllib.parse.urlsplit(
+            str(endpoint_uri)).netloc.rpartition('@')[2]
+
+        def middleware(make_request: typing.Callable,
+                       _: web3.Web3) -> typing.Callable:
+            def record_rpc_request(method: str,
+                                   params: typing.Any) -> typing.Any:
+                metrics_registry = get_metrics_registry()
+                if metrics_registry is None:
+                    return make_request(method, params)
+                start_time = time.perf_counter()
+                succeeded = False
+                try:
+                    response = make_request(method, params)
+                    succeeded = 'error' not in response
+                    return response
+                finally:
+                    metrics_registry.observe_rpc_request(
+                        blockchain, provider, method,
+                        time.perf_counter() - start_time, succeeded)
+
+            return record_rpc_request
+
+        return middleware
+
+    def __refresh_service_node_registry(
+            self, node_connections: NodeConnections) -> float:
+        blockchain_config = self._get_config()
+        time_to_live = blockchain_config['service_node_cache_ttl']
+        if time_to_live <= 0:
+            self.__service_node_registry.clear()
+        elif blockchain_config['service_node_cache_block_invalidation']:
+            block_number = \
+                node_connections.eth.get_block_number().get_minimum_result()
+            self.__service_node_registry.observe_block_number(block_number)
+        return time_to_live
+
     def __generate_sender_nonce(self, hub_contract: Web3Contract,
                                 sender_address: BlockchainAddress) -> int:
-        while True:
-            sender_nonce = secrets.randbits(256)
-            if hub_contract.caller().isValidSenderNonce(
-                    sender_address, sender_nonce).get():
-                return sender_nonce
+        # Nonces are taken from the pool of already validated nonces.
+        # Only if the pool is empty, a nonce has to be validated on the
+        # signing path.
+        sender_nonce = self._take_sender_nonce(sender_address)
+        while sender_nonce is None:
+            self.__validate_sender_nonces(
+                hub_contract, sender_address,
+                max(self._get_config()['sender_nonce_pool_size'], 1))
+            sender_nonce = self._take_sender_nonce(sender_address)
+        return sender_nonce
+
+    def __start_sender_nonce_pool_refill(
+            self, sender_address: BlockchainAddress) -> None:
+        # The pool is refilled in the background once it is less than
+        # half full
+        sender_nonce_pool_size = self._get_config()['sender_nonce_pool_size']
+        if (self.__sender_nonce_pool.count(sender_address)
+                < sender_nonce_pool_size // 2
+                and self.__sender_nonce_pool.start_refill(sender_address)):
+            try:
+                get_executor().submit(self.__refill_sender_nonce_pool,
+                                      sender_address, sender_nonce_pool_size)
+            except Exception:
+                # The executor has been shut down; the pool is refilled
+                # again when the next nonce is taken
+                self.__sender_nonce_pool.finish_refill(sender_address)
+
+    def __refill_sender_nonce_pool(self, sender_address: BlockchainAddress,
+                                   sender_nonce_pool_size: int) -> None:
+        try:
+            self.__validate_sender_nonces(
+                self._get_hub_contract(), sender_address,
+                sender_nonce_pool_size -
+                self.__sender_nonce_pool.count(sender_address))
+        except Exception:
+            # The pool is refilled again when the next nonce is taken
+            pass
+        finally:
+            self.__sender_nonce_pool.finish_refill(sender_address)
+
+    def __validate_sender_nonces(self, hub_contract: Web3Contract,
+                                 sender_address: BlockchainAddress,
+                                 number_candidates: int) -> None:
+        # Validates random nonce candidates (with a single Multicall3
+        # aggregate3 call if possible) and adds the valid ones to the
+        # pool
+        candidates = self.__sender_nonce_pool.generate_candidates(
+            sender_address, number_candidates)
+        results: list[typing.Optional[int]] = [None] * len(candidates)
+        if len(candidates) > 1:
+            hub_address = BlockchainAddress(self._get_config()['hub'])
+            results = self.__aggregate_calls([
+                (hub_address, _IS_VALID_SENDER_NONCE_SELECTOR + eth_abi.encode(
+                    ['address', 'uint256'], [sender_address, candidate]))
+                for candidate in candidates
+            ], 'bool')
+        valid_sender_nonces = []
+        for candidate, result in zip(candidates, results):
+            if result is None:
+                result = hub_contract.caller().isValidSenderNonce(
+                    sender_address, candidate).get()
+            if result:
+                valid_sender_nonces.append(candidate)
+        self.__sender_nonce_pool.add(sender_address, valid_sender_nonces)
+
+    def __create_transfer_signing_job(self, request: _TransferSignatureRequest,
+                                      sender_address: BlockchainAddress,
+                                      sender_nonce: int) -> TransferSigningJob:
+        if isinstance(request,
+                      BlockchainClient.ComputeTransferSignatureRequest):
+            message_encoder = _TRANSFER_MESSAGE_ENCODER
+            message_data = self.__get_transfer_message_data(
+                request, sender_address, sender_nonce)
+        else:
+            message_encoder = _TRANSFER_FROM_MESSAGE_ENCODER
+            message_data = self.__get_transfer_from_message_data(
+                request, sender_address, sender_nonce)
+        return TransferSigningJob(request.sender_private_key,
+                                  self.__get_eip712_domain_separator(),
+                                  message_encoder, message_data)
+
+    def __get_eip712_domain_separator(self) -> bytes:
+        # The domain separator only changes with the protocol version
+        # (fixed per client), the chain ID and the forwarder address
+        domain_key = (self._get_config()['chain_id'],
+                      self._get_config()['forwarder'])
+        domain_separator = self.__eip712_domain_separators.get(domain_key)
+        if domain_separator is None:
+            domain_separator = _EIP712_DOMAIN_ENCODER.hash_struct(
+                self.__get_eip712_domain_data())
+            self.__eip712_domain_separators[domain_key] = domain_separator
+        return domain_separator
 
     def __get_eip712_domain_data(self) -> dict[str, typing.Any]:
         return {
@@ -398,35 +1389,3 @@ class EthereumClient(BlockchainClient):
             'pantosForwarder': self._get_config()['forwarder'],
             'pantosToken': self._get_config()['tokens'][TOKEN_SYMBOL_PAN]
         }
-
-    def __find_destination_transfer(
-            self, transfer_event_logs: list[web3.types.EventData],
-            source_transaction_id: str, source_blockchain_id: int,
-            to_block_number: int) \
-            -> BlockchainClient.DestinationTransferResponse | None:
-        for transfer_event_log in transfer_event_logs:
-            transfer_event_args = transfer_event_log['args']
-            transfer_event_request = transfer_event_args['request']
-            if (transfer_event_request['sourceTransactionId']
-                    == source_transaction_id
-                    and transfer_event_request['sourceBlockchainId']
-                    == source_blockchain_id):
-                return BlockchainClient.DestinationTransferResponse(
-                    to_block_number, transfer_event_log['blockNumber'],
-                    transfer_event_log['transactionHash'].to_0x_hex(),
-                    transfer_event_request['sourceTransferId'],
-                    transfer_event_args['destinationTransferId'],
-                    BlockchainAddress(transfer_event_request['sender']),
-                    BlockchainAddress(transfer_event_request['recipient']),
-                    BlockchainAddress(transfer_event_request['sourceToken']),
-                    BlockchainAddress(
-                        transfer_event_request['destinationToken']),
-                    transfer_event_request['amount'],
-                    transfer_event_request['nonce'], [
-                        BlockchainAddress(signer_address) for signer_address in
-                        transfer_event_args['signerAddresses']
-                    ], [
-                        f"0x{signature.hex()}"
-                        for signature in transfer_event_args['signatures']
-                    ])
-        return None
@@ -1,19 +1,98 @@
 """Factory for blockchain clients.
 
 """
+import concurrent.futures
+import importlib
+import threading
+
 import semantic_version  # type: ignore
 from pantos.common.blockchains.base import Blockchain
 
 from pantos.client.library.blockchains.base import BlockchainClient
+from pantos.client.library.context import get_client_context
+from pantos.client.library.executors import get_executor
 from pantos.client.library.protocol import get_latest_protocol_version
 from pantos.client.library.protocol import is_supported_protocol_version
 
-_blockchain_clients: dict[tuple[Blockchain, semantic_version.Version],
-                          BlockchainClient] = {}
-"""Blockchain-specific client objects."""
+_BLOCKCHAIN_CLIENT_CLASS_NAMES: dict[Blockchain, tuple[str, str]] = {
+    Blockchain.AVALANCHE: ('avalanche', 'AvalancheClient'),
+    Blockchain.BNB_CHAIN: ('bnbchain', 'BnbChainClient'),
+    Blockchain.CELO: ('celo', 'CeloClient'),
+    Blockchain.CRONOS: ('cronos', 'CronosClient'),
+    Blockchain.ETHEREUM: ('ethereum', 'EthereumClient'),
+    Blockchain.POLYGON: ('polygon', 'PolygonClient'),
+    Blockchain.SOLANA: ('solana', 'SolanaClient'),
+    Blockchain.SONIC: ('sonic', 'SonicClient')
+}
+"""Module (within this package) and class name of each
+blockchain-specific client class. The modules are only imported when a
+client for their blockchain is first requested, since they import heavy
+dependencies like web3."""
+
+
+class _BlockchainClientRegistry:
+    """Thread-safe registry of blockchain-specific client objects. Each
+    client is constructed exactly once per blockchain and protocol
+    version. Callers that request a client while it is being
+    constructed wait for that construction instead of starting their
+    own (which would initialize the blockchain utilities and connect to
+    the blockchain nodes again).
+
+    """
+    def __init__(self):
+        self.__blockchain_clients: dict[
+            tuple[Blockchain, semantic_version.Version],
+            concurrent.futures.Future[BlockchainClient]] = {}
+        self.__lock = threading.Lock()
+
+    def get(self, blockchain: Blockchain,
+            protocol_version: semantic_version.Version) -> BlockchainClient:
+        key = (blockchain, protocol_version)
+        future = self.__blockchain_clients.get(key)
+        if future is not None:
+            return future.result()
+        with self.__lock:
+            future = self.__blockchain_clients.get(key)
+            construct = future is None
+            if construct:
+                future = concurrent.futures.Future()
+                self.__blockchain_clients[key] = future
+        assert future is not None
+        if not construct:
+            return future.result()
+        try:
+            blockchain_client = _get_blockchain_client_class(blockchain)(
+                protocol_version)
+        except BaseException as error:
+            # The waiting callers fail as well, but later callers try to
+            # construct the client again
+            with self.__lock:
+                del self.__blockchain_clients[key]
+            future.set_exception(error)
+            raise
+        future.set_result(blockchain_client)
+        return blockchain_client
 
-_blockchain_client_classes = BlockchainClient.find_subclasses()
-"""Blockchain-specific client classes."""
+    def clear(self) -> None:
+        with self.__lock:
+            self.__blockchain_clients.clear()
+
+    def close(self) -> None:
+        with self.__lock:
+            futures = list(self.__blockchain_clients.values())
+            self.__blockchain_clients.clear()
+        for future in futures:
+            # Clients that failed to be constructed hold no resources
+            if future.done() and future.exception() is None:
+                future.result().close()
+
+
+_blockchain_clients = _BlockchainClientRegistry()
+"""Process-wide blockchain-specific client objects."""
+
+_blockchain_client_classes: dict[Blockchain, type[BlockchainClient]] = {}
+"""Blockchain-specific client classes that have already been
+imported."""
 
 
 def get_blockchain_client(
@@ -34,15 +113,59 @@ def get_blockchain_client(
     Returns
     -------
     BlockchainClient
-        A blockchain client instance for the specified blockchain.
+        A blockchain client instance for the specified blockchain (owned
+        by the active client context, if any).
 
     """
     if protocol_version is None:
         protocol_version = get_latest_protocol_version()
     assert is_supported_protocol_version(protocol_version)
-    blockchain_client = _blockchain_clients.get((blockchain, protocol_version))
-    if blockchain_client is None:
-        blockchain_client = _blockchain_client_classes[blockchain](
-            protocol_version)
-        _blockchain_clients[(blockchain, protocol_version)] = blockchain_client
-    return blockchain_client
+    client_context = get_client_context()
+    blockchain_clients = (_blockchain_clients if client_context is None else
+                          client_context.get_resource(
+                              'blockchain_clients', _BlockchainClientRegistry,
+                              _BlockchainClientRegistry.close))
+    return blockchain_clients.get(blockchain, protocol_version)
+
+
+def prewarm_blockchain_clients(
+        blockchains: list[Blockchain],
+        protocol_version: semantic_version.Version | None = None) -> None:
+    """Construct the blockchain-specific client objects for the given
+    blockchains in parallel (e.g. during the start-up phase of a
+    service), so that the first requests do not need to wait for them.
+
+    Parameters
+    ----------
+    blockchains : list of Blockchain
+        The blockchains to construct the client instances for.
+    protocol_version : semantic_version.Version, optional
+        The version of the Pantos protocol that the blockchain client
+        instances must comply with (default: most recent supported
+        version).
+
+    Raises
+    ------
+    BlockchainClientError
+        If a blockchain client instance cannot be constructed.
+
+    """
+    executor = get_executor()
+    futures = [
+        executor.submit(get_blockchain_client, blockchain, protocol_version)
+        for blockchain in blockchains
+    ]
+    concurrent.futures.wait(futures)
+    for future in futures:
+        future.result()
+
+
+def _get_blockchain_client_class(
+        blockchain: Blockchain) -> type[BlockchainClient]:
+    blockchain_client_class = _blockchain_client_classes.get(blockchain)
+    if blockchain_client_class is None:
+        module_name, class_name = _BLOCKCHAIN_CLIENT_CLASS_NAMES[blockchain]
+        module = importlib.import_module(f'{__package__}.{module_name}')
+        blockchain_client_class = getattr(module, class_name)
+        _blockchain_client_classes[blockchain] = blockchain_client_class
+    return blockchain_client_class
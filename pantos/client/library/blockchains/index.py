@@ -0,0 +1,233 @@
+"""Module for locally indexing the token transfers on a destination
+blockchain.
+
+"""
+import dataclasses
+import json
+import sqlite3
+import threading
+import typing
+
+from pantos.client.library.blockchains.base import BlockchainClient
+
+BlockRange: typing.TypeAlias = tuple[int, int]
+"""First and last block number (both inclusive) of a block range."""
+
+IndexedDestinationTransfer: typing.TypeAlias = tuple[
+    int, str, BlockchainClient.DestinationTransferResponse]
+"""Source blockchain ID, source transaction ID, and response data of a
+token transfer on the destination blockchain."""
+
+_SCHEMA_VERSION = 1
+"""Version of the database schema. Databases with an older schema are
+recreated (the index is only a cache of the blockchain's event logs)."""
+
+_DROP_TABLES_SCRIPT = '''
+DROP TABLE IF EXISTS destination_transfers;
+DROP TABLE IF EXISTS scanned_block_ranges;
+'''
+
+_CREATE_TABLES_SCRIPT = '''
+CREATE TABLE IF NOT EXISTS destination_transfers (
+    destination_blockchain_id INTEGER NOT NULL,
+    hub_address TEXT NOT NULL,
+    source_blockchain_id INTEGER NOT NULL,
+    source_transaction_id TEXT NOT NULL,
+    transaction_block_number INTEGER NOT NULL,
+    response TEXT NOT NULL,
+    PRIMARY KEY (destination_blockchain_id, hub_address,
+                 source_blockchain_id, source_transaction_id)
+);
+CREATE TABLE IF NOT EXISTS scanned_block_ranges (
+    destination_blockchain_id INTEGER NOT NULL,
+    hub_address TEXT NOT NULL,
+    from_block_number INTEGER NOT NULL,
+    to_block_number INTEGER NOT NULL,
+    PRIMARY KEY (destination_blockchain_id, hub_address, from_block_number)
+);
+'''
+
+
+class DestinationTransferIndex:
+    """Thread-safe on-disk index of the token transfers on a
+    destination blockchain. The token transfers are keyed by their
+    source blockchain ID and source transaction ID. The index also
+    keeps track of the block ranges that have already been scanned for
+    token transfers, so that only the remaining block ranges need to
+    be queried from the blockchain nodes. All entries are scoped to
+    the destination blockchain and its Pantos Hub contract, so that a
+    database file can be shared by multiple blockchains and does not
+    return stale entries after a redeployment of the hub.
+
+    """
+    def __init__(self, database_path: str, destination_blockchain_id: int,
+                 hub_address: str):
+        """Construct an index instance and create the underlying
+        SQLite database if it does not exist yet.
+
+        Parameters
+        ----------
+        database_path : str
+            The path of the SQLite database file (or ':memory:' for an
+            in-memory database).
+        destination_blockchain_id : int
+            The ID of the indexed destination blockchain.
+        hub_address : str
+            The address of the Pantos Hub contract on the destination
+            blockchain.
+
+        """
+        self.__scope = (destination_blockchain_id, hub_address.lower())
+        self.__lock = threading.Lock()
+        self.__connection = sqlite3.connect(database_path,
+                                            check_same_thread=False)
+        with self.__lock, self.__connection:
+            self.__connection.execute('PRAGMA journal_mode=WAL')
+            schema_version = self.__connection.execute(
+                'PRAGMA user_version').fetchone()[0]
+            if schema_version != _SCHEMA_VERSION:
+                self.__connection.executescript(_DROP_TABLES_SCRIPT)
+                self.__connection.execute(
+                    f'PRAGMA user_version = {_SCHEMA_VERSION}')
+            self.__connection.executescript(_CREATE_TABLES_SCRIPT)
+
+    def read_transfer(
+            self, source_blockchain_id: int, source_transaction_id: str,
+            latest_block_number: int) \
+            -> typing.Optional[BlockchainClient.DestinationTransferResponse]:
+        """Read an indexed token transfer.
+
+        Parameters
+        ----------
+        source_blockchain_id : int
+            The ID of the token transfer's source blockchain.
+        source_transaction_id : str
+            The ID of the token transfer's transaction on the source
+            blockchain.
+        latest_block_number : int
+            The latest block number on the destination blockchain.
+
+        Returns
+        -------
+        BlockchainClient.DestinationTransferResponse or None
+            The response data of the token transfer, or None if it is
+            not indexed.
+
+        """
+        with self.__lock:
+            row = self.__connection.execute(
+                'SELECT response FROM destination_transfers '
+                'WHERE destination_blockchain_id = ? AND hub_address = ? '
+                'AND source_blockchain_id = ? '
+                'AND source_transaction_id = ?',
+                (*self.__scope, source_blockchain_id,
+                 source_transaction_id)).fetchone()
+        if row is None:
+            return None
+        return BlockchainClient.DestinationTransferResponse(
+            latest_block_number=latest_block_number, **json.loads(row[0]))
+
+    def find_unscanned_block_ranges(self, from_block_number: int,
+                                    to_block_number: int) -> list[BlockRange]:
+        """Find the block ranges within the given block range that
+        have not been scanned yet.
+
+        Parameters
+        ----------
+        from_block_number : int
+            The first block number of the block range (inclusive).
+        to_block_number : int
+            The last block number of the block range (inclusive).
+
+        Returns
+        -------
+        list of BlockRange
+            The unscanned block ranges, starting with the most recent
+            one.
+
+        """
+        with self.__lock:
+            scanned_block_ranges = self.__connection.execute(
+                'SELECT from_block_number, to_block_number '
+                'FROM scanned_block_ranges '
+                'WHERE destination_blockchain_id = ? AND hub_address = ? '
+                'AND from_block_number <= ? AND to_block_number >= ? '
+                'ORDER BY from_block_number DESC',
+                (*self.__scope, to_block_number,
+                 from_block_number)).fetchall()
+        unscanned_block_ranges = []
+        for scanned_from_block_number, scanned_to_block_number in \
+                scanned_block_ranges:
+            if scanned_to_block_number < to_block_number:
+                unscanned_block_ranges.append(
+                    (scanned_to_block_number + 1, to_block_number))
+            to_block_number = scanned_from_block_number - 1
+        if from_block_number <= to_block_number:
+            unscanned_block_ranges.append((from_block_number, to_block_number))
+        return unscanned_block_ranges
+
+    def add_scanned_block_range(
+            self, from_block_number: int, to_block_number: int,
+            transfers: typing.Iterable[IndexedDestinationTransfer]) -> None:
+        """Add the token transfers of a scanned block range to the
+        index and mark the block range as scanned.
+
+        Parameters
+        ----------
+        from_block_number : int
+            The first block number of the scanned block range
+            (inclusive).
+        to_block_number : int
+            The last block number of the scanned block range
+            (inclusive).
+        transfers : iterable of IndexedDestinationTransfer
+            All token transfers within the scanned block range.
+
+        """
+        rows = [(*self.__scope, source_blockchain_id, source_transaction_id,
+                 transfer_response.transaction_block_number,
+                 self.__serialize_transfer_response(transfer_response))
+                for source_blockchain_id, source_transaction_id,
+                transfer_response in transfers]
+        with self.__lock, self.__connection:
+            self.__connection.executemany(
+                'INSERT OR REPLACE INTO destination_transfers '
+                'VALUES (?, ?, ?, ?, ?, ?)', rows)
+            # Merge the block range with all overlapping or adjacent
+            # scanned block ranges
+            merged_block_range = self.__connection.execute(
+                'SELECT MIN(from_block_number), MAX(to_block_number) '
+                'FROM scanned_block_ranges '
+                'WHERE destination_blockchain_id = ? AND hub_address = ? '
+                'AND from_block_number <= ? AND to_block_number >= ?',
+                (*self.__scope, to_block_number + 1,
+                 from_block_number - 1)).fetchone()
+            if merged_block_range[0] is not None:
+                from_block_number = min(from_block_number,
+                                        merged_block_range[0])
+                to_block_number = max(to_block_number, merged_block_range[1])
+            self.__connection.execute(
+                'DELETE FROM scanned_block_ranges '
+                'WHERE destination_blockchain_id = ? AND hub_address = ? '
+                'AND from_block_number <= ? AND to_block_number >= ?',
+                (*self.__scope, to_block_number + 1, from_block_number - 1))
+            self.__connection.execute(
+                'INSERT INTO scanned_block_ranges VALUES (?, ?, ?, ?)',
+                (*self.__scope, from_block_number, to_block_number))
+
+    def close(self) -> None:
+        """Close the underlying SQLite database connection.
+
+        """
+        with self.__lock:
+            self.__connection.close()
+
+    def __serialize_transfer_response(
+            self,
+            transfer_response: BlockchainClient.DestinationTransferResponse) \
+            -> str:
+        # The latest block number changes with every read and is
+        # therefore not stored
+        response = dataclasses.asdict(transfer_response)
+        del response['latest_block_number']
+        return json.dumps(response)
@@ -0,0 +1,297 @@
+"""Module for encoding and signing EIP-712 token transfer messages,
+optionally spread across multiple worker processes.
+
+"""
+import concurrent.futures
+import concurrent.futures.process
+import dataclasses
+import math
+import multiprocessing
+import threading
+import typing
+
+import eth_abi
+import web3
+from pantos.common.types import PrivateKey
+
+from pantos.client.library.configuration import config
+from pantos.client.library.context import get_client_context
+
+_ACCOUNTS_CACHE_SIZE = 1024
+"""Maximum number of sender accounts cached per process."""
+
+_accounts: dict[str, typing.Any] = {}
+"""Sender accounts of this process by their private keys."""
+
+_transfer_signing_engine: typing.Optional['TransferSigningEngine'] = None
+"""Process-wide transfer signing engine."""
+
+_transfer_signing_engine_lock = threading.Lock()
+"""Lock for creating the process-wide transfer signing engine."""
+
+
+class Eip712StructEncoder:
+    """Encoder for EIP-712 structs with a fixed layout. In contrast to
+    the generic typed data signing of web3.py, the type hashes are
+    computed only once when the encoder is constructed and the struct
+    data is not validated against the types on each encoding.
+
+    """
+    def __init__(self, primary_type: str,
+                 message_types: dict[str, list[dict[str, str]]]):
+        """Construct an encoder instance.
+
+        Parameters
+        ----------
+        primary_type : str
+            The name of the struct type that is encoded by default.
+        message_types : dict
+            The fields of the primary struct type and of all struct
+            types referenced by it (in the same format as for
+            eth_account's typed data signing).
+
+        """
+        self.__primary_type = primary_type
+        self.__message_types = message_types
+        self.__type_hashes = {
+            struct_type: bytes(
+                web3.Web3.keccak(text=self.__encode_type(struct_type)))
+            for struct_type in message_types
+        }
+        # Dynamic and struct members are encoded as 32-byte hashes
+        self.__abi_types = {
+            struct_type: ['bytes32'] + [
+                'bytes32'
+                if self.__is_hashed_type(field['type']) else field['type']
+                for field in fields
+            ]
+            for struct_type, fields in message_types.items()
+        }
+
+    def hash_struct(self, data: dict[str, typing.Any],
+                    struct_type: typing.Optional[str] = None) -> bytes:
+        """Compute the EIP-712 hash of a struct.
+
+        Parameters
+        ----------
+        data : dict
+            The struct's field values by field name.
+        struct_type : str or None
+            The name of the struct's type (default: the primary type).
+
+        Returns
+        -------
+        bytes
+            The 32-byte hash of the struct.
+
+        """
+        if struct_type is None:
+            struct_type = self.__primary_type
+        values: list[typing.Any] = [self.__type_hashes[struct_type]]
+        for field in self.__message_types[struct_type]:
+            value = data[field['name']]
+            if field['type'] in self.__message_types:
+                value = self.hash_struct(value, field['type'])
+            elif field['type'] == 'string':
+                value = bytes(web3.Web3.keccak(text=value))
+            values.append(value)
+        return bytes(
+            web3.Web3.keccak(
+                eth_abi.encode(self.__abi_types[struct_type], values)))
+
+    def __encode_type(self, struct_type: str) -> str:
+        # The struct type is followed by all (transitively) referenced
+        # struct types in alphabetical order
+        referenced_struct_types = sorted(
+            self.__find_referenced_struct_types(struct_type) - {struct_type})
+        return ''.join(
+            f'{encoded_struct_type}(' +
+            ','.join(f'{field["type"]} {field["name"]}'
+                     for field in self.__message_types[encoded_struct_type]) +
+            ')'
+            for encoded_struct_type in [struct_type] + referenced_struct_types)
+
+    def __find_referenced_struct_types(self, struct_type: str) -> set[str]:
+        referenced_struct_types = {struct_type}
+        for field in self.__message_types[struct_type]:
+            if (field['type'] in self.__message_types
+                    and field['type'] not in referenced_struct_types):
+                referenced_struct_types |= \
+                    self.__find_referenced_struct_types(field['type'])
+        return referenced_struct_types
+
+    def __is_hashed_type(self, field_type: str) -> bool:
+        return field_type in self.__message_types or field_type in ('string',
+                                                                    'bytes')
+
+
+@dataclasses.dataclass
+class TransferSigningJob:
+    """Data of an EIP-712 token transfer message to be signed.
+
+    Attributes
+    ----------
+    sender_private_key : PrivateKey
+        The unencrypted private key of the sender's account.
+    domain_separator : bytes
+        The 32-byte hash of the message's EIP-712 domain.
+    message_encoder : Eip712StructEncoder
+        The encoder for the message's struct type.
+    message_data : dict
+        The message's field values by field name.
+
+    """
+    sender_private_key: PrivateKey
+    domain_separator: bytes
+    message_encoder: Eip712StructEncoder
+    message_data: dict[str, typing.Any]
+
+
+class TransferSigningEngine:
+    """Thread-safe engine for signing EIP-712 token transfer messages.
+    Hashing and signing the messages is CPU-bound, so large batches of
+    messages are spread across a pool of worker processes if the
+    engine is configured with any. Each worker process keeps the sender
+    accounts it has already used, so that a sender's private key is
+    parsed only once per worker process.
+
+    """
+    def __init__(self, number_processes: int):
+        """Construct an engine instance. The worker processes are only
+        started when the first batch of messages is signed.
+
+        Parameters
+        ----------
+        number_processes : int
+            The number of worker processes. If 0, all messages are
+            signed in the calling process.
+
+        """
+        self.__number_processes = number_processes
+        self.__lock = threading.Lock()
+        self.__executor: typing.Optional[
+            concurrent.futures.ProcessPoolExecutor] = None
+
+    @property
+    def number_processes(self) -> int:
+        """The number of worker processes.
+
+        """
+        return self.__number_processes
+
+    def sign(self, jobs: typing.Sequence[TransferSigningJob]) -> list[str]:
+        """Sign multiple token transfer messages.
+
+        Parameters
+        ----------
+        jobs : sequence of TransferSigningJob
+            The data of the messages to be signed.
+
+        Returns
+        -------
+        list of str
+            The signatures of the messages (in the same order as the
+            jobs).
+
+        """
+        if self.__number_processes == 0 or len(jobs) < 2:
+            return _sign_transfer_messages(jobs)
+        # One equally sized chunk of messages per worker process
+        chunk_size = math.ceil(len(jobs) / self.__number_processes)
+        executor = self.__get_executor()
+        try:
+            futures = [
+                executor.submit(_sign_transfer_messages,
+                                jobs[index:index + chunk_size])
+                for index in range(0, len(jobs), chunk_size)
+            ]
+            return [
+                signature for future in futures
+                for signature in future.result()
+            ]
+        except concurrent.futures.process.BrokenProcessPool:
+            # Start new worker processes for the next batch
+            with self.__lock:
+                if self.__executor is executor:
+                    self.__executor = None
+            raise
+
+    def close(self) -> None:
+        """Shut down the worker processes. They are started again when
+        the next batch of messages is signed.
+
+        """
+        with self.__lock:
+            executor = self.__executor
+            self.__executor = None
+        if executor is not None:
+            executor.shutdown()
+
+    def __get_executor(self) -> concurrent.futures.ProcessPoolExecutor:
+        with self.__lock:
+            if self.__executor is None:
+                # Worker processes are spawned instead of forked since
+                # the calling process may run other threads
+                self.__executor = concurrent.futures.ProcessPoolExecutor(
+                    self.__number_processes,
+                    mp_context=multiprocessing.get_context('spawn'))
+            return self.__executor
+
+
+def sign_transfer_message(job: TransferSigningJob) -> str:
+    """Sign a single token transfer message in the calling process.
+
+    Parameters
+    ----------
+    job : TransferSigningJob
+        The data of the message to be signed.
+
+    Returns
+    -------
+    str
+        The signature of the message.
+
+    """
+    account = _accounts.get(job.sender_private_key)
+    if account is None:
+        if len(_accounts) >= _ACCOUNTS_CACHE_SIZE:
+            _accounts.clear()
+        account = web3.Account.from_key(job.sender_private_key)
+        _accounts[job.sender_private_key] = account
+    message_digest = web3.Web3.keccak(
+        b'\x19\x01' + job.domain_separator +
+        job.message_encoder.hash_struct(job.message_data))
+    return account.unsafe_sign_hash(message_digest).signature.to_0x_hex()
+
+
+def get_transfer_signing_engine() -> TransferSigningEngine:
+    """Get the transfer signing engine of the active client context or,
+    outside of any client context, the process-wide transfer signing
+    engine. Its number of worker processes is determined by the
+    configuration.
+
+    Returns
+    -------
+    TransferSigningEngine
+        The transfer signing engine.
+
+    """
+    client_context = get_client_context()
+    if client_context is not None:
+        return client_context.get_resource('transfer_signing_engine',
+                                           _create_transfer_signing_engine,
+                                           TransferSigningEngine.close)
+    global _transfer_signing_engine
+    with _transfer_signing_engine_lock:
+        if _transfer_signing_engine is None:
+            _transfer_signing_engine = _create_transfer_signing_engine()
+        return _transfer_signing_engine
+
+
+def _create_transfer_signing_engine() -> TransferSigningEngine:
+    return TransferSigningEngine(config['signing']['processes'])
+
+
+def _sign_transfer_messages(
+        jobs: typing.Sequence[TransferSigningJob]) -> list[str]:
+    return [sign_transfer_message(job) for job in jobs]
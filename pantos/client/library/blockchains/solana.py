@@ -79,6 +79,10 @@ class SolanaClient(BlockchainClient):
         # Docstring inherited
         raise NotImplementedError  # pragma: no cover
 
+    def read_transaction_timestamp(self, transaction_id: str) -> int:
+        # Docstring inherited
+        raise NotImplementedError  # pragma: no cover
+
     def read_token_decimals(self, token_address: BlockchainAddress) -> int:
         # Docstring inherited
         raise NotImplementedError  # pragma: no cover
@@ -2,23 +2,178 @@
 
 """
 import concurrent.futures
+import contextlib
 import dataclasses
-import itertools
-import secrets
+import threading
+import time
 import typing
 
 from pantos.common.blockchains.base import Blockchain
 from pantos.common.entities import ServiceNodeBid
-from pantos.common.servicenodes import ServiceNodeClient
+from pantos.common.types import Amount
 from pantos.common.types import BlockchainAddress
 
 from pantos.client.library.blockchains import get_blockchain_client
 from pantos.client.library.blockchains.base import BlockchainClient
 from pantos.client.library.business.base import Interactor
 from pantos.client.library.business.base import InteractorError
+from pantos.client.library.business.ranking import BidRankingPolicy
+from pantos.client.library.business.ranking import LowestFeePolicy
+from pantos.client.library.business.ranking import rank_service_node_bids
 from pantos.client.library.business.tokens import TokenInteractor
 from pantos.client.library.configuration import config
 from pantos.client.library.constants import TOKEN_SYMBOL_PAN
+from pantos.client.library.context import get_client_context
+from pantos.client.library.executors import get_executor
+from pantos.client.library.metrics import record_cache_access
+from pantos.client.library.servicenodes import ServiceNodeClient
+
+_ServiceNodeBids: typing.TypeAlias = typing.Dict[BlockchainAddress,
+                                                 typing.List[ServiceNodeBid]]
+
+
+class ServiceNodeBidCache:
+    """Thread-safe cache for the service node bids (with fees in the
+    Pantos Token's smallest subunit) of each pair of source and
+    destination blockchains.
+
+    """
+    def __init__(self):
+        """Construct an empty cache instance.
+
+        """
+        self.__service_node_bids: typing.Dict[typing.Tuple[Blockchain,
+                                                           Blockchain],
+                                              _ServiceNodeBids] = {}
+        self.__refreshing: typing.Set[typing.Tuple[Blockchain,
+                                                   Blockchain]] = set()
+        self.__lock = threading.Lock()
+
+    def get(self, source_blockchain: Blockchain,
+            destination_blockchain: Blockchain) \
+            -> typing.Optional[_ServiceNodeBids]:
+        """Get the cached service node bids.
+
+        Parameters
+        ----------
+        source_blockchain : Blockchain
+            The source blockchain of the service node bids.
+        destination_blockchain : Blockchain
+            The destination blockchain of the service node bids.
+
+        Returns
+        -------
+        dict of BlockchainAddress and list of ServiceNodeBid, or None
+            The cached service node bids of each registered service
+            node, or None if they are not cached.
+
+        """
+        with self.__lock:
+            service_node_bids = self.__service_node_bids.get(
+                (source_blockchain, destination_blockchain))
+            record_cache_access('service_node_bids', service_node_bids
+                                is not None)
+            if service_node_bids is None:
+                return None
+            return {
+                service_node_address: list(bids)
+                for service_node_address, bids in service_node_bids.items()
+            }
+
+    def set(self, source_blockchain: Blockchain,
+            destination_blockchain: Blockchain,
+            service_node_bids: _ServiceNodeBids) -> None:
+        """Cache the service node bids.
+
+        Parameters
+        ----------
+        source_blockchain : Blockchain
+            The source blockchain of the service node bids.
+        destination_blockchain : Blockchain
+            The destination blockchain of the service node bids.
+        service_node_bids : dict of BlockchainAddress and list of
+                ServiceNodeBid
+            The service node bids of each registered service node.
+
+        """
+        with self.__lock:
+            self.__service_node_bids[(source_blockchain,
+                                      destination_blockchain)] = {
+                                          service_node_address: list(bids)
+                                          for service_node_address, bids in
+                                          service_node_bids.items()
+                                      }
+
+    def start_refresh(self, source_blockchain: Blockchain,
+                      destination_blockchain: Blockchain) -> bool:
+        """Mark the cached service node bids as being refreshed.
+
+        Parameters
+        ----------
+        source_blockchain : Blockchain
+            The source blockchain of the service node bids.
+        destination_blockchain : Blockchain
+            The destination blockchain of the service node bids.
+
+        Returns
+        -------
+        bool
+            True if the caller is to refresh the service node bids,
+            False if they are already being refreshed.
+
+        """
+        with self.__lock:
+            key = (source_blockchain, destination_blockchain)
+            if key in self.__refreshing:
+                return False
+            self.__refreshing.add(key)
+            return True
+
+    def finish_refresh(self, source_blockchain: Blockchain,
+                       destination_blockchain: Blockchain) -> None:
+        """Mark the cached service node bids as no longer being
+        refreshed.
+
+        Parameters
+        ----------
+        source_blockchain : Blockchain
+            The source blockchain of the service node bids.
+        destination_blockchain : Blockchain
+            The destination blockchain of the service node bids.
+
+        """
+        with self.__lock:
+            self.__refreshing.discard(
+                (source_blockchain, destination_blockchain))
+
+    def clear(self) -> None:
+        """Remove all cached service node bids.
+
+        """
+        with self.__lock:
+            self.__service_node_bids.clear()
+
+
+service_node_bid_cache = ServiceNodeBidCache()
+"""Process-wide cache for service node bids."""
+
+
+def get_service_node_bid_cache() -> ServiceNodeBidCache:
+    """Get the service node bid cache of the active client context or,
+    outside of any client context, the process-wide service node bid
+    cache.
+
+    Returns
+    -------
+    ServiceNodeBidCache
+        The service node bid cache.
+
+    """
+    client_context = get_client_context()
+    if client_context is None:
+        return service_node_bid_cache
+    return client_context.get_resource('service_node_bid_cache',
+                                       ServiceNodeBidCache)
 
 
 class BidInteractorError(InteractorError):
@@ -50,11 +205,45 @@ class BidInteractor(Interactor):
         service_node_address: BlockchainAddress
         service_node_bid: ServiceNodeBid
 
+    @dataclasses.dataclass
+    class RankedServiceNodeBid:
+        """Response data for ranking service node bids.
+
+        Attributes
+        ----------
+        service_node_address : BlockchainAddress
+            The address of the service node that offered the bid.
+        service_node_bid: ServiceNodeBid
+            The service node bid.
+
+        """
+        service_node_address: BlockchainAddress
+        service_node_bid: ServiceNodeBid
+
+    @dataclasses.dataclass
+    class AcceptableServiceNodeBid:
+        """Response data for finding an acceptable service node bid.
+
+        Attributes
+        ----------
+        service_node_address : BlockchainAddress
+            The address of the first service node that offered an
+            acceptable bid.
+        service_node_bid: ServiceNodeBid
+            The service node's acceptable bid with the lowest fee.
+
+        """
+        service_node_address: BlockchainAddress
+        service_node_bid: ServiceNodeBid
+
     def find_cheapest_service_node_bid(
             self, source_blockchain: Blockchain,
-            destination_blockchain: Blockchain) \
-            -> CheapestServiceNodeBid:
-        """Find the cheapest service node bid.
+            destination_blockchain: Blockchain,
+            valid_until_buffer: int = 0) -> CheapestServiceNodeBid:
+        """Find the cheapest service node bid. If the bid cache is
+        enabled, cached bids are used as long as they remain valid for
+        their execution time plus the given buffer, and they are
+        refreshed in the background before they expire.
 
         Parameters
         ----------
@@ -62,6 +251,10 @@ class BidInteractor(Interactor):
             The source blockchain of the service node bid.
         destination_blockchain : Blockchain
             The destination blockchain of the service node bid.
+        valid_until_buffer : int, optional
+            The buffer in seconds that a cached service node bid must
+            remain valid for in addition to its execution time
+            (default: 0).
 
         Returns
         -------
@@ -75,41 +268,148 @@ class BidInteractor(Interactor):
             if no active service node bid is found.
 
         """
+        ranked_service_node_bids = self.find_best_service_node_bids(
+            source_blockchain, destination_blockchain, LowestFeePolicy(), 1,
+            valid_until_buffer)
+        return BidInteractor.CheapestServiceNodeBid(
+            ranked_service_node_bids[0].service_node_address,
+            ranked_service_node_bids[0].service_node_bid)
+
+    def find_best_service_node_bids(
+            self, source_blockchain: Blockchain,
+            destination_blockchain: Blockchain,
+            policy: typing.Optional[BidRankingPolicy] = None,
+            number_bids: int = 1,
+            valid_until_buffer: int = 0) -> typing.List[RankedServiceNodeBid]:
+        """Find the best service node bids according to a ranking
+        policy. The bids are retrieved (or taken from the bid cache)
+        only once, so that the caller can fail over to the next best
+        bid without retrieving the bids again.
+
+        Parameters
+        ----------
+        source_blockchain : Blockchain
+            The source blockchain of the service node bids.
+        destination_blockchain : Blockchain
+            The destination blockchain of the service node bids.
+        policy : BidRankingPolicy, optional
+            The policy to rank the service node bids by (default:
+            lowest fee first).
+        number_bids : int, optional
+            The maximum number of service node bids to return (default:
+            1).
+        valid_until_buffer : int, optional
+            The buffer in seconds that a cached service node bid must
+            remain valid for in addition to its execution time
+            (default: 0).
+
+        Returns
+        -------
+        list of RankedServiceNodeBid
+            The response data with the best service node bids (best
+            first). Fewer bids are returned if there are fewer eligible
+            bids.
+
+        Raises
+        ------
+        BidInteractorError
+            If the service node bids cannot be ranked or if no eligible
+            service node bid is found.
+
+        """
+        if policy is None:
+            policy = LowestFeePolicy()
         try:
-            cheapest_bid_pairs: typing.List[typing.Tuple[BlockchainAddress,
-                                                         ServiceNodeBid]] = []
-            all_service_node_bids = self.retrieve_service_node_bids(
-                source_blockchain, destination_blockchain, False)
-            for service_node_address, service_node_bids in \
-                    all_service_node_bids.items():
-                if len(service_node_bids) == 0:
-                    continue
-                bid_pairs = cheapest_bid_pairs + list(
-                    zip(itertools.repeat(service_node_address),
-                        service_node_bids))
-                cheapest_bid = min(
-                    bid_pairs, key=lambda bid_pair:
-                    (bid_pair[1].fee, bid_pair[1].execution_time))[1]
-                cheapest_bid_pairs = [
-                    bid_pair for bid_pair in bid_pairs
-                    if bid_pair[1].fee == cheapest_bid.fee and
-                    bid_pair[1].execution_time == cheapest_bid.execution_time
-                ]
-            if len(cheapest_bid_pairs) == 0:
+            all_service_node_bids = self.__retrieve_cached_service_node_bids(
+                source_blockchain, destination_blockchain, valid_until_buffer)
+            bid_pairs = rank_service_node_bids(all_service_node_bids, policy,
+                                               number_bids)
+            if len(bid_pairs) == 0:
                 raise BidInteractorError('no active service node bids found')
+            return [
+                BidInteractor.RankedServiceNodeBid(service_node_address,
+                                                   service_node_bid)
+                for service_node_address, service_node_bid in bid_pairs
+            ]
+        except BidInteractorError:
+            raise
+        except Exception:
+            raise BidInteractorError(
+                'unable to search for the best service node bids',
+                source_blockchain=source_blockchain,
+                destination_blockchain=destination_blockchain, policy=policy,
+                number_bids=number_bids)
+
+    def find_acceptable_service_node_bid(
+            self, source_blockchain: Blockchain,
+            destination_blockchain: Blockchain, max_fee: Amount,
+            timeout: typing.Optional[float] = None) \
+            -> AcceptableServiceNodeBid:
+        """Find the first service node bid with a fee not exceeding a
+        maximum fee. The search stops as soon as a service node offers
+        an acceptable bid, without waiting for the remaining service
+        nodes.
+
+        Parameters
+        ----------
+        source_blockchain : Blockchain
+            The source blockchain of the service node bid.
+        destination_blockchain : Blockchain
+            The destination blockchain of the service node bid.
+        max_fee : int or decimal.Decimal
+            The maximum acceptable fee (an integer value in case of the
+            Pantos Token's smallest subunit, a decimal value in case of
+            the Pantos Token's main unit).
+        timeout : float, optional
+            The number of seconds to wait for an acceptable service node
+            bid (default: no timeout).
+
+        Returns
+        -------
+        AcceptableServiceNodeBid
+            The response data with the acceptable service node bid. Its
+            fee is in the Pantos Token's smallest subunit.
 
-            service_node_address, service_node_bid = (
-                cheapest_bid_pairs[0] if len(cheapest_bid_pairs) == 1 else
-                secrets.choice(cheapest_bid_pairs))
-            return BidInteractor.CheapestServiceNodeBid(
-                service_node_address, service_node_bid)
+        Raises
+        ------
+        BidInteractorError
+            If the service node bids cannot be searched or if no
+            acceptable service node bid is found in time.
+
+        """
+        try:
+            if not isinstance(max_fee, int):
+                max_fee = TokenInteractor().convert_amount_to_subunit(
+                    source_blockchain, TOKEN_SYMBOL_PAN, max_fee)
+            with contextlib.closing(
+                    self.stream_service_node_bids(source_blockchain,
+                                                  destination_blockchain,
+                                                  False, timeout)) as stream:
+                for service_node_address, service_node_bids in stream:
+                    acceptable_bids = [
+                        service_node_bid
+                        for service_node_bid in service_node_bids
+                        if service_node_bid.fee <= max_fee
+                    ]
+                    if len(acceptable_bids) > 0:
+                        service_node_bid = min(
+                            acceptable_bids, key=lambda bid:
+                            (bid.fee, bid.execution_time))
+                        return BidInteractor.AcceptableServiceNodeBid(
+                            service_node_address, service_node_bid)
+            raise BidInteractorError(
+                'no acceptable service node bid found',
+                source_blockchain=source_blockchain,
+                destination_blockchain=destination_blockchain, max_fee=max_fee,
+                timeout=timeout)
         except BidInteractorError:
             raise
         except Exception:
             raise BidInteractorError(
-                'unable to search for the cheapest service node bid',
+                'unable to search for an acceptable service node bid',
                 source_blockchain=source_blockchain,
-                destination_blockchain=destination_blockchain)
+                destination_blockchain=destination_blockchain, max_fee=max_fee,
+                timeout=timeout)
 
     def retrieve_service_node_bids(
             self, source_blockchain: Blockchain,
@@ -142,37 +442,170 @@ class BidInteractor(Interactor):
         BidInteractorError
             If the service node bids cannot be retrieved.
 
+        """
+        return dict(
+            self.stream_service_node_bids(source_blockchain,
+                                          destination_blockchain,
+                                          return_fee_in_main_unit))
+
+    def stream_service_node_bids(
+            self, source_blockchain: Blockchain,
+            destination_blockchain: Blockchain, return_fee_in_main_unit: bool,
+            timeout: typing.Optional[float] = None) \
+            -> typing.Generator[typing.Tuple[
+                BlockchainAddress, typing.List[ServiceNodeBid]], None, None]:
+        """Stream the service node bids for token transfers from a
+        specified source blockchain to a specified destination
+        blockchain. The bids of a service node are yielded as soon as
+        the service node has answered.
+
+        Parameters
+        ----------
+        source_blockchain : Blockchain
+            The source blockchain of the service node bids.
+        destination_blockchain : Blockchain
+            The destination blockchain of the service node bids.
+        return_fee_in_main_unit : bool
+            True if the service node bids' fee is to be returned in the
+            Pantos Token's main unit, False if it is to be returned in
+            the Pantos Token's smallest subunit.
+        timeout : float, optional
+            The number of seconds after which the stream ends even if
+            not all service nodes have answered yet (default: no
+            timeout).
+
+        Yields
+        ------
+        tuple of BlockchainAddress and list of ServiceNodeBid
+            The address of a registered service node and its matching
+            bids. Unreachable service nodes are skipped.
+
+        Raises
+        ------
+        BidInteractorError
+            If the service node bids cannot be retrieved.
+
         """
         try:
-            all_service_node_bids: typing.Dict[
-                BlockchainAddress, typing.List[ServiceNodeBid]] = {}
             source_blockchain_client = get_blockchain_client(source_blockchain)
             service_node_addresses = \
                 source_blockchain_client.read_service_node_addresses()
-            with concurrent.futures.ThreadPoolExecutor() as executor:
-                future_to_service_node_address = {
-                    executor.submit(
-                        self.__retrieve_bid_from_service_node,  # yapf bug
-                        source_blockchain_client,
-                        destination_blockchain,
-                        service_node_address,
-                        return_fee_in_main_unit): service_node_address
-                    for service_node_address in service_node_addresses
-                }
-                for future in concurrent.futures.as_completed(
-                        future_to_service_node_address):
-                    service_node_address = future_to_service_node_address[
-                        future]
-                    service_node_bids = future.result()
-                    if service_node_bids is not None:
-                        all_service_node_bids[
-                            service_node_address] = service_node_bids
-                return all_service_node_bids
         except Exception:
             raise BidInteractorError(
                 'unable to retrieve the service node bids',
                 source_blockchain=source_blockchain,
                 destination_blockchain=destination_blockchain)
+        future_to_service_node_address: typing.Dict[concurrent.futures.Future,
+                                                    BlockchainAddress] = {}
+        try:
+            executor = get_executor()
+            future_to_service_node_address = {
+                executor.submit(
+                    self.__retrieve_bid_from_service_node,  # yapf bug
+                    source_blockchain_client,
+                    destination_blockchain,
+                    service_node_address,
+                    return_fee_in_main_unit): service_node_address
+                for service_node_address in service_node_addresses
+            }
+            for future in concurrent.futures.as_completed(
+                    future_to_service_node_address, timeout=timeout):
+                service_node_address = future_to_service_node_address[future]
+                service_node_bids = future.result()
+                if service_node_bids is not None:
+                    yield service_node_address, service_node_bids
+        except concurrent.futures.TimeoutError:
+            return
+        except Exception:
+            raise BidInteractorError(
+                'unable to retrieve the service node bids',
+                source_blockchain=source_blockchain,
+                destination_blockchain=destination_blockchain)
+        finally:
+            # Do not wait for the service nodes that have not answered
+            for future in future_to_service_node_address:
+                future.cancel()
+
+    def __retrieve_cached_service_node_bids(
+            self, source_blockchain: Blockchain,
+            destination_blockchain: Blockchain,
+            valid_until_buffer: int) -> _ServiceNodeBids:
+        service_nodes_config = config['service_nodes']
+        if service_nodes_config['bid_cache']:
+            cached_service_node_bids = get_service_node_bid_cache().get(
+                source_blockchain, destination_blockchain)
+            if cached_service_node_bids is not None:
+                valid_service_node_bids = self.__filter_valid_bids(
+                    cached_service_node_bids, valid_until_buffer)
+                if valid_service_node_bids:
+                    if self.__compute_expiry_time(
+                            valid_service_node_bids, valid_until_buffer) \
+                            - time.time() < \
+                            service_nodes_config['bid_cache_refresh_ahead']:
+                        self.__refresh_service_node_bids_in_background(
+                            source_blockchain, destination_blockchain)
+                    return valid_service_node_bids
+        all_service_node_bids = self.retrieve_service_node_bids(
+            source_blockchain, destination_blockchain, False)
+        if service_nodes_config['bid_cache']:
+            get_service_node_bid_cache().set(source_blockchain,
+                                             destination_blockchain,
+                                             all_service_node_bids)
+        return all_service_node_bids
+
+    def __refresh_service_node_bids_in_background(
+            self, source_blockchain: Blockchain,
+            destination_blockchain: Blockchain) -> None:
+        if get_service_node_bid_cache().start_refresh(source_blockchain,
+                                                      destination_blockchain):
+            try:
+                get_executor().submit(self.__refresh_service_node_bids,
+                                      source_blockchain,
+                                      destination_blockchain)
+            except Exception:
+                # The executor has been shut down; the cached bids are
+                # refreshed again when they are next requested
+                get_service_node_bid_cache().finish_refresh(
+                    source_blockchain, destination_blockchain)
+
+    def __refresh_service_node_bids(
+            self, source_blockchain: Blockchain,
+            destination_blockchain: Blockchain) -> None:
+        try:
+            all_service_node_bids = self.retrieve_service_node_bids(
+                source_blockchain, destination_blockchain, False)
+            get_service_node_bid_cache().set(source_blockchain,
+                                             destination_blockchain,
+                                             all_service_node_bids)
+        except BidInteractorError:
+            # The cached bids are kept until they expire
+            pass
+        finally:
+            get_service_node_bid_cache().finish_refresh(
+                source_blockchain, destination_blockchain)
+
+    def __filter_valid_bids(self, all_service_node_bids: _ServiceNodeBids,
+                            valid_until_buffer: int) -> _ServiceNodeBids:
+        current_time = time.time()
+        valid_service_node_bids: _ServiceNodeBids = {}
+        for service_node_address, service_node_bids in \
+                all_service_node_bids.items():
+            service_node_bids = [
+                service_node_bid for service_node_bid in service_node_bids
+                if service_node_bid.valid_until >= current_time +
+                service_node_bid.execution_time + valid_until_buffer
+            ]
+            if len(service_node_bids) > 0:
+                valid_service_node_bids[service_node_address] = \
+                    service_node_bids
+        return valid_service_node_bids
+
+    def __compute_expiry_time(self, all_service_node_bids: _ServiceNodeBids,
+                              valid_until_buffer: int) -> float:
+        return min(service_node_bid.valid_until -
+                   service_node_bid.execution_time - valid_until_buffer
+                   for service_node_bids in all_service_node_bids.values()
+                   for service_node_bid in service_node_bids)
 
     def __retrieve_bid_from_service_node(
             self, source_blockchain_client: BlockchainClient,
@@ -20,6 +20,10 @@ from pantos.client.library.business.base import Interactor
 from pantos.client.library.business.base import InteractorError
 from pantos.client.library.configuration import config
 from pantos.client.library.configuration import get_blockchain_config
+from pantos.client.library.instrumentation import instrument_operation
+from pantos.client.library.instrumentation import instrument_stage
+from pantos.client.library.metrics import measure_http_request
+from pantos.client.library.sessions import get_http_session
 
 _DEPLOYMENT_RESOURCE = 'deployment'
 
@@ -141,43 +145,51 @@ class TokenDeploymentInteractor(Interactor):
             If the token deployment cannot be executed.
 
         """
-        deployment_blockchain_ids = [
-            blockchain.value for blockchain in request.deployment_blockchains
-        ]
-        service_node_address, service_node_bid = \
-            self.__get_cheapest_bid_response(request.payment_blockchain)
-        valid_until = self.__compute_valid_until(
-            service_node_bid.execution_time, request.valid_until_buffer)
-        blockchain_config = get_blockchain_config(request.payment_blockchain)
-        pan_token_address = blockchain_config['tokens']['pan']
-        source_blockchain_client = get_blockchain_client(
-            request.payment_blockchain)
-        payment_response = self.__get_payment_response(
-            request.payment_blockchain, request.deployment_blockchains)
-        recipient_address = BlockchainAddress(
-            payment_response.receiver_address)
-        transfer_signature_request = \
-            BlockchainClient.ComputeTransferSignatureRequest(
-                request.payer_private_key, recipient_address,
-                pan_token_address,
+        with instrument_operation('deploy_token'):
+            deployment_blockchain_ids = [
+                blockchain.value
+                for blockchain in request.deployment_blockchains
+            ]
+            with instrument_stage('service_node_bid'):
+                service_node_address, service_node_bid = \
+                    self.__get_cheapest_bid_response(
+                        request.payment_blockchain)
+            valid_until = self.__compute_valid_until(
+                service_node_bid.execution_time, request.valid_until_buffer)
+            blockchain_config = get_blockchain_config(
+                request.payment_blockchain)
+            pan_token_address = blockchain_config['tokens']['pan']
+            source_blockchain_client = get_blockchain_client(
+                request.payment_blockchain)
+            with instrument_stage('payment'):
+                payment_response = self.__get_payment_response(
+                    request.payment_blockchain, request.deployment_blockchains)
+            recipient_address = BlockchainAddress(
+                payment_response.receiver_address)
+            transfer_signature_request = \
+                BlockchainClient.ComputeTransferSignatureRequest(
+                    request.payer_private_key, recipient_address,
+                    pan_token_address,
+                    payment_response.deployment_fee.amount,
+                    service_node_address, service_node_bid, valid_until)
+            transfer_signature_response = \
+                source_blockchain_client.compute_transfer_signature(
+                        transfer_signature_request)
+            deployment_request = TokenDeploymentSubmissionRequest(
+                deployment_blockchain_ids, request.token_name,
+                request.token_symbol, request.token_decimals,
+                request.token_pausable, request.token_burnable,
+                request.token_supply, request.payment_blockchain.value,
+                transfer_signature_response.sender_address,
                 payment_response.deployment_fee.amount,
-                service_node_address, service_node_bid, valid_until)
-        transfer_signature_response = \
-            source_blockchain_client.compute_transfer_signature(
-                    transfer_signature_request)
-        deployment_request = TokenDeploymentSubmissionRequest(
-            deployment_blockchain_ids, request.token_name,
-            request.token_symbol, request.token_decimals,
-            request.token_pausable, request.token_burnable,
-            request.token_supply, request.payment_blockchain.value,
-            transfer_signature_response.sender_address,
-            payment_response.deployment_fee.amount, payment_response.signature,
-            payment_response.deployment_fee_valid_until, service_node_bid.fee,
-            service_node_bid.execution_time, service_node_bid.valid_until,
-            service_node_bid.signature,
-            transfer_signature_response.sender_nonce, valid_until,
-            transfer_signature_response.signature)
-        return self.__submit_deployment_request(deployment_request)
+                payment_response.signature,
+                payment_response.deployment_fee_valid_until,
+                service_node_bid.fee, service_node_bid.execution_time,
+                service_node_bid.valid_until, service_node_bid.signature,
+                transfer_signature_response.sender_nonce, valid_until,
+                transfer_signature_response.signature)
+            with instrument_stage('token_creator_submit'):
+                return self.__submit_deployment_request(deployment_request)
 
     def __submit_deployment_request(
             self, request: TokenDeploymentSubmissionRequest) -> uuid.UUID:
@@ -227,9 +239,11 @@ class TokenDeploymentInteractor(Interactor):
         token_creator_url_deployment = self.__build_resource_url(
             config['token_creator']['url'], _DEPLOYMENT_RESOURCE)
         try:
-            token_creator_response = requests.post(
-                token_creator_url_deployment, json=payload)
-            token_creator_response.raise_for_status()
+            with measure_http_request(token_creator_url_deployment,
+                                      _DEPLOYMENT_RESOURCE):
+                token_creator_response = get_http_session().post(
+                    token_creator_url_deployment, json=payload)
+                token_creator_response.raise_for_status()
             task_id = token_creator_response.json()['task_id']
             return uuid.UUID(task_id)
         except (requests.exceptions.HTTPError, KeyError):
@@ -274,9 +288,11 @@ class TokenDeploymentInteractor(Interactor):
             'deployment_blockchain_ids': deployment_blockchain_ids
         }
         try:
-            token_creator_response = requests.post(
-                token_creator_url_deployment_fee, json=request)
-            token_creator_response.raise_for_status()
+            with measure_http_request(token_creator_url_deployment_fee,
+                                      _PAYMENT_RESOURCE):
+                token_creator_response = get_http_session().post(
+                    token_creator_url_deployment_fee, json=request)
+                token_creator_response.raise_for_status()
             json_response = token_creator_response.json()
             deployment_fee = json_response['fee']
             return self.__PaymentResponse(
@@ -316,9 +332,11 @@ class TokenDeploymentInteractor(Interactor):
             config['token_creator']['url'], _CHEAPEST_BID_RESOURCE)
         query_parameters = f'payment_blockchain_id={payment_blockchain_id}'
         try:
-            token_creator_response = requests.get(
-                f'{token_creator_cheapest_bid_url}?{query_parameters}')
-            token_creator_response.raise_for_status()
+            with measure_http_request(token_creator_cheapest_bid_url,
+                                      _CHEAPEST_BID_RESOURCE):
+                token_creator_response = get_http_session().get(
+                    f'{token_creator_cheapest_bid_url}?{query_parameters}')
+                token_creator_response.raise_for_status()
             json_response = token_creator_response.json()
             service_node_bid = ServiceNodeBid(
                 source_blockchain=payment_blockchain,
@@ -0,0 +1,146 @@
+"""Module for ranking service node bids according to pluggable
+policies.
+
+"""
+import abc
+import heapq
+import secrets
+import typing
+
+from pantos.common.entities import BlockchainAddressBidPair
+from pantos.common.entities import ServiceNodeBid
+from pantos.common.types import BlockchainAddress
+
+_RankKey: typing.TypeAlias = typing.Tuple[typing.Any, ...]
+
+
+class BidRankingPolicy(abc.ABC):
+    """Policy for ranking service node bids. Bids with a lower rank key
+    are better.
+
+    """
+    @abc.abstractmethod
+    def rank_key(self, service_node_bid: ServiceNodeBid) \
+            -> typing.Optional[_RankKey]:
+        """Compute the rank key of a service node bid.
+
+        Parameters
+        ----------
+        service_node_bid : ServiceNodeBid
+            The service node bid to be ranked.
+
+        Returns
+        -------
+        tuple or None
+            The rank key of the service node bid, or None if the bid is
+            not eligible under the policy.
+
+        """
+        pass  # pragma: no cover
+
+
+class LowestFeePolicy(BidRankingPolicy):
+    """Policy that prefers the service node bid with the lowest fee. If
+    more than one bid has the lowest fee, the one with the lower
+    execution time is preferred.
+
+    """
+    def rank_key(self, service_node_bid: ServiceNodeBid) -> _RankKey:
+        # Docstring inherited
+        return service_node_bid.fee, service_node_bid.execution_time
+
+
+class FastestExecutionPolicy(BidRankingPolicy):
+    """Policy that prefers the service node bid with the lowest
+    execution time. If more than one bid has the lowest execution time,
+    the one with the lower fee is preferred.
+
+    """
+    def rank_key(self, service_node_bid: ServiceNodeBid) -> _RankKey:
+        # Docstring inherited
+        return service_node_bid.execution_time, service_node_bid.fee
+
+
+class LowestFeeWithinDeadlinePolicy(BidRankingPolicy):
+    """Policy that prefers the service node bid with the lowest fee
+    among the bids with an execution time not exceeding a maximum
+    execution time.
+
+    """
+    def __init__(self, max_execution_time: int):
+        """Construct a policy instance.
+
+        Parameters
+        ----------
+        max_execution_time : int
+            The maximum execution time (in seconds) of an eligible
+            service node bid.
+
+        """
+        self.__max_execution_time = max_execution_time
+        self.__lowest_fee_policy = LowestFeePolicy()
+
+    @property
+    def max_execution_time(self) -> int:
+        """The maximum execution time (in seconds) of an eligible
+        service node bid.
+
+        """
+        return self.__max_execution_time
+
+    def rank_key(self, service_node_bid: ServiceNodeBid) \
+            -> typing.Optional[_RankKey]:
+        # Docstring inherited
+        if service_node_bid.execution_time > self.__max_execution_time:
+            return None
+        return self.__lowest_fee_policy.rank_key(service_node_bid)
+
+
+def rank_service_node_bids(
+        service_node_bids: typing.Mapping[BlockchainAddress,
+                                          typing.Iterable[ServiceNodeBid]],
+        policy: BidRankingPolicy,
+        number_bids: int = 1) -> typing.List[BlockchainAddressBidPair]:
+    """Select the best service node bids according to a ranking policy.
+    All bids are ranked in a single pass, keeping only the best bids
+    seen so far in a bounded heap. Bids with equal rank keys are
+    ordered randomly, so that the load is spread across equally good
+    service nodes.
+
+    Parameters
+    ----------
+    service_node_bids : dict of BlockchainAddress and list of
+            ServiceNodeBid
+        The service node bids of each service node.
+    policy : BidRankingPolicy
+        The policy to rank the service node bids by.
+    number_bids : int, optional
+        The maximum number of service node bids to select (default: 1).
+
+    Returns
+    -------
+    list of tuple of BlockchainAddress and ServiceNodeBid
+        The selected pairs of service node address and bid, best first.
+        Fewer pairs are returned if there are fewer eligible bids.
+
+    """
+    ranked_bid_pairs = _generate_ranked_bid_pairs(service_node_bids, policy)
+    return [
+        bid_pair for _, _, bid_pair in heapq.nsmallest(
+            number_bids, ranked_bid_pairs,
+            key=lambda ranked_bid_pair: ranked_bid_pair[:2])
+    ]
+
+
+def _generate_ranked_bid_pairs(
+    service_node_bids: typing.Mapping[BlockchainAddress,
+                                      typing.Iterable[ServiceNodeBid]],
+    policy: BidRankingPolicy
+) -> typing.Iterator[typing.Tuple[_RankKey, int, BlockchainAddressBidPair]]:
+    for service_node_address, bids in service_node_bids.items():
+        for service_node_bid in bids:
+            rank_key = policy.rank_key(service_node_bid)
+            if rank_key is not None:
+                # Random tie breaker for equally ranked bids
+                yield (rank_key, secrets.randbits(32), (service_node_address,
+                                                        service_node_bid))
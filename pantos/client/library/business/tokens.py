@@ -3,6 +3,8 @@
 """
 import dataclasses
 import decimal
+import threading
+import typing
 
 from pantos.common.blockchains.base import Blockchain
 from pantos.common.types import AccountId
@@ -15,6 +17,8 @@ from pantos.client.library.blockchains import get_blockchain_client
 from pantos.client.library.business.base import Interactor
 from pantos.client.library.business.base import InteractorError
 from pantos.client.library.configuration import get_blockchain_config
+from pantos.client.library.context import get_client_context
+from pantos.client.library.metrics import record_cache_access
 
 
 class TokenInteractorError(InteractorError):
@@ -24,13 +28,101 @@ class TokenInteractorError(InteractorError):
     pass
 
 
+class TokenDecimalsCache:
+    """Thread-safe cache for the numbers of decimals of tokens. The
+    number of decimals of a token never changes once the token is
+    deployed, so the cached values never expire.
+
+    """
+    def __init__(self):
+        """Construct an empty cache instance.
+
+        """
+        self.__token_decimals: typing.Dict[typing.Tuple[Blockchain,
+                                                        BlockchainAddress],
+                                           int] = {}
+        self.__lock = threading.Lock()
+
+    def get(self, blockchain: Blockchain,
+            token_address: BlockchainAddress) -> typing.Optional[int]:
+        """Get the cached number of decimals of a token.
+
+        Parameters
+        ----------
+        blockchain : Blockchain
+            The blockchain of the token.
+        token_address : BlockchainAddress
+            The blockchain address of the token.
+
+        Returns
+        -------
+        int or None
+            The token's number of decimals, or None if it is not
+            cached.
+
+        """
+        with self.__lock:
+            token_decimals = self.__token_decimals.get(
+                (blockchain, token_address))
+        record_cache_access('token_decimals', token_decimals is not None)
+        return token_decimals
+
+    def set(self, blockchain: Blockchain, token_address: BlockchainAddress,
+            token_decimals: int) -> None:
+        """Cache the number of decimals of a token.
+
+        Parameters
+        ----------
+        blockchain : Blockchain
+            The blockchain of the token.
+        token_address : BlockchainAddress
+            The blockchain address of the token.
+        token_decimals : int
+            The token's number of decimals.
+
+        """
+        with self.__lock:
+            self.__token_decimals[(blockchain, token_address)] = \
+                token_decimals
+
+    def clear(self) -> None:
+        """Remove all cached numbers of decimals.
+
+        """
+        with self.__lock:
+            self.__token_decimals.clear()
+
+
+token_decimals_cache = TokenDecimalsCache()
+"""Process-wide cache for the numbers of decimals of tokens."""
+
+
+def get_token_decimals_cache() -> TokenDecimalsCache:
+    """Get the token decimals cache of the active client context or,
+    outside of any client context, the process-wide token decimals
+    cache.
+
+    Returns
+    -------
+    TokenDecimalsCache
+        The token decimals cache.
+
+    """
+    client_context = get_client_context()
+    if client_context is None:
+        return token_decimals_cache
+    return client_context.get_resource('token_decimals_cache',
+                                       TokenDecimalsCache)
+
+
 class TokenInteractor(Interactor):
     """Interactor for handling Pantos-compatible tokens.
 
     """
-    def convert_amount_to_main_unit(self, blockchain: Blockchain,
-                                    token_id: TokenId,
-                                    amount_subunit: int) -> decimal.Decimal:
+    def convert_amount_to_main_unit(
+            self, blockchain: Blockchain, token_id: TokenId,
+            amount_subunit: int,
+            token_decimals: typing.Optional[int] = None) -> decimal.Decimal:
         """Convert an amount from a token's smallest subunit to its main
         unit.
 
@@ -42,6 +134,9 @@ class TokenInteractor(Interactor):
             The identifier of the token.
         amount_subunit : int
             The amount in the token's smallest subunit.
+        token_decimals : int, optional
+            The token's number of decimals if already known. If not
+            specified, it is read from the blockchain.
 
         Returns
         -------
@@ -60,11 +155,8 @@ class TokenInteractor(Interactor):
                                            amount_subunit=amount_subunit)
             if amount_subunit == 0:
                 return decimal.Decimal(0)
-            token_address = self.__token_id_to_token_address(
-                blockchain, token_id)
-            blockchain_client = get_blockchain_client(blockchain)
-            token_decimals = blockchain_client.read_token_decimals(
-                token_address)
+            if token_decimals is None:
+                token_decimals = self.read_token_decimals(blockchain, token_id)
             assert token_decimals >= 0
             return decimal.Decimal(amount_subunit) / (10**token_decimals)
         except TokenInteractorError:
@@ -75,9 +167,10 @@ class TokenInteractor(Interactor):
                 blockchain=blockchain, token_id=token_id,
                 amount_subunit=amount_subunit)
 
-    def convert_amount_to_subunit(self, blockchain: Blockchain,
-                                  token_id: TokenId,
-                                  amount_main_unit: decimal.Decimal) -> int:
+    def convert_amount_to_subunit(
+            self, blockchain: Blockchain, token_id: TokenId,
+            amount_main_unit: decimal.Decimal,
+            token_decimals: typing.Optional[int] = None) -> int:
         """Convert an amount from a token's main unit to its smallest
         subunit.
 
@@ -89,6 +182,9 @@ class TokenInteractor(Interactor):
             The identifier of the token.
         amount_main_unit : decimal.Decimal
             The amount in the token's main unit.
+        token_decimals : int, optional
+            The token's number of decimals if already known. If not
+            specified, it is read from the blockchain.
 
         Returns
         -------
@@ -107,11 +203,8 @@ class TokenInteractor(Interactor):
                                            amount_main_unit=amount_main_unit)
             if amount_main_unit == 0:
                 return 0
-            token_address = self.__token_id_to_token_address(
-                blockchain, token_id)
-            blockchain_client = get_blockchain_client(blockchain)
-            token_decimals = blockchain_client.read_token_decimals(
-                token_address)
+            if token_decimals is None:
+                token_decimals = self.read_token_decimals(blockchain, token_id)
             assert token_decimals >= 0
             amount_subunit = amount_main_unit * (10**token_decimals)
             amount_subunit_integer = int(amount_subunit)
@@ -129,6 +222,68 @@ class TokenInteractor(Interactor):
                 blockchain=blockchain, token_id=token_id,
                 amount_main_unit=amount_main_unit)
 
+    def read_token_decimals(self, blockchain: Blockchain,
+                            token_id: TokenId) -> int:
+        """Read the number of decimals of a token. The number is read
+        from the blockchain only if it is not cached yet.
+
+        Parameters
+        ----------
+        blockchain : Blockchain
+            The blockchain to read the token decimals on.
+        token_id : TokenId
+            The identifier of the token.
+
+        Returns
+        -------
+        int
+            The token's number of decimals.
+
+        Raises
+        ------
+        TokenInteractorError
+            If the token decimals cannot be read.
+
+        """
+        try:
+            token_address = self.__token_id_to_token_address(
+                blockchain, token_id)
+            return self.__read_multiple_token_decimals(
+                blockchain, [token_address])[token_address]
+        except TokenInteractorError:
+            raise
+        except Exception:
+            raise TokenInteractorError('unable to read the token decimals',
+                                       blockchain=blockchain,
+                                       token_id=token_id)
+
+    def prewarm_token_decimals(self, blockchain: Blockchain) -> None:
+        """Cache the numbers of decimals of all tokens configured for a
+        blockchain. The numbers of decimals that are not cached yet are
+        read in a single batch.
+
+        Parameters
+        ----------
+        blockchain : Blockchain
+            The blockchain to cache the token decimals for.
+
+        Raises
+        ------
+        TokenInteractorError
+            If the token decimals cannot be read.
+
+        """
+        try:
+            token_addresses = [
+                BlockchainAddress(token_address) for token_address in
+                get_blockchain_config(blockchain)['tokens'].values()
+                if token_address
+            ]
+            self.__read_multiple_token_decimals(blockchain, token_addresses)
+        except Exception:
+            raise TokenInteractorError('unable to prewarm the token decimals',
+                                       blockchain=blockchain)
+
     def find_token_address(self, blockchain: Blockchain,
                            token_symbol: TokenSymbol) -> BlockchainAddress:
         """Find the blockchain address of a token by its symbol.
@@ -292,6 +447,112 @@ class TokenInteractor(Interactor):
                 'unable to retrieve the token balance of a blockchain account',
                 request=request)
 
+    @dataclasses.dataclass
+    class RetrieveTokenBalancesRequest:
+        """Request data for retrieving the token balances of multiple
+        blockchain accounts.
+
+        Attributes
+        ----------
+        blockchain : Blockchain
+            The blockchain to retrieve the token balances on.
+        account_token_ids : list of tuple of AccountId and TokenId
+            Pairs of the identifier of a blockchain account and the
+            identifier of a token.
+        return_in_main_unit : bool
+            True if the token balances are to be returned in the
+            tokens' main units, False if they are to be returned in the
+            tokens' smallest subunits.
+
+        """
+        blockchain: Blockchain
+        account_token_ids: typing.List[typing.Tuple[AccountId, TokenId]]
+        return_in_main_unit: bool
+
+    def retrieve_token_balances(
+            self,
+            request: RetrieveTokenBalancesRequest) -> typing.List[Amount]:
+        """Retrieve the token balances of multiple blockchain accounts.
+        The token balances and the token decimals are read in batches.
+
+        Parameters
+        ----------
+        request : RetrieveTokenBalancesRequest
+            The request data for retrieving the token balances.
+
+        Returns
+        -------
+        list of Amount
+            The token balances of the blockchain accounts (in the same
+            order as the requested pairs of account and token
+            identifiers).
+
+        Raises
+        ------
+        TokenInteractorError
+            If the token balances cannot be retrieved.
+
+        """
+        try:
+            token_addresses = [
+                self.__token_id_to_token_address(request.blockchain, token_id)
+                for _, token_id in request.account_token_ids
+            ]
+            blockchain_client = get_blockchain_client(request.blockchain)
+            token_balances = blockchain_client.read_multiple_token_balances([
+                (token_address, account_id) for token_address, (
+                    account_id,
+                    _) in zip(token_addresses, request.account_token_ids)
+            ])
+            assert all(token_balance >= 0 for token_balance in token_balances)
+            if not request.return_in_main_unit:
+                return list(token_balances)
+            tokens_decimals = self.__read_multiple_token_decimals(
+                request.blockchain, token_addresses)
+            return [
+                self.convert_amount_to_main_unit(
+                    request.blockchain, token_address, token_balance,
+                    tokens_decimals[token_address])
+                for token_address, token_balance in zip(
+                    token_addresses, token_balances)
+            ]
+        except TokenInteractorError:
+            raise
+        except Exception:
+            raise TokenInteractorError(
+                'unable to retrieve the token balances of blockchain '
+                'accounts', blockchain=request.blockchain,
+                number_balances=len(request.account_token_ids))
+
+    def __read_multiple_token_decimals(
+            self, blockchain: Blockchain,
+            token_addresses: typing.List[BlockchainAddress]) \
+            -> typing.Dict[BlockchainAddress, int]:
+        tokens_decimals: typing.Dict[BlockchainAddress, int] = {}
+        uncached_token_addresses = []
+        for token_address in dict.fromkeys(token_addresses):
+            token_decimals = get_token_decimals_cache().get(
+                blockchain, token_address)
+            if token_decimals is None:
+                uncached_token_addresses.append(token_address)
+            else:
+                tokens_decimals[token_address] = token_decimals
+        if len(uncached_token_addresses) == 0:
+            return tokens_decimals
+        blockchain_client = get_blockchain_client(blockchain)
+        read_tokens_decimals = ([
+            blockchain_client.read_token_decimals(uncached_token_addresses[0])
+        ] if len(uncached_token_addresses) == 1 else
+                                blockchain_client.read_multiple_token_decimals(
+                                    uncached_token_addresses))
+        for token_address, token_decimals in zip(uncached_token_addresses,
+                                                 read_tokens_decimals):
+            if token_decimals >= 0:
+                get_token_decimals_cache().set(blockchain, token_address,
+                                               token_decimals)
+            tokens_decimals[token_address] = token_decimals
+        return tokens_decimals
+
     def __token_id_to_token_address(self, blockchain: Blockchain,
                                     token_id: TokenId) -> BlockchainAddress:
         if isinstance(token_id, BlockchainAddress):
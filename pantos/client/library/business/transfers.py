@@ -1,7 +1,9 @@
 """Business logic for handling Pantos token transfers.
 
 """
+import concurrent.futures
 import dataclasses
+import functools
 import math
 import time
 import typing
@@ -11,7 +13,8 @@ from pantos.common.blockchains.base import Blockchain
 from pantos.common.entities import BlockchainAddressBidPair
 from pantos.common.entities import ServiceNodeBid
 from pantos.common.entities import ServiceNodeTransferStatus
-from pantos.common.servicenodes import ServiceNodeClient
+from pantos.common.servicenodes import \
+    ServiceNodeClient as _BaseServiceNodeClient
 from pantos.common.types import Amount
 from pantos.common.types import BlockchainAddress
 from pantos.common.types import PrivateKey
@@ -19,6 +22,7 @@ from pantos.common.types import TokenId
 
 from pantos.client.library.blockchains import BlockchainClient
 from pantos.client.library.blockchains import get_blockchain_client
+from pantos.client.library.blockchains.base import BlockchainClientError
 from pantos.client.library.blockchains.base import UnknownTransferError
 from pantos.client.library.business.base import Interactor
 from pantos.client.library.business.base import InteractorError
@@ -28,10 +32,28 @@ from pantos.client.library.configuration import get_blockchain_config
 from pantos.client.library.entitites import DestinationTransferStatus
 from pantos.client.library.entitites import ServiceNodeTaskInfo
 from pantos.client.library.entitites import TokenTransferStatus
+from pantos.client.library.executors import get_executor
+from pantos.client.library.instrumentation import instrument_operation
+from pantos.client.library.instrumentation import instrument_stage
+from pantos.client.library.servicenodes import ServiceNodeClient
 
 _DEFAULT_VALID_UNTIL_BUFFER = 120
 """Default "valid until" timestamp buffer for a token transfer in seconds."""
 
+_ServiceNodeUrls = typing.Dict[typing.Tuple[Blockchain, BlockchainAddress],
+                               str]
+"""Service node URLs by source blockchain and service node address."""
+
+_DestinationTransferRequests = typing.Dict[
+    int, BlockchainClient.DestinationTransferRequest]
+"""Destination transfer requests by token transfer status request
+index."""
+
+_DestinationTransferResponses = typing.Dict[
+    int, typing.Optional[BlockchainClient.DestinationTransferResponse]]
+"""Destination transfer responses (None for unknown token transfers) by
+token transfer status request index."""
+
 
 class TransferInteractorError(InteractorError):
     """Exception class for all transfer interactor errors.
@@ -109,6 +131,64 @@ class TransferInteractor(Interactor):
         service_node_bid: typing.Optional[BlockchainAddressBidPair] = None
         valid_until_buffer: int = _DEFAULT_VALID_UNTIL_BUFFER
 
+    @dataclasses.dataclass
+    class __TransferGroup:
+        """Data shared by all token transfers with the same source
+        blockchain, destination blockchain and source token.
+
+        Attributes
+        ----------
+        find_token_addresses_response : FindTokenAddressesResponse
+            The token's addresses on the source and destination
+            blockchain.
+        token_decimals : int or None
+            The token's number of decimals (None if no token amount
+            needs to be converted).
+        cheapest_service_node_bid : CheapestServiceNodeBid or None
+            The cheapest service node bid (None if a service node bid
+            is specified for all token transfers).
+
+        """
+        find_token_addresses_response: \
+            TokenInteractor.FindTokenAddressesResponse
+        token_decimals: typing.Optional[int]
+        cheapest_service_node_bid: typing.Optional[
+            BidInteractor.CheapestServiceNodeBid]
+
+    @dataclasses.dataclass
+    class __PreparedTransfer:
+        """Data of a token transfer that is ready to be signed and
+        submitted.
+
+        Attributes
+        ----------
+        request : TransferTokensRequest
+            The request data of the token transfer.
+        token_addresses : FindTokenAddressesResponse
+            The token's addresses on the source and destination
+            blockchain.
+        token_amount : int
+            The token amount in the token's smallest subunit.
+        service_node_address : BlockchainAddress
+            The address of the chosen service node.
+        service_node_bid : ServiceNodeBid
+            The chosen service node bid.
+        service_node_url : str or None
+            The URL of the chosen service node (None if it has not
+            been read yet).
+        valid_until : int
+            The timestamp until when the token transfer is valid (in
+            seconds since the epoch).
+
+        """
+        request: 'TransferInteractor.TransferTokensRequest'
+        token_addresses: TokenInteractor.FindTokenAddressesResponse
+        token_amount: int
+        service_node_address: BlockchainAddress
+        service_node_bid: ServiceNodeBid
+        service_node_url: typing.Optional[str]
+        valid_until: int
+
     def transfer_tokens(self,
                         request: TransferTokensRequest) -> ServiceNodeTaskInfo:
         """Transfer tokens from a sender's account on a source
@@ -131,71 +211,115 @@ class TransferInteractor(Interactor):
             If the token transfer cannot be executed.
 
         """
-        try:
-            find_token_addresses_response = \
-                TokenInteractor().find_token_addresses(
-                    request.source_blockchain, request.destination_blockchain,
-                    request.source_token_id)
-            token_amount = self.__compute_token_amount(
-                request, find_token_addresses_response.source_token_address)
-            service_node_address, service_node_bid = \
-                self.__retrieve_service_node_bid(request)
-            valid_until = self.__compute_valid_until(request, service_node_bid)
-            self.__validate_recipient_address(request)
-            source_blockchain_client = get_blockchain_client(
-                request.source_blockchain)
-            if request.source_blockchain is request.destination_blockchain:
-                # Single-chain token transfer
-                compute_transfer_signature_request = \
-                    BlockchainClient.ComputeTransferSignatureRequest(
-                        request.sender_private_key, request.recipient_address,
-                        find_token_addresses_response.source_token_address,
-                        token_amount, service_node_address, service_node_bid,
-                        valid_until)
-                compute_transfer_signature_response = \
-                    source_blockchain_client.compute_transfer_signature(
-                        compute_transfer_signature_request)
-                sender_address = \
-                    compute_transfer_signature_response.sender_address
-                sender_nonce = compute_transfer_signature_response.sender_nonce
-                signature = compute_transfer_signature_response.signature
-            else:
-                # Cross-chain token transfer
-                compute_transfer_from_signature_request = \
-                    BlockchainClient.ComputeTransferFromSignatureRequest(
-                        request.destination_blockchain,
-                        request.sender_private_key, request.recipient_address,
-                        find_token_addresses_response.source_token_address,
-                        find_token_addresses_response.destination_token_address,    # noqa: E501
-                        token_amount, service_node_address, service_node_bid,
-                        valid_until)
-                compute_transfer_from_signature_response = \
-                    source_blockchain_client.compute_transfer_from_signature(
-                        compute_transfer_from_signature_request)
-                sender_address = \
-                    compute_transfer_from_signature_response.sender_address
-                sender_nonce = \
-                    compute_transfer_from_signature_response.sender_nonce
-                signature = compute_transfer_from_signature_response.signature
-            service_node_url = source_blockchain_client.read_service_node_url(
-                service_node_address)
-            submit_transfer_request = ServiceNodeClient.SubmitTransferRequest(
-                service_node_url, request.source_blockchain,
-                request.destination_blockchain, sender_address,
-                request.recipient_address,
-                find_token_addresses_response.source_token_address,
-                find_token_addresses_response.destination_token_address,
-                token_amount, service_node_bid, sender_nonce, valid_until,
-                signature)
-            service_node_task_id = ServiceNodeClient().submit_transfer(
-                submit_transfer_request)
-            return ServiceNodeTaskInfo(service_node_task_id,
-                                       service_node_address)
-        except TransferInteractorError:
-            raise
-        except Exception:
-            raise TransferInteractorError('unable to execute a token transfer',
-                                          request=request)
+        with instrument_operation('transfer_tokens'):
+            try:
+                with instrument_stage('token_addresses'):
+                    find_token_addresses_response = \
+                        TokenInteractor().find_token_addresses(
+                            request.source_blockchain,
+                            request.destination_blockchain,
+                            request.source_token_id)
+                with instrument_stage('token_amount'):
+                    token_amount = self.__compute_token_amount(
+                        request,
+                        find_token_addresses_response.source_token_address)
+                with instrument_stage('service_node_bid'):
+                    service_node_address, service_node_bid = \
+                        self.__retrieve_service_node_bid(request)
+                return self.__submit_transfer(request,
+                                              find_token_addresses_response,
+                                              token_amount,
+                                              service_node_address,
+                                              service_node_bid)
+            except TransferInteractorError:
+                raise
+            except Exception:
+                raise TransferInteractorError(
+                    'unable to execute a token transfer', request=request)
+
+    def transfer_tokens_many(
+            self, requests: typing.Sequence[TransferTokensRequest]) \
+            -> typing.List[typing.Union[ServiceNodeTaskInfo,
+                                        TransferInteractorError]]:
+        """Execute multiple token transfers. The token addresses, the
+        token decimals and the cheapest service node bid are determined
+        only once for all token transfers sharing the same source
+        blockchain, destination blockchain and source token. The
+        service node URLs are read only once per service node. The
+        token transfers of each source blockchain are then signed
+        together (in multiple processes if configured so) and finally
+        submitted in parallel.
+
+        Parameters
+        ----------
+        requests : sequence of TransferTokensRequest
+            The request data for the new token transfers.
+
+        Returns
+        -------
+        list of ServiceNodeTaskInfo or TransferInteractorError
+            For each request (in the same order), either the service
+            node-related information of the token transfer or the
+            error that prevented the token transfer from being
+            executed.
+
+        """
+        with instrument_operation('transfer_tokens_many'):
+            results: typing.List[typing.Union[ServiceNodeTaskInfo,
+                                              TransferInteractorError,
+                                              None]] = [None] * len(requests)
+            request_groups: typing.Dict[typing.Tuple[Blockchain, Blockchain,
+                                                     TokenId],
+                                        typing.List[int]] = {}
+            for index, request in enumerate(requests):
+                request_groups.setdefault(
+                    (request.source_blockchain, request.destination_blockchain,
+                     request.source_token_id), []).append(index)
+            service_node_urls: _ServiceNodeUrls = {}
+            prepared_transfers: typing.Dict[
+                int, TransferInteractor.__PreparedTransfer] = {}
+            executor = get_executor()
+            future_to_index = {}
+            for indices in request_groups.values():
+                group_requests = [requests[index] for index in indices]
+                try:
+                    group = self.__prepare_transfer_group(
+                        group_requests, service_node_urls)
+                except Exception:
+                    for index in indices:
+                        results[index] = TransferInteractorError(
+                            'unable to execute a token transfer',
+                            request=requests[index])
+                    continue
+                for index in indices:
+                    future = executor.submit(self.__prepare_transfer_of_group,
+                                             requests[index], group,
+                                             service_node_urls)
+                    future_to_index[future] = index
+            for future in concurrent.futures.as_completed(future_to_index):
+                prepared_transfer = future.result()
+                if isinstance(prepared_transfer, TransferInteractorError):
+                    results[future_to_index[future]] = prepared_transfer
+                else:
+                    prepared_transfers[future_to_index[future]] = \
+                        prepared_transfer
+            signature_responses = self.__compute_transfer_signatures(
+                prepared_transfers)
+            future_to_index = {}
+            for index, signature_response in signature_responses.items():
+                if isinstance(signature_response, TransferInteractorError):
+                    results[index] = signature_response
+                    continue
+                future = executor.submit(self.__submit_signed_transfer_safely,
+                                         prepared_transfers[index],
+                                         signature_response)
+                future_to_index[future] = index
+            for future in concurrent.futures.as_completed(future_to_index):
+                results[future_to_index[future]] = future.result()
+            assert all(result is not None for result in results)
+            return typing.cast(
+                typing.List[typing.Union[ServiceNodeTaskInfo,
+                                         TransferInteractorError]], results)
 
     def get_token_transfer_status(self, request: TokenTransferStatusRequest) \
             -> TokenTransferStatus:
@@ -217,55 +341,421 @@ class TransferInteractor(Interactor):
             If the token transfer status cannot be retrieved.
 
         """
-        try:
+        with instrument_operation('get_token_transfer_status'):
+            try:
+                token_transfer_status, destination_transfer_request = \
+                    self.__read_source_transfer_status(request)
+                if destination_transfer_request is None:
+                    return token_transfer_status
+                with instrument_stage('destination_transfer'):
+                    try:
+                        destination_response = get_blockchain_client(
+                            token_transfer_status.destination_blockchain
+                        ).read_destination_transfer(
+                            destination_transfer_request)
+                    except UnknownTransferError:
+                        # Not a failure of the stage: the destination
+                        # transfer has just not been found yet
+                        return token_transfer_status
+                self.__update_destination_transfer_status(
+                    token_transfer_status, destination_response)
+                return token_transfer_status
+            except Exception:
+                raise TransferInteractorError(
+                    'unable to get token transfer status', request=request)
+
+    def get_token_transfer_statuses(
+            self, requests: typing.Sequence[TokenTransferStatusRequest]) \
+            -> typing.List[typing.Union[TokenTransferStatus,
+                                        TransferInteractorError]]:
+        """Get the statuses of multiple token transfers. The service
+        node statuses are retrieved in parallel. The confirmed token
+        transfers are then grouped by their destination blockchain, and
+        each destination blockchain is searched only once for all of
+        its token transfers.
+
+        Parameters
+        ----------
+        requests : sequence of TokenTransferStatusRequest
+            The request data for the statuses of the token transfers.
+
+        Returns
+        -------
+        list of TokenTransferStatus or TransferInteractorError
+            For each request (in the same order), either the data of
+            the token transfer status or the error that prevented it
+            from being retrieved.
+
+        """
+        with instrument_operation('get_token_transfer_statuses'):
+            results: typing.List[typing.Union[TokenTransferStatus,
+                                              TransferInteractorError,
+                                              None]] = [None] * len(requests)
+            destination_transfer_requests: typing.Dict[
+                Blockchain, _DestinationTransferRequests] = {}
+            executor = get_executor()
+            future_to_index = {}
+            for index, request in enumerate(requests):
+                future = executor.submit(self.__read_source_transfer_status,
+                                         request)
+                future_to_index[future] = index
+            for future in concurrent.futures.as_completed(future_to_index):
+                index = future_to_index[future]
+                try:
+                    token_transfer_status, destination_transfer_request = \
+                        future.result()
+                except Exception:
+                    results[index] = TransferInteractorError(
+                        'unable to get token transfer status',
+                        request=requests[index])
+                    continue
+                results[index] = token_transfer_status
+                if destination_transfer_request is not None:
+                    destination_transfer_requests.setdefault(
+                        token_transfer_status.destination_blockchain,
+                        {})[index] = destination_transfer_request
+            # A single search per destination blockchain
+            future_to_blockchain = {}
+            for destination_blockchain, blockchain_requests in \
+                    destination_transfer_requests.items():
+                future = executor.submit(self.__read_destination_transfers,
+                                         destination_blockchain,
+                                         blockchain_requests)
+                future_to_blockchain[future] = destination_blockchain
+            for future in concurrent.futures.as_completed(
+                    future_to_blockchain):
+                destination_blockchain = future_to_blockchain[future]
+                try:
+                    destination_responses = future.result()
+                except Exception:
+                    for index in destination_transfer_requests[
+                            destination_blockchain]:
+                        results[index] = TransferInteractorError(
+                            'unable to get token transfer status',
+                            request=requests[index])
+                    continue
+                for index, destination_response in \
+                        destination_responses.items():
+                    if destination_response is not None:
+                        self.__update_destination_transfer_status(
+                            typing.cast(TokenTransferStatus, results[index]),
+                            destination_response)
+            assert all(result is not None for result in results)
+            return typing.cast(
+                typing.List[typing.Union[TokenTransferStatus,
+                                         TransferInteractorError]], results)
+
+    def __read_source_transfer_status(
+            self, request: TokenTransferStatusRequest) \
+            -> typing.Tuple[TokenTransferStatus,
+                            typing.Optional[
+                                BlockchainClient.DestinationTransferRequest]]:
+        # Returns the token transfer status as far as it is known from
+        # the service node, together with the request data for reading
+        # the token transfer on the destination blockchain (or None if
+        # the token transfer is not yet confirmed on the source
+        # blockchain)
+        with instrument_stage('service_node_url'):
             service_node_url = get_blockchain_client(
                 request.source_blockchain).read_service_node_url(
                     request.service_node_address)
+        with instrument_stage('service_node_status'):
             source_status = ServiceNodeClient().status(
                 service_node_url, request.service_node_task_id)
-            token_transfer_status = \
-                self.__create_token_transfer_status_response(source_status)
-            if source_status.status is not ServiceNodeTransferStatus.CONFIRMED:
-                return token_transfer_status
-            source_transaction_id = source_status.transaction_id
-            token_transfer_status.source_transaction_id = source_transaction_id
-            token_transfer_status.source_transfer_id = \
-                source_status.transfer_id
-            destination_transfer_request = \
-                BlockchainClient.DestinationTransferRequest(
-                    request.source_blockchain, source_transaction_id)
-            try:
-                destination_response = get_blockchain_client(
-                    source_status.destination_blockchain
-                ).read_destination_transfer(destination_transfer_request)
-            except UnknownTransferError:
-                return token_transfer_status
-            token_transfer_status.destination_transfer_status = \
-                self.__get_destination_transfer_status(
-                    destination_response.latest_block_number,
-                    destination_response.transaction_block_number,
-                    source_status.destination_blockchain)
-            token_transfer_status.destination_transaction_id = \
-                destination_response.destination_transaction_id
-            token_transfer_status.destination_transfer_id = \
-                destination_response.destination_transfer_id
-            token_transfer_status.validator_nonce = \
-                destination_response.validator_nonce
-            token_transfer_status.signer_addresses = \
-                destination_response.signer_addresses
-            token_transfer_status.signatures = destination_response.signatures
-            return token_transfer_status
-        except Exception:
-            raise TransferInteractorError(
-                'unable to get token transfer status', request=request)
+        token_transfer_status = \
+            self.__create_token_transfer_status_response(source_status)
+        if source_status.status is not ServiceNodeTransferStatus.CONFIRMED:
+            return token_transfer_status, None
+        source_transaction_id = source_status.transaction_id
+        token_transfer_status.source_transaction_id = source_transaction_id
+        token_transfer_status.source_transfer_id = source_status.transfer_id
+        destination_transfer_request = \
+            BlockchainClient.DestinationTransferRequest(
+                request.source_blockchain, source_transaction_id,
+                request.blocks_to_search,
+                functools.partial(self.__read_source_transaction_timestamp,
+                                  request.source_blockchain,
+                                  source_transaction_id))
+        return token_transfer_status, destination_transfer_request
 
-    def __compute_token_amount(self, request: TransferTokensRequest,
-                               source_token_address: BlockchainAddress) -> int:
+    def __read_destination_transfers(
+            self, destination_blockchain: Blockchain,
+            requests: _DestinationTransferRequests) \
+            -> _DestinationTransferResponses:
+        with instrument_stage('destination_transfer'):
+            responses = get_blockchain_client(
+                destination_blockchain).read_destination_transfers(
+                    list(requests.values()))
+        return dict(zip(requests.keys(), responses))
+
+    def __update_destination_transfer_status(
+        self, token_transfer_status: TokenTransferStatus,
+        destination_response: BlockchainClient.DestinationTransferResponse
+    ) -> None:
+        token_transfer_status.destination_transfer_status = \
+            self.__get_destination_transfer_status(
+                destination_response.latest_block_number,
+                destination_response.transaction_block_number,
+                token_transfer_status.destination_blockchain)
+        token_transfer_status.destination_transaction_id = \
+            destination_response.destination_transaction_id
+        token_transfer_status.destination_transfer_id = \
+            destination_response.destination_transfer_id
+        token_transfer_status.validator_nonce = \
+            destination_response.validator_nonce
+        token_transfer_status.signer_addresses = \
+            destination_response.signer_addresses
+        token_transfer_status.signatures = destination_response.signatures
+
+    def __read_source_transaction_timestamp(
+            self, source_blockchain: Blockchain,
+            source_transaction_id: str) -> typing.Optional[int]:
+        try:
+            with instrument_stage('transaction_timestamp'):
+                return get_blockchain_client(
+                    source_blockchain).read_transaction_timestamp(
+                        source_transaction_id)
+        except BlockchainClientError:
+            # The destination transfer is then searched without a
+            # lower bound
+            return None
+
+    def __compute_token_amount(
+            self, request: TransferTokensRequest,
+            source_token_address: BlockchainAddress,
+            token_decimals: typing.Optional[int] = None) -> int:
         if isinstance(request.token_amount, int):
             return request.token_amount
         return TokenInteractor().convert_amount_to_subunit(
             request.source_blockchain, source_token_address,
-            request.token_amount)
+            request.token_amount, token_decimals)
+
+    def __prepare_transfer_group(
+            self, requests: typing.List[TransferTokensRequest],
+            service_node_urls: _ServiceNodeUrls) -> __TransferGroup:
+        source_blockchain = requests[0].source_blockchain
+        destination_blockchain = requests[0].destination_blockchain
+        token_interactor = TokenInteractor()
+        with instrument_stage('token_addresses'):
+            find_token_addresses_response = \
+                token_interactor.find_token_addresses(
+                    source_blockchain, destination_blockchain,
+                    requests[0].source_token_id)
+        token_decimals = None
+        if any(not isinstance(request.token_amount, int)
+               for request in requests):
+            with instrument_stage('token_decimals'):
+                token_decimals = token_interactor.read_token_decimals(
+                    source_blockchain,
+                    find_token_addresses_response.source_token_address)
+        cheapest_service_node_bid = None
+        valid_until_buffers = [
+            request.valid_until_buffer for request in requests
+            if request.service_node_bid is None
+        ]
+        if len(valid_until_buffers) > 0:
+            with instrument_stage('service_node_bid'):
+                cheapest_service_node_bid = \
+                    BidInteractor().find_cheapest_service_node_bid(
+                        source_blockchain, destination_blockchain,
+                        max(valid_until_buffers))
+            service_node_url_key = (
+                source_blockchain,
+                cheapest_service_node_bid.service_node_address)
+            if service_node_url_key not in service_node_urls:
+                with instrument_stage('service_node_url'):
+                    service_node_urls[service_node_url_key] = \
+                        get_blockchain_client(
+                            source_blockchain).read_service_node_url(
+                                service_node_url_key[1])
+        return self.__TransferGroup(find_token_addresses_response,
+                                    token_decimals, cheapest_service_node_bid)
+
+    def __prepare_transfer_of_group(
+            self, request: TransferTokensRequest, group: __TransferGroup,
+            service_node_urls: _ServiceNodeUrls) \
+            -> typing.Union[__PreparedTransfer, TransferInteractorError]:
+        try:
+            with instrument_stage('token_amount'):
+                token_amount = self.__compute_token_amount(
+                    request,
+                    group.find_token_addresses_response.source_token_address,
+                    group.token_decimals)
+            if request.service_node_bid is None:
+                assert group.cheapest_service_node_bid is not None
+                service_node_address = \
+                    group.cheapest_service_node_bid.service_node_address
+                service_node_bid = \
+                    group.cheapest_service_node_bid.service_node_bid
+            else:
+                service_node_address, service_node_bid = \
+                    request.service_node_bid
+            service_node_url_key = (request.source_blockchain,
+                                    service_node_address)
+            service_node_url = service_node_urls.get(service_node_url_key)
+            if service_node_url is None:
+                with instrument_stage('service_node_url'):
+                    service_node_url = get_blockchain_client(
+                        request.source_blockchain).read_service_node_url(
+                            service_node_address)
+                service_node_urls[service_node_url_key] = service_node_url
+            return self.__prepare_transfer(request,
+                                           group.find_token_addresses_response,
+                                           token_amount, service_node_address,
+                                           service_node_bid, service_node_url)
+        except TransferInteractorError as error:
+            return error
+        except Exception:
+            return TransferInteractorError(
+                'unable to execute a token transfer', request=request)
+
+    def __compute_transfer_signatures(
+            self, prepared_transfers: typing.Dict[int, __PreparedTransfer]) \
+            -> typing.Dict[int, typing.Union[
+                BlockchainClient.ComputeTransferSignatureResponse,
+                BlockchainClient.ComputeTransferFromSignatureResponse,
+                TransferInteractorError]]:
+        # The token transfers of each source blockchain are signed
+        # together
+        source_blockchain_indices: typing.Dict[Blockchain,
+                                               typing.List[int]] = {}
+        for index, prepared_transfer in sorted(prepared_transfers.items()):
+            source_blockchain_indices.setdefault(
+                prepared_transfer.request.source_blockchain, []).append(index)
+        signature_responses: typing.Dict[int, typing.Union[
+            BlockchainClient.ComputeTransferSignatureResponse,
+            BlockchainClient.ComputeTransferFromSignatureResponse,
+            TransferInteractorError]] = {}
+        for source_blockchain, indices in source_blockchain_indices.items():
+            try:
+                signature_results: typing.Sequence[typing.Any] = \
+                    get_blockchain_client(
+                        source_blockchain).compute_transfer_signatures([
+                            self.__create_signature_request(
+                                prepared_transfers[index])
+                            for index in indices
+                        ])
+            except Exception:
+                signature_results = [None] * len(indices)
+            for index, signature_result in zip(indices, signature_results):
+                if (signature_result is None or isinstance(
+                        signature_result, BlockchainClientError)):
+                    signature_responses[index] = TransferInteractorError(
+                        'unable to execute a token transfer',
+                        request=prepared_transfers[index].request)
+                else:
+                    signature_responses[index] = signature_result
+        return signature_responses
+
+    def __submit_signed_transfer_safely(
+            self, prepared_transfer: __PreparedTransfer,
+            signature_response: typing.Union[
+                BlockchainClient.ComputeTransferSignatureResponse,
+                BlockchainClient.ComputeTransferFromSignatureResponse]) \
+            -> typing.Union[ServiceNodeTaskInfo, TransferInteractorError]:
+        try:
+            return self.__submit_signed_transfer(prepared_transfer,
+                                                 signature_response)
+        except Exception:
+            return TransferInteractorError(
+                'unable to execute a token transfer',
+                request=prepared_transfer.request)
+
+    def __submit_transfer(
+            self, request: TransferTokensRequest,
+            token_addresses: TokenInteractor.FindTokenAddressesResponse,
+            token_amount: int,
+            service_node_address: BlockchainAddress,
+            service_node_bid: ServiceNodeBid,
+            service_node_url: typing.Optional[str] = None) \
+            -> ServiceNodeTaskInfo:
+        prepared_transfer = self.__prepare_transfer(request, token_addresses,
+                                                    token_amount,
+                                                    service_node_address,
+                                                    service_node_bid,
+                                                    service_node_url)
+        source_blockchain_client = get_blockchain_client(
+            request.source_blockchain)
+        signature_request = self.__create_signature_request(prepared_transfer)
+        signature_response: typing.Union[
+            BlockchainClient.ComputeTransferSignatureResponse,
+            BlockchainClient.ComputeTransferFromSignatureResponse]
+        if isinstance(signature_request,
+                      BlockchainClient.ComputeTransferSignatureRequest):
+            signature_response = \
+                source_blockchain_client.compute_transfer_signature(
+                    signature_request)
+        else:
+            signature_response = \
+                source_blockchain_client.compute_transfer_from_signature(
+                    signature_request)
+        return self.__submit_signed_transfer(prepared_transfer,
+                                             signature_response)
+
+    def __prepare_transfer(
+            self, request: TransferTokensRequest,
+            token_addresses: TokenInteractor.FindTokenAddressesResponse,
+            token_amount: int, service_node_address: BlockchainAddress,
+            service_node_bid: ServiceNodeBid,
+            service_node_url: typing.Optional[str]) -> __PreparedTransfer:
+        valid_until = self.__compute_valid_until(request, service_node_bid)
+        self.__validate_recipient_address(request)
+        return self.__PreparedTransfer(request, token_addresses, token_amount,
+                                       service_node_address, service_node_bid,
+                                       service_node_url, valid_until)
+
+    def __create_signature_request(
+            self, prepared_transfer: __PreparedTransfer) \
+            -> typing.Union[
+                BlockchainClient.ComputeTransferSignatureRequest,
+                BlockchainClient.ComputeTransferFromSignatureRequest]:
+        request = prepared_transfer.request
+        token_addresses = prepared_transfer.token_addresses
+        if request.source_blockchain is request.destination_blockchain:
+            # Single-chain token transfer
+            return BlockchainClient.ComputeTransferSignatureRequest(
+                request.sender_private_key, request.recipient_address,
+                token_addresses.source_token_address,
+                prepared_transfer.token_amount,
+                prepared_transfer.service_node_address,
+                prepared_transfer.service_node_bid,
+                prepared_transfer.valid_until)
+        # Cross-chain token transfer
+        return BlockchainClient.ComputeTransferFromSignatureRequest(
+            request.destination_blockchain, request.sender_private_key,
+            request.recipient_address, token_addresses.source_token_address,
+            token_addresses.destination_token_address,
+            prepared_transfer.token_amount,
+            prepared_transfer.service_node_address,
+            prepared_transfer.service_node_bid, prepared_transfer.valid_until)
+
+    def __submit_signed_transfer(
+            self, prepared_transfer: __PreparedTransfer,
+            signature_response: typing.Union[
+                BlockchainClient.ComputeTransferSignatureResponse,
+                BlockchainClient.ComputeTransferFromSignatureResponse]) \
+            -> ServiceNodeTaskInfo:
+        request = prepared_transfer.request
+        token_addresses = prepared_transfer.token_addresses
+        service_node_url = prepared_transfer.service_node_url
+        if service_node_url is None:
+            with instrument_stage('service_node_url'):
+                service_node_url = get_blockchain_client(
+                    request.source_blockchain).read_service_node_url(
+                        prepared_transfer.service_node_address)
+        submit_transfer_request = ServiceNodeClient.SubmitTransferRequest(
+            service_node_url, request.source_blockchain,
+            request.destination_blockchain, signature_response.sender_address,
+            request.recipient_address, token_addresses.source_token_address,
+            token_addresses.destination_token_address,
+            prepared_transfer.token_amount, prepared_transfer.service_node_bid,
+            signature_response.sender_nonce, prepared_transfer.valid_until,
+            signature_response.signature)
+        with instrument_stage('service_node_submit'):
+            service_node_task_id = ServiceNodeClient().submit_transfer(
+                submit_transfer_request)
+        return ServiceNodeTaskInfo(service_node_task_id,
+                                   prepared_transfer.service_node_address)
 
     def __compute_valid_until(self, request: TransferTokensRequest,
                               service_node_bid: ServiceNodeBid) -> int:
@@ -282,7 +772,8 @@ class TransferInteractor(Interactor):
         if request.service_node_bid is None:
             find_cheapest_bid_response = \
                 BidInteractor().find_cheapest_service_node_bid(
-                    request.source_blockchain, request.destination_blockchain)
+                    request.source_blockchain, request.destination_blockchain,
+                    request.valid_until_buffer)
             service_node_address = \
                 find_cheapest_bid_response.service_node_address
             service_node_bid = find_cheapest_bid_response.service_node_bid
@@ -302,7 +793,7 @@ class TransferInteractor(Interactor):
 
     def __create_token_transfer_status_response(
             self,
-            transfer_status: ServiceNodeClient.TransferStatusResponse) \
+            transfer_status: _BaseServiceNodeClient.TransferStatusResponse) \
             -> TokenTransferStatus:
         return TokenTransferStatus(
             destination_blockchain=transfer_status.destination_blockchain,
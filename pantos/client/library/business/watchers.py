@@ -0,0 +1,382 @@
+"""Business logic for watching the statuses of Pantos token transfers.
+
+"""
+import asyncio
+import dataclasses
+import heapq
+import itertools
+import threading
+import time
+import typing
+import uuid
+
+from pantos.common.blockchains.base import Blockchain
+from pantos.common.entities import ServiceNodeTransferStatus
+from pantos.common.types import BlockchainAddress
+
+from pantos.client.library.business.transfers import TransferInteractor
+from pantos.client.library.business.transfers import TransferInteractorError
+from pantos.client.library.configuration import get_blockchain_config
+from pantos.client.library.context import activate_client_context
+from pantos.client.library.context import get_client_context
+from pantos.client.library.entitites import DestinationTransferStatus
+from pantos.client.library.entitites import ServiceNodeTaskInfo
+from pantos.client.library.entitites import TokenTransferStatus
+from pantos.client.library.entitites import TokenTransferStatusChange
+
+_MAXIMUM_POLL_INTERVAL = 600
+"""Maximum number of seconds between two polls of a token transfer
+whose status has not changed (unless the expected time until the next
+status change is even longer)."""
+
+_FAILED_SOURCE_TRANSFER_STATUSES = frozenset(
+    {ServiceNodeTransferStatus.FAILED, ServiceNodeTransferStatus.REVERTED})
+"""Source transfer statuses of token transfers that have failed."""
+
+TokenTransferStatusCallback = typing.Callable[[TokenTransferStatusChange],
+                                              None]
+"""Callback that is notified of a change of a token transfer status."""
+
+_WatchedTransferKey = typing.Tuple[Blockchain, BlockchainAddress, uuid.UUID]
+"""Source blockchain, service node address and service node task ID of
+a watched token transfer."""
+
+
+class TransferWatcher:
+    """Thread-safe watcher that tracks the statuses of many token
+    transfers. Each token transfer is polled according to its own
+    schedule, which adapts to the bid's execution time and to the
+    block times and required confirmations of the involved
+    blockchains. The polling interval of a token transfer grows while
+    its status does not change. Token transfers are dropped as soon as
+    they are confirmed on the destination blockchain or have failed on
+    the source blockchain.
+
+    """
+    @dataclasses.dataclass
+    class __WatchedTransfer:
+        """Data of a watched token transfer.
+
+        Attributes
+        ----------
+        source_blockchain : Blockchain
+            The token transfer's source blockchain.
+        service_node_task_info : ServiceNodeTaskInfo
+            Service node-related information of the token transfer.
+        status : TokenTransferStatus or None
+            The last known status of the token transfer (None if it is
+            not known yet).
+        poll_interval : float
+            The number of seconds between the last two polls.
+        sequence_number : int
+            The sequence number of the token transfer's current entry
+            in the poll schedule.
+
+        """
+        source_blockchain: Blockchain
+        service_node_task_info: ServiceNodeTaskInfo
+        status: typing.Optional[TokenTransferStatus]
+        poll_interval: float
+        sequence_number: int = 0
+
+    def __init__(self, blocks_to_search: typing.Optional[int] = None):
+        """Construct a watcher instance without any watched token
+        transfers. The watcher belongs to the client context that is
+        active during its construction (if any), and it always uses
+        that client context's configuration and resources.
+
+        Parameters
+        ----------
+        blocks_to_search : int or None
+            The number of blocks to search for the destination
+            transfers. If None, the search is performed until the
+            genesis block (default: None).
+
+        """
+        self.__blocks_to_search = blocks_to_search
+        self.__client_context = get_client_context()
+        self.__lock = threading.Lock()
+        self.__watched_transfers: typing.Dict[
+            _WatchedTransferKey, TransferWatcher.__WatchedTransfer] = {}
+        # Heap of (poll time, sequence number, watched transfer key)
+        self.__poll_schedule: typing.List[typing.Tuple[
+            float, int, _WatchedTransferKey]] = []
+        self.__sequence_numbers = itertools.count(1)
+        self.__callbacks: typing.List[TokenTransferStatusCallback] = []
+
+    def __len__(self) -> int:
+        with self.__lock:
+            return len(self.__watched_transfers)
+
+    def add_callback(self, callback: TokenTransferStatusCallback) -> None:
+        """Add a callback that is notified of each change of a watched
+        token transfer's status.
+
+        Parameters
+        ----------
+        callback : TokenTransferStatusCallback
+            The callback to add.
+
+        """
+        with self.__lock:
+            self.__callbacks.append(callback)
+
+    def watch(self, source_blockchain: Blockchain,
+              service_node_task_info: ServiceNodeTaskInfo,
+              execution_time: typing.Optional[int] = None) -> None:
+        """Start watching a token transfer. Watching an already watched
+        token transfer has no effect.
+
+        Parameters
+        ----------
+        source_blockchain : Blockchain
+            The token transfer's source blockchain.
+        service_node_task_info : ServiceNodeTaskInfo
+            Service node-related information of the token transfer.
+        execution_time : int or None
+            The execution time in seconds of the chosen service node
+            bid. The token transfer is first polled after the
+            execution time or, if None, after the source blockchain's
+            average block time (default: None).
+
+        """
+        if execution_time is None:
+            with activate_client_context(self.__client_context):
+                poll_interval = float(
+                    get_blockchain_config(source_blockchain)
+                    ['average_block_time'])
+        else:
+            poll_interval = float(execution_time)
+        key = self.__create_key(source_blockchain, service_node_task_info)
+        with self.__lock:
+            if key in self.__watched_transfers:
+                return
+            watched_transfer = self.__WatchedTransfer(source_blockchain,
+                                                      service_node_task_info,
+                                                      None, poll_interval)
+            self.__watched_transfers[key] = watched_transfer
+            self.__schedule_poll(key, watched_transfer, time.time())
+
+    def unwatch(self, source_blockchain: Blockchain,
+                service_node_task_info: ServiceNodeTaskInfo) -> None:
+        """Stop watching a token transfer.
+
+        Parameters
+        ----------
+        source_blockchain : Blockchain
+            The token transfer's source blockchain.
+        service_node_task_info : ServiceNodeTaskInfo
+            Service node-related information of the token transfer.
+
+        """
+        key = self.__create_key(source_blockchain, service_node_task_info)
+        with self.__lock:
+            # The token transfer's entry in the poll schedule is
+            # discarded when it is due
+            self.__watched_transfers.pop(key, None)
+
+    def get_next_poll_time(self) -> typing.Optional[float]:
+        """Get the time of the next due poll.
+
+        Returns
+        -------
+        float or None
+            The time (in seconds since the epoch) when the next watched
+            token transfer is due to be polled, or None if no token
+            transfers are watched.
+
+        """
+        with self.__lock:
+            self.__discard_stale_polls()
+            if len(self.__poll_schedule) == 0:
+                return None
+            return self.__poll_schedule[0][0]
+
+    def poll(self) -> typing.List[TokenTransferStatusChange]:
+        """Poll the statuses of all watched token transfers that are
+        due and notify the callbacks of all status changes. The due
+        token transfers are polled together, so that each destination
+        blockchain is searched only once.
+
+        Returns
+        -------
+        list of TokenTransferStatusChange
+            The changes of the polled token transfers' statuses.
+
+        """
+        with activate_client_context(self.__client_context):
+            return self.__poll()
+
+    def run(self, stop_event: typing.Optional[threading.Event] = None) -> None:
+        """Poll the watched token transfers whenever they are due until
+        no token transfers are watched anymore.
+
+        Parameters
+        ----------
+        stop_event : threading.Event or None
+            An event that stops the watcher early when it is set
+            (default: None).
+
+        """
+        if stop_event is None:
+            stop_event = threading.Event()
+        while not stop_event.is_set():
+            next_poll_time = self.get_next_poll_time()
+            if next_poll_time is None:
+                return
+            if stop_event.wait(max(next_poll_time - time.time(), 0)):
+                return
+            self.poll()
+
+    async def changes(self) -> typing.AsyncIterator[TokenTransferStatusChange]:
+        """Asynchronously iterate over the status changes of the
+        watched token transfers until no token transfers are watched
+        anymore. The polls are executed in a separate thread so that
+        the event loop is not blocked.
+
+        Yields
+        ------
+        TokenTransferStatusChange
+            The next change of a watched token transfer's status.
+
+        """
+        while True:
+            next_poll_time = self.get_next_poll_time()
+            if next_poll_time is None:
+                return
+            await asyncio.sleep(max(next_poll_time - time.time(), 0))
+            for change in await asyncio.to_thread(self.poll):
+                yield change
+
+    def __poll(self) -> typing.List[TokenTransferStatusChange]:
+        due_keys = []
+        with self.__lock:
+            now = time.time()
+            self.__discard_stale_polls()
+            while (len(self.__poll_schedule) > 0
+                   and self.__poll_schedule[0][0] <= now):
+                due_keys.append(heapq.heappop(self.__poll_schedule)[2])
+                self.__discard_stale_polls()
+            due_transfers = [self.__watched_transfers[key] for key in due_keys]
+        if len(due_transfers) == 0:
+            return []
+        requests = [
+            TransferInteractor.TokenTransferStatusRequest(
+                watched_transfer.source_blockchain,
+                watched_transfer.service_node_task_info.service_node_address,
+                watched_transfer.service_node_task_info.task_id,
+                self.__blocks_to_search) for watched_transfer in due_transfers
+        ]
+        try:
+            statuses = TransferInteractor().get_token_transfer_statuses(
+                requests)
+        except Exception:
+            # The due token transfers have already been removed from the
+            # poll schedule and must not be lost
+            with self.__lock:
+                now = time.time()
+                for key, watched_transfer in zip(due_keys, due_transfers):
+                    if self.__watched_transfers.get(key) is watched_transfer:
+                        self.__back_off(watched_transfer, 0)
+                        self.__schedule_poll(key, watched_transfer, now)
+            raise
+        changes = []
+        with self.__lock:
+            now = time.time()
+            for key, watched_transfer, status in zip(due_keys, due_transfers,
+                                                     statuses):
+                if self.__watched_transfers.get(key) is not watched_transfer:
+                    # Unwatched while being polled
+                    continue
+                if isinstance(status, TransferInteractorError):
+                    self.__back_off(watched_transfer, 0)
+                    self.__schedule_poll(key, watched_transfer, now)
+                    continue
+                status_changed = self.__has_status_changed(
+                    watched_transfer.status, status)
+                if status_changed:
+                    changes.append(
+                        TokenTransferStatusChange(
+                            watched_transfer.source_blockchain,
+                            watched_transfer.service_node_task_info,
+                            watched_transfer.status, status))
+                watched_transfer.status = status
+                if self.__is_final_status(status):
+                    del self.__watched_transfers[key]
+                    continue
+                expected_interval = self.__compute_expected_interval(
+                    watched_transfer.source_blockchain, status)
+                if status_changed:
+                    watched_transfer.poll_interval = expected_interval
+                else:
+                    self.__back_off(watched_transfer, expected_interval)
+                self.__schedule_poll(key, watched_transfer, now)
+            callbacks = list(self.__callbacks)
+        for change in changes:
+            for callback in callbacks:
+                callback(change)
+        return changes
+
+    def __create_key(
+            self, source_blockchain: Blockchain,
+            service_node_task_info: ServiceNodeTaskInfo) \
+            -> _WatchedTransferKey:
+        return (source_blockchain, service_node_task_info.service_node_address,
+                service_node_task_info.task_id)
+
+    def __schedule_poll(self, key: _WatchedTransferKey,
+                        watched_transfer: __WatchedTransfer,
+                        now: float) -> None:
+        watched_transfer.sequence_number = next(self.__sequence_numbers)
+        heapq.heappush(self.__poll_schedule,
+                       (now + watched_transfer.poll_interval,
+                        watched_transfer.sequence_number, key))
+
+    def __discard_stale_polls(self) -> None:
+        # Polls of unwatched or rescheduled token transfers are stale
+        while len(self.__poll_schedule) > 0:
+            _, sequence_number, key = self.__poll_schedule[0]
+            watched_transfer = self.__watched_transfers.get(key)
+            if (watched_transfer is not None
+                    and watched_transfer.sequence_number == sequence_number):
+                return
+            heapq.heappop(self.__poll_schedule)
+
+    def __back_off(self, watched_transfer: __WatchedTransfer,
+                   expected_interval: float) -> None:
+        watched_transfer.poll_interval = max(
+            expected_interval,
+            min(2 * watched_transfer.poll_interval, _MAXIMUM_POLL_INTERVAL))
+
+    def __compute_expected_interval(self, source_blockchain: Blockchain,
+                                    status: TokenTransferStatus) -> float:
+        # Expected number of seconds until the status changes next
+        if status.source_transfer_status is not \
+                ServiceNodeTransferStatus.CONFIRMED:
+            blockchain = source_blockchain
+            blocks = (get_blockchain_config(blockchain)['confirmations']
+                      if status.source_transfer_status
+                      is ServiceNodeTransferStatus.SUBMITTED else 1)
+        else:
+            blockchain = status.destination_blockchain
+            blocks = (get_blockchain_config(blockchain)['confirmations']
+                      if status.destination_transfer_status
+                      is DestinationTransferStatus.SUBMITTED else 1)
+        return float(
+            max(blocks, 1) *
+            get_blockchain_config(blockchain)['average_block_time'])
+
+    def __has_status_changed(
+            self, previous_status: typing.Optional[TokenTransferStatus],
+            status: TokenTransferStatus) -> bool:
+        return (previous_status is None
+                or previous_status.source_transfer_status
+                is not status.source_transfer_status
+                or previous_status.destination_transfer_status
+                is not status.destination_transfer_status)
+
+    def __is_final_status(self, status: TokenTransferStatus) -> bool:
+        return (status.source_transfer_status
+                in _FAILED_SOURCE_TRANSFER_STATUSES
+                or status.destination_transfer_status
+                is DestinationTransferStatus.CONFIRMED)
@@ -8,11 +8,35 @@ import typing
 from pantos.common.blockchains.base import Blockchain
 from pantos.common.configuration import Config
 
+from pantos.client.library.context import get_client_context
+
 _DEFAULT_FILE_NAME: typing.Final[str] = 'client-library.yml'
 """Default configuration file name."""
 
-config = Config(_DEFAULT_FILE_NAME)
-"""Singleton object holding the configuration values."""
+
+class _ContextualConfig(Config):
+    """Process-wide configuration that is replaced by the configuration
+    of the active client context, if any.
+
+    """
+    def __getitem__(self, key: str) -> typing.Any:
+        # Docstring inherited
+        client_context = get_client_context()
+        if client_context is not None:
+            return client_context.config[key]
+        return super().__getitem__(key)
+
+    def is_loaded(self) -> bool:
+        # Docstring inherited
+        client_context = get_client_context()
+        if client_context is not None:
+            return client_context.config.is_loaded()
+        return super().is_loaded()
+
+
+config: Config = _ContextualConfig(_DEFAULT_FILE_NAME)
+"""Singleton object holding the configuration values (of the active
+client context, if any)."""
 
 _VALIDATION_SCHEMA_BLOCKCHAIN = {
     'type': 'dict',
@@ -41,6 +65,11 @@ _VALIDATION_SCHEMA_BLOCKCHAIN = {
             'required': True,
             'min': 1
         },
+        'parallel_log_queries': {
+            'type': 'integer',
+            'min': 1,
+            'default': 1
+        },
         'chain_id': {
             'type': 'integer',
             'required': True
@@ -57,6 +86,33 @@ _VALIDATION_SCHEMA_BLOCKCHAIN = {
             'type': 'string',
             'required': True
         },
+        'multicall': {
+            'type': 'string',
+            'default': '0xcA11bde05977b3631167028862bE2a173976CA11'
+        },
+        'calls_per_multicall': {
+            'type': 'integer',
+            'min': 1,
+            'default': 500
+        },
+        'sender_nonce_pool_size': {
+            'type': 'integer',
+            'min': 0,
+            'default': 16
+        },
+        'destination_transfer_index': {
+            'type': 'string',
+            'required': False
+        },
+        'service_node_cache_ttl': {
+            'type': 'number',
+            'min': 0,
+            'default': 60
+        },
+        'service_node_cache_block_invalidation': {
+            'type': 'boolean',
+            'default': False
+        },
         'tokens': {
             'type': 'dict',
             'required': True,
@@ -104,6 +160,57 @@ _VALIDATION_SCHEMA = {
             'timeout': {
                 'type': 'float',
                 'required': True
+            },
+            'bid_cache': {
+                'type': 'boolean',
+                'default': True
+            },
+            'bid_cache_refresh_ahead': {
+                'type': 'number',
+                'min': 0,
+                'default': 30
+            }
+        }
+    },
+    'http': {
+        'type': 'dict',
+        'default': {},
+        'schema': {
+            'pool_connections': {
+                'type': 'integer',
+                'min': 1,
+                'default': 10
+            },
+            'pool_maxsize': {
+                'type': 'integer',
+                'min': 1,
+                'default': 10
+            },
+            'pool_block': {
+                'type': 'boolean',
+                'default': False
+            }
+        }
+    },
+    'executor': {
+        'type': 'dict',
+        'default': {},
+        'schema': {
+            'max_workers': {
+                'type': 'integer',
+                'min': 1,
+                'default': 32
+            }
+        }
+    },
+    'signing': {
+        'type': 'dict',
+        'default': {},
+        'schema': {
+            'processes': {
+                'type': 'integer',
+                'min': 0,
+                'default': 0
             }
         }
     },
@@ -161,3 +268,30 @@ def load_config(file_path: typing.Optional[str] = None,
     """
     if reload or not config.is_loaded():
         config.load(_VALIDATION_SCHEMA, file_path)
+
+
+def create_config(file_path: typing.Optional[str] = None) -> Config:
+    """Create a configuration object independent of the process-wide
+    one and load it from a configuration file.
+
+    Parameters
+    ----------
+    file_path : str or None
+        The path to the configuration file (typical configuration file
+        locations are searched if none is specified).
+
+    Returns
+    -------
+    Config
+        The loaded configuration.
+
+    Raises
+    ------
+    pantos.common.configuration.ConfigError
+        If the configuration cannot be loaded (e.g. due to an invalid
+        configuration file).
+
+    """
+    client_config = Config(_DEFAULT_FILE_NAME)
+    client_config.load(_VALIDATION_SCHEMA, file_path)
+    return client_config
@@ -0,0 +1,242 @@
+"""Module for the contexts of Pantos client instances. While a client
+context is active, the client library's process-wide state (the
+configuration, the blockchain clients, the HTTP session, the shared
+executor, the transfer signing engine and the caches) is replaced by
+the state owned by the context. Outside of any client context, the
+process-wide state is used.
+
+"""
+import contextlib
+import contextvars
+import functools
+import threading
+import typing
+
+from pantos.common.configuration import Config
+
+_T = typing.TypeVar('_T')
+
+_NO_CLIENT_CONTEXT: typing.ContextManager[None] = contextlib.nullcontext()
+"""Context manager used if no client context is to be activated."""
+
+_current_client_context: contextvars.ContextVar[
+    typing.Optional['ClientContext']] = contextvars.ContextVar(
+        'current_client_context', default=None)
+"""Client context active in the current context."""
+
+
+class ClientContext:
+    """Thread-safe container for the configuration and the resources
+    owned by a Pantos client instance. The resources are created on
+    first use within the context.
+
+    """
+    def __init__(self, config: Config):
+        """Construct a client context instance without any resources.
+
+        Parameters
+        ----------
+        config : Config
+            The loaded configuration of the client instance.
+
+        """
+        self.__config = config
+        self.__resources: typing.Dict[str, typing.Any] = {}
+        self.__resource_closers: typing.List[typing.Callable[[], None]] = []
+        # Reentrant since creating a resource may require another one
+        self.__lock = threading.RLock()
+
+    @property
+    def config(self) -> Config:
+        """The configuration of the client instance.
+
+        """
+        return self.__config
+
+    def activate(self) -> typing.ContextManager[None]:
+        """Activate the client context in the current context (and in
+        the tasks submitted to its shared executor).
+
+        Returns
+        -------
+        contextlib.AbstractContextManager
+            The context manager that activates the client context.
+
+        """
+        return _ActiveClientContext(self)
+
+    def get_resource(
+            self, name: str, create: typing.Callable[[], _T],
+            close: typing.Optional[typing.Callable[[_T], None]] = None) -> _T:
+        """Get a resource of the client context. The resource is
+        created if it does not exist yet.
+
+        Parameters
+        ----------
+        name : str
+            The unique name of the resource.
+        create : callable
+            The function that creates the resource. It is called
+            while the client context is active.
+        close : callable, optional
+            The function that releases the resource when the client
+            context is closed.
+
+        Returns
+        -------
+        Any
+            The resource.
+
+        """
+        resource = self.__resources.get(name)
+        if resource is not None:
+            return resource
+        with self.__lock:
+            resource = self.__resources.get(name)
+            if resource is None:
+                with self.activate():
+                    resource = create()
+                if close is not None:
+                    self.__resource_closers.append(
+                        functools.partial(close, resource))
+                self.__resources[name] = resource
+            return resource
+
+    def close(self) -> None:
+        """Release all resources of the client context (in the reverse
+        order of their creation). New resources are created the next
+        time they are requested.
+
+        """
+        with self.__lock:
+            resource_closers = self.__resource_closers
+            self.__resources = {}
+            self.__resource_closers = []
+        for resource_closer in reversed(resource_closers):
+            resource_closer()
+
+
+def get_client_context() -> typing.Optional[ClientContext]:
+    """Get the client context active in the current context.
+
+    Returns
+    -------
+    ClientContext or None
+        The active client context, or None if the process-wide state is
+        to be used.
+
+    """
+    return _current_client_context.get()
+
+
+def activate_client_context(
+        client_context: typing.Optional[ClientContext]) \
+        -> typing.ContextManager[None]:
+    """Activate a client context, if any.
+
+    Parameters
+    ----------
+    client_context : ClientContext or None
+        The client context to activate. If None, the current context is
+        left unchanged.
+
+    Returns
+    -------
+    contextlib.AbstractContextManager
+        The context manager that activates the client context.
+
+    """
+    if client_context is None:
+        return _NO_CLIENT_CONTEXT
+    return client_context.activate()
+
+
+def bind_client_context(
+        function: typing.Callable[..., _T]) -> typing.Callable[..., _T]:
+    """Bind a function to the currently active client context, so that
+    it is executed in that client context when it is called later or in
+    another thread.
+
+    Parameters
+    ----------
+    function : callable
+        The function to bind.
+
+    Returns
+    -------
+    callable
+        The function bound to the active client context.
+
+    """
+    client_context = get_client_context()
+    if client_context is None:
+        return function
+
+    def bound_function(*args: typing.Any, **kwargs: typing.Any) -> _T:
+        with client_context.activate():
+            return function(*args, **kwargs)
+
+    return bound_function
+
+
+def bind_client_context_iterator(
+        iterator: typing.Iterator[_T]) -> typing.Iterator[_T]:
+    """Bind an iterator to the currently active client context, so that
+    each of its items is produced in that client context even if the
+    iterator is consumed after the client context has been left.
+
+    Parameters
+    ----------
+    iterator : iterator
+        The iterator to bind.
+
+    Returns
+    -------
+    iterator
+        The iterator bound to the active client context.
+
+    """
+    client_context = get_client_context()
+    if client_context is None:
+        return iterator
+    return _iterate_in_client_context(client_context, iterator)
+
+
+def _iterate_in_client_context(client_context: ClientContext,
+                               iterator: typing.Iterator[_T]) \
+        -> typing.Iterator[_T]:
+    try:
+        while True:
+            # The client context must not stay active while the item is
+            # processed by the consumer
+            with client_context.activate():
+                try:
+                    item = next(iterator)
+                except StopIteration:
+                    return
+            yield item
+    finally:
+        # Let the wrapped iterator release its resources if the consumer
+        # stops early
+        close = getattr(iterator, 'close', None)
+        if close is not None:
+            with client_context.activate():
+                close()
+
+
+class _ActiveClientContext:
+    """Context manager that makes a client context the active one.
+
+    """
+    def __init__(self, client_context: ClientContext):
+        self.__client_context = client_context
+        self.__token: typing.Optional[contextvars.Token] = None
+
+    def __enter__(self) -> None:
+        self.__token = _current_client_context.set(self.__client_context)
+
+    def __exit__(self, exception_type: typing.Any,
+                 exception: typing.Optional[BaseException],
+                 traceback: typing.Any) -> None:
+        assert self.__token is not None
+        _current_client_context.reset(self.__token)
@@ -6,8 +6,12 @@ import enum
 import uuid
 
 from pantos.common.blockchains.enums import Blockchain
+from pantos.common.entities import BlockchainAddressBidPair
 from pantos.common.entities import ServiceNodeTransferStatus
+from pantos.common.types import Amount
 from pantos.common.types import BlockchainAddress
+from pantos.common.types import PrivateKey
+from pantos.common.types import TokenId
 
 
 class DestinationTransferStatus(enum.IntEnum):
@@ -37,6 +41,46 @@ class ServiceNodeTaskInfo:
     service_node_address: BlockchainAddress
 
 
+@dataclasses.dataclass
+class TokenTransfer:
+    """Data of a token transfer to be executed as part of a batch of
+    token transfers.
+
+    Attributes
+    ----------
+    source_blockchain : Blockchain
+        The token transfer's source blockchain.
+    destination_blockchain : Blockchain
+        The token transfer's destination blockchain.
+    sender_private_key : PrivateKey
+        The unencrypted private key of the sender's account on the
+        source blockchain.
+    recipient_address : BlockchainAddress
+        The address of the recipient's account on the destination
+        blockchain.
+    source_token_id : BlockchainAddress or TokenSymbol
+        The address or symbol of the token to be transferred (on the
+        source blockchain).
+    token_amount : int or decimal.Decimal
+        The amount of tokens to be transferred (an integer value in
+        case of the token's smallest subunit, a decimal value in case
+        of the token's main unit).
+    service_node_bid : tuple of BlockchainAddress and ServiceNodeBid or None
+        A pair of the address of the chosen service node and the
+        service node's chosen bid. If none is specified, the registered
+        service node bid with the lowest fee is automatically chosen
+        (default: None).
+
+    """
+    source_blockchain: Blockchain
+    destination_blockchain: Blockchain
+    sender_private_key: PrivateKey
+    recipient_address: BlockchainAddress
+    source_token_id: TokenId
+    token_amount: Amount
+    service_node_bid: BlockchainAddressBidPair | None = None
+
+
 @dataclasses.dataclass
 class TokenTransferStatus:
     """Data for the status of a token transfer.
@@ -99,3 +143,26 @@ class TokenTransferStatus:
     validator_nonce: int | None = None
     signer_addresses: list[BlockchainAddress] | None = None
     signatures: list[str] | None = None
+
+
+@dataclasses.dataclass
+class TokenTransferStatusChange:
+    """Change of the status of a watched token transfer.
+
+    Attributes
+    ----------
+    source_blockchain : Blockchain
+        The token transfer's source blockchain.
+    service_node_task_info : ServiceNodeTaskInfo
+        Service node-related information of the token transfer.
+    previous_status : TokenTransferStatus or None
+        The previously known status of the token transfer (None if
+        the status has not been known before).
+    status : TokenTransferStatus
+        The new status of the token transfer.
+
+    """
+    source_blockchain: Blockchain
+    service_node_task_info: ServiceNodeTaskInfo
+    previous_status: TokenTransferStatus | None
+    status: TokenTransferStatus
@@ -0,0 +1,155 @@
+"""Module for the thread pool shared by all fan-out work of the Pantos
+client library (retrieving service node bids, querying event log
+windows in parallel, and reading or submitting batches of token
+transfers).
+
+"""
+import atexit
+import concurrent.futures
+import contextvars
+import threading
+import typing
+
+from pantos.client.library.configuration import config
+from pantos.client.library.context import get_client_context
+
+_executor: typing.Optional['SharedExecutor'] = None
+"""Process-wide shared executor."""
+
+_executor_lock = threading.Lock()
+"""Lock for creating and shutting down the process-wide shared
+executor."""
+
+
+class SharedExecutor(concurrent.futures.Executor):
+    """Thread-safe executor with a bounded number of long-lived worker
+    threads.
+
+    Fan-out work may be nested (e.g. the parallel event log queries of
+    a destination blockchain search that is itself one of multiple
+    parallel status reads). A task that is submitted by one of the
+    executor's own worker threads while all worker threads are busy is
+    therefore run directly in the submitting worker thread. Otherwise,
+    the submitting thread could wait for a task that never gets a
+    worker thread.
+
+    """
+    def __init__(self, max_workers: int):
+        """Construct an executor instance. The worker threads are only
+        started when tasks are submitted.
+
+        Parameters
+        ----------
+        max_workers : int
+            The maximum number of worker threads.
+
+        """
+        self.__max_workers = max_workers
+        self.__thread_pool_executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers, thread_name_prefix='pantos-client',
+            initializer=self.__mark_worker_thread)
+        self.__worker_thread = threading.local()
+        self.__number_pending_tasks = 0
+        self.__lock = threading.Lock()
+
+    @property
+    def max_workers(self) -> int:
+        """The maximum number of worker threads.
+
+        """
+        return self.__max_workers
+
+    def submit(self, fn: typing.Callable[..., typing.Any], /, *args:
+               typing.Any, **kwargs: typing.Any) -> concurrent.futures.Future:
+        # Docstring inherited
+        with self.__lock:
+            run_in_calling_thread = (
+                getattr(self.__worker_thread, 'active', False)
+                and self.__number_pending_tasks >= self.__max_workers)
+            if not run_in_calling_thread:
+                self.__number_pending_tasks += 1
+        if run_in_calling_thread:
+            return self.__run(fn, *args, **kwargs)
+        try:
+            # The task runs in a copy of the submitting thread's context
+            # (e.g. for attributing instrumented stages correctly)
+            future = self.__thread_pool_executor.submit(
+                contextvars.copy_context().run, fn, *args, **kwargs)
+        except Exception:
+            self.__finish_task()
+            raise
+        future.add_done_callback(lambda _: self.__finish_task())
+        return future
+
+    def shutdown(self, wait: bool = True, *,
+                 cancel_futures: bool = False) -> None:
+        # Docstring inherited
+        self.__thread_pool_executor.shutdown(wait=wait,
+                                             cancel_futures=cancel_futures)
+
+    def __mark_worker_thread(self) -> None:
+        self.__worker_thread.active = True
+
+    def __finish_task(self) -> None:
+        with self.__lock:
+            self.__number_pending_tasks -= 1
+
+    def __run(self, fn: typing.Callable[..., typing.Any], *args: typing.Any,
+              **kwargs: typing.Any) -> concurrent.futures.Future:
+        future: concurrent.futures.Future = concurrent.futures.Future()
+        future.set_running_or_notify_cancel()
+        try:
+            result = fn(*args, **kwargs)
+        except BaseException as error:
+            future.set_exception(error)
+        else:
+            future.set_result(result)
+        return future
+
+
+def get_executor() -> SharedExecutor:
+    """Get the shared executor of the active client context or, outside
+    of any client context, the process-wide shared executor. Its
+    maximum number of worker threads is determined by the
+    configuration. The process-wide executor is shut down when the
+    interpreter exits.
+
+    Returns
+    -------
+    SharedExecutor
+        The shared executor.
+
+    """
+    client_context = get_client_context()
+    if client_context is not None:
+        return client_context.get_resource('executor', _create_executor,
+                                           _shut_down_executor)
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = _create_executor()
+            atexit.register(shutdown_executor)
+        return _executor
+
+
+def shutdown_executor() -> None:
+    """Shut down the process-wide shared executor. Tasks that have not
+    started yet are cancelled, and running tasks are waited for. A new
+    executor is created the next time it is requested.
+
+    """
+    global _executor
+    with _executor_lock:
+        executor = _executor
+        _executor = None
+    if executor is not None:
+        atexit.unregister(shutdown_executor)
+        _shut_down_executor(executor)
+
+
+def _create_executor() -> SharedExecutor:
+    return SharedExecutor(config['executor']['max_workers'])
+
+
+def _shut_down_executor(executor: SharedExecutor) -> None:
+    executor.shutdown(cancel_futures=True)
@@ -0,0 +1,201 @@
+"""Module for instrumenting the stages of the Pantos client library's
+operations. Registered stage hooks are called with the timing and
+outcome of each operation and each of its stages. As long as no hook is
+registered, nothing is measured or recorded.
+
+The following operations and stages are instrumented (the stages of an
+operation are only recorded if they are executed):
+
+* transfer_tokens and transfer_tokens_many: token_addresses,
+  token_decimals, token_amount, service_node_bid, service_node_url,
+  sender_nonce, signature, service_node_submit
+* get_token_transfer_status and get_token_transfer_statuses:
+  service_node_url, service_node_status, transaction_timestamp,
+  destination_transfer, block_number, log_window
+* deploy_token: service_node_bid, payment, sender_nonce, signature,
+  token_creator_submit
+
+"""
+import contextlib
+import contextvars
+import dataclasses
+import threading
+import time
+import typing
+
+_NO_INSTRUMENTATION: typing.ContextManager[None] = contextlib.nullcontext()
+"""Context manager used if nothing is to be recorded."""
+
+
+@dataclasses.dataclass(frozen=True)
+class StageRecord:
+    """Timing and outcome of an instrumented operation or one of its
+    stages.
+
+    Attributes
+    ----------
+    operation : str
+        The name of the operation.
+    stage : str or None
+        The name of the stage, or None if the record covers the
+        operation as a whole.
+    duration : float
+        The duration of the operation or stage in seconds.
+    error : BaseException or None
+        The error raised by the operation or stage, or None if it
+        succeeded.
+
+    """
+    operation: str
+    stage: typing.Optional[str]
+    duration: float
+    error: typing.Optional[BaseException] = None
+
+    @property
+    def succeeded(self) -> bool:
+        """True if the operation or stage succeeded.
+
+        """
+        return self.error is None
+
+
+StageHook = typing.Callable[[StageRecord], None]
+"""Hook that is called with each stage record."""
+
+_stage_hooks: typing.Tuple[StageHook, ...] = ()
+"""Registered stage hooks (replaced as a whole on each change, so that
+it can be read without locking)."""
+
+_stage_hooks_lock = threading.Lock()
+"""Lock for changing the registered stage hooks."""
+
+_current_operation: contextvars.ContextVar[typing.Optional[str]] = \
+    contextvars.ContextVar('current_operation', default=None)
+"""Name of the instrumented operation currently executed in the
+context."""
+
+
+def add_stage_hook(hook: StageHook) -> None:
+    """Register a stage hook. The hook is called synchronously in the
+    thread that executed the operation or stage, so it should return
+    quickly. Errors raised by the hook are ignored.
+
+    Parameters
+    ----------
+    hook : callable
+        The hook to be called with each stage record.
+
+    """
+    global _stage_hooks
+    with _stage_hooks_lock:
+        _stage_hooks = _stage_hooks + (hook, )
+
+
+def remove_stage_hook(hook: StageHook) -> None:
+    """Unregister a stage hook. Nothing happens if the hook is not
+    registered.
+
+    Parameters
+    ----------
+    hook : callable
+        The hook not to be called anymore.
+
+    """
+    global _stage_hooks
+    with _stage_hooks_lock:
+        _stage_hooks = tuple(registered_hook
+                             for registered_hook in _stage_hooks
+                             if registered_hook != hook)
+
+
+def instrument_operation(operation: str) -> typing.ContextManager[None]:
+    """Instrument an operation. The stages instrumented while the
+    operation is executed (also in threads of the shared executor) are
+    recorded as stages of this operation.
+
+    Parameters
+    ----------
+    operation : str
+        The name of the operation.
+
+    Returns
+    -------
+    contextlib.AbstractContextManager
+        The context manager that measures the operation.
+
+    """
+    if len(_stage_hooks) == 0:
+        return _NO_INSTRUMENTATION
+    return _InstrumentedOperation(operation)
+
+
+def instrument_stage(stage: str) -> typing.ContextManager[None]:
+    """Instrument a stage of the currently executed operation. Nothing
+    is recorded if no operation is instrumented in the current context
+    (e.g. in background threads).
+
+    Parameters
+    ----------
+    stage : str
+        The name of the stage.
+
+    Returns
+    -------
+    contextlib.AbstractContextManager
+        The context manager that measures the stage.
+
+    """
+    if len(_stage_hooks) == 0:
+        return _NO_INSTRUMENTATION
+    operation = _current_operation.get()
+    if operation is None:
+        return _NO_INSTRUMENTATION
+    return _InstrumentedStage(operation, stage)
+
+
+class _InstrumentedStage:
+    """Context manager that measures a stage of an operation and passes
+    its record to the registered stage hooks.
+
+    """
+    def __init__(self, operation: str, stage: typing.Optional[str]):
+        self._operation = operation
+        self._stage = stage
+        self._start_time = 0.0
+
+    def __enter__(self) -> None:
+        self._start_time = time.perf_counter()
+
+    def __exit__(self, exception_type: typing.Any,
+                 exception: typing.Optional[BaseException],
+                 traceback: typing.Any) -> None:
+        stage_record = StageRecord(self._operation, self._stage,
+                                   time.perf_counter() - self._start_time,
+                                   exception)
+        for hook in _stage_hooks:
+            try:
+                hook(stage_record)
+            except Exception:
+                # A hook must never break the instrumented operation
+                pass
+
+
+class _InstrumentedOperation(_InstrumentedStage):
+    """Context manager that measures an operation as a whole and makes
+    it the current operation of its stages.
+
+    """
+    def __init__(self, operation: str):
+        super().__init__(operation, None)
+        self.__token: typing.Optional[contextvars.Token] = None
+
+    def __enter__(self) -> None:
+        self.__token = _current_operation.set(self._operation)
+        super().__enter__()
+
+    def __exit__(self, exception_type: typing.Any,
+                 exception: typing.Optional[BaseException],
+                 traceback: typing.Any) -> None:
+        assert self.__token is not None
+        _current_operation.reset(self.__token)
+        super().__exit__(exception_type, exception, traceback)
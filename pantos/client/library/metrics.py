@@ -0,0 +1,508 @@
+"""Module for the optional in-process metrics registry of the Pantos
+client library. Once metrics are enabled, the registry counts and times
+
+* the JSON-RPC requests to the blockchain nodes (per blockchain,
+  provider and JSON-RPC method),
+* the HTTP requests to the service nodes and the token creator (per
+  host and resource),
+* the instrumented operations and their stages (see the
+  instrumentation module),
+
+and it counts the hits and misses of the library's caches. The metrics
+are rendered in the Prometheus text exposition format, so that they can
+be scraped from an HTTP endpoint or pushed to a Prometheus Pushgateway.
+
+"""
+import bisect
+import contextlib
+import http.server
+import math
+import threading
+import time
+import typing
+import urllib.parse
+
+import requests
+
+from pantos.client.library.exceptions import ClientLibraryError
+from pantos.client.library.instrumentation import StageRecord
+from pantos.client.library.instrumentation import add_stage_hook
+from pantos.client.library.instrumentation import remove_stage_hook
+
+DEFAULT_LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5,
+                           5.0, 10.0, 30.0, 60.0)
+"""Default upper bounds (in seconds) of the latency histogram
+buckets."""
+
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+"""Content type of the Prometheus text exposition format."""
+
+_NO_MEASUREMENT: typing.ContextManager[None] = contextlib.nullcontext()
+"""Context manager used if metrics are not enabled."""
+
+_metrics_registry: typing.Optional['MetricsRegistry'] = None
+"""Process-wide metrics registry, or None if metrics are not
+enabled."""
+
+_metrics_registry_lock = threading.Lock()
+"""Lock for enabling and disabling the process-wide metrics
+registry."""
+
+
+class MetricsError(ClientLibraryError):
+    """Exception class for all metrics errors.
+
+    """
+    pass
+
+
+class MetricsRegistry:
+    """Thread-safe registry of the client library's counters and
+    latency histograms.
+
+    """
+    def __init__(
+            self,
+            latency_buckets: typing.Sequence[float] = DEFAULT_LATENCY_BUCKETS):
+        """Construct a registry instance with all metrics set to zero.
+
+        Parameters
+        ----------
+        latency_buckets : sequence of float, optional
+            The upper bounds (in seconds) of the latency histogram
+            buckets (default: DEFAULT_LATENCY_BUCKETS).
+
+        """
+        self.__rpc_requests = _Counter(
+            'pantos_client_rpc_requests_total',
+            'JSON-RPC requests to blockchain nodes.',
+            ('blockchain', 'provider', 'method', 'outcome'))
+        self.__rpc_request_duration = _Histogram(
+            'pantos_client_rpc_request_duration_seconds',
+            'Latency of JSON-RPC requests to blockchain nodes.',
+            ('blockchain', 'provider', 'method'), latency_buckets)
+        self.__http_requests = _Counter(
+            'pantos_client_http_requests_total',
+            'HTTP requests to service nodes and the token creator.',
+            ('host', 'resource', 'outcome'))
+        self.__http_request_duration = _Histogram(
+            'pantos_client_http_request_duration_seconds',
+            'Latency of HTTP requests to service nodes and the token '
+            'creator.', ('host', 'resource'), latency_buckets)
+        self.__operations = _Counter(
+            'pantos_client_operations_total',
+            'Executed operations (stage "" for the operation as a whole).',
+            ('operation', 'stage', 'outcome'))
+        self.__operation_duration = _Histogram(
+            'pantos_client_operation_duration_seconds',
+            'Latency of operations (stage "" for the operation as a '
+            'whole).', ('operation', 'stage'), latency_buckets)
+        self.__cache_accesses = _Counter('pantos_client_cache_accesses_total',
+                                         'Accesses to the client caches.',
+                                         ('cache', 'result'))
+
+    def observe_rpc_request(self, blockchain: str, provider: str, method: str,
+                            duration: float, succeeded: bool) -> None:
+        """Record a JSON-RPC request to a blockchain node.
+
+        Parameters
+        ----------
+        blockchain : str
+            The name of the blockchain.
+        provider : str
+            The host (and port) of the blockchain node.
+        method : str
+            The JSON-RPC method.
+        duration : float
+            The duration of the request in seconds.
+        succeeded : bool
+            True if the request succeeded.
+
+        """
+        self.__rpc_requests.increment(
+            (blockchain, provider, method, _to_outcome(succeeded)))
+        self.__rpc_request_duration.observe((blockchain, provider, method),
+                                            duration)
+
+    def observe_http_request(self, host: str, resource: str, duration: float,
+                             succeeded: bool) -> None:
+        """Record an HTTP request to a service node or the token
+        creator.
+
+        Parameters
+        ----------
+        host : str
+            The host (and port) of the service node or token creator.
+        resource : str
+            The requested resource.
+        duration : float
+            The duration of the request in seconds.
+        succeeded : bool
+            True if the request succeeded.
+
+        """
+        self.__http_requests.increment(
+            (host, resource, _to_outcome(succeeded)))
+        self.__http_request_duration.observe((host, resource), duration)
+
+    def observe_stage(self, stage_record: StageRecord) -> None:
+        """Record an instrumented operation or one of its stages. The
+        method can be registered as a stage hook.
+
+        Parameters
+        ----------
+        stage_record : StageRecord
+            The timing and outcome of the operation or stage.
+
+        """
+        stage = '' if stage_record.stage is None else stage_record.stage
+        self.__operations.increment((stage_record.operation, stage,
+                                     _to_outcome(stage_record.succeeded)))
+        self.__operation_duration.observe((stage_record.operation, stage),
+                                          stage_record.duration)
+
+    def observe_cache_access(self, cache: str, hit: bool) -> None:
+        """Record an access to a cache.
+
+        Parameters
+        ----------
+        cache : str
+            The name of the cache.
+        hit : bool
+            True if the requested entry was cached.
+
+        """
+        self.__cache_accesses.increment((cache, 'hit' if hit else 'miss'))
+
+    def render(self) -> str:
+        """Render all metrics in the Prometheus text exposition format.
+
+        Returns
+        -------
+        str
+            The rendered metrics.
+
+        """
+        lines = []
+        for metric in (self.__rpc_requests, self.__rpc_request_duration,
+                       self.__http_requests, self.__http_request_duration,
+                       self.__operations, self.__operation_duration,
+                       self.__cache_accesses):
+            lines.extend(metric.render())
+        return '\n'.join(lines) + '\n'
+
+
+def enable_metrics() -> MetricsRegistry:
+    """Enable the process-wide metrics registry. Nothing happens if
+    metrics are already enabled.
+
+    Returns
+    -------
+    MetricsRegistry
+        The process-wide metrics registry.
+
+    """
+    global _metrics_registry
+    with _metrics_registry_lock:
+        if _metrics_registry is None:
+            metrics_registry = MetricsRegistry()
+            add_stage_hook(metrics_registry.observe_stage)
+            _metrics_registry = metrics_registry
+        return _metrics_registry
+
+
+def disable_metrics() -> None:
+    """Disable the process-wide metrics registry. All metrics recorded
+    so far are discarded.
+
+    """
+    global _metrics_registry
+    with _metrics_registry_lock:
+        if _metrics_registry is not None:
+            remove_stage_hook(_metrics_registry.observe_stage)
+            _metrics_registry = None
+
+
+def get_metrics_registry() -> typing.Optional[MetricsRegistry]:
+    """Get the process-wide metrics registry.
+
+    Returns
+    -------
+    MetricsRegistry or None
+        The process-wide metrics registry, or None if metrics are not
+        enabled.
+
+    """
+    return _metrics_registry
+
+
+def measure_http_request(url: str,
+                         resource: str) -> typing.ContextManager[None]:
+    """Measure an HTTP request to a service node or the token creator.
+    The request is recorded as failed if an error is raised.
+
+    Parameters
+    ----------
+    url : str
+        The requested URL.
+    resource : str
+        The requested resource.
+
+    Returns
+    -------
+    contextlib.AbstractContextManager
+        The context manager that measures the request.
+
+    """
+    metrics_registry = _metrics_registry
+    if metrics_registry is None:
+        return _NO_MEASUREMENT
+    return _MeasuredHttpRequest(metrics_registry,
+                                urllib.parse.urlsplit(url).netloc, resource)
+
+
+def record_cache_access(cache: str, hit: bool) -> None:
+    """Record an access to a cache if metrics are enabled.
+
+    Parameters
+    ----------
+    cache : str
+        The name of the cache.
+    hit : bool
+        True if the requested entry was cached.
+
+    """
+    metrics_registry = _metrics_registry
+    if metrics_registry is not None:
+        metrics_registry.observe_cache_access(cache, hit)
+
+
+def start_metrics_server(port: int,
+                         address: str = '') -> http.server.ThreadingHTTPServer:
+    """Start an HTTP server in a background thread that serves the
+    metrics of the process-wide metrics registry for scraping.
+
+    Parameters
+    ----------
+    port : int
+        The port to listen on (0 for an arbitrary free port).
+    address : str, optional
+        The address to listen on (default: all addresses).
+
+    Returns
+    -------
+    http.server.ThreadingHTTPServer
+        The started server. It can be stopped by calling its shutdown
+        method.
+
+    Raises
+    ------
+    MetricsError
+        If metrics are not enabled or the server cannot be started.
+
+    """
+    if _metrics_registry is None:
+        raise MetricsError('metrics are not enabled')
+    try:
+        metrics_server = http.server.ThreadingHTTPServer(
+            (address, port), _MetricsRequestHandler)
+    except OSError:
+        raise MetricsError('unable to start the metrics server',
+                           address=address, port=port)
+    metrics_server.daemon_threads = True
+    threading.Thread(target=metrics_server.serve_forever,
+                     name='pantos-client-metrics', daemon=True).start()
+    return metrics_server
+
+
+def push_metrics(gateway_url: str, job: str,
+                 timeout: typing.Optional[float] = None) -> None:
+    """Push the metrics of the process-wide metrics registry to a
+    Prometheus Pushgateway, replacing all metrics previously pushed for
+    the job.
+
+    Parameters
+    ----------
+    gateway_url : str
+        The URL of the Pushgateway.
+    job : str
+        The job to push the metrics for.
+    timeout : float, optional
+        The timeout of the request in seconds.
+
+    Raises
+    ------
+    MetricsError
+        If metrics are not enabled or cannot be pushed.
+
+    """
+    metrics_registry = _metrics_registry
+    if metrics_registry is None:
+        raise MetricsError('metrics are not enabled')
+    push_url = (f'{gateway_url.rstrip("/")}/metrics/job/'
+                f'{urllib.parse.quote(job, safe="")}')
+    try:
+        response = requests.put(push_url,
+                                data=metrics_registry.render().encode('utf-8'),
+                                headers={'Content-Type': CONTENT_TYPE},
+                                timeout=timeout)
+        response.raise_for_status()
+    except requests.exceptions.RequestException:
+        raise MetricsError('unable to push the metrics', push_url=push_url)
+
+
+_LabelValues: typing.TypeAlias = typing.Tuple[str, ...]
+
+
+class _Counter:
+    """Thread-safe counter with labels.
+
+    """
+    def __init__(self, name: str, documentation: str,
+                 label_names: typing.Tuple[str, ...]):
+        self.__name = name
+        self.__documentation = documentation
+        self.__label_names = label_names
+        self.__values: typing.Dict[_LabelValues, float] = {}
+        self.__lock = threading.Lock()
+
+    def increment(self, label_values: _LabelValues,
+                  amount: float = 1.0) -> None:
+        with self.__lock:
+            self.__values[label_values] = \
+                self.__values.get(label_values, 0.0) + amount
+
+    def render(self) -> typing.List[str]:
+        with self.__lock:
+            values = sorted(self.__values.items())
+        lines = [
+            f'# HELP {self.__name} {self.__documentation}',
+            f'# TYPE {self.__name} counter'
+        ]
+        for label_values, value in values:
+            labels = _render_labels(self.__label_names, label_values)
+            lines.append(f'{self.__name}{labels} {_render_value(value)}')
+        return lines
+
+
+class _Histogram:
+    """Thread-safe histogram with labels.
+
+    """
+    def __init__(self, name: str, documentation: str,
+                 label_names: typing.Tuple[str, ...],
+                 buckets: typing.Sequence[float]):
+        self.__name = name
+        self.__documentation = documentation
+        self.__label_names = label_names
+        self.__buckets = sorted(buckets)
+        # Per label values: the number of observations in each bucket
+        # (not cumulative, with a last bucket for +Inf) and their sum
+        self.__values: typing.Dict[_LabelValues,
+                                   typing.Tuple[typing.List[int],
+                                                typing.List[float]]] = {}
+        self.__lock = threading.Lock()
+
+    def observe(self, label_values: _LabelValues, value: float) -> None:
+        bucket_index = bisect.bisect_left(self.__buckets, value)
+        with self.__lock:
+            values = self.__values.get(label_values)
+            if values is None:
+                values = ([0] * (len(self.__buckets) + 1), [0.0])
+                self.__values[label_values] = values
+            values[0][bucket_index] += 1
+            values[1][0] += value
+
+    def render(self) -> typing.List[str]:
+        with self.__lock:
+            values = sorted((label_values, (list(bucket_counts), sum_[0]))
+                            for label_values, (bucket_counts,
+                                               sum_) in self.__values.items())
+        lines = [
+            f'# HELP {self.__name} {self.__documentation}',
+            f'# TYPE {self.__name} histogram'
+        ]
+        for label_values, (bucket_counts, sum_) in values:
+            count = 0
+            for upper_bound, bucket_count in zip(self.__buckets + [math.inf],
+                                                 bucket_counts):
+                count += bucket_count
+                labels = _render_labels(
+                    self.__label_names + ('le', ),
+                    label_values + (_render_value(upper_bound), ))
+                lines.append(f'{self.__name}_bucket{labels} {count}')
+            labels = _render_labels(self.__label_names, label_values)
+            lines.append(f'{self.__name}_sum{labels} {_render_value(sum_)}')
+            lines.append(f'{self.__name}_count{labels} {count}')
+        return lines
+
+
+class _MeasuredHttpRequest:
+    """Context manager that measures an HTTP request and records it in
+    a metrics registry.
+
+    """
+    def __init__(self, metrics_registry: MetricsRegistry, host: str,
+                 resource: str):
+        self.__metrics_registry = metrics_registry
+        self.__host = host
+        self.__resource = resource
+        self.__start_time = 0.0
+
+    def __enter__(self) -> None:
+        self.__start_time = time.perf_counter()
+
+    def __exit__(self, exception_type: typing.Any,
+                 exception: typing.Optional[BaseException],
+                 traceback: typing.Any) -> None:
+        self.__metrics_registry.observe_http_request(
+            self.__host, self.__resource,
+            time.perf_counter() - self.__start_time, exception is None)
+
+
+class _MetricsRequestHandler(http.server.BaseHTTPRequestHandler):
+    """Request handler that serves the metrics of the process-wide
+    metrics registry.
+
+    """
+    def do_GET(self) -> None:
+        metrics_registry = _metrics_registry
+        if metrics_registry is None:
+            self.send_error(503, 'metrics are not enabled')
+            return
+        body = metrics_registry.render().encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', CONTENT_TYPE)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: typing.Any) -> None:
+        # Scrapes are not logged
+        pass
+
+
+def _to_outcome(succeeded: bool) -> str:
+    return 'success' if succeeded else 'error'
+
+
+def _render_labels(label_names: typing.Sequence[str],
+                   label_values: typing.Sequence[str]) -> str:
+    if len(label_names) == 0:
+        return ''
+    labels = ','.join(
+        f'{label_name}="{_escape_label_value(label_value)}"'
+        for label_name, label_value in zip(label_names, label_values))
+    return f'{{{labels}}}'
+
+
+def _escape_label_value(label_value: str) -> str:
+    return label_value.replace('\\',
+                               '\\\\').replace('"',
+                                               '\\"').replace('\n', '\\n')
+
+
+def _render_value(value: float) -> str:
+    if value == math.inf:
+        return '+Inf'
+    return repr(float(value))
@@ -0,0 +1,290 @@
+"""Module for communicating with Pantos service nodes over the shared
+HTTP session.
+
+"""
+import typing
+import uuid
+
+import requests
+from pantos.common.blockchains.base import Blockchain
+from pantos.common.entities import ServiceNodeBid
+from pantos.common.entities import ServiceNodeTransferStatus
+from pantos.common.servicenodes import \
+    ServiceNodeClient as _BaseServiceNodeClient
+from pantos.common.servicenodes import ServiceNodeClientError
+from pantos.common.types import BlockchainAddress
+
+from pantos.client.library.metrics import measure_http_request
+from pantos.client.library.sessions import get_http_session
+
+_TRANSFER_RESOURCE = 'transfer'
+
+_STATUS_RESOURCE = 'status'
+
+_BID_RESOURCE = 'bids'
+
+
+class ServiceNodeClient(_BaseServiceNodeClient):
+    """Client for communicating with Pantos service nodes. It offers the
+    same operations as pantos.common.servicenodes.ServiceNodeClient and
+    raises the same errors, but sends all requests over the process-wide
+    HTTP session, so that the connections to the service nodes are kept
+    alive and reused.
+
+    """
+    def submit_transfer(self,
+                        request: _BaseServiceNodeClient.SubmitTransferRequest,
+                        timeout: typing.Optional[float] = None) -> uuid.UUID:
+        # Docstring inherited
+        transfer_url = build_transfer_url(request.service_node_url)
+        service_node_response = None
+        try:
+            with measure_http_request(transfer_url, _TRANSFER_RESOURCE):
+                service_node_response = get_http_session().post(
+                    transfer_url, json=create_submit_transfer_payload(request),
+                    timeout=timeout)
+                # Raise an error in case of a 4xx or 5xx response status
+                # code
+                service_node_response.raise_for_status()
+            task_id = service_node_response.json()['task_id']
+            return uuid.UUID(task_id)
+        except (requests.exceptions.RequestException, ValueError, KeyError):
+            raise ServiceNodeClientError(
+                'unable to submit a new token transfer request',
+                request=request, transfer_url=transfer_url,
+                response_message=self.__read_response_message(
+                    service_node_response))
+
+    def bids(
+            self, service_node_url: str, source_blockchain: Blockchain,
+            destination_blockchain: Blockchain,
+            timeout: typing.Optional[float] = None) \
+            -> typing.List[ServiceNodeBid]:
+        # Docstring inherited
+        bids_url = build_bids_url(service_node_url, source_blockchain,
+                                  destination_blockchain)
+        service_node_response = None
+        try:
+            with measure_http_request(bids_url, _BID_RESOURCE):
+                service_node_response = get_http_session().get(
+                    bids_url, timeout=timeout)
+                service_node_response.raise_for_status()
+            return create_service_node_bids(source_blockchain,
+                                            destination_blockchain,
+                                            service_node_response.json())
+        except (requests.exceptions.RequestException, ValueError, KeyError):
+            raise ServiceNodeClientError(
+                'unable to get the bids of the service node',
+                service_node_url=service_node_url,
+                source_blockchain=source_blockchain,
+                destination_blockchain=destination_blockchain,
+                response_message=self.__read_response_message(
+                    service_node_response))
+
+    def status(self, service_node_url: str, task_id: uuid.UUID,
+               timeout: typing.Optional[float] = None) \
+            -> _BaseServiceNodeClient.TransferStatusResponse:
+        # Docstring inherited
+        status_url = build_status_url(service_node_url, task_id)
+        service_node_response = None
+        try:
+            with measure_http_request(status_url, _STATUS_RESOURCE):
+                service_node_response = get_http_session().get(
+                    status_url, timeout=timeout)
+                service_node_response.raise_for_status()
+            return create_transfer_status_response(
+                service_node_response.json())
+        except (requests.exceptions.RequestException, ValueError, KeyError):
+            raise ServiceNodeClientError(
+                'unable to get the status of the transfer',
+                service_node_url=service_node_url, task_id=task_id,
+                response_message=self.__read_response_message(
+                    service_node_response))
+
+    def __read_response_message(
+            self, response: typing.Optional[requests.Response]) \
+            -> typing.Optional[str]:
+        # No response is available if the request itself failed
+        if (response is None or 'application/json' not in response.headers.get(
+                'content-type', '')):
+            return None
+        try:
+            return response.json().get('message')
+        except (ValueError, AttributeError):
+            return None
+
+
+def create_submit_transfer_payload(
+        request: _BaseServiceNodeClient.SubmitTransferRequest) \
+        -> typing.Dict[str, typing.Any]:
+    """Create the JSON payload of a service node request for submitting
+    a new token transfer.
+
+    Parameters
+    ----------
+    request : ServiceNodeClient.SubmitTransferRequest
+        The request data for a new token transfer.
+
+    Returns
+    -------
+    dict
+        The JSON payload of the service node request.
+
+    """
+    return {
+        'source_blockchain_id': request.source_blockchain.value,
+        'destination_blockchain_id': request.destination_blockchain.value,
+        'sender_address': request.sender_address,
+        'recipient_address': request.recipient_address,
+        'source_token_address': request.source_token_address,
+        'destination_token_address': request.destination_token_address,
+        'amount': request.token_amount,
+        'bid': {
+            'fee': request.service_node_bid.fee,
+            'execution_time': request.service_node_bid.execution_time,
+            'valid_until': request.service_node_bid.valid_until,
+            'signature': request.service_node_bid.signature
+        },
+        'nonce': request.sender_nonce,
+        'valid_until': request.valid_until,
+        'signature': request.signature
+    }
+
+
+def build_transfer_url(service_node_url: str) -> str:
+    """Build the URL for submitting new token transfers to a service
+    node.
+
+    Parameters
+    ----------
+    service_node_url : str
+        The URL of the service node.
+
+    Returns
+    -------
+    str
+        The transfer URL.
+
+    """
+    transfer_url = service_node_url
+    if not service_node_url.endswith('/'):
+        transfer_url += '/'
+    transfer_url += _TRANSFER_RESOURCE
+    return transfer_url
+
+
+def build_bids_url(service_node_url: str, source_blockchain: Blockchain,
+                   destination_blockchain: Blockchain) -> str:
+    """Build the URL for retrieving the bids of a service node.
+
+    Parameters
+    ----------
+    service_node_url : str
+        The URL of the service node.
+    source_blockchain : Blockchain
+        The source blockchain of the bids.
+    destination_blockchain : Blockchain
+        The destination blockchain of the bids.
+
+    Returns
+    -------
+    str
+        The bids URL.
+
+    """
+    bids_url = service_node_url
+    if not service_node_url.endswith('/'):
+        bids_url += '/'
+    return (f'{bids_url}{_BID_RESOURCE}?'
+            f'source_blockchain={source_blockchain.value}&'
+            f'destination_blockchain={destination_blockchain.value}')
+
+
+def build_status_url(service_node_url: str, task_id: uuid.UUID) -> str:
+    """Build the URL for retrieving the status of a token transfer from
+    a service node.
+
+    Parameters
+    ----------
+    service_node_url : str
+        The URL of the service node.
+    task_id : uuid.UUID
+        The service node task ID of the token transfer.
+
+    Returns
+    -------
+    str
+        The status URL.
+
+    """
+    transfer_url = build_transfer_url(service_node_url)
+    return f'{transfer_url}/{str(task_id)}/{_STATUS_RESOURCE}'
+
+
+def create_service_node_bids(
+        source_blockchain: Blockchain, destination_blockchain: Blockchain,
+        json_response: typing.Any) -> typing.List[ServiceNodeBid]:
+    """Create the service node bids from a service node's JSON response.
+
+    Parameters
+    ----------
+    source_blockchain : Blockchain
+        The source blockchain of the bids.
+    destination_blockchain : Blockchain
+        The destination blockchain of the bids.
+    json_response : Any
+        The service node's decoded JSON response.
+
+    Returns
+    -------
+    list of ServiceNodeBid
+        The bids offered by the service node.
+
+    Raises
+    ------
+    KeyError
+        If a bid is incomplete.
+
+    """
+    return [
+        ServiceNodeBid(source_blockchain, destination_blockchain, bid['fee'],
+                       bid['execution_time'], bid['valid_until'],
+                       bid['signature']) for bid in json_response
+    ]
+
+
+def create_transfer_status_response(
+        json_response: typing.Any) \
+        -> _BaseServiceNodeClient.TransferStatusResponse:
+    """Create the transfer status response from a service node's JSON
+    response.
+
+    Parameters
+    ----------
+    json_response : Any
+        The service node's decoded JSON response.
+
+    Returns
+    -------
+    ServiceNodeClient.TransferStatusResponse
+        The transfer status response.
+
+    Raises
+    ------
+    KeyError
+        If the JSON response is incomplete.
+    ValueError
+        If the JSON response contains an invalid value.
+
+    """
+    return _BaseServiceNodeClient.TransferStatusResponse(
+        uuid.UUID(json_response['task_id']),
+        Blockchain(json_response['source_blockchain_id']),
+        Blockchain(json_response['destination_blockchain_id']),
+        BlockchainAddress(json_response['sender_address']),
+        BlockchainAddress(json_response['recipient_address']),
+        BlockchainAddress(json_response['source_token_address']),
+        BlockchainAddress(json_response['destination_token_address']),
+        json_response['amount'], json_response['fee'],
+        ServiceNodeTransferStatus.from_name(json_response['status']),
+        json_response['transfer_id'], json_response['transaction_id'])
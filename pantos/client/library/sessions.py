@@ -0,0 +1,69 @@
+"""Module for the HTTP session shared by all requests to Pantos service
+nodes and the Pantos token creator.
+
+"""
+import threading
+import typing
+
+import requests
+import requests.adapters
+
+from pantos.client.library.configuration import config
+from pantos.client.library.context import get_client_context
+
+_http_session: typing.Optional[requests.Session] = None
+"""Process-wide HTTP session."""
+
+_http_session_lock = threading.Lock()
+"""Lock for creating and closing the process-wide HTTP session."""
+
+
+def get_http_session() -> requests.Session:
+    """Get the HTTP session of the active client context or, outside
+    of any client context, the process-wide HTTP session. Its
+    connections are kept alive and pooled per host, so that subsequent
+    requests to the same host do not need to establish a new TCP
+    connection (and TLS session). The pool sizes are determined by the
+    configuration.
+
+    Returns
+    -------
+    requests.Session
+        The HTTP session.
+
+    """
+    client_context = get_client_context()
+    if client_context is not None:
+        return client_context.get_resource('http_session',
+                                           _create_http_session,
+                                           requests.Session.close)
+    global _http_session
+    with _http_session_lock:
+        if _http_session is None:
+            _http_session = _create_http_session()
+        return _http_session
+
+
+def close_http_session() -> None:
+    """Close the process-wide HTTP session and all its pooled
+    connections. A new HTTP session is created on the next request.
+
+    """
+    global _http_session
+    with _http_session_lock:
+        http_session = _http_session
+        _http_session = None
+    if http_session is not None:
+        http_session.close()
+
+
+def _create_http_session() -> requests.Session:
+    http_config = config['http']
+    http_adapter = requests.adapters.HTTPAdapter(
+        pool_connections=http_config['pool_connections'],
+        pool_maxsize=http_config['pool_maxsize'],
+        pool_block=http_config['pool_block'])
+    http_session = requests.Session()
+    http_session.mount('http://', http_adapter)
+    http_session.mount('https://', http_adapter)
+    return http_session
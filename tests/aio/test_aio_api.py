@@ -0,0 +1,89 @@
+import asyncio
+import unittest.mock
+
+from pantos.common.blockchains.base import Blockchain
+
+from pantos.client.library.aio.api import find_acceptable_service_node_bid
+from pantos.client.library.aio.api import get_token_transfer_status
+from pantos.client.library.aio.api import retrieve_service_node_bids
+from pantos.client.library.aio.api import stream_service_node_bids
+from pantos.client.library.aio.business import AsyncBidInteractor
+from pantos.client.library.aio.business import AsyncTransferInteractor
+from pantos.client.library.business.bids import BidInteractor
+from pantos.client.library.business.transfers import TransferInteractor
+
+
+@unittest.mock.patch.object(AsyncBidInteractor, 'retrieve_service_node_bids')
+@unittest.mock.patch('pantos.client.library.aio.api._initialize_library')
+def test_retrieve_service_node_bids_correct(mocked_initialize_library,
+                                            mocked_retrieve_service_node_bids,
+                                            service_node_1, bids_1):
+    mocked_retrieve_service_node_bids.return_value = {service_node_1: bids_1}
+
+    service_node_bids = asyncio.run(
+        retrieve_service_node_bids(Blockchain.ETHEREUM, Blockchain.POLYGON))
+
+    assert service_node_bids == {service_node_1: bids_1}
+    mocked_initialize_library.assert_called_once_with(False)
+    mocked_retrieve_service_node_bids.assert_awaited_once_with(
+        Blockchain.ETHEREUM, Blockchain.POLYGON, True)
+
+
+@unittest.mock.patch.object(AsyncTransferInteractor,
+                            'get_token_transfer_status')
+@unittest.mock.patch('pantos.client.library.aio.api._initialize_library')
+def test_get_token_transfer_status_correct(mocked_initialize_library,
+                                           mocked_get_token_transfer_status,
+                                           service_node_1, task_uuid):
+    asyncio.run(
+        get_token_transfer_status(Blockchain.ETHEREUM, service_node_1,
+                                  task_uuid, mainnet=True))
+
+    mocked_initialize_library.assert_called_once_with(True)
+    mocked_get_token_transfer_status.assert_awaited_once_with(
+        TransferInteractor.TokenTransferStatusRequest(Blockchain.ETHEREUM,
+                                                      service_node_1,
+                                                      task_uuid))
+
+
+@unittest.mock.patch.object(AsyncBidInteractor,
+                            'find_acceptable_service_node_bid')
+@unittest.mock.patch('pantos.client.library.aio.api._initialize_library')
+def test_find_acceptable_service_node_bid_correct(
+        mocked_initialize_library, mocked_find_acceptable_service_node_bid,
+        service_node_1, bids_1):
+    mocked_find_acceptable_service_node_bid.return_value = \
+        BidInteractor.AcceptableServiceNodeBid(service_node_1, bids_1[3])
+
+    service_node_bid = asyncio.run(
+        find_acceptable_service_node_bid(Blockchain.ETHEREUM,
+                                         Blockchain.POLYGON, 10))
+
+    assert service_node_bid == (service_node_1, bids_1[3])
+    mocked_initialize_library.assert_called_once_with(False)
+    mocked_find_acceptable_service_node_bid.assert_awaited_once_with(
+        Blockchain.ETHEREUM, Blockchain.POLYGON, 10, None)
+
+
+@unittest.mock.patch.object(AsyncBidInteractor, 'stream_service_node_bids')
+@unittest.mock.patch('pantos.client.library.aio.api._initialize_library')
+def test_stream_service_node_bids_correct(mocked_initialize_library,
+                                          mocked_stream_service_node_bids,
+                                          service_node_1, bids_1):
+    async def stream_bid_pairs(*args):
+        yield service_node_1, bids_1
+
+    mocked_stream_service_node_bids.side_effect = stream_bid_pairs
+
+    async def collect_bid_pairs():
+        return [
+            bid_pair async for bid_pair in stream_service_node_bids(
+                Blockchain.ETHEREUM, Blockchain.POLYGON, False, 1.5)
+        ]
+
+    bid_pairs = asyncio.run(collect_bid_pairs())
+
+    assert bid_pairs == [(service_node_1, bids_1)]
+    mocked_initialize_library.assert_called_once_with(False)
+    mocked_stream_service_node_bids.assert_called_once_with(
+        Blockchain.ETHEREUM, Blockchain.POLYGON, False, 1.5)
@@ -0,0 +1,390 @@
+import asyncio
+import importlib.resources
+import json
+import unittest.mock
+
+import aiohttp
+import eth_abi
+import eth_utils.abi
+import hexbytes
+import pytest
+import web3.providers.async_base
+from pantos.common.blockchains.base import Blockchain
+from pantos.common.blockchains.base import VersionedContractAbi
+from pantos.common.blockchains.enums import ContractAbi
+from pantos.common.configuration import Config
+
+from pantos.client.library.aio.blockchains import AsyncEthereumClient
+from pantos.client.library.aio.blockchains import get_async_blockchain_client
+from pantos.client.library.blockchains.base import BlockchainClient
+from pantos.client.library.blockchains.base import UnknownTransferError
+from pantos.client.library.blockchains.ethereum import EthereumClient
+from pantos.client.library.blockchains.ethereum import EthereumClientError
+from pantos.client.library.context import ClientContext
+from pantos.client.library.exceptions import ClientLibraryError
+from pantos.client.library.metrics import disable_metrics
+from pantos.client.library.metrics import enable_metrics
+
+_PROVIDER_URL = 'https://provider.test'
+
+_FALLBACK_PROVIDER_URL = 'https://fallback-provider.test'
+
+_BLOCKS_PER_QUERY = 5
+
+
+class _FakeProvider(web3.providers.async_base.AsyncBaseProvider):
+    # Answers the JSON-RPC requests from canned results (encoded
+    # according to the contract ABIs in case of contract calls)
+    def __init__(self, contract_abis):
+        super().__init__()
+        function_abis = [
+            function_abi for contract_abi in contract_abis
+            for function_abi in contract_abi
+            if function_abi['type'] == 'function'
+        ]
+        self.__function_abis = {
+            _get_function_selector(function_abi): function_abi
+            for function_abi in function_abis
+        }
+        self.results = {'eth_chainId': hex(1)}
+        self.error = None
+        self.requests = []
+
+    async def make_request(self, method, params):
+        self.requests.append((method, params))
+        if self.error is not None:
+            raise self.error
+        if method == 'eth_call':
+            result = self.__encode_call_result(
+                hexbytes.HexBytes(params[0]['data']))
+        else:
+            result = self.results[method]
+        return {'jsonrpc': '2.0', 'id': len(self.requests), 'result': result}
+
+    def __encode_call_result(self, data):
+        function_abi = self.__function_abis[bytes(data[:4])]
+        output_types = [
+            eth_utils.abi.collapse_if_tuple(output)
+            for output in function_abi['outputs']
+        ]
+        return '0x' + eth_abi.encode(
+            output_types, [self.results[function_abi['name']]]).hex()
+
+
+@pytest.fixture
+def ethereum_client(protocol_version, hub_address):
+    with unittest.mock.patch.object(BlockchainClient, '__init__',
+                                    lambda self, protocol_version: None):
+        ethereum_client = EthereumClient(protocol_version)
+    ethereum_client.protocol_version = protocol_version
+    config = {
+        'provider': _PROVIDER_URL,
+        'fallback_providers': [_FALLBACK_PROVIDER_URL],
+        'hub': hub_address,
+        'blocks_per_query': _BLOCKS_PER_QUERY
+    }
+    with unittest.mock.patch.object(EthereumClient, '_get_config',
+                                    return_value=config), \
+            unittest.mock.patch.object(
+                EthereumClient, '_get_utilities') as mocked_get_utilities:
+        mocked_get_utilities().load_contract_abi.side_effect = \
+            _load_contract_abi
+        yield ethereum_client
+
+
+@pytest.fixture
+def providers(protocol_version):
+    contract_abis = [
+        _load_contract_abi(VersionedContractAbi(contract_abi,
+                                                protocol_version))
+        for contract_abi in (ContractAbi.PANTOS_HUB, ContractAbi.PANTOS_TOKEN)
+    ]
+    providers = {
+        _PROVIDER_URL: _FakeProvider(contract_abis),
+        _FALLBACK_PROVIDER_URL: _FakeProvider(contract_abis)
+    }
+    with unittest.mock.patch(
+            'pantos.client.library.aio.blockchains.web3.AsyncHTTPProvider',
+            side_effect=providers.__getitem__):
+        yield providers
+
+
+@pytest.fixture
+def async_ethereum_client(ethereum_client):
+    return AsyncEthereumClient(ethereum_client)
+
+
+def test_read_service_node_addresses_correct(async_ethereum_client, providers,
+                                             service_node_1, service_node_2):
+    providers[_PROVIDER_URL].results['getServiceNodes'] = [
+        service_node_2, service_node_1
+    ]
+
+    service_node_addresses = asyncio.run(
+        async_ethereum_client.read_service_node_addresses())
+
+    assert service_node_addresses == sorted([service_node_1, service_node_2])
+    assert providers[_FALLBACK_PROVIDER_URL].requests == []
+
+
+def test_read_service_node_addresses_rpc_metrics(async_ethereum_client,
+                                                 providers, service_node_1):
+    providers[_PROVIDER_URL].results['getServiceNodes'] = [service_node_1]
+
+    metrics_registry = enable_metrics()
+    try:
+        asyncio.run(async_ethereum_client.read_service_node_addresses())
+        lines = metrics_registry.render().splitlines()
+    finally:
+        disable_metrics()
+
+    labels = ('blockchain="ethereum",provider="provider.test",'
+              'method="eth_call"')
+    assert (f'pantos_client_rpc_requests_total{{{labels},outcome="success"}} '
+            '1.0') in lines
+
+
+@pytest.mark.parametrize('error',
+                         [aiohttp.ClientConnectionError(),
+                          TimeoutError()])
+def test_read_service_node_addresses_fallback_provider_correct(
+        async_ethereum_client, providers, service_node_1, error):
+    providers[_PROVIDER_URL].error = error
+    providers[_FALLBACK_PROVIDER_URL].results['getServiceNodes'] = [
+        service_node_1
+    ]
+
+    service_node_addresses = asyncio.run(
+        async_ethereum_client.read_service_node_addresses())
+
+    assert service_node_addresses == [service_node_1]
+    assert len(providers[_PROVIDER_URL].requests) == 1
+    assert 'eth_call' in [
+        method for method, _ in providers[_FALLBACK_PROVIDER_URL].requests
+    ]
+
+
+def test_read_service_node_addresses_all_providers_error(
+        async_ethereum_client, providers):
+    for provider in providers.values():
+        provider.error = aiohttp.ClientConnectionError()
+
+    with pytest.raises(EthereumClientError):
+        asyncio.run(async_ethereum_client.read_service_node_addresses())
+
+
+def test_read_service_node_addresses_other_error_not_retried(
+        async_ethereum_client, providers):
+    providers[_PROVIDER_URL].error = ValueError()
+
+    with pytest.raises(EthereumClientError):
+        asyncio.run(async_ethereum_client.read_service_node_addresses())
+    assert providers[_FALLBACK_PROVIDER_URL].requests == []
+
+
+@pytest.mark.parametrize('active', [True, False])
+def test_read_service_node_url_correct(async_ethereum_client, providers,
+                                       service_node_1, service_node_url,
+                                       sender_address, active):
+    providers[_PROVIDER_URL].results['getServiceNodeRecord'] = (
+        active, service_node_url, 10**5, sender_address, 0)
+
+    read_service_node_url = async_ethereum_client.read_service_node_url(
+        service_node_1)
+
+    if active:
+        assert asyncio.run(read_service_node_url) == service_node_url
+    else:
+        with pytest.raises(EthereumClientError,
+                           match='service node is not active'):
+            asyncio.run(read_service_node_url)
+
+
+@pytest.mark.parametrize('active', [True, False])
+def test_read_external_token_address_correct(async_ethereum_client, providers,
+                                             source_token_address,
+                                             destination_token_address,
+                                             active):
+    providers[_PROVIDER_URL].results['getExternalTokenRecord'] = (
+        active, destination_token_address)
+
+    read_external_token_address = \
+        async_ethereum_client.read_external_token_address(
+            source_token_address, Blockchain.POLYGON)
+
+    if active:
+        assert asyncio.run(
+            read_external_token_address) == destination_token_address
+    else:
+        with pytest.raises(EthereumClientError,
+                           match='external token is not active'):
+            asyncio.run(read_external_token_address)
+
+
+def test_read_token_balance_correct(async_ethereum_client, providers,
+                                    source_token_address, sender_address):
+    providers[_PROVIDER_URL].results['balanceOf'] = 10**18
+
+    token_balance = asyncio.run(
+        async_ethereum_client.read_token_balance(source_token_address,
+                                                 sender_address))
+
+    assert token_balance == 10**18
+
+
+def test_read_token_decimals_correct(async_ethereum_client, providers,
+                                     source_token_address):
+    providers[_PROVIDER_URL].results['decimals'] = 8
+
+    token_decimals = asyncio.run(
+        async_ethereum_client.read_token_decimals(source_token_address))
+
+    assert token_decimals == 8
+
+
+def test_contracts_cached(async_ethereum_client, ethereum_client, providers,
+                          service_node_1, source_token_address):
+    providers[_PROVIDER_URL].results['getServiceNodes'] = [service_node_1]
+    providers[_PROVIDER_URL].results['decimals'] = 8
+
+    async def read_twice():
+        for _ in range(2):
+            await async_ethereum_client.read_service_node_addresses()
+            await async_ethereum_client.read_token_decimals(
+                source_token_address)
+
+    asyncio.run(read_twice())
+
+    # The contract ABIs are loaded only once per node connection
+    assert [
+        call.args[0].contract_abi for call in
+        ethereum_client._get_utilities().load_contract_abi.call_args_list
+    ] == [ContractAbi.PANTOS_HUB, ContractAbi.PANTOS_TOKEN]
+
+
+def test_read_token_decimals_error(async_ethereum_client, providers,
+                                   source_token_address):
+    providers[_PROVIDER_URL].error = ValueError()
+
+    with pytest.raises(EthereumClientError):
+        asyncio.run(
+            async_ethereum_client.read_token_decimals(source_token_address))
+
+
+@pytest.mark.parametrize('pooled_sender_nonce', [10, None])
+@unittest.mock.patch.object(EthereumClient, '_generate_sender_nonce',
+                            return_value=20)
+@unittest.mock.patch.object(EthereumClient, '_take_sender_nonce')
+@unittest.mock.patch.object(EthereumClient, '_sign_transfer',
+                            return_value='signature')
+def test_compute_transfer_signature_correct(mocked_sign_transfer,
+                                            mocked_take_sender_nonce,
+                                            mocked_generate_sender_nonce,
+                                            async_ethereum_client, providers,
+                                            sender_address,
+                                            pooled_sender_nonce):
+    mocked_take_sender_nonce.return_value = pooled_sender_nonce
+    # The sender's address is used as its account ID
+    request = unittest.mock.MagicMock(sender_private_key=sender_address)
+
+    response = asyncio.run(
+        async_ethereum_client.compute_transfer_signature(request))
+
+    # The sender nonces are taken from the synchronous client's pool
+    expected_sender_nonce = (20 if pooled_sender_nonce is None else
+                             pooled_sender_nonce)
+    assert response.sender_address == sender_address
+    assert response.sender_nonce == expected_sender_nonce
+    assert response.signature == 'signature'
+    mocked_sign_transfer.assert_called_once_with(request, sender_address,
+                                                 expected_sender_nonce)
+    assert mocked_generate_sender_nonce.called == (pooled_sender_nonce is None)
+    assert providers[_PROVIDER_URL].requests == []
+
+
+@unittest.mock.patch.object(EthereumClient, 'read_destination_transfer')
+def test_read_destination_transfer_correct(mocked_read_destination_transfer,
+                                           async_ethereum_client, providers,
+                                           source_transaction_id):
+    mocked_read_destination_transfer.return_value = \
+        unittest.mock.sentinel.response
+    request = BlockchainClient.DestinationTransferRequest(
+        Blockchain.POLYGON, source_transaction_id, 10)
+
+    response = asyncio.run(
+        async_ethereum_client.read_destination_transfer(request))
+
+    assert response is unittest.mock.sentinel.response
+    mocked_read_destination_transfer.assert_called_once_with(request)
+    assert providers[_PROVIDER_URL].requests == []
+
+
+@unittest.mock.patch.object(EthereumClient, 'read_destination_transfer')
+def test_read_destination_transfer_unknown_transfer(
+        mocked_read_destination_transfer, async_ethereum_client,
+        source_transaction_id):
+    mocked_read_destination_transfer.side_effect = UnknownTransferError()
+    request = BlockchainClient.DestinationTransferRequest(
+        Blockchain.POLYGON, source_transaction_id, 10)
+
+    with pytest.raises(UnknownTransferError):
+        asyncio.run(async_ethereum_client.read_destination_transfer(request))
+
+
+@unittest.mock.patch(
+    'pantos.client.library.aio.blockchains.get_blockchain_client')
+def test_get_async_blockchain_client_correct(mocked_get_blockchain_client,
+                                             ethereum_client):
+    mocked_get_blockchain_client.return_value = ethereum_client
+
+    async_blockchain_client = get_async_blockchain_client(Blockchain.ETHEREUM)
+
+    assert isinstance(async_blockchain_client, AsyncEthereumClient)
+    assert get_async_blockchain_client(
+        Blockchain.ETHEREUM) is async_blockchain_client
+
+
+@unittest.mock.patch(
+    'pantos.client.library.aio.blockchains.get_blockchain_client')
+def test_get_async_blockchain_client_owned_by_client_context(
+        mocked_get_blockchain_client, ethereum_client):
+    mocked_get_blockchain_client.return_value = ethereum_client
+    async_blockchain_clients = []
+
+    for _ in range(2):
+        client_context = ClientContext(unittest.mock.MagicMock(spec=Config))
+        with client_context.activate():
+            async_blockchain_client = get_async_blockchain_client(
+                Blockchain.ETHEREUM)
+            assert get_async_blockchain_client(
+                Blockchain.ETHEREUM) is async_blockchain_client
+        async_blockchain_clients.append(async_blockchain_client)
+
+    assert async_blockchain_clients[0] is not async_blockchain_clients[1]
+    assert get_async_blockchain_client(
+        Blockchain.ETHEREUM) not in async_blockchain_clients
+
+
+@unittest.mock.patch(
+    'pantos.client.library.aio.blockchains.get_blockchain_client')
+def test_get_async_blockchain_client_unavailable_error(
+        mocked_get_blockchain_client):
+    mocked_get_blockchain_client.return_value = unittest.mock.MagicMock(
+        spec=BlockchainClient)
+
+    with pytest.raises(ClientLibraryError):
+        get_async_blockchain_client(Blockchain.SOLANA)
+
+
+def _get_function_selector(function_abi):
+    return bytes(eth_utils.abi.function_abi_to_4byte_selector(function_abi))
+
+
+def _load_contract_abi(versioned_contract_abi):
+    version = versioned_contract_abi.version
+    contract_abi_file = importlib.resources.files(
+        'pantos.common.blockchains.contracts.'
+        f'v{version.major}_{version.minor}_{version.patch}'
+    ) / versioned_contract_abi.contract_abi.get_file_name(Blockchain.ETHEREUM)
+    with contract_abi_file.open('r') as contract_abi_file_:
+        return json.load(contract_abi_file_)
@@ -0,0 +1,287 @@
+import asyncio
+import decimal
+import unittest.mock
+
+import pytest
+from pantos.common.blockchains.base import Blockchain
+from pantos.common.entities import ServiceNodeTransferStatus
+from pantos.common.servicenodes import ServiceNodeClientError
+
+from pantos.client.library.aio.business import AsyncBidInteractor
+from pantos.client.library.aio.business import AsyncTokenInteractor
+from pantos.client.library.aio.business import AsyncTransferInteractor
+from pantos.client.library.aio.servicenodes import AsyncServiceNodeClient
+from pantos.client.library.blockchains import BlockchainClientError
+from pantos.client.library.blockchains.base import UnknownTransferError
+from pantos.client.library.business.bids import BidInteractorError
+from pantos.client.library.business.tokens import TokenInteractorError
+from pantos.client.library.business.transfers import TransferInteractor
+from pantos.client.library.business.transfers import TransferInteractorError
+from pantos.client.library.entitites import ServiceNodeTaskInfo
+
+
+@pytest.fixture
+def async_blockchain_client():
+    with unittest.mock.patch(
+            'pantos.client.library.aio.business.get_async_blockchain_client'
+    ) as mocked_get_async_blockchain_client:
+        blockchain_client = unittest.mock.MagicMock()
+        for method_name in ('read_service_node_addresses',
+                            'read_service_node_url', 'read_token_decimals',
+                            'read_token_balance', 'compute_transfer_signature',
+                            'compute_transfer_from_signature',
+                            'read_external_token_address',
+                            'read_destination_transfer'):
+            setattr(blockchain_client, method_name, unittest.mock.AsyncMock())
+        mocked_get_async_blockchain_client.return_value = blockchain_client
+        yield blockchain_client
+
+
+@pytest.mark.parametrize('amount_subunit,decimals,amount_main_unit',
+                         [(0, 8, decimal.Decimal(0)),
+                          (10**8, 8, decimal.Decimal(1)),
+                          (15, 1, decimal.Decimal('1.5'))])
+def test_convert_amount_to_main_unit_correct(amount_subunit, decimals,
+                                             amount_main_unit,
+                                             async_blockchain_client,
+                                             source_token_address):
+    async_blockchain_client.read_token_decimals.return_value = decimals
+
+    converted_amount = asyncio.run(
+        AsyncTokenInteractor().convert_amount_to_main_unit(
+            Blockchain.ETHEREUM, source_token_address, amount_subunit))
+
+    assert converted_amount == amount_main_unit
+
+
+def test_convert_amount_to_subunit_too_many_decimals_error(
+        async_blockchain_client, source_token_address):
+    async_blockchain_client.read_token_decimals.return_value = 1
+
+    with pytest.raises(TokenInteractorError):
+        asyncio.run(AsyncTokenInteractor().convert_amount_to_subunit(
+            Blockchain.ETHEREUM, source_token_address,
+            decimal.Decimal('1.25')))
+
+
+@unittest.mock.patch('pantos.client.library.aio.business.config',
+                     {'service_nodes': {
+                         'timeout': 10
+                     }})
+@unittest.mock.patch.object(AsyncServiceNodeClient, 'bids')
+def test_retrieve_service_node_bids_correct(
+        mocked_bids, async_blockchain_client, service_node_1, service_node_2,
+        service_node_url, bids_1, source_blockchain, destination_blockchain):
+    async_blockchain_client.get_blockchain.return_value = source_blockchain
+    async_blockchain_client.read_service_node_addresses.return_value = [
+        service_node_1, service_node_2
+    ]
+    async_blockchain_client.read_service_node_url.return_value = \
+        service_node_url
+    mocked_bids.side_effect = [bids_1, ServiceNodeClientError('')]
+
+    service_node_bids = asyncio.run(
+        AsyncBidInteractor().retrieve_service_node_bids(
+            source_blockchain, destination_blockchain, False))
+
+    assert service_node_bids == {service_node_1: bids_1}
+
+
+def _delayed_bids(delays_and_bids):
+    async def bids(service_node_url, source_blockchain, destination_blockchain,
+                   timeout):
+        delay, bids = delays_and_bids[service_node_url]
+        await asyncio.sleep(delay)
+        return bids
+
+    return bids
+
+
+@pytest.mark.parametrize('timeout, number_bid_pairs', [(None, 2), (0.5, 1)])
+@unittest.mock.patch('pantos.client.library.aio.business.config',
+                     {'service_nodes': {
+                         'timeout': 10
+                     }})
+@unittest.mock.patch.object(AsyncServiceNodeClient, 'bids')
+def test_stream_service_node_bids_correct(mocked_bids, timeout,
+                                          number_bid_pairs,
+                                          async_blockchain_client,
+                                          service_node_1, service_node_2,
+                                          bids_1, bids_2, source_blockchain,
+                                          destination_blockchain):
+    async_blockchain_client.get_blockchain.return_value = source_blockchain
+    async_blockchain_client.read_service_node_addresses.return_value = [
+        service_node_1, service_node_2
+    ]
+    async_blockchain_client.read_service_node_url.side_effect = \
+        lambda service_node_address: service_node_address
+    mocked_bids.side_effect = _delayed_bids({
+        service_node_1: (1, bids_1),
+        service_node_2: (0, bids_2)
+    })
+
+    async def stream_service_node_bids():
+        return [
+            bid_pair async for bid_pair in
+            AsyncBidInteractor().stream_service_node_bids(
+                source_blockchain, destination_blockchain, False, timeout)
+        ]
+
+    bid_pairs = asyncio.run(stream_service_node_bids())
+
+    assert bid_pairs == [(service_node_2, bids_2),
+                         (service_node_1, bids_1)][:number_bid_pairs]
+
+
+@unittest.mock.patch('pantos.client.library.aio.business.config',
+                     {'service_nodes': {
+                         'timeout': 10
+                     }})
+@unittest.mock.patch.object(AsyncServiceNodeClient, 'bids')
+def test_find_acceptable_service_node_bid_correct(
+        mocked_bids, async_blockchain_client, service_node_1, service_node_2,
+        bids_1, bids_2, source_blockchain, destination_blockchain):
+    async_blockchain_client.get_blockchain.return_value = source_blockchain
+    async_blockchain_client.read_service_node_addresses.return_value = [
+        service_node_1, service_node_2
+    ]
+    async_blockchain_client.read_service_node_url.side_effect = \
+        lambda service_node_address: service_node_address
+    mocked_bids.side_effect = _delayed_bids({
+        service_node_1: (10, bids_1),
+        service_node_2: (0, bids_2)
+    })
+
+    acceptable_bid = asyncio.run(
+        AsyncBidInteractor().find_acceptable_service_node_bid(
+            source_blockchain, destination_blockchain, 100))
+
+    assert acceptable_bid.service_node_address == service_node_2
+    assert acceptable_bid.service_node_bid == bids_2[3]
+
+
+@unittest.mock.patch.object(AsyncBidInteractor, 'stream_service_node_bids')
+def test_find_acceptable_service_node_bid_no_bids_error(
+        mocked_stream_service_node_bids, service_node_2, bids_2,
+        source_blockchain, destination_blockchain):
+    async def stream_service_node_bids(*args):
+        yield service_node_2, bids_2
+
+    mocked_stream_service_node_bids.side_effect = stream_service_node_bids
+
+    with pytest.raises(BidInteractorError):
+        asyncio.run(AsyncBidInteractor().find_acceptable_service_node_bid(
+            source_blockchain, destination_blockchain, 1))
+
+
+@unittest.mock.patch.object(AsyncBidInteractor, 'retrieve_service_node_bids')
+def test_find_cheapest_service_node_bid_correct(
+        mocked_retrieve_service_node_bids, service_node_1, service_node_2,
+        bids_1, bids_2, source_blockchain, destination_blockchain):
+    mocked_retrieve_service_node_bids.return_value = {
+        service_node_1: bids_1,
+        service_node_2: bids_2
+    }
+
+    cheapest_bid = asyncio.run(
+        AsyncBidInteractor().find_cheapest_service_node_bid(
+            source_blockchain, destination_blockchain))
+
+    assert cheapest_bid.service_node_address == service_node_1
+    assert cheapest_bid.service_node_bid == bids_1[3]
+
+
+@unittest.mock.patch.object(AsyncBidInteractor, 'retrieve_service_node_bids',
+                            return_value={})
+def test_find_cheapest_service_node_bid_no_bids_error(
+        mocked_retrieve_service_node_bids, source_blockchain,
+        destination_blockchain):
+    with pytest.raises(BidInteractorError):
+        asyncio.run(AsyncBidInteractor().find_cheapest_service_node_bid(
+            source_blockchain, destination_blockchain))
+
+
+@unittest.mock.patch.object(AsyncServiceNodeClient, 'submit_transfer')
+def test_transfer_tokens_correct(mocked_submit_transfer,
+                                 async_blockchain_client, sender_private_key,
+                                 sender_address, sender_nonce,
+                                 recipient_address, source_token_address,
+                                 token_amount, service_node_1,
+                                 service_node_url, bids_1, task_uuid):
+    async_blockchain_client.is_valid_recipient_address.return_value = True
+    async_blockchain_client.read_service_node_url.return_value = \
+        service_node_url
+    signature_response = unittest.mock.MagicMock(sender_address=sender_address,
+                                                 sender_nonce=sender_nonce,
+                                                 signature='signature')
+    async_blockchain_client.compute_transfer_signature.return_value = \
+        signature_response
+    mocked_submit_transfer.return_value = task_uuid
+    request = TransferInteractor.TransferTokensRequest(
+        Blockchain.ETHEREUM, Blockchain.ETHEREUM, sender_private_key,
+        recipient_address, source_token_address, token_amount,
+        (service_node_1, bids_1[0]))
+
+    task_info = asyncio.run(AsyncTransferInteractor().transfer_tokens(request))
+
+    assert task_info == ServiceNodeTaskInfo(task_uuid, service_node_1)
+    submit_transfer_request = mocked_submit_transfer.call_args.args[0]
+    assert submit_transfer_request.service_node_url == service_node_url
+    assert submit_transfer_request.sender_nonce == sender_nonce
+    assert submit_transfer_request.token_amount == token_amount
+
+
+def test_transfer_tokens_invalid_recipient_error(
+        async_blockchain_client, sender_private_key, recipient_address,
+        source_token_address, token_amount, service_node_1, bids_1):
+    async_blockchain_client.is_valid_recipient_address.return_value = False
+    request = TransferInteractor.TransferTokensRequest(
+        Blockchain.ETHEREUM, Blockchain.ETHEREUM, sender_private_key,
+        recipient_address, source_token_address, token_amount,
+        (service_node_1, bids_1[0]))
+
+    with pytest.raises(TransferInteractorError):
+        asyncio.run(AsyncTransferInteractor().transfer_tokens(request))
+    async_blockchain_client.compute_transfer_signature.assert_not_called()
+
+
+@pytest.mark.parametrize('timestamp_error', [False, True])
+@pytest.mark.parametrize('service_node_status',
+                         [[Blockchain.ETHEREUM, Blockchain.POLYGON]],
+                         indirect=True)
+@unittest.mock.patch.object(AsyncServiceNodeClient, 'status')
+@unittest.mock.patch(
+    'pantos.client.library.aio.business.get_blockchain_client')
+def test_get_token_transfer_status_source_transaction_timestamp(
+        mocked_blockchain_client, mocked_status, timestamp_error,
+        async_blockchain_client, service_node_status, service_node_url,
+        service_node_1, task_uuid):
+    if timestamp_error:
+        mocked_blockchain_client().read_transaction_timestamp.side_effect = \
+            BlockchainClientError('')
+    else:
+        mocked_blockchain_client().read_transaction_timestamp.return_value = \
+            1700000000
+    async_blockchain_client.read_service_node_url.return_value = \
+        service_node_url
+    async_blockchain_client.read_destination_transfer.side_effect = \
+        UnknownTransferError()
+    service_node_status.status = ServiceNodeTransferStatus.CONFIRMED
+    mocked_status.return_value = service_node_status
+    request = TransferInteractor.TokenTransferStatusRequest(
+        service_node_status.source_blockchain, service_node_1, task_uuid, 50)
+
+    asyncio.run(AsyncTransferInteractor().get_token_transfer_status(request))
+
+    # The source transaction timestamp is only read on demand
+    mocked_blockchain_client().read_transaction_timestamp.assert_not_called()
+    destination_transfer_request = \
+        async_blockchain_client.read_destination_transfer.call_args.args[0]
+    assert destination_transfer_request.source_transaction_id == \
+        service_node_status.transaction_id
+    assert destination_transfer_request.blocks_to_search == 50
+    assert destination_transfer_request.\
+        source_transaction_timestamp_reader() == (
+            None if timestamp_error else 1700000000)
+    mocked_blockchain_client().read_transaction_timestamp.\
+        assert_called_once_with(service_node_status.transaction_id)
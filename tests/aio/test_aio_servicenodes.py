@@ -0,0 +1,258 @@
+import asyncio
+import dataclasses
+
+import aiohttp
+import aiohttp.test_utils
+import aiohttp.web
+import pytest
+from pantos.common.blockchains.base import Blockchain
+from pantos.common.entities import ServiceNodeBid
+from pantos.common.servicenodes import ServiceNodeClient
+from pantos.common.servicenodes import ServiceNodeClientError
+from pantos.common.servicenodes import ServiceNodeTransferStatus
+
+from pantos.client.library.aio.servicenodes import AsyncServiceNodeClient
+from pantos.client.library.metrics import disable_metrics
+from pantos.client.library.metrics import enable_metrics
+
+
+class _FakeServiceNode:
+    # Serves canned JSON responses and records the received requests
+    def __init__(self):
+        self.responses = {}
+        self.requests = []
+        self.delay = 0.0
+
+    def create_application(self):
+        application = aiohttp.web.Application()
+        application.router.add_route('*', '/{path:.*}', self.__handle)
+        return application
+
+    async def __handle(self, request):
+        payload = await request.json() if request.can_read_body else None
+        self.requests.append(
+            (request.method, request.path, dict(request.query), payload))
+        await asyncio.sleep(self.delay)
+        status, body = self.responses[(request.method, request.path)]
+        if isinstance(body, str):
+            return aiohttp.web.Response(status=status, text=body)
+        return aiohttp.web.json_response(body, status=status)
+
+
+@pytest.fixture
+def service_node():
+    return _FakeServiceNode()
+
+
+@pytest.fixture
+def submit_transfer_request(source_blockchain, destination_blockchain,
+                            sender_address, recipient_address,
+                            source_token_address, destination_token_address,
+                            token_amount, sender_nonce, transfer_valid_until):
+    return ServiceNodeClient.SubmitTransferRequest(
+        '', source_blockchain, destination_blockchain, sender_address,
+        recipient_address, source_token_address, destination_token_address,
+        token_amount,
+        ServiceNodeBid(source_blockchain, destination_blockchain, 10, 100,
+                       1000, 'bid signature'), sender_nonce,
+        transfer_valid_until, 'signature')
+
+
+def test_submit_transfer_correct(service_node, submit_transfer_request,
+                                 task_uuid):
+    service_node.responses[('POST', '/transfer')] = (200, {
+        'task_id': str(task_uuid)
+    })
+
+    async def submit_transfer(client, service_node_url):
+        submit_transfer_request.service_node_url = service_node_url
+        return await client.submit_transfer(submit_transfer_request, 5)
+
+    task_id = _run(service_node, submit_transfer)
+
+    assert task_id == task_uuid
+    [(_, _, _, payload)] = service_node.requests
+    assert payload['nonce'] == submit_transfer_request.sender_nonce
+    assert payload['amount'] == submit_transfer_request.token_amount
+    assert payload['bid']['signature'] == 'bid signature'
+    assert payload['source_blockchain_id'] == \
+        submit_transfer_request.source_blockchain.value
+
+
+@pytest.mark.parametrize('status, body, response_message',
+                         [(400, {
+                             'message': 'bad request'
+                         }, 'bad request'), (500, 'internal error', None),
+                          (200, {}, None), (200, {
+                              'task_id': 'no uuid'
+                          }, None)])
+def test_submit_transfer_error(service_node, submit_transfer_request, status,
+                               body, response_message):
+    service_node.responses[('POST', '/transfer')] = (status, body)
+
+    async def submit_transfer(client, service_node_url):
+        submit_transfer_request.service_node_url = service_node_url
+        return await client.submit_transfer(submit_transfer_request)
+
+    with pytest.raises(ServiceNodeClientError) as exception_info:
+        _run(service_node, submit_transfer)
+
+    assert exception_info.value.details['response_message'] == \
+        response_message
+
+
+@pytest.mark.parametrize('trailing_slash', [True, False])
+def test_bids_correct(service_node, source_blockchain, destination_blockchain,
+                      trailing_slash):
+    service_node.responses[('GET', '/bids')] = (200, [{
+        'fee': 10,
+        'execution_time': 100,
+        'valid_until': 1000,
+        'signature': 'bid signature'
+    }])
+
+    async def bids(client, service_node_url):
+        if not trailing_slash:
+            service_node_url = service_node_url.rstrip('/')
+        return await client.bids(service_node_url, source_blockchain,
+                                 destination_blockchain)
+
+    service_node_bids = _run(service_node, bids)
+
+    assert service_node_bids == [
+        ServiceNodeBid(source_blockchain, destination_blockchain, 10, 100,
+                       1000, 'bid signature')
+    ]
+    assert service_node.requests == [('GET', '/bids', {
+        'source_blockchain': str(source_blockchain.value),
+        'destination_blockchain': str(destination_blockchain.value)
+    }, None)]
+
+
+@pytest.mark.parametrize('status, body', [(200, [{}]),
+                                          (503, {
+                                              'message': 'unavailable'
+                                          }), (200, 'no json')])
+def test_bids_error(service_node, source_blockchain, destination_blockchain,
+                    status, body):
+    service_node.responses[('GET', '/bids')] = (status, body)
+
+    async def bids(client, service_node_url):
+        return await client.bids(service_node_url, source_blockchain,
+                                 destination_blockchain)
+
+    with pytest.raises(ServiceNodeClientError):
+        _run(service_node, bids)
+
+
+def test_bids_timeout_error(service_node, source_blockchain,
+                            destination_blockchain):
+    service_node.responses[('GET', '/bids')] = (200, [])
+    service_node.delay = 1.0
+
+    async def bids(client, service_node_url):
+        return await client.bids(service_node_url, source_blockchain,
+                                 destination_blockchain, 0.05)
+
+    with pytest.raises(ServiceNodeClientError):
+        _run(service_node, bids)
+
+
+def test_bids_connection_error(source_blockchain, destination_blockchain,
+                               unused_port):
+    async def bids():
+        async with aiohttp.ClientSession() as session:
+            return await AsyncServiceNodeClient(session).bids(
+                f'http://127.0.0.1:{unused_port}', source_blockchain,
+                destination_blockchain)
+
+    with pytest.raises(ServiceNodeClientError):
+        asyncio.run(bids())
+
+
+def test_bids_metrics(service_node, source_blockchain, destination_blockchain):
+    async def bids(client, service_node_url):
+        service_node.responses[('GET', '/bids')] = (200, [])
+        await client.bids(service_node_url, source_blockchain,
+                          destination_blockchain)
+        service_node.responses[('GET', '/bids')] = (503, {})
+        with pytest.raises(ServiceNodeClientError):
+            await client.bids(service_node_url, source_blockchain,
+                              destination_blockchain)
+
+    metrics_registry = enable_metrics()
+    try:
+        _run(service_node, bids)
+        lines = metrics_registry.render().splitlines()
+    finally:
+        disable_metrics()
+
+    for outcome in ('success', 'error'):
+        assert any(
+            line.startswith('pantos_client_http_requests_total{')
+            and line.endswith(f'resource="bids",outcome="{outcome}"}} 1.0')
+            for line in lines)
+
+
+@pytest.mark.parametrize('service_node_status',
+                         [(Blockchain.ETHEREUM, Blockchain.BNB_CHAIN)],
+                         indirect=['service_node_status'])
+def test_status_correct(service_node, service_node_status):
+    task_id = service_node_status.task_id
+    # Service nodes return the transaction ID as a hexadecimal string
+    service_node_status = dataclasses.replace(
+        service_node_status,
+        transaction_id=service_node_status.transaction_id.to_0x_hex())
+    service_node.responses[('GET', f'/transfer/{task_id}/status')] = (200, {
+        'task_id': str(task_id),
+        'source_blockchain_id': service_node_status.source_blockchain.value,
+        'destination_blockchain_id': service_node_status.
+        destination_blockchain.value,
+        'sender_address': service_node_status.sender_address,
+        'recipient_address': service_node_status.recipient_address,
+        'source_token_address': service_node_status.source_token_address,
+        'destination_token_address': service_node_status.
+        destination_token_address,
+        'amount': service_node_status.token_amount,
+        'fee': service_node_status.fee,
+        'status': ServiceNodeTransferStatus.ACCEPTED.name.lower(),
+        'transfer_id': service_node_status.transfer_id,
+        'transaction_id': service_node_status.transaction_id
+    })
+
+    async def status(client, service_node_url):
+        return await client.status(service_node_url, task_id, 5)
+
+    assert _run(service_node, status) == service_node_status
+
+
+@pytest.mark.parametrize('status, body', [(404, {
+    'message': 'task not found'
+}), (200, {
+    'task_id': 'no uuid'
+})])
+def test_status_error(service_node, task_uuid, status, body):
+    service_node.responses[('GET', f'/transfer/{task_uuid}/status')] = (status,
+                                                                        body)
+
+    async def get_status(client, service_node_url):
+        return await client.status(service_node_url, task_uuid)
+
+    with pytest.raises(ServiceNodeClientError):
+        _run(service_node, get_status)
+
+
+@pytest.fixture
+def unused_port():
+    return aiohttp.test_utils.unused_port()
+
+
+def _run(service_node, request_service_node):
+    async def run():
+        async with aiohttp.test_utils.TestServer(
+                service_node.create_application()) as server:
+            async with aiohttp.ClientSession() as session:
+                return await request_service_node(
+                    AsyncServiceNodeClient(session), str(server.make_url('/')))
+
+    return asyncio.run(run())
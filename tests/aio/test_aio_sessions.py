@@ -0,0 +1,66 @@
+import asyncio
+import unittest.mock
+
+import pytest
+
+from pantos.client.library.aio.sessions import close_async_http_session
+from pantos.client.library.aio.sessions import get_async_http_session
+
+_CONFIG = {
+    'http': {
+        'pool_connections': 4,
+        'pool_maxsize': 8,
+        'pool_block': False
+    }
+}
+
+
+@pytest.fixture(autouse=True)
+def mocked_config():
+    with unittest.mock.patch('pantos.client.library.aio.sessions.config',
+                             _CONFIG):
+        yield
+
+
+def test_get_async_http_session_connection_limits():
+    async def get_connection_limits():
+        connector = get_async_http_session().connector
+        await close_async_http_session()
+        return connector.limit, connector.limit_per_host
+
+    assert asyncio.run(get_connection_limits()) == (32, 8)
+
+
+def test_get_async_http_session_reused_correct():
+    async def get_sessions():
+        first_session = get_async_http_session()
+        second_session = get_async_http_session()
+        await close_async_http_session()
+        return first_session, second_session
+
+    first_session, second_session = asyncio.run(get_sessions())
+
+    assert first_session is second_session
+    assert first_session.closed
+
+
+def test_get_async_http_session_per_event_loop_correct():
+    async def get_session():
+        session = get_async_http_session()
+        await close_async_http_session()
+        return session
+
+    assert asyncio.run(get_session()) is not asyncio.run(get_session())
+
+
+def test_get_async_http_session_after_close_correct():
+    async def get_sessions():
+        first_session = get_async_http_session()
+        await close_async_http_session()
+        second_session = get_async_http_session()
+        await close_async_http_session()
+        return first_session, second_session
+
+    first_session, second_session = asyncio.run(get_sessions())
+
+    assert first_session is not second_session
@@ -11,6 +11,7 @@ def blockchain_config(chain_id, hub_address, forwarder_address,
         'chain_id': chain_id,
         'hub': hub_address,
         'forwarder': forwarder_address,
+        'sender_nonce_pool_size': 0,
         'tokens': {
             TOKEN_SYMBOL_PAN: pan_token_address
         }
@@ -1,7 +1,11 @@
+import subprocess
+import sys
+import threading
 import unittest.mock
 
 import pytest
 from pantos.common.blockchains.base import Blockchain
+from pantos.common.configuration import Config
 
 from pantos.client.library.blockchains.avalanche import AvalancheClient
 from pantos.client.library.blockchains.base import BlockchainClient
@@ -10,10 +14,17 @@ from pantos.client.library.blockchains.celo import CeloClient
 from pantos.client.library.blockchains.cronos import CronosClient
 from pantos.client.library.blockchains.ethereum import EthereumClient
 from pantos.client.library.blockchains.factory import _blockchain_clients
+from pantos.client.library.blockchains.factory import \
+    _get_blockchain_client_class
 from pantos.client.library.blockchains.factory import get_blockchain_client
+from pantos.client.library.blockchains.factory import \
+    prewarm_blockchain_clients
 from pantos.client.library.blockchains.polygon import PolygonClient
 from pantos.client.library.blockchains.solana import SolanaClient
 from pantos.client.library.blockchains.sonic import SonicClient
+from pantos.client.library.context import ClientContext
+from pantos.client.library.executors import SharedExecutor
+from pantos.client.library.protocol import get_latest_protocol_version
 from pantos.client.library.protocol import get_supported_protocol_versions
 
 
@@ -27,7 +38,7 @@ def clear_blockchain_clients():
 @pytest.mark.parametrize('blockchain',
                          [blockchain for blockchain in Blockchain])
 def test_get_blockchain_client_correct(blockchain, protocol_version):
-    blockchain_client_class = _get_blockchain_client_class(blockchain)
+    blockchain_client_class = _get_expected_blockchain_client_class(blockchain)
     with unittest.mock.patch.object(blockchain_client_class, '__init__',
                                     lambda self, protocol_version_: None):
         blockchain_client = get_blockchain_client(
@@ -36,7 +47,99 @@ def test_get_blockchain_client_correct(blockchain, protocol_version):
         assert isinstance(blockchain_client, blockchain_client_class)
 
 
-def _get_blockchain_client_class(blockchain):
+def test_get_blockchain_client_single_flight_correct():
+    number_threads = 8
+    barrier = threading.Barrier(number_threads)
+    constructed = threading.Event()
+    constructor_calls = []
+
+    def construct(self, protocol_version):
+        constructor_calls.append(protocol_version)
+        # Keep the construction running until all threads wait for it
+        constructed.wait(timeout=0.2)
+
+    def get_client():
+        barrier.wait()
+        blockchain_clients.append(get_blockchain_client(Blockchain.ETHEREUM))
+
+    blockchain_clients = []
+    with unittest.mock.patch.object(EthereumClient, '__init__', construct):
+        threads = [
+            threading.Thread(target=get_client) for _ in range(number_threads)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    assert constructor_calls == [get_latest_protocol_version()]
+    assert len(blockchain_clients) == number_threads
+    assert all(blockchain_client is blockchain_clients[0]
+               for blockchain_client in blockchain_clients)
+
+
+def test_get_blockchain_client_error_retried():
+    with unittest.mock.patch.object(EthereumClient, '__init__',
+                                    side_effect=[ValueError, None]):
+        with pytest.raises(ValueError):
+            get_blockchain_client(Blockchain.ETHEREUM)
+        blockchain_client = get_blockchain_client(Blockchain.ETHEREUM)
+
+    assert isinstance(blockchain_client, EthereumClient)
+
+
+def test_prewarm_blockchain_clients_correct():
+    executor = SharedExecutor(2)
+    with unittest.mock.patch(
+            'pantos.client.library.blockchains.factory.get_executor',
+            return_value=executor), \
+            unittest.mock.patch.object(
+                EthereumClient, '__init__',
+                return_value=None) as mocked_ethereum, \
+            unittest.mock.patch.object(
+                PolygonClient, '__init__',
+                return_value=None) as mocked_polygon:
+        prewarm_blockchain_clients([Blockchain.ETHEREUM, Blockchain.POLYGON])
+        prewarm_blockchain_clients([Blockchain.ETHEREUM])
+    executor.shutdown()
+
+    mocked_ethereum.assert_called_once_with(get_latest_protocol_version())
+    mocked_polygon.assert_called_once_with(get_latest_protocol_version())
+
+
+def test_blockchain_clients_closed_with_client_context():
+    client_context = ClientContext(unittest.mock.MagicMock(spec=Config))
+    with unittest.mock.patch.object(EthereumClient, '__init__',
+                                    return_value=None), \
+            unittest.mock.patch.object(EthereumClient,
+                                       'close') as mocked_close:
+        with client_context.activate():
+            get_blockchain_client(Blockchain.ETHEREUM)
+        client_context.close()
+
+    mocked_close.assert_called_once_with()
+
+
+def test_blockchain_client_classes_complete():
+    assert {
+        blockchain: _get_blockchain_client_class(blockchain)
+        for blockchain in Blockchain
+    } == BlockchainClient.find_subclasses()
+
+
+def test_import_blockchain_clients_deferred():
+    # The blockchain-specific clients (and web3) must only be imported
+    # when a client is first requested
+    result = subprocess.run([
+        sys.executable, '-c', 'import sys, pantos.client; '
+        'print("web3" in sys.modules, '
+        '"pantos.client.library.blockchains.ethereum" in sys.modules)'
+    ], check=True, capture_output=True, text=True)
+
+    assert result.stdout.split() == ['False', 'False']
+
+
+def _get_expected_blockchain_client_class(blockchain):
     if blockchain is Blockchain.AVALANCHE:
         return AvalancheClient
     if blockchain is Blockchain.BNB_CHAIN:
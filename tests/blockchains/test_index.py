@@ -0,0 +1,185 @@
+import sqlite3
+
+import pytest
+from pantos.common.blockchains.enums import Blockchain
+from pantos.common.types import BlockchainAddress
+
+from pantos.client.library.blockchains.base import BlockchainClient
+from pantos.client.library.blockchains.index import DestinationTransferIndex
+
+_DESTINATION_BLOCKCHAIN_ID = Blockchain.ETHEREUM.value
+
+_HUB_ADDRESS = '0x' + 40 * 'A'
+
+_SOURCE_TRANSACTION_ID = '0x' + 64 * 'a'
+
+
+def _transfer_response(latest_block_number, transaction_block_number):
+    return BlockchainClient.DestinationTransferResponse(
+        latest_block_number, transaction_block_number, '0x' + 64 * 'b', 1, 2,
+        BlockchainAddress('0x' + 40 * '1'), BlockchainAddress('0x' + 40 * '2'),
+        BlockchainAddress('0x' + 40 * '3'), BlockchainAddress('0x' + 40 * '4'),
+        10**30, 3, [BlockchainAddress('0x' + 40 * '5')], ['0x' + 130 * 'c'])
+
+
+@pytest.fixture
+def destination_transfer_index():
+    destination_transfer_index = DestinationTransferIndex(
+        ':memory:', _DESTINATION_BLOCKCHAIN_ID, _HUB_ADDRESS)
+    yield destination_transfer_index
+    destination_transfer_index.close()
+
+
+def test_read_transfer_correct(destination_transfer_index):
+    destination_transfer_index.add_scanned_block_range(
+        10, 20, [(Blockchain.POLYGON.value, _SOURCE_TRANSACTION_ID,
+                  _transfer_response(25, 15))])
+
+    transfer_response = destination_transfer_index.read_transfer(
+        Blockchain.POLYGON.value, _SOURCE_TRANSACTION_ID, 30)
+
+    assert transfer_response == _transfer_response(30, 15)
+
+
+@pytest.mark.parametrize('source_blockchain_id_transaction_id',
+                         [(Blockchain.POLYGON.value, '0x' + 64 * 'f'),
+                          (Blockchain.CELO.value, _SOURCE_TRANSACTION_ID)])
+def test_read_transfer_not_indexed(source_blockchain_id_transaction_id,
+                                   destination_transfer_index):
+    destination_transfer_index.add_scanned_block_range(
+        10, 20, [(Blockchain.POLYGON.value, _SOURCE_TRANSACTION_ID,
+                  _transfer_response(25, 15))])
+
+    transfer_response = destination_transfer_index.read_transfer(
+        *source_blockchain_id_transaction_id, 30)
+
+    assert transfer_response is None
+
+
+@pytest.mark.parametrize('destination_blockchain_id_hub_address',
+                         [(Blockchain.BNB_CHAIN.value, _HUB_ADDRESS),
+                          (_DESTINATION_BLOCKCHAIN_ID, '0x' + 40 * 'B')])
+def test_read_transfer_other_destination_not_indexed(
+        destination_blockchain_id_hub_address, tmp_path):
+    database_path = str(tmp_path / 'index.sqlite')
+    destination_transfer_index = DestinationTransferIndex(
+        database_path, _DESTINATION_BLOCKCHAIN_ID, _HUB_ADDRESS)
+    destination_transfer_index.add_scanned_block_range(
+        10, 20, [(Blockchain.POLYGON.value, _SOURCE_TRANSACTION_ID,
+                  _transfer_response(25, 15))])
+
+    other_destination_transfer_index = DestinationTransferIndex(
+        database_path, *destination_blockchain_id_hub_address)
+    transfer_response = other_destination_transfer_index.read_transfer(
+        Blockchain.POLYGON.value, _SOURCE_TRANSACTION_ID, 30)
+    unscanned_block_ranges = \
+        other_destination_transfer_index.find_unscanned_block_ranges(0, 30)
+    other_destination_transfer_index.close()
+    destination_transfer_index.close()
+
+    assert transfer_response is None
+    assert unscanned_block_ranges == [(0, 30)]
+
+
+def test_read_transfer_hub_address_case_insensitive(tmp_path):
+    database_path = str(tmp_path / 'index.sqlite')
+    destination_transfer_index = DestinationTransferIndex(
+        database_path, _DESTINATION_BLOCKCHAIN_ID, _HUB_ADDRESS)
+    destination_transfer_index.add_scanned_block_range(
+        10, 20, [(Blockchain.POLYGON.value, _SOURCE_TRANSACTION_ID,
+                  _transfer_response(25, 15))])
+    destination_transfer_index.close()
+
+    destination_transfer_index = DestinationTransferIndex(
+        database_path, _DESTINATION_BLOCKCHAIN_ID, _HUB_ADDRESS.lower())
+    transfer_response = destination_transfer_index.read_transfer(
+        Blockchain.POLYGON.value, _SOURCE_TRANSACTION_ID, 30)
+    destination_transfer_index.close()
+
+    assert transfer_response == _transfer_response(30, 15)
+
+
+def test_init_legacy_schema_recreated(tmp_path):
+    database_path = str(tmp_path / 'index.sqlite')
+    connection = sqlite3.connect(database_path)
+    connection.execute(
+        'CREATE TABLE scanned_block_ranges (from_block_number INTEGER '
+        'PRIMARY KEY, to_block_number INTEGER NOT NULL)')
+    connection.execute('INSERT INTO scanned_block_ranges VALUES (0, 30)')
+    connection.commit()
+    connection.close()
+
+    destination_transfer_index = DestinationTransferIndex(
+        database_path, _DESTINATION_BLOCKCHAIN_ID, _HUB_ADDRESS)
+    unscanned_block_ranges = \
+        destination_transfer_index.find_unscanned_block_ranges(0, 30)
+    destination_transfer_index.close()
+
+    assert unscanned_block_ranges == [(0, 30)]
+
+
+def test_read_transfer_persisted(tmp_path):
+    database_path = str(tmp_path / 'index.sqlite')
+    destination_transfer_index = DestinationTransferIndex(
+        database_path, _DESTINATION_BLOCKCHAIN_ID, _HUB_ADDRESS)
+    destination_transfer_index.add_scanned_block_range(
+        10, 20, [(Blockchain.POLYGON.value, _SOURCE_TRANSACTION_ID,
+                  _transfer_response(25, 15))])
+    destination_transfer_index.close()
+
+    destination_transfer_index = DestinationTransferIndex(
+        database_path, _DESTINATION_BLOCKCHAIN_ID, _HUB_ADDRESS)
+    transfer_response = destination_transfer_index.read_transfer(
+        Blockchain.POLYGON.value, _SOURCE_TRANSACTION_ID, 30)
+    unscanned_block_ranges = \
+        destination_transfer_index.find_unscanned_block_ranges(0, 30)
+    destination_transfer_index.close()
+
+    assert transfer_response == _transfer_response(30, 15)
+    assert unscanned_block_ranges == [(21, 30), (0, 9)]
+
+
+def test_find_unscanned_block_ranges_nothing_scanned(
+        destination_transfer_index):
+    assert destination_transfer_index.find_unscanned_block_ranges(5, 50) == [
+        (5, 50)
+    ]
+
+
+@pytest.mark.parametrize('block_range_expected', [
+    ((0, 100), [(91, 100), (61, 69), (31, 39), (0, 9)]),
+    ((15, 65), [(61, 65), (31, 39)]),
+    ((12, 18), []),
+    ((31, 39), [(31, 39)]),
+    ((20, 40), [(31, 39)]),
+    ((95, 99), [(95, 99)]),
+])
+def test_find_unscanned_block_ranges_correct(block_range_expected,
+                                             destination_transfer_index):
+    block_range, expected_unscanned_block_ranges = block_range_expected
+    for from_block_number, to_block_number in [(10, 30), (40, 60), (70, 90)]:
+        destination_transfer_index.add_scanned_block_range(
+            from_block_number, to_block_number, [])
+
+    unscanned_block_ranges = \
+        destination_transfer_index.find_unscanned_block_ranges(*block_range)
+
+    assert unscanned_block_ranges == expected_unscanned_block_ranges
+
+
+@pytest.mark.parametrize('block_ranges', [
+    [(0, 9), (10, 19), (20, 29)],
+    [(20, 29), (0, 9), (10, 19)],
+    [(0, 15), (10, 29), (5, 20)],
+    [(0, 29), (5, 10)],
+])
+def test_add_scanned_block_range_merged(block_ranges,
+                                        destination_transfer_index):
+    for from_block_number, to_block_number in block_ranges:
+        destination_transfer_index.add_scanned_block_range(
+            from_block_number, to_block_number, [])
+
+    assert destination_transfer_index.find_unscanned_block_ranges(0, 40) == [
+        (30, 40)
+    ]
+    assert destination_transfer_index.find_unscanned_block_ranges(0, 29) == []
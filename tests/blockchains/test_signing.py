@@ -0,0 +1,147 @@
+import unittest.mock
+
+import pytest
+import web3
+
+from pantos.client.library.blockchains.ethereum import \
+    _TRANSFER_FROM_MESSAGE_TYPES
+from pantos.client.library.blockchains.ethereum import _TRANSFER_MESSAGE_TYPES
+from pantos.client.library.blockchains.signing import Eip712StructEncoder
+from pantos.client.library.blockchains.signing import TransferSigningEngine
+from pantos.client.library.blockchains.signing import TransferSigningJob
+from pantos.client.library.blockchains.signing import \
+    get_transfer_signing_engine
+from pantos.client.library.blockchains.signing import sign_transfer_message
+
+_DOMAIN_DATA = {
+    'name': 'Pantos',
+    'version': '1',
+    'chainId': 1,
+    'verifyingContract': '0x' + 40 * '2'
+}
+
+_DOMAIN_TYPES = {
+    'EIP712Domain': [{
+        'name': 'name',
+        'type': 'string'
+    }, {
+        'name': 'version',
+        'type': 'string'
+    }, {
+        'name': 'chainId',
+        'type': 'uint256'
+    }, {
+        'name': 'verifyingContract',
+        'type': 'address'
+    }]
+}
+
+_CONFIG = {'signing': {'processes': 3}}
+
+_PRIVATE_KEYS = ['0x' + 64 * '1', '0x' + 64 * '2']
+
+
+def _transfer_message_data(nonce):
+    return {
+        'request': {
+            'sender': '0x' + 40 * '3',
+            'recipient': '0x' + 40 * '4',
+            'token': '0x' + 40 * '5',
+            'amount': 10**18,
+            'serviceNode': '0x' + 40 * '6',
+            'fee': 10**8,
+            'nonce': nonce,
+            'validUntil': 1700000000
+        },
+        'blockchainId': 0,
+        'pantosHub': '0x' + 40 * '7',
+        'pantosForwarder': '0x' + 40 * '2',
+        'pantosToken': '0x' + 40 * '8'
+    }
+
+
+def _transfer_from_message_data(nonce):
+    return {
+        'request': {
+            'destinationBlockchainId': 1,
+            'sender': '0x' + 40 * '3',
+            'recipient': 'recipient',
+            'sourceToken': '0x' + 40 * '5',
+            'destinationToken': 'destination token',
+            'amount': 10**18,
+            'serviceNode': '0x' + 40 * '6',
+            'fee': 10**8,
+            'nonce': nonce,
+            'validUntil': 1700000000
+        },
+        'sourceBlockchainId': 0,
+        'pantosHub': '0x' + 40 * '7',
+        'pantosForwarder': '0x' + 40 * '2',
+        'pantosToken': '0x' + 40 * '8'
+    }
+
+
+def _signing_jobs_signatures(number_jobs):
+    domain_separator = Eip712StructEncoder(
+        'EIP712Domain', _DOMAIN_TYPES).hash_struct(_DOMAIN_DATA)
+    transfer_encoder = Eip712StructEncoder('Transfer', _TRANSFER_MESSAGE_TYPES)
+    transfer_from_encoder = Eip712StructEncoder('TransferFrom',
+                                                _TRANSFER_FROM_MESSAGE_TYPES)
+    signing_jobs = []
+    signatures = []
+    for nonce in range(number_jobs):
+        private_key = _PRIVATE_KEYS[nonce % 2]
+        if nonce % 3 == 0:
+            message_encoder = transfer_from_encoder
+            message_types = _TRANSFER_FROM_MESSAGE_TYPES
+            message_data = _transfer_from_message_data(nonce)
+        else:
+            message_encoder = transfer_encoder
+            message_types = _TRANSFER_MESSAGE_TYPES
+            message_data = _transfer_message_data(nonce)
+        signing_jobs.append(
+            TransferSigningJob(private_key, domain_separator, message_encoder,
+                               message_data))
+        signatures.append(
+            web3.Account.sign_typed_data(private_key, _DOMAIN_DATA,
+                                         message_types,
+                                         message_data).signature.to_0x_hex())
+    return signing_jobs, signatures
+
+
+def test_sign_transfer_message_correct():
+    signing_jobs, signatures = _signing_jobs_signatures(3)
+
+    assert [
+        sign_transfer_message(signing_job) for signing_job in signing_jobs
+    ] == signatures
+
+
+@pytest.mark.parametrize('number_processes_jobs', [(0, 5), (2, 1), (2, 5)])
+def test_sign_correct(number_processes_jobs):
+    number_processes, number_jobs = number_processes_jobs
+    signing_jobs, signatures = _signing_jobs_signatures(number_jobs)
+    transfer_signing_engine = TransferSigningEngine(number_processes)
+
+    try:
+        assert transfer_signing_engine.sign(signing_jobs) == signatures
+    finally:
+        transfer_signing_engine.close()
+
+
+def test_sign_no_jobs():
+    transfer_signing_engine = TransferSigningEngine(2)
+
+    assert transfer_signing_engine.sign([]) == []
+
+
+@unittest.mock.patch(
+    'pantos.client.library.blockchains.signing.'
+    '_transfer_signing_engine', None)
+@unittest.mock.patch('pantos.client.library.blockchains.signing.config',
+                     _CONFIG)
+def test_get_transfer_signing_engine_correct():
+    transfer_signing_engine = get_transfer_signing_engine()
+
+    assert transfer_signing_engine.number_processes == 3
+    assert get_transfer_signing_engine() is transfer_signing_engine
@@ -59,6 +59,11 @@ def test_read_service_node_url_not_implemented(solana_client):
         solana_client.read_service_node_url(None)
 
 
+def test_read_transaction_timestamp_not_implemented(solana_client):
+    with pytest.raises(NotImplementedError):
+        solana_client.read_transaction_timestamp(None)
+
+
 def test_read_token_decimals_not_implemented(solana_client):
     with pytest.raises(NotImplementedError):
         solana_client.read_token_decimals(None)
@@ -1,13 +1,29 @@
-import contextlib
+import concurrent.futures
+import dataclasses
+import decimal
 import unittest
 
 import pytest
 from pantos.common.blockchains.base import Blockchain
-from pantos.common.servicenodes import ServiceNodeClient
 
 from pantos.client.library.business.bids import BidInteractor
 from pantos.client.library.business.bids import BidInteractorError
+from pantos.client.library.business.bids import service_node_bid_cache
+from pantos.client.library.business.ranking import LowestFeePolicy
+from pantos.client.library.business.ranking import \
+    LowestFeeWithinDeadlinePolicy
 from pantos.client.library.business.tokens import TokenInteractor
+from pantos.client.library.servicenodes import ServiceNodeClient
+
+_CONFIG = {
+    'service_nodes': {
+        'timeout': 1,
+        'bid_cache': True,
+        'bid_cache_refresh_ahead': 30
+    }
+}
+
+_CURRENT_TIME = 1000
 
 
 class _Break(Exception):
@@ -15,11 +31,12 @@ class _Break(Exception):
 
 
 class _MockThread:
-    def __init__(self, target):
+    def __init__(self, target, args=(), daemon=None):
         self.__target = target
+        self.__args = args
 
     def start(self):
-        self.__target()
+        self.__target(*self.__args)
 
 
 class _MockFuture:
@@ -34,22 +51,25 @@ class _MockFuture:
             raise self.__result
         return self.__result
 
+    def cancel(self):
+        return False
 
-class _MockThreadPoolExecutor(contextlib.AbstractContextManager):
-    def __init__(self):
-        pass
-
-    def __exit__(self, *args):
-        pass
 
+class _MockExecutor:
     def submit(self, function, *args):
         return _MockFuture(function, *args)
 
 
-def _mock_as_completed(dictionary):
+def _mock_as_completed(dictionary, timeout=None):
     return dictionary.keys()
 
 
+def _mock_as_completed_timeout(dictionary, timeout=None):
+    yield next(iter(dictionary))
+    raise concurrent.futures.TimeoutError
+
+
+@unittest.mock.patch('pantos.client.library.business.bids.config', _CONFIG)
 @unittest.mock.patch.object(BidInteractor, 'retrieve_service_node_bids')
 def test_find_cheapest_service_node_bid_correct(
         mocked_retrieve_service_node_bids, service_node_1, service_node_2,
@@ -67,6 +87,7 @@ def test_find_cheapest_service_node_bid_correct(
     assert cheapest_service_node_bid.service_node_bid.fee == 1
 
 
+@unittest.mock.patch('pantos.client.library.business.bids.config', _CONFIG)
 @unittest.mock.patch.object(BidInteractor, 'retrieve_service_node_bids')
 def test_find_cheapest_service_node_bid_no_bids_error(
         mocked_retrieve_service_node_bids, service_node_1):
@@ -78,6 +99,7 @@ def test_find_cheapest_service_node_bid_no_bids_error(
                                                       Blockchain.CRONOS)
 
 
+@unittest.mock.patch('pantos.client.library.business.bids.config', _CONFIG)
 @unittest.mock.patch.object(BidInteractor, 'retrieve_service_node_bids')
 def test_find_cheapest_service_node_bid_interactor_error(
         mocked_retrieve_service_node_bids):
@@ -89,6 +111,7 @@ def test_find_cheapest_service_node_bid_interactor_error(
                                                       Blockchain.CRONOS)
 
 
+@unittest.mock.patch('pantos.client.library.business.bids.config', _CONFIG)
 @unittest.mock.patch.object(BidInteractor, 'retrieve_service_node_bids')
 def test_find_cheapest_service_node_bid_error(
         mocked_retrieve_service_node_bids):
@@ -100,13 +123,162 @@ def test_find_cheapest_service_node_bid_error(
                                                       Blockchain.CRONOS)
 
 
+@unittest.mock.patch('pantos.client.library.business.bids.config', _CONFIG)
+@unittest.mock.patch.object(BidInteractor, 'retrieve_service_node_bids')
+def test_find_best_service_node_bids_correct(mocked_retrieve_service_node_bids,
+                                             service_node_1, service_node_2,
+                                             bids_1, bids_2):
+    mocked_retrieve_service_node_bids.return_value = {
+        service_node_1: bids_1,
+        service_node_2: bids_2
+    }
+    bid_interactor = BidInteractor()
+
+    ranked_service_node_bids = bid_interactor.find_best_service_node_bids(
+        Blockchain.CELO, Blockchain.CRONOS, LowestFeePolicy(), 3)
+
+    assert ranked_service_node_bids == [
+        BidInteractor.RankedServiceNodeBid(service_node_1, bids_1[3]),
+        BidInteractor.RankedServiceNodeBid(service_node_2, bids_2[3]),
+        BidInteractor.RankedServiceNodeBid(service_node_1, bids_1[1])
+    ]
+    mocked_retrieve_service_node_bids.assert_called_once()
+
+
+@unittest.mock.patch('pantos.client.library.business.bids.config', _CONFIG)
+@unittest.mock.patch.object(BidInteractor, 'retrieve_service_node_bids')
+def test_find_best_service_node_bids_no_eligible_bids_error(
+        mocked_retrieve_service_node_bids, service_node_1, bids_1):
+    mocked_retrieve_service_node_bids.return_value = {service_node_1: bids_1}
+    bid_interactor = BidInteractor()
+
+    with pytest.raises(BidInteractorError):
+        bid_interactor.find_best_service_node_bids(
+            Blockchain.CELO, Blockchain.CRONOS,
+            LowestFeeWithinDeadlinePolicy(1))
+
+
+def _valid_bids(bids, valid_for):
+    return [
+        dataclasses.replace(
+            bid, valid_until=_CURRENT_TIME + bid.execution_time + valid_for)
+        for bid in bids
+    ]
+
+
+@pytest.mark.parametrize('valid_for, valid_until_buffer, cached',
+                         [(100, 0, True), (100, 70, True), (100, 101, False),
+                          (-1, 0, False)])
+@unittest.mock.patch('pantos.client.library.business.bids.config', _CONFIG)
+@unittest.mock.patch('pantos.client.library.business.bids.time')
+@unittest.mock.patch.object(BidInteractor, 'retrieve_service_node_bids')
+def test_find_cheapest_service_node_bid_cached(
+        mocked_retrieve_service_node_bids, mocked_time, valid_for,
+        valid_until_buffer, cached, service_node_1, bids_1):
+    mocked_time.time.return_value = _CURRENT_TIME
+    mocked_retrieve_service_node_bids.return_value = {
+        service_node_1: _valid_bids(bids_1, valid_for)
+    }
+    bid_interactor = BidInteractor()
+
+    for _ in range(2):
+        cheapest_service_node_bid = \
+            bid_interactor.find_cheapest_service_node_bid(
+                Blockchain.CELO, Blockchain.CRONOS, valid_until_buffer)
+        assert cheapest_service_node_bid.service_node_bid.fee == 1
+
+    assert mocked_retrieve_service_node_bids.call_count == (1 if cached else 2)
+
+
+@unittest.mock.patch('pantos.client.library.business.bids.config', _CONFIG)
+@unittest.mock.patch('pantos.client.library.business.bids.time')
+@unittest.mock.patch('pantos.client.library.business.bids.get_executor',
+                     _MockExecutor)
+@unittest.mock.patch.object(BidInteractor, 'retrieve_service_node_bids')
+def test_find_cheapest_service_node_bid_refreshed_ahead(
+        mocked_retrieve_service_node_bids, mocked_time, service_node_1,
+        service_node_2, bids_1, bids_2):
+    mocked_time.time.return_value = _CURRENT_TIME
+    mocked_retrieve_service_node_bids.side_effect = [{
+        service_node_1: _valid_bids(bids_1, 10)
+    }, {
+        service_node_2: _valid_bids(bids_2, 100)
+    },
+                                                     BidInteractorError('')]
+    bid_interactor = BidInteractor()
+
+    bid_interactor.find_cheapest_service_node_bid(Blockchain.CELO,
+                                                  Blockchain.CRONOS)
+    cheapest_service_node_bid = bid_interactor.find_cheapest_service_node_bid(
+        Blockchain.CELO, Blockchain.CRONOS)
+    assert cheapest_service_node_bid.service_node_address == service_node_1
+    cheapest_service_node_bid = bid_interactor.find_cheapest_service_node_bid(
+        Blockchain.CELO, Blockchain.CRONOS)
+
+    assert cheapest_service_node_bid.service_node_address == service_node_2
+    assert mocked_retrieve_service_node_bids.call_count == 2
+    assert service_node_bid_cache.get(Blockchain.CELO, Blockchain.CRONOS) == {
+        service_node_2: _valid_bids(bids_2, 100)
+    }
+
+
+@unittest.mock.patch('pantos.client.library.business.bids.config', _CONFIG)
+@unittest.mock.patch('pantos.client.library.business.bids.time')
+@unittest.mock.patch('pantos.client.library.business.bids.get_executor')
+@unittest.mock.patch.object(BidInteractor, 'retrieve_service_node_bids')
+def test_find_cheapest_service_node_bid_refresh_executor_shut_down(
+        mocked_retrieve_service_node_bids, mocked_get_executor, mocked_time,
+        service_node_1, bids_1):
+    mocked_time.time.return_value = _CURRENT_TIME
+    mocked_retrieve_service_node_bids.return_value = {
+        service_node_1: _valid_bids(bids_1, 10)
+    }
+    mocked_get_executor().submit.side_effect = RuntimeError
+    bid_interactor = BidInteractor()
+
+    for _ in range(3):
+        cheapest_service_node_bid = \
+            bid_interactor.find_cheapest_service_node_bid(
+                Blockchain.CELO, Blockchain.CRONOS)
+
+    assert cheapest_service_node_bid.service_node_address == service_node_1
+    assert mocked_retrieve_service_node_bids.call_count == 1
+    # A failed submission does not block later refresh attempts
+    assert mocked_get_executor().submit.call_count == 2
+
+
+@unittest.mock.patch(
+    'pantos.client.library.business.bids.config',
+    {'service_nodes': _CONFIG['service_nodes'] | {
+        'bid_cache': False
+    }})
+@unittest.mock.patch('pantos.client.library.business.bids.time')
+@unittest.mock.patch.object(BidInteractor, 'retrieve_service_node_bids')
+def test_find_cheapest_service_node_bid_cache_disabled(
+        mocked_retrieve_service_node_bids, mocked_time, service_node_1,
+        bids_1):
+    mocked_time.time.return_value = _CURRENT_TIME
+    mocked_retrieve_service_node_bids.return_value = {
+        service_node_1: _valid_bids(bids_1, 100)
+    }
+    bid_interactor = BidInteractor()
+
+    for _ in range(2):
+        bid_interactor.find_cheapest_service_node_bid(Blockchain.CELO,
+                                                      Blockchain.CRONOS)
+
+    assert mocked_retrieve_service_node_bids.call_count == 2
+    assert service_node_bid_cache.get(Blockchain.CELO,
+                                      Blockchain.CRONOS) is None
+
+
 @unittest.mock.patch('pantos.client.library.business.bids.config',
                      {'service_nodes': {
                          'timeout': 1
                      }})
 @unittest.mock.patch('concurrent.futures.as_completed', _mock_as_completed)
-@unittest.mock.patch('concurrent.futures.ThreadPoolExecutor',
-                     _MockThreadPoolExecutor)
+@unittest.mock.patch('pantos.client.library.business.bids.get_executor',
+                     _MockExecutor)
 @unittest.mock.patch('threading.Thread', _MockThread)
 @unittest.mock.patch.object(TokenInteractor, 'convert_amount_to_main_unit',
                             lambda _0, _1, _2, z: z)
@@ -138,8 +310,8 @@ def test_retrieve_service_node_bids_correct(mocked_get_blockchain_client,
                          'timeout': 1
                      }})
 @unittest.mock.patch('concurrent.futures.as_completed', _mock_as_completed)
-@unittest.mock.patch('concurrent.futures.ThreadPoolExecutor',
-                     _MockThreadPoolExecutor)
+@unittest.mock.patch('pantos.client.library.business.bids.get_executor',
+                     _MockExecutor)
 @unittest.mock.patch('threading.Thread', _MockThread)
 @unittest.mock.patch.object(ServiceNodeClient, 'bids')
 @unittest.mock.patch('pantos.client.library.business.bids.'
@@ -168,8 +340,8 @@ def test_retrieve_service_node_bids_not_fee_in_main_unint_correct(
                          'timeout': 1
                      }})
 @unittest.mock.patch('concurrent.futures.as_completed', _mock_as_completed)
-@unittest.mock.patch('concurrent.futures.ThreadPoolExecutor',
-                     _MockThreadPoolExecutor)
+@unittest.mock.patch('pantos.client.library.business.bids.get_executor',
+                     _MockExecutor)
 @unittest.mock.patch('threading.Thread', _MockThread)
 @unittest.mock.patch.object(TokenInteractor, 'convert_amount_to_main_unit',
                             lambda _0, _1, _2, z: z)
@@ -204,3 +376,104 @@ def test_retrieve_service_node_bids_general_error(
     with pytest.raises(BidInteractorError):
         bid_interactor.retrieve_service_node_bids(Blockchain.CELO,
                                                   Blockchain.CRONOS, True)
+
+
+@unittest.mock.patch('pantos.client.library.business.bids.config', _CONFIG)
+@unittest.mock.patch('concurrent.futures.as_completed',
+                     _mock_as_completed_timeout)
+@unittest.mock.patch('pantos.client.library.business.bids.get_executor',
+                     _MockExecutor)
+@unittest.mock.patch.object(ServiceNodeClient, 'bids')
+@unittest.mock.patch('pantos.client.library.business.bids.'
+                     'get_blockchain_client')
+def test_stream_service_node_bids_timeout(mocked_get_blockchain_client,
+                                          mocked_service_node_bids,
+                                          service_node_1, service_node_2,
+                                          bids_1):
+    mocked_get_blockchain_client().read_service_node_addresses.return_value = [
+        service_node_1, service_node_2
+    ]
+    mocked_get_blockchain_client().read_service_node_url.return_value = ''
+    mocked_service_node_bids.return_value = bids_1
+    bid_interactor = BidInteractor()
+
+    bids = list(
+        bid_interactor.stream_service_node_bids(Blockchain.CELO,
+                                                Blockchain.CRONOS, False, 1))
+
+    assert bids == [(service_node_1, bids_1)]
+
+
+@unittest.mock.patch('pantos.client.library.business.bids.'
+                     'get_blockchain_client')
+def test_stream_service_node_bids_error(mocked_get_blockchain_client):
+    mocked_get_blockchain_client.side_effect = Exception
+    bid_interactor = BidInteractor()
+
+    with pytest.raises(BidInteractorError):
+        next(
+            bid_interactor.stream_service_node_bids(Blockchain.CELO,
+                                                    Blockchain.CRONOS, False))
+
+
+@unittest.mock.patch.object(BidInteractor, 'stream_service_node_bids')
+def test_find_acceptable_service_node_bid_correct(
+        mocked_stream_service_node_bids, service_node_1, service_node_2,
+        bids_1, bids_2):
+    mocked_stream_service_node_bids.return_value = (bid_pair for bid_pair in [(
+        service_node_1, bids_1), (service_node_2, bids_2)])
+    bid_interactor = BidInteractor()
+
+    acceptable_service_node_bid = \
+        bid_interactor.find_acceptable_service_node_bid(
+            Blockchain.CELO, Blockchain.CRONOS, 10, 5)
+
+    assert acceptable_service_node_bid.service_node_address == service_node_1
+    assert acceptable_service_node_bid.service_node_bid.fee == 1
+    mocked_stream_service_node_bids.assert_called_once_with(
+        Blockchain.CELO, Blockchain.CRONOS, False, 5)
+
+
+@unittest.mock.patch.object(BidInteractor, 'stream_service_node_bids')
+def test_find_acceptable_service_node_bid_first_service_node(
+        mocked_stream_service_node_bids, service_node_1, service_node_2,
+        bids_1, bids_2):
+    mocked_stream_service_node_bids.return_value = (bid_pair for bid_pair in [(
+        service_node_2, bids_2), (service_node_1, bids_1)])
+    bid_interactor = BidInteractor()
+
+    acceptable_service_node_bid = \
+        bid_interactor.find_acceptable_service_node_bid(
+            Blockchain.CELO, Blockchain.CRONOS, 50)
+
+    assert acceptable_service_node_bid.service_node_address == service_node_2
+    assert acceptable_service_node_bid.service_node_bid.fee == 2
+
+
+@unittest.mock.patch.object(TokenInteractor, 'convert_amount_to_subunit',
+                            return_value=1)
+@unittest.mock.patch.object(BidInteractor, 'stream_service_node_bids')
+def test_find_acceptable_service_node_bid_main_unit(
+        mocked_stream_service_node_bids, mocked_convert_amount_to_subunit,
+        service_node_2, bids_2):
+    mocked_stream_service_node_bids.return_value = (
+        bid_pair for bid_pair in [(service_node_2, bids_2)])
+    bid_interactor = BidInteractor()
+
+    with pytest.raises(BidInteractorError):
+        bid_interactor.find_acceptable_service_node_bid(
+            Blockchain.CELO, Blockchain.CRONOS, decimal.Decimal('0.01'))
+
+    mocked_convert_amount_to_subunit.assert_called_once_with(
+        Blockchain.CELO, 'pan', decimal.Decimal('0.01'))
+
+
+@unittest.mock.patch.object(BidInteractor, 'stream_service_node_bids')
+def test_find_acceptable_service_node_bid_error(
+        mocked_stream_service_node_bids):
+    mocked_stream_service_node_bids.side_effect = Exception
+    bid_interactor = BidInteractor()
+
+    with pytest.raises(BidInteractorError):
+        bid_interactor.find_acceptable_service_node_bid(
+            Blockchain.CELO, Blockchain.CRONOS, 1)
@@ -12,15 +12,16 @@ from pantos.client.library.business.deployments import \
 
 
 @unittest.mock.patch('pantos.client.library.business.deployments.uuid.UUID')
-@unittest.mock.patch('pantos.client.library.business.deployments.requests')
+@unittest.mock.patch(
+    'pantos.client.library.business.deployments.get_http_session')
 @unittest.mock.patch(
     'pantos.client.library.business.deployments.get_blockchain_client')
 @unittest.mock.patch('pantos.client.library.business.deployments.config')
 @unittest.mock.patch(
     'pantos.client.library.business.deployments.get_blockchain_config')
 def test_deploy_token_correct(mocked_blockchain_config, mocked_config,
-                              mocked_blockchain_client, mocked_request,
-                              mocked_uuid):
+                              mocked_blockchain_client,
+                              mocked_get_http_session, mocked_uuid):
     request = TokenDeploymentInteractor.TokenDeploymentRequest(
         'name', 'SYM', 10, True, False, 123, [Blockchain.ETHEREUM],
         Blockchain.ETHEREUM, PrivateKey('priv_key'))
@@ -32,8 +33,8 @@ def test_deploy_token_correct(mocked_blockchain_config, mocked_config,
     mocked_blockchain_client().compute_transfer_signature.assert_called_once()
 
 
-@unittest.mock.patch('pantos.client.library.business.deployments.requests.get',
-                     side_effect=requests.exceptions.HTTPError(''))
+@unittest.mock.patch(
+    'pantos.client.library.business.deployments.get_http_session')
 @unittest.mock.patch(
     'pantos.client.library.business.deployments.get_blockchain_client')
 @unittest.mock.patch('pantos.client.library.business.deployments.config')
@@ -42,7 +43,9 @@ def test_deploy_token_correct(mocked_blockchain_config, mocked_config,
 def test_deploy_token_request_exception(mocked_blockchain_config,
                                         mocked_config,
                                         mocked_blockchain_client,
-                                        mocked_post_request):
+                                        mocked_get_http_session):
+    mocked_get_http_session().get.side_effect = \
+        requests.exceptions.HTTPError('')
     request = TokenDeploymentInteractor.TokenDeploymentRequest(
         'name', 'SYM', 10, True, False, 123, [Blockchain.ETHEREUM],
         Blockchain.ETHEREUM, PrivateKey('priv_key'))
@@ -54,9 +57,11 @@ def test_deploy_token_request_exception(mocked_blockchain_config,
         TokenDeploymentInteractor().deploy_token(request)
 
 
-@unittest.mock.patch('pantos.client.library.business.deployments.requests')
+@unittest.mock.patch(
+    'pantos.client.library.business.deployments.get_http_session')
 @unittest.mock.patch('pantos.client.library.business.deployments.config')
-def test_deploy_token_valid_until_error(mocked_config, mocked_request):
+def test_deploy_token_valid_until_error(mocked_config,
+                                        mocked_get_http_session):
     mocked_config.__getitem__().__getitem__.return_value = 'some_url'
     request = TokenDeploymentInteractor.TokenDeploymentRequest(
         'name', 'SYM', 10, True, False, 123, [Blockchain.ETHEREUM],
@@ -68,9 +73,8 @@ def test_deploy_token_valid_until_error(mocked_config, mocked_request):
 
 @unittest.mock.patch('pantos.client.library.business.deployments.uuid.UUID',
                      side_effect=requests.exceptions.HTTPError(''))
-@unittest.mock.patch('pantos.client.library.business.deployments.requests.get')
 @unittest.mock.patch(
-    'pantos.client.library.business.deployments.requests.post')
+    'pantos.client.library.business.deployments.get_http_session')
 @unittest.mock.patch(
     'pantos.client.library.business.deployments.get_blockchain_client')
 @unittest.mock.patch('pantos.client.library.business.deployments.config')
@@ -78,8 +82,7 @@ def test_deploy_token_valid_until_error(mocked_config, mocked_request):
     'pantos.client.library.business.deployments.get_blockchain_config')
 def test_deploy_token_unable_to_submit(mocked_blockchain_config, mocked_config,
                                        mocked_blockchain_client,
-                                       mocked_request_post, mocked_request_get,
-                                       mocked_uuid):
+                                       mocked_get_http_session, mocked_uuid):
     request = TokenDeploymentInteractor.TokenDeploymentRequest(
         'name', 'SYM', 10, True, False, 123, [Blockchain.ETHEREUM],
         Blockchain.ETHEREUM, PrivateKey('priv_key'))
@@ -0,0 +1,79 @@
+import pytest
+from pantos.common.blockchains.base import Blockchain
+from pantos.common.entities import ServiceNodeBid
+
+from pantos.client.library.business.ranking import FastestExecutionPolicy
+from pantos.client.library.business.ranking import LowestFeePolicy
+from pantos.client.library.business.ranking import \
+    LowestFeeWithinDeadlinePolicy
+from pantos.client.library.business.ranking import rank_service_node_bids
+
+_SERVICE_NODE_1 = '0x' + 40 * '1'
+
+_SERVICE_NODE_2 = '0x' + 40 * '2'
+
+
+def _bid(fee, execution_time):
+    return ServiceNodeBid(Blockchain.ETHEREUM, Blockchain.POLYGON, fee,
+                          execution_time, 1000, f'sig{fee}/{execution_time}')
+
+
+_SERVICE_NODE_BIDS = {
+    _SERVICE_NODE_1: [_bid(30, 100),
+                      _bid(10, 600),
+                      _bid(20, 60)],
+    _SERVICE_NODE_2: [_bid(10, 300), _bid(40, 30)],
+}
+
+
+@pytest.mark.parametrize(
+    'policy_expected_bids',
+    [(LowestFeePolicy(), [(_SERVICE_NODE_2, 0), (_SERVICE_NODE_1, 1),
+                          (_SERVICE_NODE_1, 2)]),
+     (FastestExecutionPolicy(), [(_SERVICE_NODE_2, 1), (_SERVICE_NODE_1, 2),
+                                 (_SERVICE_NODE_1, 0)]),
+     (LowestFeeWithinDeadlinePolicy(100), [(_SERVICE_NODE_1, 2),
+                                           (_SERVICE_NODE_1, 0),
+                                           (_SERVICE_NODE_2, 1)])])
+def test_rank_service_node_bids_correct(policy_expected_bids):
+    policy, expected_bids = policy_expected_bids
+
+    bid_pairs = rank_service_node_bids(_SERVICE_NODE_BIDS, policy, 3)
+
+    assert bid_pairs == [(service_node_address,
+                          _SERVICE_NODE_BIDS[service_node_address][index])
+                         for service_node_address, index in expected_bids]
+
+
+def test_rank_service_node_bids_default_number_bids():
+    bid_pairs = rank_service_node_bids(_SERVICE_NODE_BIDS, LowestFeePolicy())
+
+    assert bid_pairs == [(_SERVICE_NODE_2,
+                          _SERVICE_NODE_BIDS[_SERVICE_NODE_2][0])]
+
+
+def test_rank_service_node_bids_fewer_eligible_bids():
+    bid_pairs = rank_service_node_bids(_SERVICE_NODE_BIDS,
+                                       LowestFeeWithinDeadlinePolicy(30), 3)
+
+    assert bid_pairs == [(_SERVICE_NODE_2,
+                          _SERVICE_NODE_BIDS[_SERVICE_NODE_2][1])]
+
+
+def test_rank_service_node_bids_no_bids():
+    assert rank_service_node_bids({_SERVICE_NODE_1: []}, LowestFeePolicy(),
+                                  3) == []
+
+
+def test_rank_service_node_bids_ties_randomized():
+    service_node_bids = {
+        _SERVICE_NODE_1: [_bid(10, 60)],
+        _SERVICE_NODE_2: [_bid(10, 60)]
+    }
+
+    best_service_node_addresses = {
+        rank_service_node_bids(service_node_bids, LowestFeePolicy())[0][0]
+        for _ in range(100)
+    }
+
+    assert best_service_node_addresses == {_SERVICE_NODE_1, _SERVICE_NODE_2}
@@ -1,10 +1,13 @@
+import decimal
 import unittest.mock
 
 import pytest
 from pantos.common.blockchains.base import Blockchain
+from pantos.common.types import TokenSymbol
 
 from pantos.client.library.business.tokens import TokenInteractor
 from pantos.client.library.business.tokens import TokenInteractorError
+from pantos.client.library.business.tokens import token_decimals_cache
 
 
 class MockedBlockchainClient:
@@ -74,3 +77,119 @@ def test_convert_amount_to_subunit_correct_non_zero(
     mocked_token_id_to_token_address.return_value = source_token_address
     assert TokenInteractor().convert_amount_to_subunit(Blockchain.ETHEREUM, 2,
                                                        8) == 800000000
+
+
+@unittest.mock.patch(
+    'pantos.client.library.business.tokens.get_blockchain_client')
+@unittest.mock.patch.object(TokenInteractor, 'find_token_address')
+def test_retrieve_token_balances_correct(mocked_find_token_address,
+                                         mocked_get_blockchain_client,
+                                         source_token_address,
+                                         destination_token_address,
+                                         sender_address, recipient_address):
+    mocked_find_token_address.return_value = source_token_address
+    blockchain_client = mocked_get_blockchain_client()
+    blockchain_client.read_multiple_token_balances.return_value = [
+        150, 2, 10**18
+    ]
+    blockchain_client.read_multiple_token_decimals.return_value = [2, 18]
+    request = TokenInteractor.RetrieveTokenBalancesRequest(
+        Blockchain.ETHEREUM, [(sender_address, TokenSymbol('pan')),
+                              (recipient_address, TokenSymbol('pan')),
+                              (sender_address, destination_token_address)],
+        True)
+
+    token_balances = TokenInteractor().retrieve_token_balances(request)
+
+    assert token_balances == [
+        decimal.Decimal('1.5'),
+        decimal.Decimal('0.02'),
+        decimal.Decimal(1)
+    ]
+    blockchain_client.read_multiple_token_balances.assert_called_once_with([
+        (source_token_address, sender_address),
+        (source_token_address, recipient_address),
+        (destination_token_address, sender_address)
+    ])
+    blockchain_client.read_multiple_token_decimals.assert_called_once_with(
+        [source_token_address, destination_token_address])
+
+
+@unittest.mock.patch(
+    'pantos.client.library.business.tokens.get_blockchain_client')
+def test_retrieve_token_balances_error(mocked_get_blockchain_client,
+                                       source_token_address, sender_address):
+    mocked_get_blockchain_client().read_multiple_token_balances.side_effect = \
+        Exception
+    request = TokenInteractor.RetrieveTokenBalancesRequest(
+        Blockchain.ETHEREUM, [(sender_address, source_token_address)], False)
+
+    with pytest.raises(TokenInteractorError):
+        TokenInteractor().retrieve_token_balances(request)
+
+
+@unittest.mock.patch(
+    'pantos.client.library.business.tokens.get_blockchain_client')
+def test_read_token_decimals_cached(mocked_get_blockchain_client,
+                                    source_token_address):
+    mocked_get_blockchain_client().read_token_decimals.return_value = 8
+    token_interactor = TokenInteractor()
+
+    for _ in range(3):
+        assert token_interactor.convert_amount_to_main_unit(
+            Blockchain.ETHEREUM, source_token_address,
+            10**8) == decimal.Decimal(1)
+
+    mocked_get_blockchain_client().read_token_decimals.assert_called_once_with(
+        source_token_address)
+    assert token_decimals_cache.get(Blockchain.ETHEREUM,
+                                    source_token_address) == 8
+    assert token_decimals_cache.get(Blockchain.POLYGON,
+                                    source_token_address) is None
+
+
+@unittest.mock.patch(
+    'pantos.client.library.business.tokens.get_blockchain_client')
+@unittest.mock.patch('pantos.client.library.business.tokens.'
+                     'get_blockchain_config')
+def test_prewarm_token_decimals_correct(mocked_get_blockchain_config,
+                                        mocked_get_blockchain_client,
+                                        source_token_address,
+                                        destination_token_address):
+    mocked_get_blockchain_config.return_value = {
+        'tokens': {
+            'pan': source_token_address,
+            'best': destination_token_address,
+            'panpol': None
+        }
+    }
+    blockchain_client = mocked_get_blockchain_client()
+    blockchain_client.read_multiple_token_decimals.return_value = [8, 18]
+
+    TokenInteractor().prewarm_token_decimals(Blockchain.ETHEREUM)
+    token_decimals = TokenInteractor().read_token_decimals(
+        Blockchain.ETHEREUM, TokenSymbol('best'))
+
+    assert token_decimals == 18
+    blockchain_client.read_multiple_token_decimals.assert_called_once_with(
+        [source_token_address, destination_token_address])
+    blockchain_client.read_token_decimals.assert_not_called()
+
+
+@unittest.mock.patch(
+    'pantos.client.library.business.tokens.get_blockchain_client')
+@unittest.mock.patch(
+    'pantos.client.library.business.tokens.get_blockchain_config',
+    return_value={
+        'tokens': {
+            'pan': '0x53bAFF6C5A3F2F578C78eC8e66464C31aF62A7D6',
+            'best': '0x57FeAEC5F8f3A19264d8DfF24a88dA9F774e30a2'
+        }
+    })
+def test_prewarm_token_decimals_error(mocked_get_blockchain_config,
+                                      mocked_get_blockchain_client):
+    mocked_get_blockchain_client().read_multiple_token_decimals.side_effect = \
+        Exception
+
+    with pytest.raises(TokenInteractorError):
+        TokenInteractor().prewarm_token_decimals(Blockchain.ETHEREUM)
@@ -1,19 +1,32 @@
+import dataclasses
+import decimal
 import itertools
 import unittest.mock
+import uuid
 
 import pytest
 from pantos.common.blockchains.base import Blockchain
 from pantos.common.entities import ServiceNodeTransferStatus
-from pantos.common.servicenodes import ServiceNodeClient
+from pantos.common.servicenodes import \
+    ServiceNodeClient as _BaseServiceNodeClient
 from pantos.common.types import PrivateKey
+from pantos.common.types import TokenSymbol
 
 from pantos.client import BlockchainAddress
+from pantos.client.library.blockchains.base import BlockchainClient
+from pantos.client.library.blockchains.base import BlockchainClientError
 from pantos.client.library.blockchains.base import UnknownTransferError
+from pantos.client.library.business.bids import BidInteractor
+from pantos.client.library.business.tokens import TokenInteractor
 from pantos.client.library.business.tokens import TokenInteractorError
 from pantos.client.library.business.transfers import TransferInteractor
 from pantos.client.library.business.transfers import TransferInteractorError
 from pantos.client.library.entitites import DestinationTransferStatus
+from pantos.client.library.entitites import ServiceNodeTaskInfo
 from pantos.client.library.entitites import TokenTransferStatus
+from pantos.client.library.instrumentation import add_stage_hook
+from pantos.client.library.instrumentation import remove_stage_hook
+from pantos.client.library.servicenodes import ServiceNodeClient
 
 
 @unittest.mock.patch(
@@ -86,6 +99,85 @@ def test_get_token_transfer_status_confirmed_source_unknown_destination(
     assert expected_response == response
 
 
+@pytest.mark.parametrize('timestamp_error', [False, True])
+@pytest.mark.parametrize('service_node_status',
+                         [[Blockchain.ETHEREUM, Blockchain.POLYGON]],
+                         indirect=True)
+@unittest.mock.patch.object(ServiceNodeClient, 'status')
+@unittest.mock.patch('pantos.client.library.business.transfers.'
+                     'get_blockchain_client')
+def test_get_token_transfer_status_source_transaction_timestamp(
+        mocked_blockchain_client, mocked_sn_status, timestamp_error,
+        service_node_status, service_node_url, service_node_1, task_uuid):
+    mocked_blockchain_client().read_service_node_url.return_value = \
+        service_node_url
+    if timestamp_error:
+        mocked_blockchain_client().read_transaction_timestamp.side_effect = \
+            BlockchainClientError('')
+    else:
+        mocked_blockchain_client().read_transaction_timestamp.return_value = \
+            1700000000
+    mocked_blockchain_client().read_destination_transfer.side_effect = \
+        UnknownTransferError()
+    service_node_status.status = ServiceNodeTransferStatus.CONFIRMED
+    mocked_sn_status.return_value = service_node_status
+    request = TransferInteractor.TokenTransferStatusRequest(
+        service_node_status.source_blockchain, service_node_1, task_uuid, 50)
+
+    TransferInteractor().get_token_transfer_status(request)
+
+    # The source transaction timestamp is only read on demand
+    mocked_blockchain_client().read_transaction_timestamp.assert_not_called()
+    mocked_blockchain_client().read_destination_transfer.\
+        assert_called_once()
+    destination_transfer_request = mocked_blockchain_client().\
+        read_destination_transfer.call_args.args[0]
+    assert destination_transfer_request.source_blockchain is \
+        service_node_status.source_blockchain
+    assert destination_transfer_request.source_transaction_id == \
+        service_node_status.transaction_id
+    assert destination_transfer_request.blocks_to_search == 50
+    assert destination_transfer_request.\
+        source_transaction_timestamp_reader() == (
+            None if timestamp_error else 1700000000)
+    mocked_blockchain_client().read_transaction_timestamp.\
+        assert_called_once_with(service_node_status.transaction_id)
+
+
+@pytest.mark.parametrize('service_node_status',
+                         [[Blockchain.ETHEREUM, Blockchain.POLYGON]],
+                         indirect=True)
+@unittest.mock.patch.object(ServiceNodeClient, 'status')
+@unittest.mock.patch('pantos.client.library.business.transfers.'
+                     'get_blockchain_client')
+def test_get_token_transfer_status_unknown_destination_stage_succeeded(
+        mocked_blockchain_client, mocked_sn_status, service_node_status,
+        service_node_url, service_node_1, task_uuid):
+    mocked_blockchain_client().read_service_node_url.return_value = \
+        service_node_url
+    mocked_blockchain_client().read_destination_transfer.side_effect = \
+        UnknownTransferError()
+    service_node_status.status = ServiceNodeTransferStatus.CONFIRMED
+    mocked_sn_status.return_value = service_node_status
+    request = TransferInteractor.TokenTransferStatusRequest(
+        service_node_status.source_blockchain, service_node_1, task_uuid)
+    stage_records = []
+    add_stage_hook(stage_records.append)
+
+    try:
+        response = TransferInteractor().get_token_transfer_status(request)
+    finally:
+        remove_stage_hook(stage_records.append)
+
+    assert response.destination_transfer_status is \
+        DestinationTransferStatus.UNKNOWN
+    [destination_transfer_record] = [
+        stage_record for stage_record in stage_records
+        if stage_record.stage == 'destination_transfer'
+    ]
+    assert destination_transfer_record.succeeded
+
+
 @pytest.mark.parametrize('service_node_status',
                          [[source_blockchain, destination_blockchain]
                           for source_blockchain, destination_blockchain in
@@ -191,7 +283,7 @@ def test_get_token_transfer_status_error(service_node_1, task_uuid):
 
 
 def _create_minimal_expected_token_transfer_status(
-        service_node_status: ServiceNodeClient.TransferStatusResponse) \
+        service_node_status: _BaseServiceNodeClient.TransferStatusResponse) \
         -> TokenTransferStatus:
     return TokenTransferStatus(
         destination_blockchain=service_node_status.destination_blockchain,
@@ -202,3 +294,319 @@ def _create_minimal_expected_token_transfer_status(
         source_token_address=service_node_status.source_token_address,
         destination_token_address=service_node_status.
         destination_token_address, amount=service_node_status.token_amount)
+
+
+@unittest.mock.patch.object(ServiceNodeClient, 'submit_transfer')
+@unittest.mock.patch('pantos.client.library.business.transfers.'
+                     'get_blockchain_client')
+@unittest.mock.patch('pantos.client.library.business.transfers.'
+                     'BidInteractor.find_cheapest_service_node_bid')
+@unittest.mock.patch(
+    'pantos.client.library.business.transfers.'
+    'TokenInteractor.read_token_decimals', return_value=8)
+@unittest.mock.patch('pantos.client.library.business.transfers.'
+                     'TokenInteractor.find_token_addresses')
+def test_transfer_tokens_many_correct(
+        mocked_find_token_addresses, mocked_read_token_decimals,
+        mocked_find_cheapest_service_node_bid, mocked_get_blockchain_client,
+        mocked_submit_transfer, sender_private_key, sender_address,
+        sender_nonce, recipient_address, source_token_address,
+        destination_token_address, service_node_1, service_node_url, bids_1,
+        task_uuid):
+    mocked_find_token_addresses.return_value = \
+        TokenInteractor.FindTokenAddressesResponse(source_token_address,
+                                                   destination_token_address)
+    mocked_find_cheapest_service_node_bid.return_value = \
+        BidInteractor.CheapestServiceNodeBid(service_node_1, bids_1[3])
+    blockchain_client = mocked_get_blockchain_client()
+    blockchain_client.read_service_node_url.return_value = service_node_url
+    blockchain_client.compute_transfer_signatures.side_effect = \
+        lambda requests: [
+            BlockchainClient.ComputeTransferFromSignatureResponse(
+                sender_address, sender_nonce, 'signature')
+        ] * len(requests)
+    mocked_submit_transfer.return_value = task_uuid
+    requests = [
+        TransferInteractor.TransferTokensRequest(Blockchain.ETHEREUM,
+                                                 Blockchain.POLYGON,
+                                                 sender_private_key,
+                                                 recipient_address,
+                                                 TokenSymbol('pan'),
+                                                 token_amount)
+        for token_amount in [decimal.Decimal('1.5'), 10,
+                             decimal.Decimal(2)]
+    ]
+
+    results = TransferInteractor().transfer_tokens_many(requests)
+
+    assert results == [ServiceNodeTaskInfo(task_uuid, service_node_1)] * 3
+    mocked_find_token_addresses.assert_called_once()
+    mocked_read_token_decimals.assert_called_once()
+    mocked_find_cheapest_service_node_bid.assert_called_once()
+    blockchain_client.read_service_node_url.assert_called_once_with(
+        service_node_1)
+    submitted_amounts = sorted(
+        call.args[0].token_amount
+        for call in mocked_submit_transfer.call_args_list)
+    assert submitted_amounts == [10, 150000000, 200000000]
+
+
+@unittest.mock.patch.object(ServiceNodeClient, 'submit_transfer')
+@unittest.mock.patch('pantos.client.library.business.transfers.'
+                     'get_blockchain_client')
+@unittest.mock.patch('pantos.client.library.business.transfers.'
+                     'BidInteractor.find_cheapest_service_node_bid')
+@unittest.mock.patch(
+    'pantos.client.library.business.transfers.'
+    'TokenInteractor.read_token_decimals', return_value=8)
+@unittest.mock.patch('pantos.client.library.business.transfers.'
+                     'TokenInteractor.find_token_addresses')
+def test_transfer_tokens_many_instrumented(
+        mocked_find_token_addresses, mocked_read_token_decimals,
+        mocked_find_cheapest_service_node_bid, mocked_get_blockchain_client,
+        mocked_submit_transfer, sender_private_key, sender_address,
+        sender_nonce, recipient_address, source_token_address,
+        destination_token_address, service_node_1, service_node_url, bids_1,
+        task_uuid):
+    mocked_find_token_addresses.return_value = \
+        TokenInteractor.FindTokenAddressesResponse(source_token_address,
+                                                   destination_token_address)
+    mocked_find_cheapest_service_node_bid.return_value = \
+        BidInteractor.CheapestServiceNodeBid(service_node_1, bids_1[3])
+    blockchain_client = mocked_get_blockchain_client()
+    blockchain_client.read_service_node_url.return_value = service_node_url
+    blockchain_client.compute_transfer_signatures.side_effect = \
+        lambda requests: [
+            BlockchainClient.ComputeTransferFromSignatureResponse(
+                sender_address, sender_nonce, 'signature')
+        ] * len(requests)
+    mocked_submit_transfer.return_value = task_uuid
+    requests = [
+        TransferInteractor.TransferTokensRequest(Blockchain.ETHEREUM,
+                                                 Blockchain.POLYGON,
+                                                 sender_private_key,
+                                                 recipient_address,
+                                                 TokenSymbol('pan'),
+                                                 token_amount)
+        for token_amount in [decimal.Decimal('1.5'), 10]
+    ]
+    stage_records = []
+    add_stage_hook(stage_records.append)
+
+    try:
+        TransferInteractor().transfer_tokens_many(requests)
+    finally:
+        remove_stage_hook(stage_records.append)
+
+    assert all(stage_record.operation == 'transfer_tokens_many'
+               and stage_record.succeeded for stage_record in stage_records)
+    assert stage_records[-1].stage is None
+    stages = [stage_record.stage for stage_record in stage_records[:-1]]
+    assert sorted(stages) == [
+        'service_node_bid', 'service_node_submit', 'service_node_submit',
+        'service_node_url', 'token_addresses', 'token_amount', 'token_amount',
+        'token_decimals'
+    ]
+
+
+@unittest.mock.patch.object(ServiceNodeClient, 'submit_transfer')
+@unittest.mock.patch('pantos.client.library.business.transfers.'
+                     'get_blockchain_client')
+@unittest.mock.patch('pantos.client.library.business.transfers.'
+                     'TokenInteractor.find_token_addresses')
+def test_transfer_tokens_many_partial_failure(
+        mocked_find_token_addresses, mocked_get_blockchain_client,
+        mocked_submit_transfer, sender_private_key, sender_address,
+        sender_nonce, recipient_address, source_token_address, service_node_1,
+        service_node_url, bids_1, task_uuid):
+    mocked_find_token_addresses.side_effect = [
+        TokenInteractor.FindTokenAddressesResponse(source_token_address,
+                                                   source_token_address),
+        TokenInteractorError('unable to search for token addresses')
+    ]
+    blockchain_client = mocked_get_blockchain_client()
+    blockchain_client.read_service_node_url.return_value = service_node_url
+    blockchain_client.compute_transfer_signatures.side_effect = \
+        lambda requests: [
+            BlockchainClient.ComputeTransferSignatureResponse(
+                sender_address, sender_nonce, 'signature')
+        ] * len(requests)
+    blockchain_client.is_valid_recipient_address.side_effect = \
+        lambda address: address == recipient_address
+    mocked_submit_transfer.return_value = task_uuid
+    unknown_token_address = BlockchainAddress(
+        '0x0000000000000000000000000000000000000001')
+    requests = [
+        TransferInteractor.TransferTokensRequest(Blockchain.ETHEREUM,
+                                                 Blockchain.ETHEREUM,
+                                                 sender_private_key,
+                                                 recipient_address,
+                                                 source_token_address, 10,
+                                                 (service_node_1, bids_1[0])),
+        TransferInteractor.TransferTokensRequest(Blockchain.ETHEREUM,
+                                                 Blockchain.ETHEREUM,
+                                                 sender_private_key,
+                                                 recipient_address,
+                                                 unknown_token_address, 10,
+                                                 (service_node_1, bids_1[0])),
+        TransferInteractor.TransferTokensRequest(Blockchain.ETHEREUM,
+                                                 Blockchain.ETHEREUM,
+                                                 sender_private_key,
+                                                 BlockchainAddress('invalid'),
+                                                 source_token_address, 10,
+                                                 (service_node_1, bids_1[0]))
+    ]
+
+    results = TransferInteractor().transfer_tokens_many(requests)
+
+    assert results[0] == ServiceNodeTaskInfo(task_uuid, service_node_1)
+    assert isinstance(results[1], TransferInteractorError)
+    assert isinstance(results[2], TransferInteractorError)
+    mocked_submit_transfer.assert_called_once()
+
+
+@unittest.mock.patch.object(ServiceNodeClient, 'submit_transfer')
+@unittest.mock.patch('pantos.client.library.business.transfers.'
+                     'get_blockchain_client')
+@unittest.mock.patch('pantos.client.library.business.transfers.'
+                     'TokenInteractor.find_token_addresses')
+def test_transfer_tokens_many_signed_together(
+        mocked_find_token_addresses, mocked_get_blockchain_client,
+        mocked_submit_transfer, sender_private_key, sender_address,
+        sender_nonce, recipient_address, source_token_address,
+        destination_token_address, service_node_1, service_node_url, bids_1,
+        task_uuid):
+    mocked_find_token_addresses.return_value = \
+        TokenInteractor.FindTokenAddressesResponse(source_token_address,
+                                                   destination_token_address)
+    blockchain_client = mocked_get_blockchain_client()
+    blockchain_client.read_service_node_url.return_value = service_node_url
+    blockchain_client.compute_transfer_signatures.side_effect = \
+        lambda requests: [
+            BlockchainClient.ComputeTransferSignatureResponse(
+                sender_address, sender_nonce, 'signature'),
+            BlockchainClientError(''),
+            BlockchainClient.ComputeTransferFromSignatureResponse(
+                sender_address, sender_nonce + 1, 'signature')
+        ]
+    mocked_submit_transfer.return_value = task_uuid
+    requests = [
+        TransferInteractor.TransferTokensRequest(Blockchain.ETHEREUM,
+                                                 destination_blockchain,
+                                                 sender_private_key,
+                                                 recipient_address,
+                                                 source_token_address, 10,
+                                                 (service_node_1, bids_1[0]))
+        for destination_blockchain in
+        [Blockchain.ETHEREUM, Blockchain.ETHEREUM, Blockchain.POLYGON]
+    ]
+
+    results = TransferInteractor().transfer_tokens_many(requests)
+
+    assert results[0] == ServiceNodeTaskInfo(task_uuid, service_node_1)
+    assert isinstance(results[1], TransferInteractorError)
+    assert results[2] == ServiceNodeTaskInfo(task_uuid, service_node_1)
+    blockchain_client.compute_transfer_signatures.assert_called_once()
+    signature_requests = \
+        blockchain_client.compute_transfer_signatures.call_args.args[0]
+    assert [
+        type(signature_request) for signature_request in signature_requests
+    ] == [
+        BlockchainClient.ComputeTransferSignatureRequest,
+        BlockchainClient.ComputeTransferSignatureRequest,
+        BlockchainClient.ComputeTransferFromSignatureRequest
+    ]
+    assert sorted(call.args[0].sender_nonce
+                  for call in mocked_submit_transfer.call_args_list) == [
+                      sender_nonce, sender_nonce + 1
+                  ]
+
+
+@pytest.mark.parametrize('service_node_status',
+                         [[Blockchain.ETHEREUM, Blockchain.POLYGON]],
+                         indirect=True)
+@unittest.mock.patch.object(ServiceNodeClient, 'status')
+@unittest.mock.patch('pantos.client.library.business.transfers.'
+                     'get_blockchain_config')
+@unittest.mock.patch('pantos.client.library.business.transfers.'
+                     'get_blockchain_client')
+def test_get_token_transfer_statuses_correct(mocked_blockchain_client,
+                                             mocked_blockchain_config,
+                                             mocked_sn_status,
+                                             service_node_status,
+                                             destination_transfer_response,
+                                             service_node_url, service_node_1):
+    task_ids = [uuid.uuid4() for _ in range(5)]
+    service_node_statuses = {
+        task_ids[0]: dataclasses.replace(
+            service_node_status, task_id=task_ids[0],
+            status=ServiceNodeTransferStatus.CONFIRMED, transaction_id='0xa'),
+        task_ids[1]: dataclasses.replace(
+            service_node_status, task_id=task_ids[1],
+            status=ServiceNodeTransferStatus.CONFIRMED, transaction_id='0xb'),
+        task_ids[2]: dataclasses.replace(service_node_status,
+                                         task_id=task_ids[2]),
+        task_ids[4]: dataclasses.replace(
+            service_node_status, task_id=task_ids[4],
+            destination_blockchain=Blockchain.CELO,
+            status=ServiceNodeTransferStatus.CONFIRMED, transaction_id='0xc')
+    }
+
+    def status(service_node_url, task_id):
+        if task_id not in service_node_statuses:
+            raise Exception
+        return service_node_statuses[task_id]
+
+    def read_destination_transfers(requests):
+        source_transaction_ids = [
+            request.source_transaction_id for request in requests
+        ]
+        if source_transaction_ids == ['0xc']:
+            raise BlockchainClientError('')
+        assert sorted(source_transaction_ids) == ['0xa', '0xb']
+        return [
+            destination_transfer_response
+            if source_transaction_id == '0xa' else None
+            for source_transaction_id in source_transaction_ids
+        ]
+
+    mocked_blockchain_client().read_service_node_url.return_value = \
+        service_node_url
+    mocked_blockchain_client().read_transaction_timestamp.return_value = \
+        1700000000
+    mocked_blockchain_client().read_destination_transfers.side_effect = \
+        read_destination_transfers
+    mocked_blockchain_config().__getitem__.return_value = 1
+    mocked_sn_status.side_effect = status
+    requests = [
+        TransferInteractor.TokenTransferStatusRequest(Blockchain.ETHEREUM,
+                                                      service_node_1, task_id)
+        for task_id in task_ids
+    ]
+
+    results = TransferInteractor().get_token_transfer_statuses(requests)
+
+    assert len(results) == 5
+    assert results[0].source_transaction_id == '0xa'
+    assert results[0].destination_transfer_status is \
+        DestinationTransferStatus.CONFIRMED
+    assert results[0].destination_transaction_id == \
+        destination_transfer_response.destination_transaction_id
+    assert results[1].source_transaction_id == '0xb'
+    assert results[1].destination_transfer_status is \
+        DestinationTransferStatus.UNKNOWN
+    assert results[2] == _create_minimal_expected_token_transfer_status(
+        service_node_statuses[task_ids[2]])
+    assert isinstance(results[3], TransferInteractorError)
+    assert isinstance(results[4], TransferInteractorError)
+    # A single search per destination blockchain
+    assert mocked_blockchain_client().read_destination_transfers.\
+        call_count == 2
+    mocked_blockchain_client().read_destination_transfer.assert_not_called()
+
+
+@unittest.mock.patch('pantos.client.library.business.transfers.'
+                     'get_blockchain_client')
+def test_get_token_transfer_statuses_empty(mocked_blockchain_client):
+    assert TransferInteractor().get_token_transfer_statuses([]) == []
+    mocked_blockchain_client().read_destination_transfers.assert_not_called()
@@ -0,0 +1,298 @@
+import asyncio
+import threading
+import unittest.mock
+import uuid
+
+import pytest
+from pantos.common.blockchains.base import Blockchain
+from pantos.common.entities import ServiceNodeTransferStatus
+
+from pantos.client.library.business.transfers import TransferInteractor
+from pantos.client.library.business.transfers import TransferInteractorError
+from pantos.client.library.business.watchers import TransferWatcher
+from pantos.client.library.entitites import DestinationTransferStatus
+from pantos.client.library.entitites import ServiceNodeTaskInfo
+from pantos.client.library.entitites import TokenTransferStatus
+
+_CURRENT_TIME = 1000
+
+_BLOCKCHAIN_CONFIGS = {
+    Blockchain.ETHEREUM: {
+        'average_block_time': 12,
+        'confirmations': 5
+    },
+    Blockchain.POLYGON: {
+        'average_block_time': 2,
+        'confirmations': 20
+    }
+}
+
+
+def _token_transfer_status(
+        source_transfer_status,
+        destination_transfer_status=DestinationTransferStatus.UNKNOWN):
+    return TokenTransferStatus(Blockchain.POLYGON, source_transfer_status,
+                               destination_transfer_status)
+
+
+@pytest.fixture(autouse=True)
+def mocked_blockchain_config():
+    with unittest.mock.patch(
+            'pantos.client.library.business.watchers.get_blockchain_config',
+            side_effect=_BLOCKCHAIN_CONFIGS.__getitem__) as \
+            mocked_blockchain_config:
+        yield mocked_blockchain_config
+
+
+@pytest.fixture
+def mocked_time():
+    with unittest.mock.patch(
+            'pantos.client.library.business.watchers.time') as mocked_time:
+        mocked_time.time.return_value = _CURRENT_TIME
+        yield mocked_time
+
+
+@pytest.fixture
+def service_node_task_info(service_node_1):
+    return ServiceNodeTaskInfo(uuid.uuid4(), service_node_1)
+
+
+@pytest.mark.parametrize('execution_time_poll_time',
+                         [(None, _CURRENT_TIME + 12),
+                          (300, _CURRENT_TIME + 300)])
+def test_watch_correct(execution_time_poll_time, mocked_time,
+                       service_node_task_info):
+    execution_time, expected_poll_time = execution_time_poll_time
+    transfer_watcher = TransferWatcher()
+
+    transfer_watcher.watch(Blockchain.ETHEREUM, service_node_task_info,
+                           execution_time)
+    transfer_watcher.watch(Blockchain.ETHEREUM, service_node_task_info, 1)
+
+    assert len(transfer_watcher) == 1
+    assert transfer_watcher.get_next_poll_time() == expected_poll_time
+
+
+def test_unwatch_correct(mocked_time, service_node_task_info):
+    transfer_watcher = TransferWatcher()
+    transfer_watcher.watch(Blockchain.ETHEREUM, service_node_task_info)
+
+    transfer_watcher.unwatch(Blockchain.ETHEREUM, service_node_task_info)
+
+    assert len(transfer_watcher) == 0
+    assert transfer_watcher.get_next_poll_time() is None
+
+
+@unittest.mock.patch.object(TransferInteractor, 'get_token_transfer_statuses')
+def test_poll_not_due(mocked_get_token_transfer_statuses, mocked_time,
+                      service_node_task_info):
+    transfer_watcher = TransferWatcher()
+    transfer_watcher.watch(Blockchain.ETHEREUM, service_node_task_info, 60)
+    mocked_time.time.return_value = _CURRENT_TIME + 59
+
+    changes = transfer_watcher.poll()
+
+    assert changes == []
+    mocked_get_token_transfer_statuses.assert_not_called()
+
+
+@unittest.mock.patch.object(TransferInteractor, 'get_token_transfer_statuses')
+def test_poll_transfer_lifecycle(mocked_get_token_transfer_statuses,
+                                 mocked_time, service_node_task_info):
+    # Status returned by each poll and expected number of seconds until
+    # the next poll
+    statuses_poll_intervals = [
+        (_token_transfer_status(ServiceNodeTransferStatus.ACCEPTED), 12),
+        (_token_transfer_status(ServiceNodeTransferStatus.SUBMITTED), 60),
+        (_token_transfer_status(ServiceNodeTransferStatus.CONFIRMED), 2),
+        (_token_transfer_status(ServiceNodeTransferStatus.CONFIRMED,
+                                DestinationTransferStatus.SUBMITTED), 40),
+        (_token_transfer_status(ServiceNodeTransferStatus.CONFIRMED,
+                                DestinationTransferStatus.CONFIRMED), None)
+    ]
+    callback = unittest.mock.Mock()
+    transfer_watcher = TransferWatcher(100)
+    transfer_watcher.add_callback(callback)
+    transfer_watcher.watch(Blockchain.ETHEREUM, service_node_task_info, 30)
+    previous_status = None
+    for status, poll_interval in statuses_poll_intervals:
+        poll_time = transfer_watcher.get_next_poll_time()
+        mocked_time.time.return_value = poll_time
+        mocked_get_token_transfer_statuses.return_value = [status]
+
+        changes = transfer_watcher.poll()
+
+        assert len(changes) == 1
+        assert changes[0].source_blockchain is Blockchain.ETHEREUM
+        assert changes[0].service_node_task_info == service_node_task_info
+        assert changes[0].previous_status == previous_status
+        assert changes[0].status == status
+        callback.assert_called_with(changes[0])
+        if poll_interval is None:
+            assert transfer_watcher.get_next_poll_time() is None
+        else:
+            assert transfer_watcher.get_next_poll_time() == \
+                poll_time + poll_interval
+        previous_status = status
+    assert len(transfer_watcher) == 0
+    assert callback.call_count == len(statuses_poll_intervals)
+    mocked_get_token_transfer_statuses.assert_called_with([
+        TransferInteractor.TokenTransferStatusRequest(
+            Blockchain.ETHEREUM, service_node_task_info.service_node_address,
+            service_node_task_info.task_id, 100)
+    ])
+
+
+@pytest.mark.parametrize(
+    'source_transfer_status',
+    [ServiceNodeTransferStatus.FAILED, ServiceNodeTransferStatus.REVERTED])
+@unittest.mock.patch.object(TransferInteractor, 'get_token_transfer_statuses')
+def test_poll_failed_transfer_dropped(mocked_get_token_transfer_statuses,
+                                      source_transfer_status, mocked_time,
+                                      service_node_task_info):
+    transfer_watcher = TransferWatcher()
+    transfer_watcher.watch(Blockchain.ETHEREUM, service_node_task_info, 0)
+    mocked_get_token_transfer_statuses.return_value = [
+        _token_transfer_status(source_transfer_status)
+    ]
+
+    changes = transfer_watcher.poll()
+
+    assert len(changes) == 1
+    assert len(transfer_watcher) == 0
+
+
+@pytest.mark.parametrize(
+    'status_poll_intervals',
+    [(_token_transfer_status(
+        ServiceNodeTransferStatus.ACCEPTED), [24, 48, 96, 192, 384]),
+     (TransferInteractorError(''), [400, 600, 600, 600, 600])])
+@unittest.mock.patch.object(TransferInteractor, 'get_token_transfer_statuses')
+def test_poll_unchanged_status_backed_off(mocked_get_token_transfer_statuses,
+                                          status_poll_intervals, mocked_time,
+                                          service_node_task_info):
+    status, expected_poll_intervals = status_poll_intervals
+    transfer_watcher = TransferWatcher()
+    transfer_watcher.watch(Blockchain.ETHEREUM, service_node_task_info, 100)
+    mocked_get_token_transfer_statuses.return_value = [status]
+    mocked_time.time.return_value = transfer_watcher.get_next_poll_time()
+    transfer_watcher.poll()
+    poll_intervals = []
+    for _ in expected_poll_intervals:
+        poll_time = transfer_watcher.get_next_poll_time()
+        mocked_time.time.return_value = poll_time
+
+        changes = transfer_watcher.poll()
+
+        assert changes == []
+        poll_intervals.append(transfer_watcher.get_next_poll_time() -
+                              poll_time)
+
+    assert poll_intervals == expected_poll_intervals
+    assert len(transfer_watcher) == 1
+
+
+@unittest.mock.patch.object(TransferInteractor, 'get_token_transfer_statuses')
+def test_poll_error_rescheduled(mocked_get_token_transfer_statuses,
+                                mocked_time, service_node_task_info):
+    transfer_watcher = TransferWatcher()
+    transfer_watcher.watch(Blockchain.ETHEREUM, service_node_task_info, 100)
+    mocked_get_token_transfer_statuses.side_effect = RuntimeError
+    poll_time = transfer_watcher.get_next_poll_time()
+    mocked_time.time.return_value = poll_time
+
+    with pytest.raises(RuntimeError):
+        transfer_watcher.poll()
+
+    assert len(transfer_watcher) == 1
+    assert transfer_watcher.get_next_poll_time() == poll_time + 200
+
+
+@unittest.mock.patch.object(TransferInteractor, 'get_token_transfer_statuses')
+def test_poll_due_transfers_batched(mocked_get_token_transfer_statuses,
+                                    mocked_time, service_node_1):
+    service_node_task_infos = [
+        ServiceNodeTaskInfo(uuid.uuid4(), service_node_1) for _ in range(3)
+    ]
+    transfer_watcher = TransferWatcher()
+    for execution_time, service_node_task_info in zip([10, 20, 30],
+                                                      service_node_task_infos):
+        transfer_watcher.watch(Blockchain.ETHEREUM, service_node_task_info,
+                               execution_time)
+    mocked_get_token_transfer_statuses.return_value = [
+        _token_transfer_status(ServiceNodeTransferStatus.ACCEPTED)
+    ] * 2
+    mocked_time.time.return_value = _CURRENT_TIME + 25
+
+    changes = transfer_watcher.poll()
+
+    assert [change.service_node_task_info
+            for change in changes] == service_node_task_infos[:2]
+    mocked_get_token_transfer_statuses.assert_called_once()
+    assert [
+        request.service_node_task_id
+        for request in mocked_get_token_transfer_statuses.call_args.args[0]
+    ] == [
+        service_node_task_info.task_id
+        for service_node_task_info in service_node_task_infos[:2]
+    ]
+
+
+@unittest.mock.patch.object(TransferInteractor, 'get_token_transfer_statuses')
+def test_run_until_no_transfers_watched(mocked_get_token_transfer_statuses,
+                                        service_node_task_info):
+    mocked_get_token_transfer_statuses.return_value = [
+        _token_transfer_status(ServiceNodeTransferStatus.CONFIRMED,
+                               DestinationTransferStatus.CONFIRMED)
+    ]
+    callback = unittest.mock.Mock()
+    transfer_watcher = TransferWatcher()
+    transfer_watcher.add_callback(callback)
+    transfer_watcher.watch(Blockchain.ETHEREUM, service_node_task_info, 0)
+
+    transfer_watcher.run()
+
+    callback.assert_called_once()
+    assert len(transfer_watcher) == 0
+
+
+@unittest.mock.patch.object(TransferInteractor, 'get_token_transfer_statuses')
+def test_run_stopped(mocked_get_token_transfer_statuses,
+                     service_node_task_info):
+    stop_event = threading.Event()
+    stop_event.set()
+    transfer_watcher = TransferWatcher()
+    transfer_watcher.watch(Blockchain.ETHEREUM, service_node_task_info, 0)
+
+    transfer_watcher.run(stop_event)
+
+    mocked_get_token_transfer_statuses.assert_not_called()
+    assert len(transfer_watcher) == 1
+
+
+@unittest.mock.patch.object(TransferInteractor, 'get_token_transfer_statuses')
+def test_changes_correct(mocked_get_token_transfer_statuses, mocked_time,
+                         service_node_task_info):
+    statuses = [
+        _token_transfer_status(ServiceNodeTransferStatus.ACCEPTED),
+        _token_transfer_status(ServiceNodeTransferStatus.ACCEPTED),
+        _token_transfer_status(ServiceNodeTransferStatus.CONFIRMED,
+                               DestinationTransferStatus.CONFIRMED)
+    ]
+    mocked_get_token_transfer_statuses.side_effect = [[status]
+                                                      for status in statuses]
+    transfer_watcher = TransferWatcher()
+    transfer_watcher.watch(Blockchain.ETHEREUM, service_node_task_info, 30)
+
+    async def sleep(delay):
+        mocked_time.time.return_value += delay
+
+    async def collect_changes():
+        return [change async for change in transfer_watcher.changes()]
+
+    with unittest.mock.patch('asyncio.sleep', side_effect=sleep):
+        changes = asyncio.run(collect_changes())
+
+    assert [change.status for change in changes] == [statuses[0], statuses[2]]
+    assert mocked_get_token_transfer_statuses.call_count == 3
+    assert mocked_time.time.return_value == _CURRENT_TIME + 30 + 12 + 24
@@ -1,6 +1,7 @@
 """Shared fixtures for all pantos.client.library package tests.
 
 """
+import unittest.mock
 import uuid
 
 import hexbytes
@@ -14,6 +15,9 @@ from pantos.common.types import BlockchainAddress
 from pantos.common.types import PrivateKey
 
 from pantos.client.library.blockchains.base import BlockchainClient
+from pantos.client.library.business.bids import service_node_bid_cache
+from pantos.client.library.business.tokens import token_decimals_cache
+from pantos.client.library.executors import SharedExecutor
 from pantos.client.library.protocol import get_supported_protocol_versions
 
 _BLOCK_NUMBER = 1
@@ -107,6 +111,29 @@ _BIDS_2 = [
 ]
 
 
+@pytest.fixture(autouse=True)
+def clear_token_decimals_cache():
+    token_decimals_cache.clear()
+    yield
+    token_decimals_cache.clear()
+
+
+@pytest.fixture(autouse=True)
+def clear_service_node_bid_cache():
+    service_node_bid_cache.clear()
+    yield
+    service_node_bid_cache.clear()
+
+
+@pytest.fixture(scope='session', autouse=True)
+def shared_executor():
+    shared_executor = SharedExecutor(8)
+    with unittest.mock.patch('pantos.client.library.executors._executor',
+                             shared_executor):
+        yield shared_executor
+    shared_executor.shutdown(cancel_futures=True)
+
+
 @pytest.fixture(params=get_supported_protocol_versions())
 def protocol_version(request):
     return request.param
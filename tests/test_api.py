@@ -1,12 +1,32 @@
 import unittest.mock
 
+import pytest
 from pantos.common.blockchains.base import Blockchain
+from pantos.common.configuration import ConfigError
+from pantos.common.types import TokenSymbol
 
+from pantos.client.library.api import FastestExecutionPolicy
+from pantos.client.library.api import PantosClient
+from pantos.client.library.api import create_transfer_watcher
 from pantos.client.library.api import deploy_pantos_compatible_token
+from pantos.client.library.api import find_acceptable_service_node_bid
+from pantos.client.library.api import find_best_service_node_bids
 from pantos.client.library.api import get_token_transfer_status
+from pantos.client.library.api import get_token_transfer_statuses
+from pantos.client.library.api import prewarm_blockchain_clients
+from pantos.client.library.api import retrieve_token_balances
+from pantos.client.library.api import stream_service_node_bids
+from pantos.client.library.api import transfer_tokens_many
+from pantos.client.library.business.bids import BidInteractor
 from pantos.client.library.business.deployments import \
     TokenDeploymentInteractor
+from pantos.client.library.business.tokens import TokenInteractor
 from pantos.client.library.business.transfers import TransferInteractor
+from pantos.client.library.business.watchers import TransferWatcher
+from pantos.client.library.context import get_client_context
+from pantos.client.library.entitites import ServiceNodeTaskInfo
+from pantos.client.library.entitites import TokenTransfer
+from pantos.client.library.exceptions import ClientLibraryError
 
 
 @unittest.mock.patch('pantos.client.library.api._initialize_library')
@@ -35,3 +55,242 @@ def test_get_token_transfer_status_correct(mocked_initialize_library,
         TransferInteractor.TokenTransferStatusRequest(Blockchain.ETHEREUM,
                                                       service_node_1,
                                                       task_uuid))
+
+
+@unittest.mock.patch.object(TransferInteractor, 'get_token_transfer_statuses')
+@unittest.mock.patch('pantos.client.library.api._initialize_library')
+def test_get_token_transfer_statuses_correct(
+        mocked_initialize_library, mocked_get_token_transfer_statuses,
+        service_node_1, task_uuid):
+    mocked_get_token_transfer_statuses.return_value = [unittest.mock.sentinel]
+
+    results = get_token_transfer_statuses([
+        (Blockchain.ETHEREUM, ServiceNodeTaskInfo(task_uuid, service_node_1))
+    ], 100)
+
+    assert results == [unittest.mock.sentinel]
+    mocked_initialize_library.assert_called_once()
+    mocked_get_token_transfer_statuses.assert_called_once_with([
+        TransferInteractor.TokenTransferStatusRequest(Blockchain.ETHEREUM,
+                                                      service_node_1,
+                                                      task_uuid, 100)
+    ])
+
+
+@unittest.mock.patch('pantos.client.library.api._initialize_library')
+def test_create_transfer_watcher_correct(mocked_initialize_library):
+    transfer_watcher = create_transfer_watcher(mainnet=True)
+
+    assert isinstance(transfer_watcher, TransferWatcher)
+    assert len(transfer_watcher) == 0
+    mocked_initialize_library.assert_called_once_with(True)
+
+
+@unittest.mock.patch.object(TransferInteractor, 'transfer_tokens_many')
+@unittest.mock.patch('pantos.client.library.api._initialize_library')
+def test_transfer_tokens_many_correct(mocked_initialize_library,
+                                      mocked_transfer_tokens_many,
+                                      sender_private_key, recipient_address,
+                                      service_node_1, task_uuid):
+    token_transfer = TokenTransfer(Blockchain.ETHEREUM, Blockchain.POLYGON,
+                                   sender_private_key, recipient_address,
+                                   TokenSymbol('pan'), 10)
+    mocked_transfer_tokens_many.return_value = [
+        ServiceNodeTaskInfo(task_uuid, service_node_1)
+    ]
+
+    results = transfer_tokens_many([token_transfer])
+
+    assert results == [ServiceNodeTaskInfo(task_uuid, service_node_1)]
+    mocked_initialize_library.assert_called_once()
+    mocked_transfer_tokens_many.assert_called_once_with([
+        TransferInteractor.TransferTokensRequest(Blockchain.ETHEREUM,
+                                                 Blockchain.POLYGON,
+                                                 sender_private_key,
+                                                 recipient_address,
+                                                 TokenSymbol('pan'), 10)
+    ])
+
+
+@unittest.mock.patch.object(TokenInteractor, 'retrieve_token_balances',
+                            return_value=[1, 2])
+@unittest.mock.patch('pantos.client.library.api._initialize_library')
+def test_retrieve_token_balances_correct(mocked_initialize_library,
+                                         mocked_retrieve_token_balances,
+                                         sender_address, recipient_address):
+    account_token_ids = [(sender_address, TokenSymbol('pan')),
+                         (recipient_address, TokenSymbol('pan'))]
+
+    token_balances = retrieve_token_balances(Blockchain.ETHEREUM,
+                                             account_token_ids, False)
+
+    assert token_balances == [1, 2]
+    mocked_initialize_library.assert_called_once()
+    mocked_retrieve_token_balances.assert_called_once_with(
+        TokenInteractor.RetrieveTokenBalancesRequest(Blockchain.ETHEREUM,
+                                                     account_token_ids, False))
+
+
+@unittest.mock.patch.object(BidInteractor, 'find_acceptable_service_node_bid')
+@unittest.mock.patch('pantos.client.library.api._initialize_library')
+def test_find_acceptable_service_node_bid_correct(
+        mocked_initialize_library, mocked_find_acceptable_service_node_bid,
+        service_node_1, bids_1):
+    mocked_find_acceptable_service_node_bid.return_value = \
+        BidInteractor.AcceptableServiceNodeBid(service_node_1, bids_1[3])
+
+    service_node_bid = find_acceptable_service_node_bid(
+        Blockchain.ETHEREUM, Blockchain.POLYGON, 10, 2.5, mainnet=True)
+
+    assert service_node_bid == (service_node_1, bids_1[3])
+    mocked_initialize_library.assert_called_once_with(True)
+    mocked_find_acceptable_service_node_bid.assert_called_once_with(
+        Blockchain.ETHEREUM, Blockchain.POLYGON, 10, 2.5)
+
+
+@unittest.mock.patch.object(BidInteractor, 'find_best_service_node_bids')
+@unittest.mock.patch('pantos.client.library.api._initialize_library')
+def test_find_best_service_node_bids_correct(
+        mocked_initialize_library, mocked_find_best_service_node_bids,
+        service_node_1, service_node_2, bids_1, bids_2):
+    policy = FastestExecutionPolicy()
+    mocked_find_best_service_node_bids.return_value = [
+        BidInteractor.RankedServiceNodeBid(service_node_1, bids_1[3]),
+        BidInteractor.RankedServiceNodeBid(service_node_2, bids_2[3])
+    ]
+
+    service_node_bids = find_best_service_node_bids(Blockchain.ETHEREUM,
+                                                    Blockchain.POLYGON, policy,
+                                                    2, mainnet=True)
+
+    assert service_node_bids == [(service_node_1, bids_1[3]),
+                                 (service_node_2, bids_2[3])]
+    mocked_initialize_library.assert_called_once_with(True)
+    mocked_find_best_service_node_bids.assert_called_once_with(
+        Blockchain.ETHEREUM, Blockchain.POLYGON, policy, 2)
+
+
+@unittest.mock.patch.object(BidInteractor, 'stream_service_node_bids')
+@unittest.mock.patch('pantos.client.library.api._initialize_library')
+def test_stream_service_node_bids_correct(mocked_initialize_library,
+                                          mocked_stream_service_node_bids,
+                                          service_node_1, bids_1):
+    mocked_stream_service_node_bids.return_value = iter([(service_node_1,
+                                                          bids_1)])
+
+    bid_pairs = stream_service_node_bids(Blockchain.ETHEREUM,
+                                         Blockchain.POLYGON)
+
+    mocked_initialize_library.assert_called_once_with(False)
+    assert list(bid_pairs) == [(service_node_1, bids_1)]
+    mocked_stream_service_node_bids.assert_called_once_with(
+        Blockchain.ETHEREUM, Blockchain.POLYGON, True, None)
+
+
+@unittest.mock.patch('pantos.client.library.api._prewarm_blockchain_clients')
+@unittest.mock.patch('pantos.client.library.api._initialize_library')
+def test_prewarm_blockchain_clients_correct(mocked_initialize_library,
+                                            mocked_prewarm_blockchain_clients):
+    prewarm_blockchain_clients([Blockchain.ETHEREUM, Blockchain.POLYGON],
+                               mainnet=True)
+
+    mocked_initialize_library.assert_called_once_with(True)
+    mocked_prewarm_blockchain_clients.assert_called_once_with(
+        [Blockchain.ETHEREUM, Blockchain.POLYGON])
+
+
+@unittest.mock.patch('pantos.client.library.api._check_protocol_version')
+@unittest.mock.patch('pantos.client.library.api._create_config')
+@unittest.mock.patch.object(TokenInteractor, 'retrieve_token_balances')
+def test_pantos_client_own_context_correct(mocked_retrieve_token_balances,
+                                           mocked_create_config,
+                                           mocked_check_protocol_version,
+                                           sender_address):
+    client_contexts = []
+    mocked_retrieve_token_balances.side_effect = \
+        lambda _: client_contexts.append(get_client_context())
+
+    with PantosClient('client.yml', mainnet=True) as client:
+        client.retrieve_token_balances(Blockchain.ETHEREUM,
+                                       [(sender_address, TokenSymbol('pan'))])
+        client.retrieve_token_balances(Blockchain.ETHEREUM,
+                                       [(sender_address, TokenSymbol('pan'))])
+
+    assert client.mainnet
+    assert client_contexts[0] is not None
+    assert client_contexts[0] is client_contexts[1]
+    assert client_contexts[0].config is mocked_create_config.return_value
+    assert get_client_context() is None
+    mocked_create_config.assert_called_once_with('client.yml')
+    mocked_check_protocol_version.assert_called_once_with(True)
+
+
+@unittest.mock.patch('pantos.client.library.api._check_protocol_version')
+@unittest.mock.patch('pantos.client.library.api._create_config')
+def test_pantos_client_separate_contexts_correct(
+        mocked_create_config, mocked_check_protocol_version):
+    first_client = PantosClient()
+    second_client = PantosClient()
+
+    first_transfer_watcher = first_client.create_transfer_watcher()
+    second_transfer_watcher = second_client.create_transfer_watcher()
+
+    with first_client._activate():
+        first_client_context = get_client_context()
+    with second_client._activate():
+        second_client_context = get_client_context()
+    assert first_client_context is not second_client_context
+    assert isinstance(first_transfer_watcher, TransferWatcher)
+    assert isinstance(second_transfer_watcher, TransferWatcher)
+    assert mocked_create_config.call_count == 2
+    mocked_check_protocol_version.assert_has_calls(
+        [unittest.mock.call(False),
+         unittest.mock.call(False)])
+
+
+@unittest.mock.patch('pantos.client.library.api._check_protocol_version')
+@unittest.mock.patch('pantos.client.library.api._create_config')
+@unittest.mock.patch.object(BidInteractor, 'stream_service_node_bids')
+def test_pantos_client_stream_service_node_bids_correct(
+        mocked_stream_service_node_bids, mocked_create_config,
+        mocked_check_protocol_version, service_node_1, bids_1):
+    def stream_service_node_bids(*args):
+        yield get_client_context(), bids_1
+
+    mocked_stream_service_node_bids.side_effect = stream_service_node_bids
+    client = PantosClient()
+
+    bid_pairs = list(
+        client.stream_service_node_bids(Blockchain.ETHEREUM,
+                                        Blockchain.POLYGON))
+
+    with client._activate():
+        client_context = get_client_context()
+    assert bid_pairs == [(client_context, bids_1)]
+
+
+@unittest.mock.patch('pantos.client.library.api._create_config',
+                     side_effect=ConfigError(''))
+def test_pantos_client_config_error(mocked_create_config):
+    client = PantosClient()
+
+    with pytest.raises(ClientLibraryError):
+        client.prewarm_token_decimals([Blockchain.ETHEREUM])
+
+
+@unittest.mock.patch('pantos.client.library.api._check_protocol_version')
+@unittest.mock.patch('pantos.client.library.api._create_config')
+def test_pantos_client_close_correct(mocked_create_config,
+                                     mocked_check_protocol_version):
+    client = PantosClient()
+    with client._activate():
+        client_context = get_client_context()
+    closer = unittest.mock.MagicMock()
+    client_context.get_resource('resource', lambda: 'resource', closer)
+
+    client.close()
+
+    closer.assert_called_once_with('resource')
+    with client._activate():
+        assert get_client_context() is not client_context
+    assert mocked_create_config.call_count == 2
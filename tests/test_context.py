@@ -0,0 +1,160 @@
+import threading
+import unittest.mock
+
+import pytest
+from pantos.common.configuration import Config
+
+from pantos.client.library.configuration import config
+from pantos.client.library.context import ClientContext
+from pantos.client.library.context import activate_client_context
+from pantos.client.library.context import bind_client_context
+from pantos.client.library.context import bind_client_context_iterator
+from pantos.client.library.context import get_client_context
+from pantos.client.library.executors import get_executor
+
+
+@pytest.fixture
+def client_config():
+    client_config = unittest.mock.MagicMock(spec=Config)
+    client_config.is_loaded.return_value = True
+    client_config.__getitem__.side_effect = {
+        'executor': {
+            'max_workers': 2
+        }
+    }.__getitem__
+    return client_config
+
+
+@pytest.fixture
+def client_context(client_config):
+    client_context = ClientContext(client_config)
+    yield client_context
+    client_context.close()
+
+
+def test_activate_correct(client_context):
+    assert get_client_context() is None
+
+    with client_context.activate():
+        assert get_client_context() is client_context
+
+    assert get_client_context() is None
+
+
+def test_activate_client_context_none_correct(client_context):
+    with client_context.activate():
+        with activate_client_context(None):
+            assert get_client_context() is client_context
+
+
+def test_config_delegated_correct(client_context):
+    with client_context.activate():
+        assert config.is_loaded()
+        assert config['executor'] == {'max_workers': 2}
+
+
+def test_get_resource_created_once_correct(client_context):
+    create = unittest.mock.MagicMock(side_effect=get_client_context)
+
+    first_resource = client_context.get_resource('resource', create)
+    second_resource = client_context.get_resource('resource', create)
+
+    assert first_resource is client_context
+    assert second_resource is client_context
+    create.assert_called_once_with()
+
+
+def test_get_resource_concurrent_correct(client_context):
+    create = unittest.mock.MagicMock(return_value=unittest.mock.sentinel)
+    barrier = threading.Barrier(8)
+    resources = []
+
+    def get_resource():
+        barrier.wait()
+        resources.append(client_context.get_resource('resource', create))
+
+    threads = [threading.Thread(target=get_resource) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert resources == 8 * [unittest.mock.sentinel]
+    create.assert_called_once_with()
+
+
+def test_close_correct(client_context):
+    closed_resources = []
+    client_context.get_resource('first', lambda: 'first',
+                                closed_resources.append)
+    client_context.get_resource('second', lambda: 'second',
+                                closed_resources.append)
+
+    client_context.close()
+
+    assert closed_resources == ['second', 'first']
+    assert client_context.get_resource('first', lambda: 'new') == 'new'
+
+
+def test_executor_per_client_context_correct(client_config):
+    first_client_context = ClientContext(client_config)
+    second_client_context = ClientContext(client_config)
+
+    with first_client_context.activate():
+        first_executor = get_executor()
+        assert get_executor() is first_executor
+        assert first_executor.submit(get_client_context).result(
+            timeout=5) is first_client_context
+    with second_client_context.activate():
+        second_executor = get_executor()
+
+    assert first_executor is not second_executor
+    assert first_executor.max_workers == 2
+    first_client_context.close()
+    second_client_context.close()
+
+
+def test_bind_client_context_correct(client_context):
+    with client_context.activate():
+        bound_function = bind_client_context(get_client_context)
+    results = []
+    thread = threading.Thread(target=lambda: results.append(bound_function()))
+    thread.start()
+    thread.join()
+
+    assert results == [client_context]
+
+
+def test_bind_client_context_no_client_context_correct():
+    assert bind_client_context(get_client_context) is get_client_context
+
+
+def test_bind_client_context_iterator_correct(client_context):
+    def iterate():
+        for _ in range(2):
+            yield get_client_context()
+
+    with client_context.activate():
+        bound_iterator = bind_client_context_iterator(iterate())
+
+    assert get_client_context() is None
+    assert list(bound_iterator) == [client_context, client_context]
+
+
+def test_bind_client_context_iterator_closed_correct(client_context):
+    closing_client_contexts = []
+
+    def iterate():
+        try:
+            while True:
+                yield get_client_context()
+        finally:
+            closing_client_contexts.append(get_client_context())
+
+    with client_context.activate():
+        bound_iterator = bind_client_context_iterator(iterate())
+
+    assert next(bound_iterator) is client_context
+    bound_iterator.close()
+
+    assert closing_client_contexts == [client_context]
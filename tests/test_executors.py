@@ -0,0 +1,86 @@
+import threading
+import unittest.mock
+
+import pytest
+
+from pantos.client.library.executors import SharedExecutor
+from pantos.client.library.executors import get_executor
+from pantos.client.library.executors import shutdown_executor
+
+_CONFIG = {'executor': {'max_workers': 3}}
+
+
+def _current_thread_name():
+    return threading.current_thread().name
+
+
+def _submit_nested(executor):
+    calling_thread_name = _current_thread_name()
+    nested_thread_name = executor.submit(_current_thread_name).result(
+        timeout=5)
+    return calling_thread_name, nested_thread_name
+
+
+@pytest.fixture
+def executor():
+    executor = SharedExecutor(2)
+    yield executor
+    executor.shutdown()
+
+
+def test_submit_correct(executor):
+    future = executor.submit(_current_thread_name)
+
+    assert future.result(timeout=5).startswith('pantos-client')
+
+
+def test_submit_error(executor):
+    future = executor.submit(int, 'invalid')
+
+    with pytest.raises(ValueError):
+        future.result(timeout=5)
+
+
+def test_submit_nested_worker_available(executor):
+    calling_thread_name, nested_thread_name = executor.submit(
+        _submit_nested, executor).result(timeout=5)
+
+    assert nested_thread_name.startswith('pantos-client')
+    assert nested_thread_name != calling_thread_name
+
+
+def test_submit_nested_all_workers_busy():
+    executor = SharedExecutor(1)
+
+    try:
+        calling_thread_name, nested_thread_name = executor.submit(
+            _submit_nested, executor).result(timeout=5)
+    finally:
+        executor.shutdown()
+
+    assert nested_thread_name == calling_thread_name
+
+
+@unittest.mock.patch('pantos.client.library.executors._executor', None)
+@unittest.mock.patch('pantos.client.library.executors.config', _CONFIG)
+def test_get_executor_correct():
+    executor = get_executor()
+
+    try:
+        assert executor.max_workers == 3
+        assert get_executor() is executor
+    finally:
+        shutdown_executor()
+
+
+@unittest.mock.patch('pantos.client.library.executors._executor', None)
+@unittest.mock.patch('pantos.client.library.executors.config', _CONFIG)
+def test_shutdown_executor_correct():
+    executor = get_executor()
+
+    shutdown_executor()
+
+    with pytest.raises(RuntimeError):
+        executor.submit(_current_thread_name)
+    assert get_executor() is not executor
+    shutdown_executor()
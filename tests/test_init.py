@@ -1,38 +1,108 @@
+import threading
 import unittest.mock
 
 import pytest
 import semantic_version  # type: ignore
 from pantos.common.configuration import ConfigError
 
-from pantos.client.library import _initialized
+import pantos.client.library
+from pantos.client.library import check_protocol_version
 from pantos.client.library import initialize_library
 from pantos.client.library.exceptions import ClientLibraryError
 from pantos.client.library.protocol import is_supported_protocol_version
 
 
+@pytest.fixture(autouse=True)
+def uninitialized_library(monkeypatch):
+    monkeypatch.setattr(pantos.client.library, '_initialized_networks',
+                        frozenset())
+    monkeypatch.setattr(pantos.client.library, '_config_loaded', False)
+
+
 @pytest.mark.parametrize('mainnet', [False, True])
 @pytest.mark.parametrize('initialized', [False, True])
 @unittest.mock.patch('pantos.client.library._config')
 @unittest.mock.patch('pantos.client.library._load_config')
 def test_initialize_library_correct(mock_load_config, mock_config, initialized,
                                     mainnet, protocol_version):
-    _initialized.value = initialized
+    if initialized:
+        pantos.client.library._initialized_networks = frozenset([mainnet])
+        pantos.client.library._config_loaded = True
     mock_config.__getitem__.side_effect = _get_config(
         protocol_version).__getitem__
 
     initialize_library(mainnet)
 
-    assert _initialized.value
+    assert pantos.client.library._initialized_networks == frozenset([mainnet])
     if initialized:
         mock_load_config.assert_not_called()
     else:
         mock_load_config.assert_called_once()
 
 
+@unittest.mock.patch('pantos.client.library._config')
+@unittest.mock.patch('pantos.client.library._load_config')
+def test_initialize_library_both_networks(mock_load_config, mock_config,
+                                          protocol_version):
+    mock_config.__getitem__.side_effect = _get_config(
+        protocol_version).__getitem__
+
+    initialize_library(False)
+    initialize_library(True)
+
+    assert pantos.client.library._initialized_networks == frozenset(
+        [False, True])
+    mock_load_config.assert_called_once()
+
+
+@unittest.mock.patch('pantos.client.library._config')
+@unittest.mock.patch('pantos.client.library._load_config')
+def test_initialize_library_other_network_unsupported(mock_load_config,
+                                                      mock_config,
+                                                      protocol_version):
+    unsupported_protocol_version = semantic_version.Version('123.456.789')
+    mock_config.__getitem__.side_effect = {
+        'protocol': {
+            'mainnet': str(unsupported_protocol_version),
+            'testnet': str(protocol_version)
+        }
+    }.__getitem__
+    initialize_library(False)
+
+    # Initializing another network is not silently ignored
+    with pytest.raises(ClientLibraryError) as exception_info:
+        initialize_library(True)
+
+    raised_error = exception_info.value
+    assert raised_error.details['protocol_version'] == \
+        unsupported_protocol_version
+    assert pantos.client.library._initialized_networks == frozenset([False])
+
+
+@unittest.mock.patch('pantos.client.library._config')
+@unittest.mock.patch('pantos.client.library._load_config')
+def test_initialize_library_concurrent(mock_load_config, mock_config,
+                                       protocol_version):
+    mock_config.__getitem__.side_effect = _get_config(
+        protocol_version).__getitem__
+    threads = [
+        threading.Thread(target=initialize_library, args=(mainnet, ))
+        for mainnet in [False, True] * 8
+    ]
+
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=5)
+
+    assert pantos.client.library._initialized_networks == frozenset(
+        [False, True])
+    mock_load_config.assert_called_once()
+
+
 @pytest.mark.parametrize('mainnet', [False, True])
 @unittest.mock.patch('pantos.client.library._load_config')
 def test_initialize_library_config_load_error(mock_load_config, mainnet):
-    _initialized.value = False
     mock_load_config.side_effect = ConfigError('')
 
     with pytest.raises(ClientLibraryError) as exception_info:
@@ -40,6 +110,7 @@ def test_initialize_library_config_load_error(mock_load_config, mainnet):
 
     raised_error = exception_info.value
     assert isinstance(raised_error.__context__, ConfigError)
+    assert not pantos.client.library._config_loaded
 
 
 @pytest.mark.parametrize('mainnet', [False, True])
@@ -47,7 +118,6 @@ def test_initialize_library_config_load_error(mock_load_config, mainnet):
 @unittest.mock.patch('pantos.client.library._load_config')
 def test_initialize_library_unsupported_protocol_version(
         mock_load_config, mock_config, mainnet):
-    _initialized.value = False
     protocol_version = semantic_version.Version('123.456.789')
     assert not is_supported_protocol_version(protocol_version)
     mock_config.__getitem__.side_effect = _get_config(
@@ -59,6 +129,20 @@ def test_initialize_library_unsupported_protocol_version(
     raised_error = exception_info.value
     assert raised_error.details['protocol_version'] == protocol_version
     assert raised_error.__context__ is None
+    assert pantos.client.library._initialized_networks == frozenset()
+
+
+@pytest.mark.parametrize('mainnet', [False, True])
+@unittest.mock.patch('pantos.client.library._config')
+def test_check_protocol_version_unsupported(mock_config, mainnet,
+                                            protocol_version):
+    config = _get_config(protocol_version)
+    config['protocol']['mainnet' if mainnet else 'testnet'] = '0.0.0'
+    mock_config.__getitem__.side_effect = config.__getitem__
+
+    with pytest.raises(ClientLibraryError):
+        check_protocol_version(mainnet)
+    check_protocol_version(not mainnet)
 
 
 def _get_config(protocol_version):
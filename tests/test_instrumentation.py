@@ -0,0 +1,109 @@
+import contextlib
+
+import pytest
+
+from pantos.client.library.executors import SharedExecutor
+from pantos.client.library.instrumentation import StageRecord
+from pantos.client.library.instrumentation import add_stage_hook
+from pantos.client.library.instrumentation import instrument_operation
+from pantos.client.library.instrumentation import instrument_stage
+from pantos.client.library.instrumentation import remove_stage_hook
+
+
+def _run_stage(stage):
+    with instrument_stage(stage):
+        pass
+
+
+@pytest.fixture
+def stage_records():
+    stage_records = []
+    add_stage_hook(stage_records.append)
+    yield stage_records
+    remove_stage_hook(stage_records.append)
+
+
+def test_instrument_operation_no_hooks():
+    assert isinstance(instrument_operation('operation'),
+                      contextlib.nullcontext)
+
+
+def test_instrument_stage_no_hooks():
+    with instrument_operation('operation'):
+        assert isinstance(instrument_stage('stage'), contextlib.nullcontext)
+
+
+def test_instrument_operation_correct(stage_records):
+    with instrument_operation('operation'):
+        _run_stage('stage_1')
+        _run_stage('stage_2')
+
+    assert [(stage_record.operation, stage_record.stage)
+            for stage_record in stage_records] == [('operation', 'stage_1'),
+                                                   ('operation', 'stage_2'),
+                                                   ('operation', None)]
+    assert all(stage_record.succeeded and stage_record.duration >= 0
+               for stage_record in stage_records)
+    assert stage_records[-1].duration >= sum(
+        stage_record.duration for stage_record in stage_records[:-1])
+
+
+def test_instrument_operation_error(stage_records):
+    error = ValueError('stage error')
+
+    with pytest.raises(ValueError):
+        with instrument_operation('operation'):
+            with instrument_stage('stage'):
+                raise error
+
+    assert stage_records == [
+        StageRecord('operation', 'stage', stage_records[0].duration, error),
+        StageRecord('operation', None, stage_records[1].duration, error)
+    ]
+    assert not stage_records[0].succeeded
+
+
+def test_instrument_stage_outside_operation(stage_records):
+    _run_stage('stage')
+
+    assert stage_records == []
+
+
+def test_instrument_stage_hook_error(stage_records):
+    def failing_hook(stage_record):
+        raise Exception
+
+    add_stage_hook(failing_hook)
+    try:
+        with instrument_operation('operation'):
+            _run_stage('stage')
+    finally:
+        remove_stage_hook(failing_hook)
+
+    assert len(stage_records) == 2
+
+
+def test_instrument_stage_shared_executor(stage_records):
+    executor = SharedExecutor(2)
+    try:
+        with instrument_operation('operation'):
+            executor.submit(_run_stage, 'stage').result(timeout=5)
+        # Stages of tasks submitted outside an operation are ignored
+        executor.submit(_run_stage, 'stage').result(timeout=5)
+    finally:
+        executor.shutdown()
+
+    assert [(stage_record.operation, stage_record.stage)
+            for stage_record in stage_records] == [('operation', 'stage'),
+                                                   ('operation', None)]
+
+
+def test_remove_stage_hook(stage_records):
+    remove_stage_hook(stage_records.append)
+
+    with instrument_operation('operation'):
+        _run_stage('stage')
+
+    assert stage_records == []
+    # Removing a hook that is not registered is ignored
+    remove_stage_hook(stage_records.append)
@@ -0,0 +1,184 @@
+import unittest.mock
+import urllib.request
+
+import pytest
+import requests
+
+from pantos.client.library.instrumentation import StageRecord
+from pantos.client.library.instrumentation import instrument_operation
+from pantos.client.library.instrumentation import instrument_stage
+from pantos.client.library.metrics import CONTENT_TYPE
+from pantos.client.library.metrics import MetricsError
+from pantos.client.library.metrics import MetricsRegistry
+from pantos.client.library.metrics import disable_metrics
+from pantos.client.library.metrics import enable_metrics
+from pantos.client.library.metrics import get_metrics_registry
+from pantos.client.library.metrics import measure_http_request
+from pantos.client.library.metrics import push_metrics
+from pantos.client.library.metrics import record_cache_access
+from pantos.client.library.metrics import start_metrics_server
+
+_GATEWAY_URL = 'http://localhost:9091/'
+
+_SERVICE_NODE_URL = 'https://service-node.pantos.io:8080/transfer'
+
+
+@pytest.fixture
+def metrics_registry():
+    metrics_registry = enable_metrics()
+    yield metrics_registry
+    disable_metrics()
+
+
+def test_metrics_registry_render_counter():
+    metrics_registry = MetricsRegistry()
+    metrics_registry.observe_cache_access('token_decimals', True)
+    metrics_registry.observe_cache_access('token_decimals', True)
+    metrics_registry.observe_cache_access('token_decimals', False)
+
+    lines = metrics_registry.render().splitlines()
+
+    assert '# TYPE pantos_client_cache_accesses_total counter' in lines
+    assert ('pantos_client_cache_accesses_total{cache="token_decimals",'
+            'result="hit"} 2.0') in lines
+    assert ('pantos_client_cache_accesses_total{cache="token_decimals",'
+            'result="miss"} 1.0') in lines
+
+
+def test_metrics_registry_render_histogram():
+    metrics_registry = MetricsRegistry(latency_buckets=[0.1, 1.0])
+    metrics_registry.observe_rpc_request('ethereum', 'node:8545', 'eth_call',
+                                         0.05, True)
+    metrics_registry.observe_rpc_request('ethereum', 'node:8545', 'eth_call',
+                                         0.5, False)
+
+    lines = metrics_registry.render().splitlines()
+
+    labels = 'blockchain="ethereum",provider="node:8545",method="eth_call"'
+    assert '# TYPE pantos_client_rpc_request_duration_seconds histogram' in \
+        lines
+    assert (f'pantos_client_rpc_request_duration_seconds_bucket{{{labels},'
+            'le="0.1"} 1') in lines
+    assert (f'pantos_client_rpc_request_duration_seconds_bucket{{{labels},'
+            'le="1.0"} 2') in lines
+    assert (f'pantos_client_rpc_request_duration_seconds_bucket{{{labels},'
+            'le="+Inf"} 2') in lines
+    assert (f'pantos_client_rpc_request_duration_seconds_sum{{{labels}}} '
+            '0.55') in lines
+    assert (f'pantos_client_rpc_request_duration_seconds_count{{{labels}}} '
+            '2') in lines
+    assert (f'pantos_client_rpc_requests_total{{{labels},outcome="success"}} '
+            '1.0') in lines
+    assert (f'pantos_client_rpc_requests_total{{{labels},outcome="error"}} '
+            '1.0') in lines
+
+
+def test_metrics_registry_render_escaped_label_value():
+    metrics_registry = MetricsRegistry()
+    metrics_registry.observe_cache_access('a"b\\c\nd', True)
+
+    assert ('pantos_client_cache_accesses_total{cache="a\\"b\\\\c\\nd",'
+            'result="hit"} 1.0') in metrics_registry.render().splitlines()
+
+
+def test_metrics_registry_observe_stage():
+    metrics_registry = MetricsRegistry()
+    metrics_registry.observe_stage(
+        StageRecord('transfer_tokens', 'signature', 0.01))
+    metrics_registry.observe_stage(
+        StageRecord('transfer_tokens', None, 0.02, Exception()))
+
+    lines = metrics_registry.render().splitlines()
+
+    assert ('pantos_client_operations_total{operation="transfer_tokens",'
+            'stage="signature",outcome="success"} 1.0') in lines
+    assert ('pantos_client_operations_total{operation="transfer_tokens",'
+            'stage="",outcome="error"} 1.0') in lines
+
+
+def test_enable_metrics_correct(metrics_registry):
+    assert enable_metrics() is metrics_registry
+    assert get_metrics_registry() is metrics_registry
+
+    with instrument_operation('transfer_tokens'):
+        with instrument_stage('signature'):
+            pass
+
+    lines = metrics_registry.render().splitlines()
+    assert ('pantos_client_operations_total{operation="transfer_tokens",'
+            'stage="signature",outcome="success"} 1.0') in lines
+
+
+def test_disable_metrics_correct(metrics_registry):
+    disable_metrics()
+
+    assert get_metrics_registry() is None
+    # Recording is a no-op while metrics are disabled
+    record_cache_access('token_decimals', True)
+    with measure_http_request(_SERVICE_NODE_URL, 'transfer'):
+        pass
+    assert 'token_decimals' not in metrics_registry.render()
+
+
+def test_measure_http_request_correct(metrics_registry):
+    with measure_http_request(_SERVICE_NODE_URL, 'transfer'):
+        pass
+    with pytest.raises(requests.exceptions.HTTPError):
+        with measure_http_request(_SERVICE_NODE_URL, 'transfer'):
+            raise requests.exceptions.HTTPError
+
+    lines = metrics_registry.render().splitlines()
+    labels = 'host="service-node.pantos.io:8080",resource="transfer"'
+    assert (f'pantos_client_http_requests_total{{{labels},outcome="success"}} '
+            '1.0') in lines
+    assert (f'pantos_client_http_requests_total{{{labels},outcome="error"}} '
+            '1.0') in lines
+    assert f'pantos_client_http_request_duration_seconds_count{{{labels}}} 2' \
+        in lines
+
+
+def test_start_metrics_server_correct(metrics_registry):
+    record_cache_access('token_decimals', True)
+    metrics_server = start_metrics_server(0, '127.0.0.1')
+    try:
+        port = metrics_server.server_address[1]
+        with urllib.request.urlopen(f'http://127.0.0.1:{port}/metrics',
+                                    timeout=5) as response:
+            content_type = response.headers['Content-Type']
+            body = response.read().decode('utf-8')
+    finally:
+        metrics_server.shutdown()
+        metrics_server.server_close()
+
+    assert content_type == CONTENT_TYPE
+    assert body == metrics_registry.render()
+
+
+def test_start_metrics_server_not_enabled():
+    with pytest.raises(MetricsError):
+        start_metrics_server(0, '127.0.0.1')
+
+
+@unittest.mock.patch('pantos.client.library.metrics.requests.put')
+def test_push_metrics_correct(mocked_put, metrics_registry):
+    record_cache_access('token_decimals', False)
+
+    push_metrics(_GATEWAY_URL, 'pantos client', timeout=3)
+
+    mocked_put.assert_called_once_with(
+        'http://localhost:9091/metrics/job/pantos%20client',
+        data=metrics_registry.render().encode('utf-8'),
+        headers={'Content-Type': CONTENT_TYPE}, timeout=3)
+    mocked_put().raise_for_status.assert_called_once()
+
+
+@unittest.mock.patch('pantos.client.library.metrics.requests.put',
+                     side_effect=requests.exceptions.ConnectionError)
+def test_push_metrics_error(mocked_put, metrics_registry):
+    with pytest.raises(MetricsError):
+        push_metrics(_GATEWAY_URL, 'pantos-client')
+
+
+def test_push_metrics_not_enabled():
+    with pytest.raises(MetricsError):
+        push_metrics(_GATEWAY_URL, 'pantos-client')
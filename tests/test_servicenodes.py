@@ -0,0 +1,170 @@
+import unittest.mock
+
+import pytest
+import requests.exceptions
+from pantos.common.blockchains.base import Blockchain
+from pantos.common.entities import ServiceNodeBid
+from pantos.common.servicenodes import ServiceNodeClientError
+from pantos.common.servicenodes import ServiceNodeTransferStatus
+
+from pantos.client.library.servicenodes import ServiceNodeClient
+from pantos.client.library.servicenodes import build_bids_url
+from pantos.client.library.servicenodes import build_status_url
+from pantos.client.library.servicenodes import build_transfer_url
+
+_SERVICE_NODE_URL = 'https://servicenode.pantos.io'
+
+
+def _mock_response(json_response=None, error=None):
+    response = unittest.mock.Mock()
+    response.headers = {'content-type': 'application/json'}
+    response.json.return_value = json_response
+    if error is not None:
+        response.raise_for_status.side_effect = error
+    return response
+
+
+@pytest.fixture
+def submit_transfer_request(source_blockchain, destination_blockchain,
+                            sender_address, recipient_address,
+                            source_token_address, destination_token_address,
+                            token_amount, sender_nonce, transfer_valid_until):
+    return ServiceNodeClient.SubmitTransferRequest(
+        _SERVICE_NODE_URL, source_blockchain, destination_blockchain,
+        sender_address, recipient_address, source_token_address,
+        destination_token_address, token_amount,
+        ServiceNodeBid(source_blockchain, destination_blockchain, 10, 100,
+                       1000, 'bid signature'), sender_nonce,
+        transfer_valid_until, 'signature')
+
+
+@unittest.mock.patch('pantos.client.library.servicenodes.get_http_session')
+def test_submit_transfer_correct(mocked_get_http_session,
+                                 submit_transfer_request, task_uuid):
+    mocked_session = mocked_get_http_session()
+    mocked_session.post.return_value = _mock_response(
+        {'task_id': str(task_uuid)})
+
+    task_id = ServiceNodeClient().submit_transfer(submit_transfer_request, 5)
+
+    assert task_id == task_uuid
+    mocked_session.post.assert_called_once()
+    assert mocked_session.post.call_args.args == (
+        f'{_SERVICE_NODE_URL}/transfer', )
+    assert mocked_session.post.call_args.kwargs['timeout'] == 5
+    assert mocked_session.post.call_args.kwargs['json']['nonce'] == \
+        submit_transfer_request.sender_nonce
+
+
+@unittest.mock.patch('pantos.client.library.servicenodes.get_http_session')
+def test_submit_transfer_http_error(mocked_get_http_session,
+                                    submit_transfer_request):
+    mocked_get_http_session().post.return_value = _mock_response(
+        {'message': 'bad request'}, requests.exceptions.HTTPError(''))
+
+    with pytest.raises(ServiceNodeClientError) as exception_info:
+        ServiceNodeClient().submit_transfer(submit_transfer_request)
+
+    assert exception_info.value.details['response_message'] == 'bad request'
+
+
+@unittest.mock.patch('pantos.client.library.servicenodes.get_http_session')
+def test_submit_transfer_connection_error(mocked_get_http_session,
+                                          submit_transfer_request):
+    mocked_get_http_session().post.side_effect = \
+        requests.exceptions.ConnectionError('')
+
+    with pytest.raises(ServiceNodeClientError) as exception_info:
+        ServiceNodeClient().submit_transfer(submit_transfer_request)
+
+    assert exception_info.value.details['response_message'] is None
+
+
+@unittest.mock.patch('pantos.client.library.servicenodes.get_http_session')
+def test_bids_correct(mocked_get_http_session, source_blockchain,
+                      destination_blockchain):
+    mocked_session = mocked_get_http_session()
+    mocked_session.get.return_value = _mock_response([{
+        'fee': 10,
+        'execution_time': 100,
+        'valid_until': 1000,
+        'signature': 'bid signature'
+    }])
+
+    bids = ServiceNodeClient().bids(_SERVICE_NODE_URL + '/', source_blockchain,
+                                    destination_blockchain)
+
+    assert bids == [
+        ServiceNodeBid(source_blockchain, destination_blockchain, 10, 100,
+                       1000, 'bid signature')
+    ]
+    mocked_session.get.assert_called_once_with(
+        f'{_SERVICE_NODE_URL}/bids?source_blockchain='
+        f'{source_blockchain.value}&destination_blockchain='
+        f'{destination_blockchain.value}', timeout=None)
+
+
+@unittest.mock.patch('pantos.client.library.servicenodes.get_http_session')
+def test_bids_error(mocked_get_http_session, source_blockchain,
+                    destination_blockchain):
+    mocked_get_http_session().get.return_value = _mock_response([{}])
+
+    with pytest.raises(ServiceNodeClientError):
+        ServiceNodeClient().bids(_SERVICE_NODE_URL, source_blockchain,
+                                 destination_blockchain)
+
+
+@pytest.mark.parametrize('service_node_status',
+                         [(Blockchain.ETHEREUM, Blockchain.BNB_CHAIN)],
+                         indirect=['service_node_status'])
+@unittest.mock.patch('pantos.client.library.servicenodes.get_http_session')
+def test_status_correct(mocked_get_http_session, service_node_status):
+    mocked_session = mocked_get_http_session()
+    mocked_session.get.return_value = _mock_response({
+        'task_id': str(service_node_status.task_id),
+        'source_blockchain_id': service_node_status.source_blockchain.value,
+        'destination_blockchain_id': service_node_status.
+        destination_blockchain.value,
+        'sender_address': service_node_status.sender_address,
+        'recipient_address': service_node_status.recipient_address,
+        'source_token_address': service_node_status.source_token_address,
+        'destination_token_address': service_node_status.
+        destination_token_address,
+        'amount': service_node_status.token_amount,
+        'fee': service_node_status.fee,
+        'status': ServiceNodeTransferStatus.ACCEPTED.name.lower(),
+        'transfer_id': service_node_status.transfer_id,
+        'transaction_id': service_node_status.transaction_id
+    })
+
+    status = ServiceNodeClient().status(_SERVICE_NODE_URL,
+                                        service_node_status.task_id, 5)
+
+    assert status == service_node_status
+    mocked_session.get.assert_called_once_with(
+        f'{_SERVICE_NODE_URL}/transfer/{service_node_status.task_id}/status',
+        timeout=5)
+
+
+@unittest.mock.patch('pantos.client.library.servicenodes.get_http_session')
+def test_status_error(mocked_get_http_session, task_uuid):
+    mocked_get_http_session().get.side_effect = \
+        requests.exceptions.Timeout('')
+
+    with pytest.raises(ServiceNodeClientError):
+        ServiceNodeClient().status(_SERVICE_NODE_URL, task_uuid)
+
+
+@pytest.mark.parametrize('service_node_url',
+                         [_SERVICE_NODE_URL, f'{_SERVICE_NODE_URL}/'])
+def test_build_urls_correct(service_node_url, source_blockchain,
+                            destination_blockchain, task_uuid):
+    assert build_transfer_url(service_node_url) == \
+        f'{_SERVICE_NODE_URL}/transfer'
+    assert build_bids_url(
+        service_node_url, source_blockchain, destination_blockchain) == \
+        (f'{_SERVICE_NODE_URL}/bids?'
+         f'source_blockchain={source_blockchain.value}&'
+         f'destination_blockchain={destination_blockchain.value}')
+    assert build_status_url(service_node_url, task_uuid) == \
+        f'{_SERVICE_NODE_URL}/transfer/{task_uuid}/status'
@@ -0,0 +1,45 @@
+import unittest.mock
+
+import requests
+
+from pantos.client.library.sessions import close_http_session
+from pantos.client.library.sessions import get_http_session
+
+_CONFIG = {
+    'http': {
+        'pool_connections': 4,
+        'pool_maxsize': 8,
+        'pool_block': True
+    }
+}
+
+
+@unittest.mock.patch('pantos.client.library.sessions._http_session', None)
+@unittest.mock.patch('pantos.client.library.sessions.config', _CONFIG)
+def test_get_http_session_correct():
+    http_session = get_http_session()
+
+    assert isinstance(http_session, requests.Session)
+    assert get_http_session() is http_session
+    for url_prefix in ['http://', 'https://']:
+        http_adapter = http_session.get_adapter(url_prefix)
+        assert http_adapter._pool_connections == 4
+        assert http_adapter._pool_maxsize == 8
+        assert http_adapter._pool_block is True
+
+
+@unittest.mock.patch('pantos.client.library.sessions._http_session', None)
+@unittest.mock.patch('pantos.client.library.sessions.config', _CONFIG)
+def test_close_http_session_correct():
+    http_session = get_http_session()
+
+    with unittest.mock.patch.object(http_session, 'close') as mocked_close:
+        close_http_session()
+
+    mocked_close.assert_called_once_with()
+    assert get_http_session() is not http_session
+
+
+@unittest.mock.patch('pantos.client.library.sessions._http_session', None)
+def test_close_http_session_no_session():
+    close_http_session()